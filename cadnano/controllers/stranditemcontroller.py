@@ -31,7 +31,8 @@ class StrandItemController():
         ('oligoSelectedChangedSignal', 'oligoSelectedChangedSlot'),
         # ('oligoRemovedSignal', 'oligoRemovedSlot'),
         ('oligoSequenceAddedSignal', 'oligoSequenceAddedSlot'),
-        ('oligoSequenceClearedSignal', 'oligoSequenceClearedSlot')
+        ('oligoSequenceClearedSignal', 'oligoSequenceClearedSlot'),
+        ('oligoStrandsMovedSignal', 'oligoStrandsMovedSlot')
     ]
 
     def connectSignals(self):
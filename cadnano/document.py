@@ -40,10 +40,12 @@ from cadnano.fileio.encode import encodeToFile
 
 from cadnano.part import Part
 from cadnano.part.nucleicacidpart import NucleicAcidPart
-from cadnano.part.refreshsegmentscmd import RefreshSegmentsCommand
 from cadnano.oligo import Oligo
+from cadnano.selectionengine import SelectionEngine
 from cadnano.strandset import StrandSet
+from cadnano.strandset.removestrandcmd import RemoveStrandsCommand
 from cadnano.strand import Strand
+from cadnano.strand.resizecmd import ResizeStrandsCommand
 
 from cadnano.cntypes import (
     DocCtrlT,
@@ -78,6 +80,7 @@ class Document(CNObject):
         self._app_window = None
         # the dictionary maintains what is selected
         self._selection_dict = {}
+        self._selection_engine = None   # SelectionEngine of _selection_dict
         self._active_part = None
 
         self._filename = None
@@ -266,6 +269,7 @@ class Document(CNObject):
             self._selection_dict[ss][strand] = value
         else:
             self._selection_dict[ss] = {strand: value}
+        self._selection_engine = None
         self._strand_selected_changed_dict[strand] = value
     # end def
 
@@ -285,6 +289,7 @@ class Document(CNObject):
                 del temp[strand]
                 if len(temp) == 0:
                     del self._selection_dict[ss]
+                self._selection_engine = None
                 self._strand_selected_changed_dict[strand] = (False, False)
                 return True
             else:
@@ -361,6 +366,7 @@ class Document(CNObject):
         """
         # print("clearAllSelected")
         self._selection_dict = {}
+        self._selection_engine = None
         # the added list is what was recently selected or deselected
         self._strand_selected_changed_dict = {}
         self.documentClearSelectionsSignal.emit(self)
@@ -534,34 +540,37 @@ class Document(CNObject):
         return (min_low_delta, min_high_delta)
     # end def
 
+    def selectionEngine(self) -> SelectionEngine:
+        """Get the :class:`SelectionEngine` of the strand selection, built
+        again only after the selection or its strandsets changed
+
+        Returns:
+            the :class:`SelectionEngine`
+        """
+        engine = self._selection_engine
+        if engine is None or not engine.isValid():
+            engine = self._selection_engine = SelectionEngine(self._selection_dict)
+        return engine
+    # end def
+
     def getSelectionBounds(self) -> Tuple[int, int]:
         """Get the index bounds of a strand selection
 
         Returns:
             tuple: of :obj:`int`
         """
-        min_low_delta = -1
-        min_high_delta = -1
-        for strandset in self._selection_dict.keys():
-            selected_list = self.sortedSelectedStrands(strandset)
-            temp_low, temp_high = self.determineStrandSetBounds(selected_list, strandset)
-            if temp_low < min_low_delta or min_low_delta < 0:
-                min_low_delta = temp_low
-            if temp_high < min_high_delta or min_high_delta < 0:
-                min_high_delta = temp_high
-
-        return (min_low_delta, min_high_delta)
+        return self.selectionEngine().bounds()
     # end def
 
     def deleteStrandSelection(self, use_undostack: bool = True):
         """Delete selected strands. First iterates through all selected strands
-        and extracts refs to xovers and strands. Next, calls removeXover
-        on xoverlist as part of its own macroed command for isoluation
-        purposes. Finally, calls removeStrand on all strands that were
-        fully selected (low and high), or had at least one non-xover
-        endpoint selected.
+        and extracts refs to xovers and strands. Next, removes the xovers and
+        all strands that were fully selected (low and high), or had at least
+        one non-xover endpoint selected, with one :class:`RemoveStrandsCommand`
+        per part, after the commands clearing their sequences and decorators,
+        all as a single undo step.
         """
-        xoList = []
+        part_xovers = {}
         strand_dict = {}
         for strandset_dict in self._selection_dict.values():
             for strand, selected in strandset_dict.items():
@@ -576,101 +585,67 @@ class Document(CNObject):
                 sel3p = selected[0] if idx_low == strand.idx3Prime() else selected[1]
                 if sel3p:  # is idx3p selected?
                     if strand3p:  # is there an xover
-                        xoList.append((part, strand, strand3p, use_undostack))
+                        part_xovers.setdefault(part, []).append((strand, strand3p))
                     else:  # idx3p is a selected endpoint
                         strand_dict[strand] = True
                 else:
                     if not strand5p:  # idx5p is a selected endpoint
                         strand_dict[strand] = True
 
-        if use_undostack and xoList:
-            self.undoStack().beginMacro("Delete xovers")
-        for part, strand, strand3p, useUndo in xoList:
-            NucleicAcidPart.removeXover(part, strand, strand3p, useUndo)
-            self.removeStrandFromSelection(strand)
-            self.removeStrandFromSelection(strand3p)
         self._selection_dict = {}
+        self._selection_engine = None
         self.documentClearSelectionsSignal.emit(self)
-        if use_undostack:
-            if xoList:  # end xover macro if it was started
-                self.undoStack().endMacro()
-            if True in strand_dict.values():
-                self.undoStack().beginMacro("Delete selection")
-            else:
-                return  # nothing left to do
+
+        part_strands = {}
         for strand, delete in strand_dict.items():
             if delete:
-                strand.strandSet().removeStrand(strand)
-        if use_undostack:
-            self.undoStack().endMacro()
+                part_strands.setdefault(strand.part(), []).append(strand)
+        if not part_xovers and not part_strands:
+            return
+
+        cmds = []
+        oligos = set()
+        for strands in part_strands.values():
+            for strand in strands:
+                oligo = strand.oligo()
+                if oligo not in oligos:
+                    oligos.add(oligo)
+                    if oligo.sequence() is not None:
+                        cmds.append(oligo.applySequenceCMD(None))
+                cmds += strand.clearDecoratorCommands()
+        for part in dict.fromkeys(list(part_xovers) + list(part_strands)):
+            cmds.append(RemoveStrandsCommand(part, part_strands.get(part, []),
+                                             part_xovers.get(part, [])))
+        util.execCommandList(self, cmds, desc="Delete selection",
+                             use_undostack=use_undostack)
     # end def
 
     def resizeSelection(self, delta: int, use_undostack: bool = True):
-        """Moves the selected idxs by delta by first iterating over all strands
-        to calculate new idxs (method will return if snap-to behavior would
-        create illegal state), then applying a resize command to each strand.
+        """Moves the selected idxs by delta by first calculating the new idxs
+        of all strands (method will return if snap-to behavior would create
+        illegal state), then applying a single :class:`ResizeStrandsCommand`
+        after the commands clearing the sequences and the insertions left
+        behind.
 
         Args:
             delta:
             use_undostack: optional, default is ``True``
         """
-        resize_list = []
-        vh_set = set()
-        # calculate new idxs
-        part = None
-        for strandset_dict in self._selection_dict.values():
-            for strand, selected in strandset_dict.items():
-                if part is None:
-                    part = strand.part()
-                idx_low, idx_high = strand.idxs()
-                new_low, new_high = strand.idxs()
-                delta_low = delta_high = delta
-
-                # process xovers to get revised delta
-                if selected[0] and strand.connectionLow():
-                    new_low = part.xoverSnapTo(strand, idx_low, delta)
-                    if new_low is None:
-                        return
-                    delta_high = new_low - idx_low
-                if selected[1] and strand.connectionHigh():
-                    new_high = part.xoverSnapTo(strand, idx_high, delta)
-                    if new_high is None:
-                        return
-                    delta_low = new_high - idx_high
-
-                # process endpoints
-                if selected[0] and not strand.connectionLow():
-                    new_low = idx_low + delta_low
-                if selected[1] and not strand.connectionHigh():
-                    new_high = idx_high + delta_high
-
-                if new_low > new_high:  # check for illegal state
-                    return
-
-                vh_set.add(strand.idNum())
-                resize_list.append((strand, new_low, new_high))
-            # end for
-        # end for
-
-        # execute the resize commands
-        us = self.undoStack()
-        if use_undostack:
-            us.beginMacro("Resize Selection")
-
-        for strand, idx_low, idx_high in resize_list:
-            Strand.resize(strand,
-                          (idx_low, idx_high),
-                          use_undostack,
-                          update_segments=False)
-        if resize_list:
-            cmd = RefreshSegmentsCommand(part, vh_set)
-            if use_undostack:
-                us.push(cmd)
-            else:
-                cmd.redo()
-
-        if use_undostack:
-            us.endMacro()
+        resize_list = self.selectionEngine().newIdxs(delta)
+        if not resize_list:
+            return
+
+        cmds = []
+        oligos = set()
+        for strand, new_idxs in resize_list:
+            oligo = strand.oligo()
+            if oligo not in oligos:
+                oligos.add(oligo)
+                cmds.append(oligo.applySequenceCMD(None))
+            cmds += strand.getRemoveInsertionCommands(new_idxs)
+        cmds.append(ResizeStrandsCommand(resize_list))
+        util.execCommandList(self, cmds, desc="Resize Selection",
+                             use_undostack=use_undostack)
     # end def
 
     def updateStrandSelection(self):
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""Reading of the binary ``.cnb`` format written by :mod:`cnbencode`
+
+:func:`decode` hands the mapped arrays of each part to the bulk loader of
+:func:`v3decode.decodePart`, loads the stored points, if any, instead of
+computing them and fills the crossover table of the part from the file.
+"""
+import io
+import json
+import mmap
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy as np
+
+import cadnano.fileio.v3decode as v3decode
+from cadnano.fileio.cnbencode import (
+    ALIGNMENTS,
+    MAGIC,
+    PREAMBLE,
+    VERSION
+)
+from cadnano.part.crossovertable import PerNeighborHitsT
+from cadnano.cntypes import (
+    DocT,
+    HitListT,
+    NucleicAcidPartT,
+    PointsT
+)
+
+TableEntryT = Tuple[int, List[int], PerNeighborHitsT]
+
+
+class CNBFile(object):
+    """A ``.cnb`` file with its arrays mapped into memory.  Arrays are read
+    only views of the mapping, so processes opening the same file share the
+    pages.
+
+    Args:
+        filename: full path file name
+        use_mmap: map the file, otherwise read it into memory
+
+    Raises:
+        IOError: not a ``.cnb`` file or a newer version
+    """
+
+    def __init__(self, filename: str, use_mmap: bool = True):
+        with io.open(filename, 'rb') as fd:
+            if use_mmap:
+                self._buffer = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = fd.read()
+        if len(self._buffer) < PREAMBLE.size:
+            raise IOError("{} is not a cnb file".format(filename))
+        magic, version, header_length = PREAMBLE.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise IOError("{} is not a cnb file".format(filename))
+        if version > VERSION:
+            raise IOError("cnb version {} of {} is not supported".format(version, filename))
+        header_end = PREAMBLE.size + header_length
+        self.header: dict = json.loads(bytes(self._buffer[PREAMBLE.size:header_end]).decode('utf-8'))
+        alignment = ALIGNMENTS[version]
+        self._data_start = -(-header_end // alignment)*alignment
+    # end def
+
+    def close(self):
+        """Unmap the file.  Arrays obtained from it must not be used
+        afterwards.
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+    # end def
+
+    def numParts(self) -> int:
+        return len(self.header['parts'])
+    # end def
+
+    def arrayNames(self, part_index: int) -> List[str]:
+        return list(self.header['parts'][part_index]['arrays'].keys())
+    # end def
+
+    def array(self, part_index: int, name: str) -> np.ndarray:
+        """
+        Args:
+            part_index: index of the part in the file
+            name: of the array, e.g. ``'origins'``, ``'strand_idxs'`` or
+                ``'axis_pts'``
+
+        Returns:
+            read only view of the array in the file
+
+        Raises:
+            KeyError: no such array
+        """
+        dtype, shape, offset = self.header['parts'][part_index]['arrays'][name]
+        if 0 in shape:
+            # may lie past the end of the file
+            return np.empty(shape, dtype=np.dtype(dtype))
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=self._buffer,
+                          offset=self._data_start + offset)
+    # end def
+
+    def strings(self, part_index: int, name: str) -> List[str]:
+        """
+        Args:
+            part_index: index of the part in the file
+            name: of a column of strings
+
+        Returns:
+            the strings, ``None`` where the column held ``None``
+        """
+        arrays = self.header['parts'][part_index]['arrays']
+        data = bytes(self.array(part_index, name + '.data'))
+        offsets = self.array(part_index, name + '.offsets').tolist()
+        strings = [data[lo:hi].decode('utf-8') for lo, hi in zip(offsets[:-1], offsets[1:])]
+        if name + '.none' in arrays:
+            for i in np.flatnonzero(self.array(part_index, name + '.none')).tolist():
+                strings[i] = None
+        return strings
+    # end def
+
+    def columns(self, part_index: int, prefix: str, packed: dict) -> Dict[str, list]:
+        """Unpack the columns stored by :func:`cnbencode.packColumns`
+
+        Returns:
+            lists of values by name
+        """
+        columns = {}
+        for name, kind in packed['columns'].items():
+            if kind is None:
+                columns[name] = packed['values'][name]
+            elif kind == 'str':
+                columns[name] = self.strings(part_index, prefix + name)
+            elif kind == 'bool':
+                columns[name] = self.array(part_index, prefix + name).astype(bool).tolist()
+            else:
+                columns[name] = self.array(part_index, prefix + name).tolist()
+        return columns
+    # end def
+
+    def toDict(self) -> dict:
+        """
+        Returns:
+            the document dictionary as read from a version 3 json file
+        """
+        doc_dict = dict(self.header)
+        doc_dict['parts'] = [self.partDict(i) for i in range(self.numParts())]
+        return doc_dict
+    # end def
+
+    def partTables(self, part_index: int) -> dict:
+        """
+        Returns:
+            the dictionary of a part for :func:`v3decode.decodePart`, with
+            the tables as the arrays of the file and the ``strands`` as the
+            flat tables of :func:`v3decode.strandTables`
+        """
+        part_dict = dict(self.header['parts'][part_index])
+        part_dict.pop('arrays')
+        array = self.array
+
+        part_dict['virtual_helices'] = self.columns(part_index, 'vh.',
+                                                    part_dict['virtual_helices'])
+        for name in ('origins', 'directions', 'vh_list', 'insertions', 'xovers'):
+            part_dict[name] = array(part_index, name)
+        part_dict['strands'] = {'counts': array(part_index, 'strand_counts'),
+                                'idxs': array(part_index, 'strand_idxs'),
+                                'colors': self.strings(part_index, 'strand_colors')}
+
+        oligos = part_dict['oligos']
+        if isinstance(oligos, dict):
+            columns = self.columns(part_index, 'oligo.', oligos)
+            keys = list(columns.keys())
+            part_dict['oligos'] = [dict(zip(keys, values)) for values in zip(*columns.values())]
+        return part_dict
+    # end def
+
+    def partDict(self, part_index: int) -> dict:
+        """
+        Returns:
+            the dictionary of a part as read from a version 3 json file
+        """
+        part_dict = self.partTables(part_index)
+        for name in ('origins', 'directions', 'vh_list', 'insertions'):
+            part_dict[name] = part_dict[name].tolist()
+        part_dict['xovers'] = [[from_id, bool(from_is_fwd), from_idx, to_id, bool(to_is_fwd), to_idx]
+                               for from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx
+                               in part_dict['xovers'].tolist()]
+
+        strands = part_dict['strands']
+        idxs = strands['idxs'].tolist()
+        colors = strands['colors']
+        indices = []
+        properties = []
+        i = 0
+        for fwd_count, rev_count in strands['counts'].tolist():
+            if fwd_count < 0:
+                indices.append(None)
+                properties.append(None)
+                continue
+            j, k = i + fwd_count, i + fwd_count + rev_count
+            indices.append([idxs[i:j], idxs[j:k]])
+            properties.append([colors[i:j], colors[j:k]])
+            i = k
+        part_dict['strands'] = {'indices': indices, 'properties': properties}
+        return part_dict
+    # end def
+
+    def points(self, part_index: int) -> Optional[PointsT]:
+        """
+        Returns:
+            the stored axis, forward and reverse points of the virtual
+            helices in ``vh_list`` order or ``None`` if they were not saved
+        """
+        if 'axis_pts' not in self.header['parts'][part_index]['arrays']:
+            return None
+        return tuple(self.array(part_index, name) for name in ('axis_pts', 'fwd_pts', 'rev_pts'))
+    # end def
+
+    def crossoverTable(self, part_index: int) -> List[TableEntryT]:
+        """Unpack the arrays of :func:`cnbencode.packCrossoverTable`
+
+        Returns:
+            ``(ID number, neighbors, hits per neighbor)`` of each entry of
+            the crossover table of the part, none for a version 1 file
+        """
+        if 'xover_table.ids' not in self.header['parts'][part_index]['arrays']:
+            return []
+        ids, counts, neighbors, groups, rows = (
+            self.array(part_index, 'xover_table.' + name).tolist()
+            for name in ('ids', 'counts', 'neighbors', 'groups', 'rows'))
+        entries = []
+        i_neighbor = i_group = i_row = 0
+        for id_num, (num_neighbors, num_groups) in zip(ids, counts):
+            per_neighbor_hits = {}
+            for neighbor_id, *row_counts in groups[i_group:i_group + num_groups]:
+                hit_lists = []
+                for num_f, num_r in zip(row_counts[0::2], row_counts[1::2]):
+                    f_rows = rows[i_row:i_row + num_f]
+                    i_row += num_f
+                    r_rows = rows[i_row:i_row + num_r]
+                    i_row += num_r
+                    hit_lists.append(_hitList(f_rows, r_rows))
+                per_neighbor_hits[neighbor_id] = tuple(hit_lists)
+            i_group += num_groups
+            entries.append((id_num, neighbors[i_neighbor:i_neighbor + num_neighbors],
+                            per_neighbor_hits))
+            i_neighbor += num_neighbors
+        return entries
+    # end def
+# end class
+
+
+def _hitList(f_rows: List[List[int]], r_rows: List[List[int]]) -> HitListT:
+    """
+    Args:
+        f_rows: ``(index, neighbor index)`` of the hits against the forward
+            phosphates of a neighbor
+        r_rows: same against its reverse phosphates
+
+    Returns:
+        list of the form::
+
+            [(id_num_index, forward_neighbor_idxs, reverse_neighbor_idxs), ...]]
+    """
+    hits = {}
+    for idx, f_idx in f_rows:
+        hits.setdefault(idx, ([], []))[0].append(f_idx)
+    for idx, r_idx in r_rows:
+        hits.setdefault(idx, ([], []))[1].append(r_idx)
+    return [(idx, f_idxs, r_idxs) for idx, (f_idxs, r_idxs) in sorted(hits.items())]
+# end def
+
+
+def decode(document: DocT, filename: str, emit_signals: bool = True):
+    """Populate the document from a ``.cnb`` file
+
+    Args:
+        document:
+        filename: full path file name
+        emit_signals: whether to signal views
+    """
+    cnb_file = CNBFile(filename)
+    try:
+        for part_index in range(cnb_file.numParts()):
+            _decodePart(document, cnb_file, part_index, emit_signals)
+    finally:
+        cnb_file.close()
+    v3decode.decodeModifications(document, cnb_file.header['modifications'])
+# end def
+
+
+def _decodePart(document: DocT, cnb_file: CNBFile, part_index: int,
+                emit_signals: bool) -> NucleicAcidPartT:
+    """Decode a part of the file.  No array of the file is referenced once
+    this returns, so the file can be closed.
+
+    Returns:
+        the new part
+    """
+    part_dict = cnb_file.partTables(part_index)
+    part = v3decode.decodePart(document, part_dict,
+                               grid_type=v3decode.determineLatticeType(part_dict),
+                               emit_signals=emit_signals,
+                               points=cnb_file.points(part_index))
+    xover_table = part._xover_table
+    for id_num, neighbors, per_neighbor_hits in cnb_file.crossoverTable(part_index):
+        xover_table.set(id_num, neighbors, per_neighbor_hits)
+    return part
+# end def
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Binary cadnano document format (``.cnb``)
+
+A ``.cnb`` file stores the same document as a version 3 json file, with the
+bulky members of each part as typed arrays that :mod:`cnbdecode` can
+memory map.  Layout::
+
+    magic b'CNB\\0' | uint32 version | uint64 header length | json header |
+    arrays, each 8 byte aligned (64 bytes in version 1)
+
+The header is the version 3 document dictionary less the arrays.  Each part
+lists its arrays as ``name: [dtype, shape, offset]``, offsets counted from the
+end of the header.  Integers are stored in the smallest of 16, 32 and 64 bits
+holding them.  Columns of strings are stored as utf-8 bytes ``name.data``
+plus ``name.offsets`` and, where values may be ``None``, ``name.none``.
+
+Besides the document, each part stores its table of potential crossovers,
+see :func:`packCrossoverTable`, which :mod:`cnbdecode` loads instead of
+searching the coordinates again, and optionally the per base points.
+"""
+import io
+import json
+import struct
+from typing import (
+    Dict,
+    List
+)
+
+import numpy as np
+
+import cadnano.fileio.v3decode as v3decode
+import cadnano.fileio.v3encode as v3encode
+from cadnano.fileio.encode import EncoderforPandas
+from cadnano.cntypes import (
+    DocT,
+    NucleicAcidPartT
+)
+
+MAGIC = b'CNB\0'
+VERSION = 2
+PREAMBLE = struct.Struct('<4sIQ')
+ALIGNMENT = 8
+ALIGNMENTS = {1: 64, 2: ALIGNMENT}
+"""Alignment of the arrays by file version"""
+
+ArraysT = Dict[str, np.ndarray]
+
+
+def encodeToFile(filename: str, document: DocT, with_points: bool = False):
+    """Encode the document to a binary ``.cnb`` file
+
+    Args:
+        filename: Filename path for writing
+        document: Document to encode
+        with_points: also store the axis, forward and reverse points of each
+            virtual helix
+    """
+    doc_dict = v3encode.encodeDocument(document)
+    part_arrays = []
+    for part, part_dict in zip(document.getParts(), doc_dict['parts']):
+        part_arrays.append(encodePartArrays(part, part_dict, with_points))
+
+    # lay out the arrays after the header
+    data_offset = 0
+    layout = []
+    for part_dict, arrays in zip(doc_dict['parts'], part_arrays):
+        array_table = {}
+        for name, array in arrays.items():
+            data_offset = _align(data_offset)
+            array_table[name] = [array.dtype.str, list(array.shape), data_offset]
+            layout.append((data_offset, array))
+            data_offset += array.nbytes
+        part_dict['arrays'] = array_table
+    header = json.dumps(doc_dict, separators=(',', ':'), cls=EncoderforPandas).encode('utf-8')
+    data_start = _align(PREAMBLE.size + len(header))
+
+    with io.open(filename, 'wb') as fd:
+        fd.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        fd.write(header)
+        for offset, array in layout:
+            fd.write(b'\0'*(data_start + offset - fd.tell()))
+            fd.write(np.ascontiguousarray(array).tobytes())
+# end def
+
+
+def encodePartArrays(part: NucleicAcidPartT, part_dict: dict, with_points: bool) -> ArraysT:
+    """Move the bulky members of an encoded part into typed arrays
+
+    Args:
+        part:
+        part_dict: from :func:`v3encode.encodePart`, modified in place
+        with_points: also store the axis, forward and reverse points
+
+    Returns:
+        arrays by name
+    """
+    arrays = {}
+    arrays['origins'] = np.asarray(part_dict.pop('origins'), dtype='<f8')
+    arrays['directions'] = np.asarray(part_dict.pop('directions'), dtype='<f8')
+    vh_list = part_dict.pop('vh_list')
+    arrays['vh_list'] = intArray(vh_list, 2)
+
+    part_dict['virtual_helices'] = packColumns(arrays, 'vh.', part_dict['virtual_helices'])
+
+    # flat strand tables in vh_list order, forward strands first
+    counts, idxs, colors = v3decode.strandTables(part_dict)
+    part_dict.pop('strands')
+    arrays['strand_counts'] = intArray(counts, 2)
+    arrays['strand_idxs'] = intArray(idxs, 2)
+    packStrings(arrays, 'strand_colors', colors)
+
+    arrays['insertions'] = intArray(part_dict.pop('insertions'), 3)
+    arrays['xovers'] = intArray(part_dict.pop('xovers'), 6)
+
+    oligos = part_dict['oligos']
+    keys = list(oligos[0].keys()) if oligos else []
+    if all(list(oligo.keys()) == keys for oligo in oligos):
+        part_dict['oligos'] = packColumns(arrays, 'oligo.',
+                                          {key: [oligo[key] for oligo in oligos] for key in keys})
+
+    packCrossoverTable(arrays, part)
+
+    if with_points:
+        points = [part.getCoordinates(id_num) for id_num, _ in vh_list]
+        for i, name in enumerate(('axis_pts', 'fwd_pts', 'rev_pts')):
+            arrays[name] = (np.concatenate([x[i] for x in points]).astype('<f8')
+                            if points else np.empty((0, 3), dtype='<f8'))
+    return arrays
+# end def
+
+
+def packColumns(arrays: ArraysT, prefix: str, columns: Dict[str, list]) -> dict:
+    """Store the columns of booleans, numbers or strings of a table in
+    ``arrays``
+
+    Args:
+        arrays: to add the arrays of the columns to
+        prefix: of the array names
+        columns: lists of values by name
+
+    Returns:
+        dictionary of form ``{'columns': {name: kind}, 'values': {name: list}}``
+        with the kind of each stored column and any column left in ``values``
+        since it holds other types
+    """
+    kinds = {}
+    values = {}
+    for name, column in columns.items():
+        kind = _columnKind(column)
+        if kind is None:
+            values[name] = column
+        elif kind == 'str':
+            packStrings(arrays, prefix + name, column)
+        elif kind == 'int':
+            arrays[prefix + name] = intArray(column)
+        else:
+            arrays[prefix + name] = np.array(column, dtype=_KIND_DTYPES[kind])
+        kinds[name] = kind
+    return {'columns': kinds, 'values': values}
+# end def
+
+
+def packStrings(arrays: ArraysT, name: str, strings: List[str]):
+    """Store a list of strings, or ``None``, as utf-8 bytes and offsets
+
+    Args:
+        arrays: to add ``name.data``, ``name.offsets`` and ``name.none`` to
+        name: of the column
+        strings:
+    """
+    encoded = [(x or '').encode('utf-8') for x in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(x) for x in encoded], out=offsets[1:])
+    arrays[name + '.data'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    arrays[name + '.offsets'] = intArray(offsets)
+    if any(x is None for x in strings):
+        arrays[name + '.none'] = np.array([x is None for x in strings], dtype=np.uint8)
+# end def
+
+
+_KIND_DTYPES = {'bool': np.uint8, 'float': '<f8'}
+
+
+def packCrossoverTable(arrays: ArraysT, part: NucleicAcidPartT):
+    """Store the potential crossovers of every virtual helix of ``part``,
+    building its crossover table first if needed
+
+    Arrays:
+
+        ``xover_table.ids``: ID number of each entry
+        ``xover_table.counts``: number of neighbors and of neighbors with
+            hits of each entry
+        ``xover_table.neighbors``: the neighbors of the entries
+        ``xover_table.groups``: per neighbor with hits, its ID number and the
+            number of rows of its forward hits against the neighbor's
+            forward and reverse phosphates, then of its reverse hits
+        ``xover_table.rows``: ``(index, neighbor index)`` of each hit
+
+    Args:
+        arrays: to add the arrays to
+        part:
+    """
+    part.buildCrossoverTable()
+    entries = part._xover_table.entries
+    ids = sorted(entries)
+    counts = []
+    neighbors = []
+    groups = []
+    rows = []
+    for id_num in ids:
+        entry_neighbors, per_neighbor_hits = entries[id_num]
+        counts.append((len(entry_neighbors), len(per_neighbor_hits)))
+        neighbors += entry_neighbors
+        for neighbor_id, hit_lists in per_neighbor_hits.items():
+            group = [neighbor_id]
+            for hits in hit_lists:
+                f_rows = [(idx, f_idx) for idx, f_idxs, _ in hits for f_idx in f_idxs]
+                r_rows = [(idx, r_idx) for idx, _, r_idxs in hits for r_idx in r_idxs]
+                group += [len(f_rows), len(r_rows)]
+                rows += f_rows
+                rows += r_rows
+            groups.append(group)
+    arrays['xover_table.ids'] = intArray(ids)
+    arrays['xover_table.counts'] = intArray(counts, 2)
+    arrays['xover_table.neighbors'] = intArray(neighbors)
+    arrays['xover_table.groups'] = intArray(groups, 5)
+    arrays['xover_table.rows'] = intArray(rows, 2)
+# end def
+
+
+def intArray(values, width: int = None) -> np.ndarray:
+    """
+    Args:
+        values: integers, e.g. a list of rows
+        width (optional): number of columns, ``None`` for a flat array
+
+    Returns:
+        array of the smallest of 16, 32 and 64 bit little endian integers
+        holding the values
+    """
+    array = np.array(values, dtype=np.int64)
+    if width is not None:
+        array = array.reshape((-1, width))
+    for dtype in ('<i2', '<i4'):
+        info = np.iinfo(dtype)
+        if array.size == 0 or (info.min <= array.min() and array.max() <= info.max):
+            return array.astype(dtype)
+    return array.astype('<i8')
+# end def
+
+
+def _columnKind(column: list) -> str:
+    """
+    Returns:
+        one of ``'bool'``, ``'int'``, ``'float'`` or ``'str'`` if every value
+        of ``column`` is of that type (or ``None`` for ``'str'``), otherwise
+        ``None``
+    """
+    types = set(type(x) for x in column)
+    if types <= {bool, np.bool_}:
+        return 'bool'
+    if types <= {int, np.int64, np.int32}:
+        return 'int' if all(-2**63 <= x < 2**63 for x in column) else None
+    if types <= {float, np.float64}:
+        return 'float'
+    if types <= {str, type(None)}:
+        return 'str'
+    return None
+# end def
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT)*ALIGNMENT
+# end def
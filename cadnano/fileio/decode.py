@@ -2,33 +2,104 @@
 import json
 import io
 import os.path
+from typing import Callable
 
+import cadnano.fileio.cnbdecode as cnbdecode
 import cadnano.fileio.v2decode as v2decode
 import cadnano.fileio.c25decode as c25decode
 import cadnano.fileio.v3decode as v3decode
+from cadnano.fileio.jsonstream import JSONStreamReader
 from cadnano.cntypes import (
     DocT
 )
 
 def decodeFile( filename: str,
                 document: DocT = None,
-                emit_signals: bool = False) -> DocT:
-    with io.open(filename, 'r', encoding='utf-8') as fd:
-        nno_dict = json.load(fd)
+                emit_signals: bool = False,
+                stream: bool = False,
+                progress: Callable[[float], None] = None) -> DocT:
+    """Decode a cadnano 2, 2.5 (``.c25``), 3 or binary (``.cnb``) file
+
+    Args:
+        filename: full path file name
+        document: to decode into, a new ``Document`` if ``None``
+        emit_signals: whether to signal views
+        stream: read a json file incrementally, see :func:`streamDecode`
+        progress: called with the fraction of the file read so far, streaming
+            only
+
+    Returns:
+        the document
+    """
     if document is None:
         from cadnano.document import Document
         document = Document()
-    if 'format' not in nno_dict:
-        if os.path.splitext(filename)[1] == '.c25':
-            c25decode.decode(document, nno_dict, emit_signals=emit_signals)
-        else:
-            v2decode.decode(document, nno_dict, emit_signals=emit_signals)
+    if os.path.splitext(filename)[1] == '.cnb':
+        cnbdecode.decode(document, filename, emit_signals=emit_signals)
+    elif stream:
+        streamDecode(filename, document, emit_signals=emit_signals, progress=progress)
     else:
-        v3decode.decode(document, nno_dict, emit_signals=emit_signals)
+        with io.open(filename, 'r', encoding='utf-8') as fd:
+            nno_dict = json.load(fd)
+        if 'format' not in nno_dict:
+            if os.path.splitext(filename)[1] == '.c25':
+                c25decode.decode(document, nno_dict, emit_signals=emit_signals)
+            else:
+                v2decode.decode(document, nno_dict, emit_signals=emit_signals)
+        else:
+            v3decode.decode(document, nno_dict, emit_signals=emit_signals)
+    # precompute potential crossovers for the path and slice views
+    for part in document.getParts():
+        part.buildCrossoverTable()
     return document
 # end def
 
 
+def streamDecode(   filename: str,
+                    document: DocT,
+                    emit_signals: bool = False,
+                    progress: Callable[[float], None] = None):
+    """Decode a file without parsing it as a whole.  The ``vstrands`` of a
+    cadnano 2 file are reduced to segment ends, crossovers and insertions one
+    helix at a time and the ``parts`` of a cadnano 3 file are decoded one at
+    a time as they are read, so the per base lists of a large file are never
+    all in memory.  ``.c25`` files are read whole.
+
+    Args:
+        filename: full path file name
+        document: to decode into
+        emit_signals: whether to signal views
+        progress: called with the fraction of the file read so far
+    """
+    is_c25 = os.path.splitext(filename)[1] == '.c25'
+    report = None
+    if progress is not None:
+        file_size = max(os.path.getsize(filename), 1)
+
+        def report(num_chars: int):
+            progress(min(num_chars / file_size, 1.))
+    obj = {}
+    helices = None
+    with io.open(filename, 'r', encoding='utf-8') as fd:
+        reader = JSONStreamReader(fd, progress=report)
+        for key in reader.iterObject():
+            if key == 'vstrands' and not is_c25:
+                helices = [v2decode.readHelix(helix) for helix in reader.iterValues()]
+            elif key == 'parts':
+                v3decode.decodeParts(document, reader.iterValues(), emit_signals=emit_signals)
+            else:
+                obj[key] = reader.readValue()
+    if 'format' in obj:
+        v3decode.decodeModifications(document, obj['modifications'])
+    elif is_c25:
+        c25decode.decode(document, obj, emit_signals=emit_signals)
+    else:
+        v2decode.decodeHelices(document, helices, obj, emit_signals=emit_signals)
+    if progress is not None:
+        progress(1.)
+# end def
+
+
 def loadtest() -> DocT:
     import os
     root_path = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
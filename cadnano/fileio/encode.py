@@ -1,5 +1,6 @@
 import io
 import json
+import os.path
 from typing import Union
 
 import numpy as np
@@ -12,13 +13,18 @@ from cadnano.cntypes import (
 
 def encodeToFile(filename: str, document: DocT, legacy: bool = False):
     """
-    Encodes the document as json object and outputs to file.
+    Encodes the document as json object and outputs to file.  Filenames
+    ending in ``.cnb`` are written in the binary format of :mod:`cnbencode`.
 
     Args:
         filename: Filename path for writing
         document: Document to encode
         legacy: Export for use with legacy (pre v2.5) cadnano versions.
     """
+    if not legacy and os.path.splitext(filename)[1] == '.cnb':
+        import cadnano.fileio.cnbencode as cnbencode
+        cnbencode.encodeToFile(filename, document)
+        return
     json_string = encode(document, legacy)
     with io.open(filename, 'w', encoding='utf-8') as fd:
         fd.write(json_string)
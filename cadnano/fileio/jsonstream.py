@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Incremental reading of large JSON files
+
+:class:`JSONStreamReader` walks the containers of a JSON document one member
+at a time, parsing only the values asked for, so a large array can be
+consumed element by element without holding the whole parsed tree in memory.
+"""
+import json
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    TextIO
+)
+
+WHITESPACE = ' \t\n\r'
+NUMBER_CHARS = '0123456789+-.eE'
+CHUNK_SIZE = 1 << 16
+
+
+class JSONStreamReader(object):
+    """Pull reader of a JSON document in a text file
+
+    Navigate containers with :meth:`iterObject` and :meth:`iterArray` and
+    parse values with :meth:`readValue`.  Members skipped by the caller are
+    parsed and dropped.
+
+    Args:
+        fd: text file object
+        progress: called with the number of characters read so far
+        chunk_size: minimum number of characters read at a time
+    """
+
+    def __init__(self, fd: TextIO,
+                 progress: Callable[[int], None] = None,
+                 chunk_size: int = CHUNK_SIZE):
+        self._fd = fd
+        self._progress = progress
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._offset = 0
+        """Number of characters dropped from the front of ``_buf``"""
+        self._eof = False
+    # end def
+
+    def position(self) -> int:
+        """
+        Returns:
+            number of characters consumed
+        """
+        return self._offset + self._pos
+    # end def
+
+    def _fill(self, size: int = 0) -> bool:
+        """Read at least ``max(size, chunk_size)`` more characters
+
+        Returns:
+            ``False`` at the end of the file, ``True`` otherwise
+        """
+        if self._eof:
+            return False
+        if self._pos:
+            self._offset += self._pos
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        data = self._fd.read(max(size, self._chunk_size))
+        if not data:
+            self._eof = True
+            return False
+        self._buf += data
+        if self._progress is not None:
+            self._progress(self._offset + len(self._buf))
+        return True
+    # end def
+
+    def _peek(self) -> str:
+        """
+        Returns:
+            the next non whitespace character without consuming it, or ``''``
+            at the end of the file
+        """
+        while True:
+            buf = self._buf
+            pos, end = self._pos, len(buf)
+            while pos < end and buf[pos] in WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < end:
+                return buf[pos]
+            if not self._fill():
+                return ''
+    # end def
+
+    def _expect(self, chars: str) -> str:
+        """Consume the next token, which must be one of ``chars``
+
+        Raises:
+            ValueError: the next token is not one of ``chars``
+        """
+        c = self._peek()
+        if not c or c not in chars:
+            raise ValueError("expected one of {!r} at position {} got {!r}".format(
+                             chars, self.position(), c))
+        self._pos += 1
+        return c
+    # end def
+
+    def readValue(self) -> Any:
+        """Parse the next value
+
+        Raises:
+            ValueError: malformed JSON
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # read as much again as is buffered to keep retries linear
+                if not self._fill(len(self._buf) - self._pos):
+                    raise
+                continue
+            if self._isTruncated(value, end) and self._fill():
+                continue
+            self._pos = end
+            return value
+    # end def
+
+    def _isTruncated(self, value: Any, end: int) -> bool:
+        """Whether a value parsed up to ``end`` may continue in the next
+        chunk, e.g. ``0.`` of ``0.25``
+        """
+        buf = self._buf
+        if end == len(buf):
+            return True
+        if isinstance(value, (int, float)) and buf[end] in NUMBER_CHARS:
+            return all(c in NUMBER_CHARS for c in buf[end:])
+        return False
+    # end def
+
+    def iterObject(self) -> Iterator[str]:
+        """Iterate over the keys of the next value, which must be an object.
+        Consume the value of each key before advancing or it is skipped.
+
+        Yields:
+            each key
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.readValue()
+            if not isinstance(key, str):
+                raise ValueError("expected a key at position {}".format(self.position()))
+            self._expect(':')
+            self._peek()
+            start = self.position()
+            yield key
+            if self.position() == start:
+                self.readValue()
+            if self._expect(',}') == '}':
+                return
+    # end def
+
+    def iterArray(self) -> Iterator[int]:
+        """Iterate over the next value, which must be an array.  Consume each
+        element before advancing or it is skipped.
+
+        Yields:
+            the index of each element
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        i = 0
+        while True:
+            self._peek()
+            start = self.position()
+            yield i
+            if self.position() == start:
+                self.readValue()
+            if self._expect(',]') == ']':
+                return
+            i += 1
+    # end def
+
+    def iterValues(self) -> Iterator[Any]:
+        """Iterate over the parsed elements of the next value, which must be
+        an array
+
+        Yields:
+            each element
+        """
+        for _ in self.iterArray():
+            yield self.readValue()
+    # end def
+# end class
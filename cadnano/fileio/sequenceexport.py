@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Streaming export of the oligo sequences of parts
+
+Rows are produced lazily by :meth:`Oligo.sequenceRow`, one pass over the
+strands of each oligo, and written straight to an open text file as CSV with
+the columns of :data:`SEQUENCE_COLUMNS`, as FASTA, or as a plate layout for
+ordering.  Documents with several parts can have their parts exported in
+worker processes.
+"""
+import csv
+import multiprocessing
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    TextIO,
+    Tuple
+)
+
+from cadnano.oligo import (
+    SEQUENCE_COLUMNS,
+    CircularOligoException
+)
+from cadnano.cntypes import (
+    DocT,
+    NucleicAcidPartT
+)
+
+RowT = Tuple[str, str, str, str, str, str, str]
+
+PLATE_ROWS = 'ABCDEFGH'
+PLATE_COLUMNS = 12
+
+FORMATS = ('csv', 'fasta', 'plate')
+
+
+def iterPartRows(part: NucleicAcidPartT) -> Iterator[RowT]:
+    """
+    Args:
+        part:
+
+    Yields:
+        the :meth:`Oligo.sequenceRow` of each oligo of ``part``
+
+    Raises:
+        CircularOligoException: on the first circular oligo
+    """
+    for oligo in part.oligos():
+        yield oligo.sequenceRow()
+# end def
+
+
+def writeCSV(fd: TextIO, rows: Iterable[RowT], header: bool = True):
+    """Write rows as CSV in the format of :meth:`NucleicAcidPart.getSequences`
+
+    Args:
+        fd: open text file, opened with ``newline=''``
+        rows:
+        header: write the column names first
+    """
+    writer = csv.writer(fd, lineterminator='\n')
+    if header:
+        writer.writerow(SEQUENCE_COLUMNS)
+    writer.writerows(rows)
+# end def
+
+
+def writeFASTA(fd: TextIO, rows: Iterable[RowT]):
+    """Write rows as FASTA records named ``start-end``
+
+    Args:
+        fd: open text file
+        rows:
+    """
+    fd.writelines('>%s-%s\n%s\n' % (row[0], row[1], row[4]) for row in rows)
+# end def
+
+
+def writePlates(fd: TextIO, rows: Iterable[RowT], plate_prefix: str = 'Plate'):
+    """Write rows as a 96 well plate layout, filled row by row, with the
+    columns ``Plate``, ``Well``, ``Name``, ``Sequence``
+
+    Args:
+        fd: open text file, opened with ``newline=''``
+        rows:
+        plate_prefix: plate names are this followed by the plate number
+    """
+    writer = csv.writer(fd, lineterminator='\n')
+    writer.writerow(['Plate', 'Well', 'Name', 'Sequence'])
+    plate_size = len(PLATE_ROWS)*PLATE_COLUMNS
+    for i, row in enumerate(rows):
+        plate, well = divmod(i, plate_size)
+        well_row, well_column = divmod(well, PLATE_COLUMNS)
+        writer.writerow(['%s%d' % (plate_prefix, plate + 1),
+                         '%s%d' % (PLATE_ROWS[well_row], well_column + 1),
+                         '%s-%s' % (row[0], row[1]), row[4]])
+# end def
+
+
+def writeRows(fd: TextIO, rows: Iterable[RowT], fmt: str = 'csv'):
+    """Write rows in one of :data:`FORMATS`"""
+    if fmt == 'csv':
+        writeCSV(fd, rows)
+    elif fmt == 'fasta':
+        writeFASTA(fd, rows)
+    elif fmt == 'plate':
+        writePlates(fd, rows)
+    else:
+        raise ValueError("Unknown sequence export format %s" % (fmt))
+# end def
+
+
+_FORK_DOCUMENT = None
+"""Document the worker processes inherit, see :func:`_forkedPartRows`"""
+
+
+def _forkedPartRows(part_index: int) -> List[RowT]:
+    part = list(_FORK_DOCUMENT.getParts())[part_index]
+    return list(iterPartRows(part))
+# end def
+
+
+def iterDocumentRows(document: DocT, processes: int = None) -> Iterator[RowT]:
+    """Rows of all parts of ``document``, part by part
+
+    Args:
+        document:
+        processes: number of worker processes to export the parts in.  The
+            workers are forked so they share the model, hence the parts are
+            exported in this process where ``fork`` is not available, or
+            for ``None`` or ``1``.
+
+    Raises:
+        CircularOligoException: on the first circular oligo
+    """
+    global _FORK_DOCUMENT
+    parts = list(document.getParts())
+    if processes is None or processes < 2 or len(parts) < 2:
+        for part in parts:
+            yield from iterPartRows(part)
+        return
+    try:
+        context = multiprocessing.get_context('fork')
+    except ValueError:
+        yield from iterDocumentRows(document)
+        return
+    _FORK_DOCUMENT = document
+    try:
+        with context.Pool(min(processes, len(parts))) as pool:
+            for rows in pool.imap(_forkedPartRows, range(len(parts))):
+                yield from rows
+    finally:
+        _FORK_DOCUMENT = None
+# end def
+
+
+def exportSequences(filename: str, document: DocT, fmt: str = 'csv',
+                    active_part_only: bool = False, processes: int = None):
+    """Export the oligo sequences of a document to a file
+
+    Args:
+        filename: Filename path for writing
+        document: Document to export
+        fmt: one of :data:`FORMATS`
+        active_part_only: export only the active part of ``document``
+        processes: see :func:`iterDocumentRows`
+
+    Raises:
+        CircularOligoException: nothing is written if any oligo is circular
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Unknown sequence export format %s" % (fmt))
+    if active_part_only:
+        parts = [part for part in [document.activePart()] if part is not None]
+    else:
+        parts = list(document.getParts())
+    for part in parts:
+        circular_oligos = part.getCircularOligos()
+        if circular_oligos:
+            raise CircularOligoException("Cannot export circular oligo " +
+                                         circular_oligos[0].getName())
+    if active_part_only:
+        rows = (row for part in parts for row in iterPartRows(part))
+    else:
+        rows = iterDocumentRows(document, processes)
+    with open(filename, 'w', newline='') as fd:
+        writeRows(fd, rows, fmt)
+# end def
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
-from collections import defaultdict
+from typing import (
+    List,
+    Tuple
+)
 
 from cadnano.part.refresholigoscmd import RefreshOligosCommand
 from cadnano.proxies.cnenum import (
@@ -33,7 +36,105 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
     Raises:
         IOError, AssertionError, TypeError
     """
-    num_bases = len(obj['vstrands'][0]['scaf'])
+    helices = [readHelix(helix) for helix in obj['vstrands']]
+    decodeHelices(document, helices, obj, emit_signals=emit_signals)
+# end def
+
+
+def readHelix(helix: dict) -> dict:
+    """Reduce an element of ``vstrands`` to what :func:`decodeHelices` needs,
+    i.e. the per base ``scaf``, ``stap``, ``loop`` and ``skip`` lists to
+    segment ends, crossovers and insertions.
+
+    Args:
+        helix: an element of the ``vstrands`` list of a cadnano 2 file
+
+    Returns:
+        dictionary with keys ``num``, ``row``, ``col``, ``length``,
+        ``scaf_seg``, ``scaf_xo``, ``stap_seg``, ``stap_xo``, ``insertions``
+        and ``stap_colors``
+
+    Raises:
+        AssertionError
+    """
+    vh_num = helix['num']
+    scaf = helix['scaf']
+    stap = helix['stap']
+    insertions = helix['loop']
+    skips = helix['skip']
+    try:
+        # validate file serialization of lists
+        assert(len(scaf) == len(stap) and
+               len(scaf) == len(insertions) and
+               len(insertions) == len(skips))
+        scaf_seg, scaf_xo = readSegments(StrandEnum.SCAFFOLD, vh_num, scaf)
+        stap_seg, stap_xo = readSegments(StrandEnum.STAPLE, vh_num, stap)
+    except AssertionError:
+        print("Unrecognized file format.")
+        raise
+    insertion_list = []
+    for base_idx in range(len(stap)):
+        sum_of_insert_skip = insertions[base_idx] + skips[base_idx]
+        if sum_of_insert_skip != 0:
+            insertion_list.append((base_idx, sum_of_insert_skip))
+    return {'num': vh_num,
+            'row': helix['row'],
+            'col': helix['col'],
+            'length': len(scaf),
+            'scaf_seg': scaf_seg,
+            'scaf_xo': scaf_xo,
+            'stap_seg': stap_seg,
+            'stap_xo': stap_xo,
+            'insertions': insertion_list,
+            'stap_colors': helix['stap_colors']
+            }
+# end def
+
+
+def readSegments(strandtype: EnumType, vh_num: int, bases: list) -> Tuple[List[int], list]:
+    """Find the segment ends and the 3' crossovers of a ``scaf`` or ``stap``
+    list
+
+    Returns:
+        tuple of the form (segment ends, crossovers) where the segment ends
+        pair up as low and high indices and crossovers are tuples of form
+        (index, 3' virtual helix, 3' index)
+
+    Raises:
+        AssertionError: odd number of segment ends
+    """
+    seg = []
+    xo = []
+    for i in range(len(bases)):
+        five_vh, five_idx, three_vh, three_idx = bases[i]
+        if five_vh == -1 and three_vh == -1:
+            continue  # null base
+        if isSegmentStartOrEnd(strandtype, vh_num, i, five_vh,
+                               five_idx, three_vh, three_idx):
+            seg.append(i)
+        if five_vh != vh_num and three_vh != vh_num:  # special case
+            seg.append(i)  # end segment on a double crossover
+        if is3primeXover(strandtype, vh_num, i, three_vh, three_idx):
+            xo.append((i, three_vh, three_idx))
+    assert (len(seg) % 2 == 0)
+    return seg, xo
+# end def
+
+
+def decodeHelices(document: DocT, helices: List[dict], obj: dict, emit_signals: bool = True):
+    """Populate the document from helices read by :func:`readHelix`
+
+    Args:
+        document:
+        helices: the ``vstrands`` of a cadnano 2 file in :func:`readHelix`
+            form
+        obj: the rest of the file, i.e. ``oligos`` and ``modifications``
+        emit_signals: whether to signal views
+
+    Raises:
+        IOError, TypeError
+    """
+    num_bases = helices[0]['length']
     if num_bases % 32 == 0:
         lattice_type = LatticeEnum.SQUARE
         grid_type = GridEnum.SQUARE
@@ -46,7 +147,7 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
     part = None
     # DETERMINE MAX ROW,COL
     max_row_json = max_col_json = 0
-    for helix in obj['vstrands']:
+    for helix in helices:
         max_row_json = max(max_row_json, int(helix['row'])+1)
         max_col_json = max(max_col_json, int(helix['col'])+1)
 
@@ -73,7 +174,7 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
     min_col, max_col = 10000, -10000
 
     # find row, column limits
-    for helix in obj['vstrands']:
+    for helix in helices:
         row = helix['row']
         if row < min_row:
             min_row = row
@@ -100,11 +201,10 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
     # print("\trows(%d, %d): avg: %d" % (min_row, max_row, delta_row))
     # print("\tcolumns(%d, %d): avg: %d" % (min_col, max_col, delta_column))
 
-    for helix in obj['vstrands']:
+    for helix in helices:
         vh_num = helix['num']
         row = helix['row']
         col = helix['col']
-        scaf = helix['scaf']
         # align row and columns to the center 0, 0
         if HoneycombDnaPart.isEvenParity(row, col):
             coord = (row - delta_row, col - delta_column)
@@ -116,11 +216,18 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
 
     # make sure we retain the original order
     radius = DEFAULT_RADIUS
-    for vh_num in sorted(vh_num_to_coord.keys()):
+    vh_nums = sorted(vh_num_to_coord.keys())
+    x_list, y_list = [], []
+    for vh_num in vh_nums:
         row, col = vh_num_to_coord[vh_num]
         x, y = doLattice(radius, row, col)
-        part.createVirtualHelix(x, y, 0., num_bases,
-                                id_num=vh_num, use_undostack=False)
+        x_list.append(x)
+        y_list.append(y)
+    if vh_nums:
+        part.batchCreateVirtualHelices(x_list, y_list,
+                                       length=[num_bases]*len(vh_nums),
+                                       id_nums=vh_nums,
+                                       use_undo_stack=False)
     # zoom to fit
     if emit_signals:
         part.partZDimensionsChangedSignal.emit(part, *part.zBoundsIds(), True)
@@ -130,77 +237,30 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
     setReopen(False)
     setBatch(False)
 
-    # INSTALL STRANDS AND COLLECT XOVER LOCATIONS
-    scaf_seg = defaultdict(list)
-    scaf_xo = defaultdict(list)
-    stap_seg = defaultdict(list)
-    stap_xo = defaultdict(list)
-    try:
-        for helix in obj['vstrands']:
-            vh_num = helix['num']
-            row, col = vh_num_to_coord[vh_num]
-            scaf = helix['scaf']
-            stap = helix['stap']
-            insertions = helix['loop']
-            skips = helix['skip']
-
-            if isEven(row, col):
-                scaf_strand_set, stap_strand_set = part.getStrandSets(vh_num)
-            else:
-                stap_strand_set, scaf_strand_set = part.getStrandSets(vh_num)
-
-            # validate file serialization of lists
-            assert(len(scaf) == len(stap) and
-                   len(scaf) == len(insertions) and
-                   len(insertions) == len(skips))
-
-            # read scaffold segments and xovers
-            for i in range(len(scaf)):
-                five_vh, five_idx, three_vh, three_idx = scaf[i]
-                if five_vh == -1 and three_vh == -1:
-                    continue  # null base
-                if isSegmentStartOrEnd(StrandEnum.SCAFFOLD, vh_num, i, five_vh,
-                                       five_idx, three_vh, three_idx):
-                    scaf_seg[vh_num].append(i)
-                if five_vh != vh_num and three_vh != vh_num:  # special case
-                    scaf_seg[vh_num].append(i)  # end segment on a double crossover
-                if is3primeXover(StrandEnum.SCAFFOLD, vh_num, i, three_vh, three_idx):
-                    scaf_xo[vh_num].append((i, three_vh, three_idx))
-            assert (len(scaf_seg[vh_num]) % 2 == 0)
-
-            # install scaffold segments
-            for i in range(0, len(scaf_seg[vh_num]), 2):
-                low_idx = scaf_seg[vh_num][i]
-                high_idx = scaf_seg[vh_num][i + 1]
-                scaf_strand_set.createStrand(low_idx, high_idx, use_undostack=False)
-
-            # read staple segments and xovers
-            for i in range(len(stap)):
-                five_vh, five_idx, three_vh, three_idx = stap[i]
-                if five_vh == -1 and three_vh == -1:
-                    continue  # null base
-                if isSegmentStartOrEnd(StrandEnum.STAPLE, vh_num, i, five_vh,
-                                       five_idx, three_vh, three_idx):
-                    stap_seg[vh_num].append(i)
-                if five_vh != vh_num and three_vh != vh_num:  # special case
-                    stap_seg[vh_num].append(i)  # end segment on a double crossover
-                if is3primeXover(StrandEnum.STAPLE, vh_num, i, three_vh, three_idx):
-                    stap_xo[vh_num].append((i, three_vh, three_idx))
-            assert (len(stap_seg[vh_num]) % 2 == 0)
-
-            # install staple segments
-            for i in range(0, len(stap_seg[vh_num]), 2):
-                low_idx = stap_seg[vh_num][i]
-                high_idx = stap_seg[vh_num][i + 1]
-                stap_strand_set.createStrand(low_idx, high_idx, use_undostack=False)
-            part.refreshSegments(vh_num)
-        # end for
-    except AssertionError:
-        print("Unrecognized file format.")
-        raise
+    # INSTALL STRANDS
+    for helix in helices:
+        vh_num = helix['num']
+        row, col = vh_num_to_coord[vh_num]
+
+        if isEven(row, col):
+            scaf_strand_set, stap_strand_set = part.getStrandSets(vh_num)
+        else:
+            stap_strand_set, scaf_strand_set = part.getStrandSets(vh_num)
+
+        # install scaffold segments
+        scaf_seg = helix['scaf_seg']
+        for i in range(0, len(scaf_seg), 2):
+            scaf_strand_set.createStrand(scaf_seg[i], scaf_seg[i + 1], use_undostack=False)
+
+        # install staple segments
+        stap_seg = helix['stap_seg']
+        for i in range(0, len(stap_seg), 2):
+            stap_strand_set.createStrand(stap_seg[i], stap_seg[i + 1], use_undostack=False)
+        part.refreshSegments(vh_num)
+    # end for
 
     # INSTALL XOVERS
-    for helix in obj['vstrands']:
+    for helix in helices:
         vh_num = helix['num']
         row, col = vh_num_to_coord[vh_num]
 
@@ -210,7 +270,7 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
             stap_strand_set, scaf_strand_set = part.getStrandSets(vh_num)
 
         # install scaffold xovers
-        for (idx5p, to_vh_num, idx3p) in scaf_xo[vh_num]:
+        for (idx5p, to_vh_num, idx3p) in helix['scaf_xo']:
             # idx3p is 3' end of strand5p, idx5p is 5' end of strand3p
             try:
                 strand5p = scaf_strand_set.getStrand(idx5p)
@@ -232,7 +292,7 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
                              use_undostack=False)
 
         # install staple xovers
-        for (idx5p, to_vh_num, idx3p) in stap_xo[vh_num]:
+        for (idx5p, to_vh_num, idx3p) in helix['stap_xo']:
             # idx3p is 3' end of strand5p, idx5p is 5' end of strand3p
             strand5p = stap_strand_set.getStrand(idx5p)
             coord = vh_num_to_coord[to_vh_num]
@@ -252,13 +312,9 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
     RefreshOligosCommand(part).redo()
 
     # COLORS, INSERTIONS, SKIPS
-    for helix in obj['vstrands']:
+    for helix in helices:
         vh_num = helix['num']
         row, col = vh_num_to_coord[vh_num]
-        scaf = helix['scaf']
-        stap = helix['stap']
-        insertions = helix['loop']
-        skips = helix['skip']
 
         if isEven(row, col):
             scaf_strand_set, stap_strand_set = part.getStrandSets(vh_num)
@@ -266,13 +322,11 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
             stap_strand_set, scaf_strand_set = part.getStrandSets(vh_num)
 
         # install insertions and skips
-        for base_idx in range(len(stap)):
-            sum_of_insert_skip = insertions[base_idx] + skips[base_idx]
-            if sum_of_insert_skip != 0:
-                strand = scaf_strand_set.getStrand(base_idx)
-                strand.addInsertion(base_idx,
-                                    sum_of_insert_skip,
-                                    use_undostack=False)
+        for base_idx, sum_of_insert_skip in helix['insertions']:
+            strand = scaf_strand_set.getStrand(base_idx)
+            strand.addInsertion(base_idx,
+                                sum_of_insert_skip,
+                                use_undostack=False)
         # end for
         # populate colors
         for base_idx, color_number in helix['stap_colors']:
@@ -1,15 +1,24 @@
 # -*- coding: utf-8 -*-
 from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
     Tuple,
     Set
 )
 
+import numpy as np
+
 from cadnano.fileio.lattice import (
     HoneycombDnaPart,
     SquareDnaPart
 )
+from cadnano.decorators.insertion import Insertion
+from cadnano.oligo import Oligo
 from cadnano.part.nucleicacidpart import DEFAULT_RADIUS
 from cadnano.part.refresholigoscmd import RefreshOligosCommand
+from cadnano.strand import Strand
 from cadnano.proxies.cnenum import (
     GridEnum,
     PointEnum,
@@ -19,10 +28,15 @@ from cadnano.proxies.cnenum import (
 from cadnano.objectinstance import ObjectInstance
 from cadnano.cntypes import (
     DocT,
+    NucleicAcidPartT,
+    OligoT,
+    PointsT,
     Vec3T
 )
 
-def decode(document: DocT, obj: dict, emit_signals: bool = True):
+StrandTablesT = Tuple[np.ndarray, np.ndarray, List[str]]
+
+def decode(document: DocT, obj: dict, emit_signals: bool = True, fast: bool = True):
     """Parses a dictionary (obj) created from reading a json file and uses it
     to populate the given document with model data.
 
@@ -30,13 +44,27 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
         document:
         obj:
         emit_signals: whether to signal views
+        fast: use the bulk loader of :func:`decodePart`, default is ``True``
 
     Raises:
         AssertionError, TypeError
     """
     obj.get('name')
+    decodeParts(document, obj['parts'], emit_signals=emit_signals, fast=fast)
+    decodeModifications(document, obj['modifications'])
+# end def
+
+def decodeParts(document: DocT, part_dicts: Iterable[dict],
+                emit_signals: bool = True, fast: bool = True):
+    """Decode each part of the ``parts`` list of a file as it is iterated
 
-    for part_dict in obj['parts']:
+    Args:
+        document:
+        part_dicts: the ``dict`` of each part
+        emit_signals: whether to signal views
+        fast: use the bulk loader of :func:`decodePart`
+    """
+    for part_dict in part_dicts:
         grid_type = determineLatticeType(part_dict)
 
         # NOTE: NC 2018.05.15 THIS is commented out since it violates model view
@@ -46,10 +74,16 @@ def decode(document: DocT, obj: dict, emit_signals: bool = True):
         # document.setSliceOrGridViewVisible(view_type=ortho_view_type)
 
         decodePart(document, part_dict, grid_type=grid_type,
-                   emit_signals=emit_signals)
+                   emit_signals=emit_signals, fast=fast)
+# end def
 
-    modifications = obj['modifications']
+def decodeModifications(document: DocT, modifications: dict):
+    """Install the ``modifications`` of a file, after all parts are decoded
 
+    Args:
+        document:
+        modifications:
+    """
     for mod_id, item in modifications.items():
         document.createMod(item['props'], mod_id)
         ext_locations = item['ext_locations']
@@ -73,8 +107,8 @@ def determineLatticeType(part_dict: dict) -> EnumType:
     if grid_type is not None:
         return grid_type
 
-    vh_id_list = part_dict.get('vh_list')
-    origins = part_dict.get('origins')
+    vh_id_list = _rows(part_dict.get('vh_list'))
+    origins = _rows(part_dict.get('origins'))
 
     square_delta_x = 0.
     square_delta_y = 0.
@@ -112,14 +146,35 @@ def determineLatticeType(part_dict: dict) -> EnumType:
 def decodePart( document: DocT,
                 part_dict: dict,
                 grid_type: EnumType,
-                emit_signals: bool = False):
+                emit_signals: bool = False,
+                fast: bool = True,
+                points: PointsT = None) -> NucleicAcidPartT:
     """Decode a a deserialized Part dictionary
 
+    With ``fast`` set, virtual helices are created in one batch and strands,
+    crossovers and oligos are built directly rather than through per strand
+    commands, with segments computed once per virtual helix.  The resulting
+    model is the same as with ``fast=False``.  Parts the bulk loader can't
+    handle, i.e. crossovers that require splitting a strand, fall back to the
+    per strand commands.
+
+    The tables of ``part_dict``, i.e. ``origins``, ``directions``,
+    ``vh_list``, ``insertions`` and ``xovers``, may be arrays and the
+    ``strands`` may be given as the flat tables of :func:`strandTables`, as
+    read from a binary file.
+
     Args:
         document:
         part_dict: deserialized dictionary describing the Part
         grid_type:
         emit_signals:
+        fast: use the bulk loader, default is ``True``
+        points: optional, the axis, forward and reverse points of the
+            virtual helices in ``vh_list`` order, used instead of computing
+            them if they match the virtual helix lengths and ``fast`` is set
+
+    Returns:
+        the new part
     """
     if ( part_dict.get('point_type') == PointEnum.ARBITRARY or
         not part_dict.get('is_lattice', True) ):
@@ -132,75 +187,20 @@ def decodePart( document: DocT,
                                             grid_type=grid_type)
     part.setActive(True)
 
-    vh_id_list = part_dict.get('vh_list')
-    vh_props = part_dict.get('virtual_helices')
     origins = part_dict.get('origins', [])
-    directions = part_dict.get('directions', [])
-    keys = list(vh_props.keys())
-
     if len(origins) == 0:
         raise ValueError("no virtual_helices found, origins length zero")
 
-    if not is_lattice or len(origins[0]) == 3:
-        for id_num, size in vh_id_list:
-            x, y, z = origins[id_num]
-            direction = directions[id_num]
-            vh_props['eulerZ'][id_num] = 0.5*(360./10.5)
-            vals = [vh_props[k][id_num] for k in keys]
-            part.createVirtualHelix(x, y, z, size,
-                                    id_num=id_num,
-                                    direction=direction,
-                                    properties=(keys, vals),
-                                    safe=False,
-                                    use_undostack=False)
-    else:
-        for id_num, size in vh_id_list:
-            x, y = origins[id_num]
-            z = vh_props['z'][id_num]
-            vh_props['eulerZ'][id_num] = 0.5*(360./10.5)
-            vals = [vh_props[k][id_num] for k in keys]
-            part.createVirtualHelix(x, y, z, size,
-                                    id_num=id_num,
-                                    properties=(keys, vals),
-                                    safe=False,
-                                    use_undostack=False)
-        # end for
+    if not (fast and _batchCreateVirtualHelices(part, part_dict, is_lattice, points)):
+        _createVirtualHelices(part, part_dict, is_lattice)
         # zoom to fit
     if emit_signals:
         part.partZDimensionsChangedSignal.emit(part, *part.zBoundsIds(), True)
 
-    strands = part_dict['strands']
-    strand_index_list = strands['indices']
-    color_list = strands['properties']
-    for i in range(len(vh_id_list)):
-        id_num = vh_id_list[i][0]
-        idx_set = strand_index_list[i]
-        if idx_set is not None:
-            fwd_strand_set, rev_strand_set = part.getStrandSets(id_num)
-            fwd_idxs, rev_idxs = idx_set
-            fwd_colors, rev_colors = color_list[i]
-            for idxs, color in zip(fwd_idxs, fwd_colors):
-                low_idx, high_idx = idxs
-                fwd_strand_set.createDeserializedStrand(low_idx, high_idx, color,
-                                                        use_undostack=False)
-            for idxs, color in zip(rev_idxs, rev_colors):
-                low_idx, high_idx = idxs
-                rev_strand_set.createDeserializedStrand(low_idx, high_idx, color,
-                                                        use_undostack=False)
-            part.refreshSegments(id_num)   # update segments
-    # end for
+    oligos = _installStrandsFast(part, part_dict) if fast else None
+    if oligos is None:
+        _installStrands(part, part_dict)
 
-    xovers = part_dict['xovers']
-    for from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx in xovers:
-        from_strand = part.getStrand(from_is_fwd, from_id, from_idx)
-        to_strand = part.getStrand(to_is_fwd, to_id, to_idx)
-        part.createXover(from_strand, from_idx,
-                         to_strand, to_idx,
-                         update_oligo=False,
-                         use_undostack=False)
-    # end for
-
-    RefreshOligosCommand(part).redo()
     for oligo in part_dict['oligos']:
         id_num = oligo['id_num']
         idx = oligo['idx5p']
@@ -215,17 +215,11 @@ def decodePart( document: DocT,
     # end for
 
     # INSERTIONS, SKIPS
-    for id_num, idx, length in part_dict['insertions']:
-        fwd_strand = part.getStrand(True, id_num, idx)
-        rev_strand = part.getStrand(False, id_num, idx)
-        if fwd_strand:
-            fwd_strand.addInsertion(idx, length, use_undostack=False)
-        elif rev_strand:
-            rev_strand.addInsertion(idx, length, use_undostack=False)
-        else:
-            ins = 'Insertion' if length > 0 else 'Skip'
-            print("Cannot find strand for {} at {}[{}]".format(ins, id_num, idx))
-    # end for
+    if oligos is None:
+        _installInsertions(part, part_dict)
+    else:
+        _installInsertionsFast(part, part_dict, oligos)
+        _emitStrandsAdded(part, part_dict, oligos)
 
     # TODO fix this to set position
     # instance_props = part_dict['instance_properties']    # list
@@ -245,6 +239,445 @@ def decodePart( document: DocT,
         if value is not None:
             part.setProperty(key, value, use_undostack=False)
             part.partPropertyChangedSignal.emit(part, key, value)
+    return part
+# end def
+
+
+def _rows(table) -> list:
+    """Rows of a table of a part dictionary given as a list or as an array
+    read from a binary file
+    """
+    return table.tolist() if isinstance(table, np.ndarray) else table
+# end def
+
+
+def _helixOrigin(part_dict: dict, id_num: int, is_lattice: bool) -> Vec3T:
+    origin = part_dict['origins'][id_num]
+    if not is_lattice or len(origin) == 3:
+        return tuple(origin)
+    x, y = origin
+    return x, y, part_dict['virtual_helices']['z'][id_num]
+# end def
+
+
+def _helixOrigins(part_dict: dict, id_nums: List[int], is_lattice: bool) -> np.ndarray:
+    """Array version of :func:`_helixOrigin`
+
+    Returns:
+        n x 3 origins of the virtual helices ``id_nums``
+    """
+    origins = np.asarray(part_dict['origins'], dtype=float)[id_nums]
+    if not is_lattice or origins.shape[1] == 3:
+        return origins
+    z = part_dict['virtual_helices']['z']
+    return np.column_stack((origins, [z[id_num] for id_num in id_nums]))
+# end def
+
+
+def _createVirtualHelices(part: NucleicAcidPartT, part_dict: dict, is_lattice: bool):
+    """Create the virtual helices of a part one at a time
+
+    Args:
+        part:
+        part_dict: deserialized dictionary describing the Part
+        is_lattice:
+    """
+    vh_id_list = _rows(part_dict.get('vh_list'))
+    vh_props = part_dict.get('virtual_helices')
+    directions = _rows(part_dict.get('directions', []))
+    keys = list(vh_props.keys())
+    is_3d = not is_lattice or len(part_dict['origins'][0]) == 3
+    for id_num, size in vh_id_list:
+        x, y, z = _helixOrigin(part_dict, id_num, is_lattice)
+        vh_props['eulerZ'][id_num] = 0.5*(360./10.5)
+        vals = [vh_props[k][id_num] for k in keys]
+        if is_3d:
+            part.createVirtualHelix(x, y, z, size,
+                                    id_num=id_num,
+                                    direction=directions[id_num],
+                                    properties=(keys, vals),
+                                    safe=False,
+                                    use_undostack=False)
+        else:
+            part.createVirtualHelix(x, y, z, size,
+                                    id_num=id_num,
+                                    properties=(keys, vals),
+                                    safe=False,
+                                    use_undostack=False)
+    # end for
+# end def
+
+
+def _batchCreateVirtualHelices(part: NucleicAcidPartT, part_dict: dict, is_lattice: bool,
+                               points: PointsT = None) -> bool:
+    """Create the virtual helices of a part with
+    :meth:`NucleicAcidPart.batchCreateVirtualHelices`, applying the same
+    minimum length as :meth:`NucleicAcidPart.createVirtualHelix`
+
+    Args:
+        part:
+        part_dict: deserialized dictionary describing the Part
+        is_lattice:
+        points: optional, see :func:`decodePart`
+
+    Returns:
+        ``False`` if nothing was created because origins repeat, which
+        :meth:`NucleicAcidPart.createVirtualHelix` skips, ``True`` otherwise
+    """
+    vh_id_list = _rows(part_dict.get('vh_list'))
+    if not vh_id_list:
+        return True
+    vh_props = part_dict.get('virtual_helices')
+    keys = list(vh_props.keys())
+    is_3d = not is_lattice or len(part_dict['origins'][0]) == 3
+
+    id_nums = [id_num for id_num, _ in vh_id_list]
+    origins = _helixOrigins(part_dict, id_nums, is_lattice)
+    rounded = np.around(origins, decimals=9)
+    if len(np.unique(rounded, axis=0)) != len(id_nums):
+        return False
+
+    euler_z = vh_props['eulerZ']
+    for id_num in id_nums:
+        euler_z[id_num] = 0.5*(360./10.5)
+    columns = [vh_props[k] for k in keys]
+    properties_list = [(keys, [column[id_num] for column in columns]) for id_num in id_nums]
+    min_length = part.getProperty('max_vhelix_length')
+    lengths = [max(size, min_length) for _, size in vh_id_list]
+    if points is not None and lengths != [size for _, size in vh_id_list]:
+        # the points do not cover the lengthened virtual helices
+        points = None
+    directions = None
+    if is_3d:
+        directions = np.asarray(part_dict['directions'], dtype=float)[id_nums].tolist()
+    x_list, y_list, z_list = origins.T.tolist()
+    part.batchCreateVirtualHelices(x_list, y_list, z_list,
+                                   length=lengths,
+                                   id_nums=id_nums,
+                                   properties_list=properties_list,
+                                   safe_list=[False]*len(id_nums),
+                                   use_undo_stack=False,
+                                   directions=directions,
+                                   points=points)
+    return True
+# end def
+
+
+def _installStrands(part: NucleicAcidPartT, part_dict: dict):
+    """Create strands and crossovers with per strand commands then assign
+    oligos
+
+    Args:
+        part:
+        part_dict: deserialized dictionary describing the Part
+    """
+    counts, idxs, colors = strandTables(part_dict)
+    idxs = idxs.tolist()
+    i = 0
+    for (id_num, _), (fwd_count, rev_count) in zip(_rows(part_dict['vh_list']), counts.tolist()):
+        if fwd_count < 0:
+            continue
+        for strand_set, count in zip(part.getStrandSets(id_num), (fwd_count, rev_count)):
+            for (low_idx, high_idx), color in zip(idxs[i:i + count], colors[i:i + count]):
+                strand_set.createDeserializedStrand(low_idx, high_idx, color,
+                                                    use_undostack=False)
+            i += count
+        part.refreshSegments(id_num)   # update segments
+    # end for
+
+    xovers = _rows(part_dict['xovers'])
+    for from_id, from_is_fwd, from_idx, to_id, to_is_fwd, to_idx in xovers:
+        from_strand = part.getStrand(from_is_fwd, from_id, from_idx)
+        to_strand = part.getStrand(to_is_fwd, to_id, to_idx)
+        part.createXover(from_strand, from_idx,
+                         to_strand, to_idx,
+                         update_oligo=False,
+                         use_undostack=False)
+    # end for
+
+    RefreshOligosCommand(part).redo()
+# end def
+
+
+def _installInsertions(part: NucleicAcidPartT, part_dict: dict):
+    for id_num, idx, length in _rows(part_dict['insertions']):
+        fwd_strand = part.getStrand(True, id_num, idx)
+        rev_strand = part.getStrand(False, id_num, idx)
+        if fwd_strand:
+            fwd_strand.addInsertion(idx, length, use_undostack=False)
+        elif rev_strand:
+            rev_strand.addInsertion(idx, length, use_undostack=False)
+        else:
+            ins = 'Insertion' if length > 0 else 'Skip'
+            print("Cannot find strand for {} at {}[{}]".format(ins, id_num, idx))
+    # end for
+# end def
+
+
+def strandTables(part_dict: dict) -> StrandTablesT:
+    """The strands of a part as flat tables, in ``vh_list`` order with the
+    forward strands of a virtual helix first
+
+    Args:
+        part_dict: deserialized dictionary describing the Part, whose
+            ``strands`` are either the nested lists of a json file or
+            already these tables, keyed ``counts``, ``idxs`` and ``colors``
+
+    Returns:
+        tuple of form::
+
+            (counts, idxs, colors)
+
+        where ``counts`` holds the number of forward and reverse strands of
+        each virtual helix, ``-1`` for a virtual helix without strand sets,
+        ``idxs`` the low and high index of each strand and ``colors`` its
+        color
+    """
+    strands = part_dict['strands']
+    if 'counts' in strands:
+        return (np.asarray(strands['counts']).reshape((-1, 2)),
+                np.asarray(strands['idxs']).reshape((-1, 2)),
+                strands['colors'])
+    counts = []
+    idxs = []
+    colors = []
+    for idx_set, color_set in zip(strands['indices'], strands['properties']):
+        if idx_set is None:
+            counts.append((-1, -1))
+            continue
+        counts.append((len(idx_set[0]), len(idx_set[1])))
+        for ss_idxs, ss_colors in zip(idx_set, color_set):
+            idxs += ss_idxs
+            colors += ss_colors
+    return (np.array(counts, dtype=int).reshape((-1, 2)),
+            np.array(idxs, dtype=int).reshape((-1, 2)),
+            colors)
+# end def
+
+
+def _sortStrands(part: NucleicAcidPartT,
+                 id_nums: List[int],
+                 counts: np.ndarray,
+                 idxs: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Number the strand sets of :func:`strandTables` and sort the strands
+    by strand set and low index
+
+    Args:
+        part:
+        id_nums: the ``vh_list`` ID numbers
+        counts: from :func:`strandTables`
+        idxs: from :func:`strandTables`
+
+    Returns:
+        tuple of form::
+
+            (order, set_of_strand)
+
+        where ``order`` sorts the strands and ``set_of_strand`` holds the
+        sorted strand set numbers, ``2*i`` and ``2*i + 1`` for the forward
+        and reverse strand set of the i-th virtual helix, or ``None`` if a
+        strand is out of bounds or strands overlap
+    """
+    set_counts = np.maximum(counts, 0).ravel()
+    if set_counts.sum() != len(idxs):
+        return None
+    set_of_strand = np.repeat(np.arange(len(set_counts)), set_counts)
+    set_sizes = np.array([strand_set.length() for id_num in id_nums
+                          for strand_set in part.getStrandSets(id_num)], dtype=int)
+    lows = idxs[:, 0].astype(int)
+    highs = idxs[:, 1].astype(int)
+    if not np.all((0 <= lows) & (lows <= highs) & (highs < set_sizes[set_of_strand])):
+        return None
+    order = np.lexsort((lows, set_of_strand))
+    set_of_strand = set_of_strand[order]
+    lows, highs = lows[order], highs[order]
+    if np.any((set_of_strand[1:] == set_of_strand[:-1]) & (lows[1:] <= highs[:-1])):
+        return None
+    return order, set_of_strand
+# end def
+
+
+def _linkXovers(xovers: np.ndarray,
+                id_nums: List[int],
+                set_of_strand: np.ndarray,
+                lows: np.ndarray,
+                highs: np.ndarray) -> Optional[List[Tuple[int, int]]]:
+    """Resolve each serialized crossover to the strands it joins, replaying
+    the checks of :meth:`NucleicAcidPart.createXover`
+
+    Args:
+        xovers: n x 6 crossovers
+        id_nums: the ``vh_list`` ID numbers
+        set_of_strand: sorted strand set numbers, see :func:`_sortStrands`
+        lows: sorted low indices of the strands
+        highs: sorted high indices of the strands
+
+    Returns:
+        list of pairs of sorted strand positions or ``None`` if a crossover
+        needs a strand split or would be refused
+    """
+    if not len(xovers):
+        return []
+    ids = xovers[:, [0, 3]]
+    is_fwd = xovers[:, [1, 4]].astype(bool)
+    idxs = xovers[:, [2, 5]]
+    if not len(lows) or ids.min() < 0 or idxs.min() < 0:
+        return None
+    position_of_id = np.full(max(max(id_nums), ids.max()) + 1, -1, dtype=int)
+    position_of_id[id_nums] = np.arange(len(id_nums))
+    positions = position_of_id[ids]
+    sets = 2*positions + ~is_fwd
+    span = max(highs.max(), idxs.max()) + 1
+    k = np.searchsorted(set_of_strand*span + lows, sets*span + idxs, side='right') - 1
+    k_valid = np.maximum(k, 0)
+    if not np.all((positions >= 0) & (k >= 0) & (set_of_strand[k_valid] == sets) &
+                  (highs[k_valid] >= idxs)):
+        return None
+    from_k, to_k = k[:, 0], k[:, 1]
+    if not np.array_equal(idxs[:, 0], np.where(is_fwd[:, 0], highs[from_k], lows[from_k])):
+        return None     # the 5' strand needs a split
+    if not np.array_equal(idxs[:, 1], np.where(is_fwd[:, 1], lows[to_k], highs[to_k])):
+        return None     # the 3' strand needs a split
+    # Strand.hasXoverAt checks the high end first
+    checks_3p = (idxs[:, 1] == highs[to_k]) == is_fwd[:, 1]
+    connected_3p = set()
+    connected_5p = set()
+    links = list(zip(from_k.tolist(), to_k.tolist()))
+    for (from_key, to_key), check_3p in zip(links, checks_3p.tolist()):
+        if to_key in (connected_3p if check_3p else connected_5p):
+            return None
+        connected_3p.add(from_key)
+        connected_5p.add(to_key)
+    return links
+# end def
+
+
+def _installStrandsFast(part: NucleicAcidPartT, part_dict: dict) -> Optional[List[OligoT]]:
+    """Bulk version of :func:`_installStrands`.  Strands are added to the
+    strand arrays and heaps directly, crossovers set the strand connections
+    and oligos are assigned in the same order ``RefreshOligosCommand`` does,
+    so every oligo gets the same 5' strand and color.  Crossovers are
+    matched to strands on the tables of :func:`strandTables`.
+
+    No signals are emitted, see :func:`_emitStrandsAdded`
+
+    Args:
+        part:
+        part_dict: deserialized dictionary describing the Part
+
+    Returns:
+        list of the new oligos or ``None`` if nothing was installed because
+        the part needs :func:`_installStrands`
+    """
+    id_nums = [id_num for id_num, _ in _rows(part_dict['vh_list'])]
+    counts, idxs, colors = strandTables(part_dict)
+    sorted_strands = _sortStrands(part, id_nums, counts, idxs)
+    if sorted_strands is None:
+        return None
+    order, set_of_strand = sorted_strands
+    lows = idxs[order, 0].astype(int)
+    highs = idxs[order, 1].astype(int)
+    xovers = np.asarray(part_dict['xovers'], dtype=int).reshape((-1, 6))
+    links = _linkXovers(xovers, id_nums, set_of_strand, lows, highs)
+    if links is None:
+        return None
+
+    # 1. strands
+    set_starts = np.searchsorted(set_of_strand, np.arange(2*len(id_nums) + 1)).tolist()
+    low_list = lows.tolist()
+    high_list = highs.tolist()
+    strands = []
+    strand_objects = {}
+    for i, (id_num, (fwd_count, _)) in enumerate(zip(id_nums, counts.tolist())):
+        if fwd_count < 0:
+            continue
+        for j, strandset in enumerate(part.getStrandSets(id_num)):
+            start, stop = set_starts[2*i + j], set_starts[2*i + j + 1]
+            new_strands = [Strand(strandset, low_idx, high_idx)
+                           for low_idx, high_idx in zip(low_list[start:stop], high_list[start:stop])]
+            strandset._setStrands(new_strands)
+            strands += new_strands
+            strand_objects[(id_num, j == 0)] = new_strands
+        part.refreshSegments(id_num)
+    colors = dict(zip(strands, [colors[k] for k in order.tolist()]))
+
+    # 2. crossovers
+    for from_k, to_k in links:
+        strand5p = strands[from_k]
+        strand3p = strands[to_k]
+        strand5p.setConnection3p(strand3p)
+        strand3p.setConnection5p(strand5p)
+
+    # 3. oligos, visiting strands in the order of RefreshOligosCommand
+    oligos = []
+    visited = set()
+    for id_num in list(part.getIdNums()):
+        for is_fwd in (False, True):
+            for strand in strand_objects.get((id_num, is_fwd), ()):
+                if strand in visited:
+                    continue
+                oligo = Oligo(part, colors[strand])
+                chain = list(strand.generator5pStrand())
+                strand5 = chain[-1]
+                is_circular = strand.connection3p() == strand5
+                if not is_circular:
+                    chain += list(strand.generator3pStrand())[1:]
+                strand.setChainOligo(oligo)
+                visited.update(chain)
+                oligo.setStrand5p(strand5)
+                if is_circular:
+                    oligo._setLoop(True)
+                oligo.refreshLength()
+                part._addOligoToSet(oligo)
+                oligos.append(oligo)
+    return oligos
+# end def
+
+
+def _installInsertionsFast(part: NucleicAcidPartT, part_dict: dict, oligos: List[OligoT]):
+    """Bulk version of :func:`_installInsertions` for strands installed by
+    :func:`_installStrandsFast`.  Insertions are stored directly and the
+    oligo lengths refreshed once.
+    """
+    if not len(part_dict['insertions']):
+        return
+    insertions = part.insertions()
+    for id_num, idx, length in _rows(part_dict['insertions']):
+        fwd_strand = part.getStrand(True, id_num, idx)
+        rev_strand = part.getStrand(False, id_num, idx)
+        strand = fwd_strand if fwd_strand else rev_strand
+        if strand:
+            insertions_on_vh = insertions[id_num]
+            low_idx, high_idx = strand.idxs()
+            if low_idx <= idx <= high_idx and idx not in insertions_on_vh:
+                # make sure length is -1 if a skip
+                insertions_on_vh[idx] = Insertion(idx, -1 if length < 0 else length)
+        else:
+            ins = 'Insertion' if length > 0 else 'Skip'
+            print("Cannot find strand for {} at {}[{}]".format(ins, id_num, idx))
+    # end for
+    for oligo in oligos:
+        oligo.refreshLength()
+# end def
+
+
+def _emitStrandsAdded(part: NucleicAcidPartT, part_dict: dict, oligos: List[OligoT]):
+    """Notify the views of everything :func:`_installStrandsFast` and
+    :func:`_installInsertionsFast` added, once the model is complete
+    """
+    for oligo in oligos:
+        part.partOligoAddedSignal.emit(part, oligo)
+    strandsets = [part.getStrandSets(id_num) for id_num, _ in _rows(part_dict['vh_list'])]
+    for fwd_ss, rev_ss in strandsets:
+        for strandset in (fwd_ss, rev_ss):
+            for strand in strandset.strand_heap:
+                strandset.strandsetStrandAddedSignal.emit(strandset, strand)
+            if strandset.strand_heap:
+                part.partStrandChangedSignal.emit(part, strandset.idNum())
+    for fwd_ss, rev_ss in strandsets:
+        for strandset in (fwd_ss, rev_ss):
+            for strand in strandset.strand_heap:
+                strand.strandConnectionChangedSignal.emit(strand)
 # end def
 
 
@@ -1,56 +1,42 @@
 from cadnano.proxies.cnproxy import UndoCommand
-from cadnano import util
+from cadnano.strand import sequenceengine
 from cadnano.cntypes import (
     OligoT
 )
 
 class ApplySequenceCommand(UndoCommand):
+    """Applies a sequence to an oligo and its complement to the strands
+    paired with it.  Undo restores the previous sequence of only the strands
+    whose sequence changed.
+    """
     def __init__(self, oligo: OligoT, sequence: str):
         super(ApplySequenceCommand, self).__init__("apply sequence")
         self._oligo = oligo
         self._new_sequence = sequence
-        self._old_sequence = oligo.sequence()
+        self._old_sequences = []    # (strand, sequence) of changed strands
+        self._oligo_list = []
     # end def
 
     def redo(self):
-        olg = self._oligo
         n_s = None if self._new_sequence is None else ''.join(self._new_sequence)
-        n_s_original = self._new_sequence
-        oligo_list = [olg]
-        for strand in olg.strand5p().generator3pStrand():
-            used_seq, n_s = strand.setSequence(n_s)
-            # get the compliment ahead of time
-            used_seq = None if used_seq is None else util.comp(used_seq)
-            for comp_strand in strand.getComplementStrands():
-                comp_strand.setComplementSequence(used_seq, strand)
-                oligo_list.append(comp_strand.oligo())
-            # end for
-            # as long as the new Applied Sequence is not None
-            if n_s is None and n_s_original is not None:
-                break
+        new_sequences, oligo_list = sequenceengine.applySequence(self._oligo, n_s)
+        old_sequences = []
+        for strand, sequence in new_sequences.items():
+            old_sequence = strand._sequence
+            if old_sequence != sequence:
+                old_sequences.append((strand, old_sequence))
+                strand._sequence = sequence
         # end for
+        self._old_sequences = old_sequences
+        self._oligo_list = oligo_list
         for oligo in oligo_list:
             oligo.oligoSequenceAddedSignal.emit(oligo)
     # end def
 
     def undo(self):
-        olg = self._oligo
-        o_s = None if self._old_sequence is None else ''.join(self._old_sequence)
-
-        oligo_list = [olg]
-
-        for strand in olg.strand5p().generator3pStrand():
-            used_seq, o_s = strand.setSequence(o_s)
-
-            # get the compliment ahead of time
-            used_seq = None if used_seq is None else util.comp(used_seq)
-            for comp_strand in strand.getComplementStrands():
-                comp_strand.setComplementSequence(used_seq, strand)
-                oligo_list.append(comp_strand.oligo())
-            # end for
-        # for
-
-        for oligo in oligo_list:
+        for strand, sequence in self._old_sequences:
+            strand._sequence = sequence
+        for oligo in self._oligo_list:
             oligo.oligoSequenceAddedSignal.emit(oligo)
     # end def
 # end class
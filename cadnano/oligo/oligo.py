@@ -35,6 +35,11 @@ PROPERTY_KEYS = ['name', 'color', 'length', 'is_visible']
 ALL_KEYS = ['id_num', 'idx5p', 'is_circular'] + PROPERTY_KEYS
 
 
+SEQUENCE_COLUMNS = ['Start', 'End', 'Color', 'Mod5',
+                    'Sequence', 'Mod3', 'AbstractSequence']
+"""Columns of a sequence export, see :meth:`Oligo.sequenceRow`"""
+
+
 class CircularOligoException(Exception):
     pass
 
@@ -129,6 +134,11 @@ class Oligo(CNObject):
 
     oligoSelectedChangedSignal = ProxySignal(CNObject, bool, name='oligoSelectedChangedSignal')
     """pyqtSignal(QObject, bool): (oligo, bool)"""
+
+    oligoStrandsMovedSignal = ProxySignal(CNObject, name='oligoStrandsMovedSignal')
+    """self: some or all strands of this oligo now belong to other oligos.
+    Emitted once instead of ``strandHasNewOligoSignal`` for every strand
+    """
     ### SLOTS ###
 
     ### ACCESSORS ###
@@ -239,9 +249,7 @@ class Oligo(CNObject):
         s5p = self._strand5p
         if self._is_circular:
             return s5p._strand5p
-        for strand in s5p.generator3pStrand():
-            pass
-        return strand
+        return s5p.chainEnds()[1]
     # end def
 
     def setStrand5p(self, strand: Strand):
@@ -301,9 +309,24 @@ class Oligo(CNObject):
         Returns:
             output with this oligo's values appended for each key
         """
+        for key, value in zip(SEQUENCE_COLUMNS, self.sequenceRow()):
+            output[key].append(value)
+        return output
+    # end def
+
+    def sequenceRow(self) -> Tuple[str, str, str, str, str, str, str]:
+        """The values of this oligo in a sequence export, in one pass over its
+        strands
+
+        Returns:
+            values for the columns of :data:`SEQUENCE_COLUMNS`
+
+        Raises:
+            CircularOligoException: circular oligos have no ends to export
+        """
         part = self.part()
-        vh_num5p = self.strand5p().idNum()
         strand5p = self.strand5p()
+        vh_num5p = strand5p.idNum()
         idx5p = strand5p.idx5Prime()
         seq = []
         a_seq = []
@@ -313,31 +336,17 @@ class Oligo(CNObject):
         for strand in strand5p.generator3pStrand():
             seq.append(Strand.sequence(strand, for_export=True))
             a_seq.append(Strand.abstractSeq(strand))
-            if strand.connection3p() is None:  # last strand in the oligo
-                vh_num3p = strand.idNum()
-                idx3p = strand.idx3Prime()
-        a_seq = ','.join(a_seq)
-        a_seq = "(%s)" % (a_seq)
+        # strand is the last strand in the oligo
+        vh_num3p = strand.idNum()
+        idx3p = strand.idx3Prime()
+        a_seq = "(%s)" % (','.join(a_seq))
         modseq5p, modseq5p_name = part.getStrandModSequence(strand5p, idx5p,
                                                             ModEnum.END_5PRIME)
         modseq3p, modseq3p_name = part.getStrandModSequence(strand, idx3p,
                                                             ModEnum.END_3PRIME)
-        seq = ''.join(seq)
-        seq = modseq5p + seq + modseq3p
-        # output = "%d[%d]\t%d[%d]\t%s\t%s\t%s\t%s\t(%s)\n" % \
-        #          (vh_num5p, idx5p, vh_num3p, idx3p, self.getColor(),
-        #           modseq5p_name, seq, modseq3p_name, a_seq)
-        # these are the keys
-        # keys = ['Start','End','Color', 'Mod5',
-        #         'Sequence','Mod3','AbstractSequence']
-        output['Start'].append("%d[%d]" % (vh_num5p, idx5p))
-        output['End'].append("%d[%d]" % (vh_num3p, idx3p))
-        output['Color'].append(self.getColor())
-        output['Mod5'].append(modseq5p_name)
-        output['Sequence'].append(seq)
-        output['Mod3'].append(modseq3p_name)
-        output['AbstractSequence'].append(a_seq)
-        return output
+        seq = modseq5p + ''.join(seq) + modseq3p
+        return ("%d[%d]" % (vh_num5p, idx5p), "%d[%d]" % (vh_num3p, idx3p),
+                self.getColor(), modseq5p_name, seq, modseq3p_name, a_seq)
     # end def
 
     def shouldHighlight(self) -> bool:
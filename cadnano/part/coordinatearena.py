@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+"""Pooled storage of the per virtual base coordinates of a
+:class:`NucleicAcidPart`
+
+Every virtual helix owns a block of rows in shared buffers with head room on
+both ends, so extending or trimming a virtual helix only touches its own
+rows.  A virtual helix that outgrows its block moves to a new block at the
+end of the buffers.  Rows not used by any virtual helix hold ``inf``
+coordinates and an ID number of ``-1``, so whole buffer queries can still
+run against the buffers directly.
+
+The Z extent and size of every virtual helix are kept per ID number, so the
+Z bounds and the longest virtual helix of a part are found without scanning
+the buffers.
+"""
+from typing import (
+    Dict,
+    List,
+    Set,
+    Tuple,
+    Union
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    PointsT,
+    Vec3T
+)
+
+FlatCoordinatesT = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+MIN_BLOCK_HEADROOM = 64
+"""Minimum number of free rows of a block, split between both ends
+"""
+
+
+def _blockCapacity(size: int) -> int:
+    return size + max(size // 2, MIN_BLOCK_HEADROOM)
+# end def
+
+
+class CoordinateArena(object):
+    """Per virtual base buffers ``axis_pts``, ``fwd_pts``, ``rev_pts``,
+    ``id_nums`` and ``indices`` shared by all virtual helices.
+
+    ``offset_and_size`` maps an ID number (list index) to the rows of a
+    virtual helix in the buffers and ``blocks`` to the rows reserved for it.
+
+    ``z_mins``, ``z_maxs`` and ``sizes`` are indexed by ID number and hold
+    the Z extent of the axis points and the number of points of every
+    virtual helix, ``inf``, ``-inf`` and 0 for unused ID numbers.  The Z
+    extent of a virtual helix whose points were added, removed or
+    overwritten is recomputed on the next :meth:`zBounds`.
+
+    Args:
+        size: initial number of rows
+    """
+
+    def __init__(self, size: int):
+        self.axis_pts = np.full((size, 3), np.inf, dtype=float)
+        self.fwd_pts = np.full((size, 3), np.inf, dtype=float)
+        self.rev_pts = np.full((size, 3), np.inf, dtype=float)
+        self.id_nums = np.full((size,), -1, dtype=int)
+        self.indices = np.zeros((size,), dtype=int)
+
+        self.offset_and_size: List[Union[None, Tuple[int, int]]] = []
+        self.blocks: Dict[int, Tuple[int, int]] = {}
+        self.total_points: int = 0
+        self.end: int = 0
+        """First row not reserved by any block"""
+        self.garbage: int = 0
+        """Number of rows below ``end`` reserved by no block"""
+        self._flat: FlatCoordinatesT = None
+
+        self.z_mins = np.empty((0,), dtype=float)
+        self.z_maxs = np.empty((0,), dtype=float)
+        self.sizes = np.empty((0,), dtype=int)
+        self._z_dirty: Set[int] = set()
+    # end def
+
+    def __len__(self) -> int:
+        return len(self.axis_pts)
+
+    def copy(self) -> 'CoordinateArena':
+        new_arena = CoordinateArena(0)
+        new_arena.axis_pts = self.axis_pts.copy()
+        new_arena.fwd_pts = self.fwd_pts.copy()
+        new_arena.rev_pts = self.rev_pts.copy()
+        new_arena.id_nums = self.id_nums.copy()
+        new_arena.indices = self.indices.copy()
+        new_arena.offset_and_size = self.offset_and_size.copy()
+        new_arena.blocks = self.blocks.copy()
+        new_arena.total_points = self.total_points
+        new_arena.end = self.end
+        new_arena.garbage = self.garbage
+        new_arena.z_mins = self.z_mins.copy()
+        new_arena.z_maxs = self.z_maxs.copy()
+        new_arena.sizes = self.sizes.copy()
+        new_arena._z_dirty = set(self._z_dirty)
+        return new_arena
+    # end def
+
+    def addHelix(self, id_num: int):
+        """Add an empty virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+        """
+        offset_and_size = self.offset_and_size
+        if id_num >= len(offset_and_size):
+            offset_and_size += [None]*(id_num - len(offset_and_size) + 1)
+        offset_and_size[id_num] = (self.end, 0)
+        self.blocks[id_num] = (self.end, 0)
+        num_ids = len(self.sizes)
+        if id_num >= num_ids:
+            new_num_ids = max(2*num_ids, id_num + 1, 64)
+            for name, fill in (('z_mins', np.inf), ('z_maxs', -np.inf), ('sizes', 0)):
+                old = getattr(self, name)
+                new = np.full((new_num_ids,), fill, dtype=old.dtype)
+                new[:num_ids] = old
+                setattr(self, name, new)
+        self._clearExtent(id_num)
+    # end def
+
+    def reserve(self, sizes: List[int]):
+        """Make room for the blocks of new virtual helices so that adding them
+        does not reallocate the buffers more than once
+
+        Args:
+            sizes: number of points of each new virtual helix
+        """
+        num_rows = self.end + sum(_blockCapacity(size) for size in sizes)
+        if num_rows > len(self.axis_pts):
+            self._grow(max(2*len(self.axis_pts), num_rows))
+    # end def
+
+    def insert(self, id_num: int, points: PointsT, is_right: bool) -> Tuple[int, int]:
+        """Add points to either end of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            points: tuple of n x 3 :obj:`array-like` of the axis, forward and
+                reverse points
+            is_right: whether to append or prepend
+
+        Returns:
+            the new offset and size of ``id_num``
+        """
+        new_axis_pts, new_fwd_pts, new_rev_pts = points
+        num_points = len(new_axis_pts)
+        offset, size = self.offset_and_size[id_num]
+        block_start, capacity = self.blocks[id_num]
+        new_size = size + num_points
+        self._flat = None
+
+        if is_right:
+            room = block_start + capacity - offset - size
+        else:
+            room = offset - block_start
+        if room < num_points:
+            offset = self._relocate(id_num, new_size, is_right)
+        elif not is_right:
+            offset -= num_points
+        if is_right:
+            lo, hi = offset + size, offset + new_size
+        else:
+            lo, hi = offset, offset + num_points
+        self.axis_pts[lo:hi] = new_axis_pts
+        self.fwd_pts[lo:hi] = new_fwd_pts
+        self.rev_pts[lo:hi] = new_rev_pts
+        self.id_nums[lo:hi] = id_num
+        if is_right:
+            self.indices[lo:hi] = np.arange(size, new_size)
+        else:
+            # prepending shifts every base index
+            self.indices[offset:offset + new_size] = np.arange(new_size)
+        self.offset_and_size[id_num] = (offset, new_size)
+        self.sizes[id_num] = new_size
+        self._z_dirty.add(id_num)
+        self.total_points += num_points
+        return offset, new_size
+    # end def
+
+    def trim(self, id_num: int, length: int, is_right: bool) -> bool:
+        """Remove points from either end of a virtual helix, removing the
+        virtual helix if all of its points are removed
+
+        Args:
+            id_num: virtual helix ID number
+            length: number of points to remove
+            is_right: whether to trim the end or the start
+
+        Returns:
+            ``True`` if ``id_num`` is removed, ``False`` otherwise
+
+        Raises:
+            IndexError: ``length`` exceeds the size of ``id_num``
+        """
+        offset, size = self.offset_and_size[id_num]
+        if length > size:
+            raise IndexError("length longer {} than indices existing".format(length))
+        self._flat = None
+        if length == size:
+            self.release(id_num)
+            return True
+        if is_right:
+            self._clearRows(offset + size - length, offset + size)
+        else:
+            self._clearRows(offset, offset + length)
+            offset += length
+            self.indices[offset:offset + size - length] -= length
+        self.offset_and_size[id_num] = (offset, size - length)
+        self.sizes[id_num] = size - length
+        self._z_dirty.add(id_num)
+        self.total_points -= length
+        return False
+    # end def
+
+    def release(self, id_num: int):
+        """Remove a virtual helix and free its block
+
+        Args:
+            id_num: virtual helix ID number
+        """
+        offset_and_size = self.offset_and_size
+        _, size = offset_and_size[id_num]
+        block_start, capacity = self.blocks.pop(id_num)
+        self._clearRows(block_start, block_start + capacity)
+        self.garbage += capacity
+        self.total_points -= size
+        self._flat = None
+        offset_and_size[id_num] = None
+        self._clearExtent(id_num)
+        # trim the unused id_nums at the end
+        while len(offset_and_size) > id_num and offset_and_size[-1] is None:
+            offset_and_size.pop()
+    # end def
+
+    def setPoints(self, id_num: int, points: PointsT, idx_start: int = 0):
+        """Overwrite the points of a virtual helix from an index on
+
+        Args:
+            id_num: virtual helix ID number
+            points: tuple of :obj:`array-like` of the axis, forward and
+                reverse points
+            idx_start: index of the first point to overwrite
+        """
+        new_axis_pts, new_fwd_pts, new_rev_pts = points
+        offset, _ = self.offset_and_size[id_num]
+        lo = offset + idx_start
+        hi = lo + len(new_axis_pts)
+        self.axis_pts[lo:hi] = new_axis_pts
+        self.fwd_pts[lo:hi] = new_fwd_pts
+        self.rev_pts[lo:hi] = new_rev_pts
+        self._z_dirty.add(id_num)
+        self._flat = None
+    # end def
+
+    def translate(self, id_num: int, delta: Vec3T):
+        """
+        Args:
+            id_num: virtual helix ID number
+            delta: of :obj:`float` of length 3
+        """
+        offset, size = self.offset_and_size[id_num]
+        lo, hi = offset, offset + size
+        self.axis_pts[lo:hi] += delta
+        self.fwd_pts[lo:hi] += delta
+        self.rev_pts[lo:hi] += delta
+        self.z_mins[id_num] += delta[2]
+        self.z_maxs[id_num] += delta[2]
+        self._flat = None
+    # end def
+
+    def translateMany(self, id_nums: List[int], delta: Vec3T):
+        """:meth:`translate` several virtual helices with one fancy indexed
+        add per buffer
+
+        Args:
+            id_nums: virtual helix ID numbers
+            delta: of :obj:`float` of length 3
+        """
+        offset_and_size = self.offset_and_size
+        offsets, sizes = zip(*[offset_and_size[id_num] for id_num in id_nums])
+        sizes = np.array(sizes, dtype=int)
+        starts = np.cumsum(sizes) - sizes
+        # row k of helix i is offsets[i] + k, i.e. the running count shifted
+        rows = np.arange(sizes.sum()) + np.repeat(np.array(offsets, dtype=int) - starts, sizes)
+        self.axis_pts[rows] += delta
+        self.fwd_pts[rows] += delta
+        self.rev_pts[rows] += delta
+        self.z_mins[id_nums] += delta[2]
+        self.z_maxs[id_nums] += delta[2]
+        self._flat = None
+    # end def
+
+    def zBounds(self) -> Tuple[int, int]:
+        """ID numbers of the virtual helices with the lowest and highest
+        axis point Z, ties going to the lowest ID number
+
+        Returns:
+            tuple of form (ID_z_min, ID_z_max), ``-1`` for a bound without
+            virtual helices
+        """
+        z_mins, z_maxs = self.z_mins, self.z_maxs
+        if self._z_dirty:
+            offset_and_size = self.offset_and_size
+            axis_z = self.axis_pts[:, 2]
+            for id_num in self._z_dirty:
+                offset, size = offset_and_size[id_num]
+                if size:
+                    z = axis_z[offset:offset + size]
+                    z_mins[id_num] = z.min()
+                    z_maxs[id_num] = z.max()
+                else:
+                    z_mins[id_num], z_maxs[id_num] = np.inf, -np.inf
+            self._z_dirty.clear()
+        if not len(z_mins):
+            return -1, -1
+        id_z_min = int(np.argmin(z_mins))
+        id_z_max = int(np.argmax(z_maxs))
+        if np.isinf(z_mins[id_z_min]):
+            id_z_min = -1
+        if np.isinf(z_maxs[id_z_max]):
+            id_z_max = -1
+        return id_z_min, id_z_max
+    # end def
+
+    def maxSize(self) -> int:
+        """
+        Returns:
+            the number of points of the longest virtual helix, 0 if there
+            are none
+        """
+        return int(self.sizes.max()) if len(self.sizes) else 0
+    # end def
+
+    def flatView(self) -> FlatCoordinatesT:
+        """Rows of all virtual helices without gaps ordered by ID number and
+        index, i.e. the layout of a single contiguous buffer.  Rebuilt on the
+        first call after a change.
+
+        Returns:
+            tuple of form (axis_pts, fwd_pts, rev_pts, id_nums, indices)
+        """
+        if self._flat is None:
+            spans = [np.arange(o_and_s[0], o_and_s[0] + o_and_s[1])
+                     for o_and_s in self.offset_and_size if o_and_s is not None]
+            rows = np.concatenate(spans) if spans else np.empty((0,), dtype=int)
+            self._flat = (self.axis_pts[rows], self.fwd_pts[rows], self.rev_pts[rows],
+                          self.id_nums[rows], self.indices[rows])
+        return self._flat
+    # end def
+
+    def compact(self, min_size: int = 0):
+        """Repack all blocks in ID number order dropping unused rows
+
+        Args:
+            min_size: minimum number of rows after compacting
+        """
+        offset_and_size = self.offset_and_size
+        live = [(id_num, o_and_s) for id_num, o_and_s in enumerate(offset_and_size)
+                if o_and_s is not None]
+        capacities = [_blockCapacity(size) for _, (_, size) in live]
+        packed = CoordinateArena(max(sum(capacities), min_size))
+        old_buffers = (self.axis_pts, self.fwd_pts, self.rev_pts, self.id_nums, self.indices)
+        new_buffers = (packed.axis_pts, packed.fwd_pts, packed.rev_pts,
+                       packed.id_nums, packed.indices)
+        blocks = self.blocks
+        block_start = 0
+        for (id_num, (offset, size)), capacity in zip(live, capacities):
+            new_offset = block_start + (capacity - size) // 2
+            for old, new in zip(old_buffers, new_buffers):
+                new[new_offset:new_offset + size] = old[offset:offset + size]
+            offset_and_size[id_num] = (new_offset, size)
+            blocks[id_num] = (block_start, capacity)
+            block_start += capacity
+        self.axis_pts, self.fwd_pts, self.rev_pts, self.id_nums, self.indices = new_buffers
+        self.end = block_start
+        self.garbage = 0
+        self._flat = None
+    # end def
+
+    def _relocate(self, id_num: int, new_size: int, is_right: bool) -> int:
+        """Move a virtual helix to a new block with room for ``new_size``
+        points
+
+        Returns:
+            the offset of ``id_num`` once the new points are added to the
+            end given by ``is_right``
+        """
+        capacity = _blockCapacity(new_size)
+        block_start = self._allocate(capacity)
+        # allocating may compact and move id_num
+        offset, size = self.offset_and_size[id_num]
+        old_block_start, old_capacity = self.blocks[id_num]
+        new_lo = block_start + (capacity - new_size) // 2
+        new_offset = new_lo if is_right else new_lo + new_size - size
+        for buffer in (self.axis_pts, self.fwd_pts, self.rev_pts, self.id_nums, self.indices):
+            buffer[new_offset:new_offset + size] = buffer[offset:offset + size]
+        self._clearRows(old_block_start, old_block_start + old_capacity)
+        self.garbage += old_capacity
+        self.blocks[id_num] = (block_start, capacity)
+        self.offset_and_size[id_num] = (new_offset, size)
+        return new_lo
+    # end def
+
+    def _allocate(self, capacity: int) -> int:
+        """Reserve rows at the end of the buffers, compacting or growing them
+        as required
+
+        Returns:
+            the first row reserved
+        """
+        num_rows = len(self.axis_pts)
+        if self.end + capacity > num_rows:
+            if self.garbage and 2*self.garbage >= self.end:
+                self.compact(num_rows)
+            num_rows = len(self.axis_pts)
+            if self.end + capacity > num_rows:
+                self._grow(max(2*num_rows, self.end + capacity))
+        block_start = self.end
+        self.end += capacity
+        return block_start
+    # end def
+
+    def _grow(self, num_rows: int):
+        old_rows = len(self.axis_pts)
+        for name, fill in (('axis_pts', np.inf), ('fwd_pts', np.inf), ('rev_pts', np.inf),
+                           ('id_nums', -1), ('indices', 0)):
+            old = getattr(self, name)
+            new = np.full((num_rows,) + old.shape[1:], fill, dtype=old.dtype)
+            new[:old_rows] = old
+            setattr(self, name, new)
+    # end def
+
+    def _clearExtent(self, id_num: int):
+        self.z_mins[id_num] = np.inf
+        self.z_maxs[id_num] = -np.inf
+        self.sizes[id_num] = 0
+        self._z_dirty.discard(id_num)
+    # end def
+
+    def _clearRows(self, lo: int, hi: int):
+        self.axis_pts[lo:hi] = np.inf
+        self.fwd_pts[lo:hi] = np.inf
+        self.rev_pts[lo:hi] = np.inf
+        self.id_nums[lo:hi] = -1
+        self.indices[lo:hi] = 0
+    # end def
+# end class
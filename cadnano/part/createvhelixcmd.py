@@ -1,14 +1,15 @@
-from ast import literal_eval
-import bisect
 from typing import (
+    Dict,
     Union,
     List,
     Tuple
 )
 
 from cadnano.proxies.cnproxy import UndoCommand
+from .neighbortable import parseNeighbors
 from cadnano.cntypes import (
     NucleicAcidPartT,
+    PointsT,
     RectT,
     Vec3T
 )
@@ -63,7 +64,7 @@ class CreateVirtualHelixCommand(UndoCommand):
 
         self.neighbors: List[int] = []
         if not safe:
-            self.neighbors = literal_eval(self.values[self.keys.index('neighbors')])
+            self.neighbors = parseNeighbors(self.values[self.keys.index('neighbors')])
 
         self.threshold: float = 2.1*part.radius()
         self.safe: bool = safe
@@ -84,13 +85,10 @@ class CreateVirtualHelixCommand(UndoCommand):
                     part._getVirtualHelixOriginNeighbors(id_num, self.threshold))
 
             neighbors = self.neighbors
-            part.vh_properties.loc[id_num, 'neighbors'] = str(list(neighbors))
+            vh_neighbors = part.vh_neighbors
+            vh_neighbors.set(id_num, neighbors)
             for neighbor_id in neighbors:
-                nneighbors = literal_eval(
-                    part.getVirtualHelixProperties(neighbor_id, 'neighbors')
-                )
-                bisect.insort_left(nneighbors, id_num)
-                part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+                vh_neighbors.link(neighbor_id, id_num)
         else:
             neighbors = self.neighbors
         if self.keys is not None:
@@ -109,12 +107,11 @@ class CreateVirtualHelixCommand(UndoCommand):
         part = self.part
         id_num = self.id_num
         # since we're hashing on the object in the views do this first
+        vh_neighbors = part.vh_neighbors
         for neighbor_id in self.neighbors:
-            nneighbors = literal_eval(part.getVirtualHelixProperties(neighbor_id, 'neighbors'))
             try:
-                nneighbors.remove(id_num)
-                part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
-            except:
+                vh_neighbors.unlink(neighbor_id, id_num)
+            except ValueError:
                 print("id_num %d not there in neighbor %d" % (id_num, neighbor_id))
                 pass
 
@@ -128,3 +125,107 @@ class CreateVirtualHelixCommand(UndoCommand):
         part.partVirtualHelixRemovedSignal.emit(part, id_num)
     # end def
 # end class
+
+
+class CreateVirtualHelicesCommand(UndoCommand):
+    def __init__(self,
+                part: NucleicAcidPartT,
+                id_nums: List[int],
+                origins: List[Vec3T],
+                directions: List[Vec3T],
+                lengths: List[int],
+                properties_list: List[tuple] = None,
+                safe_list: List[bool] = None,
+                points: PointsT = None):
+        '''``UndoCommand`` to create many virtual helices in a
+        ``NucleicAcidPart`` as a single step.  Neighbors of all new virtual
+        helices are found in one pass and the views are notified once with
+        ``partVirtualHelicesAddedSignal``
+
+        Args:
+            part: The parent ``NucleicAcidPart``
+            id_nums: the reserved ID numbers of the helices in the ``part``
+            origins: the coordinates of the 0 - index bases
+            directions: the directions of the virtual helices
+            lengths: Lengths of the virtual helices in bases
+            properties_list: the initial or inherited properties as a
+                (keys, values) tuple or ``None`` per virtual helix
+            safe_list: whether to update the neighbors of each virtual helix,
+                see :class:`CreateVirtualHelixCommand`.  Default is all ``True``
+            points: the points of the virtual helices one after the other,
+                computed if ``None``, see :meth:`NucleicAcidPart._createHelices`
+        '''
+        super(CreateVirtualHelicesCommand, self).__init__("create virtual helices")
+        self.part: NucleicAcidPartT = part
+        self.id_nums: List[int] = list(id_nums)
+        self.origins: List[Vec3T] = list(origins)
+        self.directions: List[Vec3T] = list(directions)
+        self.lengths: List[int] = list(lengths)
+        self.color: str = part.getColor()
+        if properties_list is not None:
+            properties_list = [None if properties is None else
+                               (properties if isinstance(properties, tuple) else
+                                (list(properties.keys()), list(properties.values())))
+                               for properties in properties_list]
+        self.properties_list: List[tuple] = properties_list
+        if safe_list is None:
+            safe_list = [True]*len(self.id_nums)
+        self.safe_ids: List[int] = [id_num for id_num, safe in zip(self.id_nums, safe_list) if safe]
+
+        self.neighbors: Dict[int, List[int]] = {}
+        for i, safe in enumerate(safe_list):
+            if not safe:
+                keys, values = properties_list[i]
+                self.neighbors[self.id_nums[i]] = parseNeighbors(values[keys.index('neighbors')])
+
+        self.points: PointsT = points
+        self.threshold: float = 2.1*part.radius()
+        self.old_limits: RectT = None
+    # end def
+
+    def redo(self):
+        part = self.part
+        self.old_limits = part.getVirtualHelixOriginLimits()
+        part._createHelices(self.id_nums, self.origins, self.directions,
+                            self.lengths, self.color, self.properties_list,
+                            points=self.points)
+
+        safe_ids = self.safe_ids
+        if safe_ids:    # update all neighbors
+            neighbors_dict = self.neighbors
+            if safe_ids[0] not in neighbors_dict:
+                neighbors_dict.update(part._batchOriginNeighbors(safe_ids, self.threshold))
+            safe_id_set = set(safe_ids)
+            vh_neighbors = part.vh_neighbors
+            for id_num in safe_ids:
+                neighbors = neighbors_dict[id_num]
+                vh_neighbors.set(id_num, neighbors)
+                for neighbor_id in neighbors:
+                    # new virtual helices already list each other
+                    if neighbor_id not in safe_id_set:
+                        vh_neighbors.link(neighbor_id, id_num)
+        part.partVirtualHelicesAddedSignal.emit(part, list(self.id_nums))
+    # end def
+
+    def undo(self):
+        part = self.part
+        vh_neighbors = part.vh_neighbors
+        for id_num in reversed(self.id_nums):
+            # since we're hashing on the object in the views do this first
+            neighbors = list(vh_neighbors.get(id_num))
+            for neighbor_id in neighbors:
+                try:
+                    vh_neighbors.unlink(neighbor_id, id_num)
+                except ValueError:
+                    print("id_num %d not there in neighbor %d" % (id_num, neighbor_id))
+
+            # signaling the view is two parts to clean up signals properly
+            # and then allow the views to refresh
+            part.partVirtualHelixRemovingSignal.emit(
+                part, id_num, part.getVirtualHelix(id_num), neighbors)
+            # clear out part references
+            part._removeHelix(id_num)
+            part.partVirtualHelixRemovedSignal.emit(part, id_num)
+        part._setVirtualHelixOriginLimits(self.old_limits)
+    # end def
+# end class
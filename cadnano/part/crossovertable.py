@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Per part table of potential crossovers used by
+:meth:`NucleicAcidPart.potentialCrossoverMap`
+"""
+from bisect import bisect_left
+from collections import defaultdict
+from typing import (
+    Dict,
+    List,
+    Set,
+    Tuple
+)
+
+from cadnano.cntypes import HitListT
+
+PerNeighborHitsT = Dict[int, Tuple[HitListT, HitListT]]
+
+XOVER_TABLE_PROPERTY_KEYS = frozenset([
+    'bases_per_repeat',
+    'eulerZ',
+    'helical_pitch',
+    'minor_groove_angle',
+    'turns_per_repeat'
+])
+"""Virtual helix properties the potential crossovers of a virtual helix
+depend on
+"""
+
+
+class CrossoverTable(object):
+    """Full length potential crossover hits for each virtual helix against
+    its neighbors.
+
+    An entry depends on the coordinates and properties of its own virtual
+    helix and on the coordinates of its neighbors, so invalidating a virtual
+    helix also drops the entries of every virtual helix that used it as a
+    neighbor.  An entry is also ignored when the neighbor list it was computed
+    with no longer matches.
+    """
+
+    def __init__(self):
+        self.entries: Dict[int, Tuple[List[int], PerNeighborHitsT]] = {}
+        self.dependents: Dict[int, Set[int]] = defaultdict(set)
+    # end def
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, id_num: int) -> bool:
+        return id_num in self.entries
+
+    def clear(self):
+        self.entries.clear()
+        self.dependents.clear()
+    # end def
+
+    def get(self, id_num: int, neighbors: List[int]) -> PerNeighborHitsT:
+        """
+        Args:
+            id_num: virtual helix ID number
+            neighbors: current neighbors of ``id_num``
+
+        Returns:
+            the hits per neighbor or ``None`` if there is no valid entry
+        """
+        entry = self.entries.get(id_num)
+        if entry is None or entry[0] != neighbors:
+            return None
+        return entry[1]
+    # end def
+
+    def set(self, id_num: int, neighbors: List[int], per_neighbor_hits: PerNeighborHitsT):
+        self.entries[id_num] = (list(neighbors), per_neighbor_hits)
+        dependents = self.dependents
+        for neighbor_id in neighbors:
+            dependents[neighbor_id].add(id_num)
+    # end def
+
+    def invalidate(self, id_num: int):
+        """Drop the entry of a virtual helix and of every virtual helix
+        depending on it
+
+        Args:
+            id_num: virtual helix ID number
+        """
+        entries = self.entries
+        entries.pop(id_num, None)
+        for dependent_id in self.dependents.pop(id_num, ()):
+            entries.pop(dependent_id, None)
+    # end def
+# end class
+
+
+def windowHits(hits: HitListT, start: int, length: int) -> HitListT:
+    """The hits of a hit list sorted by index within a window of indices
+
+    Args:
+        hits: list of the form::
+
+            [(id_num_index, forward_neighbor_idxs, reverse_neighbor_idxs), ...]]
+
+        start: first index of the window
+        length: length of the window
+
+    Returns:
+        list of the hits in ``[start, start + length)``
+    """
+    idxs = [hit[0] for hit in hits]
+    return hits[bisect_left(idxs, start):bisect_left(idxs, start + length)]
+# end def
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Per virtual helix index of insertions used by
+:meth:`NucleicAcidPart.insertions`
+"""
+from bisect import (
+    bisect_left,
+    bisect_right
+)
+from itertools import accumulate
+from typing import (
+    Callable,
+    List
+)
+
+from cadnano.cntypes import InsertionT
+
+
+class InsertionIndex(dict):
+    """Insertions of a virtual helix by base index.
+
+    Besides the dictionary it keeps the sorted base indices of the insertions
+    and the prefix sums of their lengths, rebuilt on the first query after
+    the insertions change, so the insertions and the total insertion length
+    of a range of bases are found by bisection.  ``version`` counts the
+    changes, letting a :class:`Strand` cache its total length.
+
+    Change the length of an insertion with :meth:`setLength` so the index
+    sees it.
+
+    Args:
+        on_change (optional): called with the base index of each changed
+            insertion
+    """
+
+    def __init__(self, *args, on_change: Callable[[int], None] = None, **kwargs):
+        super(InsertionIndex, self).__init__(*args, **kwargs)
+        self.version: int = 0
+        self._idxs: List[int] = None
+        self._prefix_lengths: List[int] = None
+        self._on_change = on_change
+    # end def
+
+    def __setitem__(self, idx: int, insertion: InsertionT):
+        super(InsertionIndex, self).__setitem__(idx, insertion)
+        self._changed(idx)
+    # end def
+
+    def __delitem__(self, idx: int):
+        super(InsertionIndex, self).__delitem__(idx)
+        self._changed(idx)
+    # end def
+
+    def pop(self, idx: int, *args):
+        was_in = idx in self
+        value = super(InsertionIndex, self).pop(idx, *args)
+        if was_in:
+            self._changed(idx)
+        return value
+    # end def
+
+    def clear(self):
+        idxs = list(self.keys())
+        super(InsertionIndex, self).clear()
+        self.invalidate()
+        if self._on_change is not None:
+            for idx in idxs:
+                self._on_change(idx)
+    # end def
+
+    def update(self, *args, **kwargs):
+        for idx, insertion in dict(*args, **kwargs).items():
+            self[idx] = insertion
+    # end def
+
+    def invalidate(self):
+        """Mark the sorted indices and prefix sums as stale"""
+        self.version += 1
+        self._idxs = None
+    # end def
+
+    def _changed(self, idx: int):
+        self.invalidate()
+        if self._on_change is not None:
+            self._on_change(idx)
+    # end def
+
+    def setLength(self, idx: int, length: int):
+        """Change the length of the insertion at ``idx``
+
+        Args:
+            idx: base index of the insertion
+            length: new length, negative for a skip
+        """
+        self[idx].setLength(length)
+        self._changed(idx)
+    # end def
+
+    def _refresh(self):
+        idxs = self._idxs = sorted(self.keys())
+        self._prefix_lengths = [0] + list(accumulate(self[idx].length() for idx in idxs))
+    # end def
+
+    def _bounds(self, idx_low: int, idx_high: int) -> slice:
+        if self._idxs is None:
+            self._refresh()
+        return slice(bisect_left(self._idxs, idx_low), bisect_right(self._idxs, idx_high))
+    # end def
+
+    def insertionsBetween(self, idx_low: int, idx_high: int) -> List[InsertionT]:
+        """
+        Args:
+            idx_low: low index, inclusive
+            idx_high: high index, inclusive
+
+        Returns:
+            the insertions between the indices, sorted by index
+        """
+        if not self:
+            return []
+        bounds = self._bounds(idx_low, idx_high)
+        return [self[idx] for idx in self._idxs[bounds]]
+    # end def
+
+    def lengthBetween(self, idx_low: int, idx_high: int) -> int:
+        """
+        Args:
+            idx_low: low index, inclusive
+            idx_high: high index, inclusive
+
+        Returns:
+            the sum of the lengths of the insertions between the indices
+        """
+        if not self:
+            return 0
+        bounds = self._bounds(idx_low, idx_high)
+        if bounds.stop <= bounds.start:
+            return 0
+        prefix_lengths = self._prefix_lengths
+        return prefix_lengths[bounds.stop] - prefix_lengths[bounds.start]
+    # end def
+# end class
+
+
+class InsertionIndices(dict):
+    """:class:`InsertionIndex` by virtual helix ID number, created on first
+    access like a ``defaultdict``
+
+    Args:
+        on_change: called with the ID number and base index of each changed
+            insertion
+    """
+
+    def __init__(self, on_change: Callable[[int, int], None]):
+        super(InsertionIndices, self).__init__()
+        self._on_change = on_change
+    # end def
+
+    def __missing__(self, id_num: int) -> InsertionIndex:
+        on_change = self._on_change
+        insertions = InsertionIndex(on_change=lambda idx: on_change(id_num, idx))
+        self[id_num] = insertions
+        return insertions
+    # end def
+# end class
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Integer adjacency of the virtual helices of a :class:`NucleicAcidPart`
+
+The ``'neighbors'`` virtual helix property is still read and written as the
+string of a list (i.e. ``'[1, 3, 4]'``) by the file formats and the views.
+The table keeps the integer lists and tracks which virtual helices need that
+string refreshed, so that creating, removing and moving virtual helices only
+does integer work.
+"""
+import bisect
+from ast import literal_eval
+from typing import (
+    Dict,
+    List,
+    Set
+)
+
+
+def formatNeighbors(neighbors: List[int]) -> str:
+    """
+    Args:
+        neighbors: ID numbers of the neighbors
+
+    Returns:
+        the serialized ``'neighbors'`` property
+    """
+    return str(list(neighbors))
+# end def
+
+
+def parseNeighbors(value: str) -> List[int]:
+    """
+    Args:
+        value: the serialized ``'neighbors'`` property
+
+    Returns:
+        list of neighbor ID numbers
+    """
+    return [int(x) for x in literal_eval(value)]
+# end def
+
+
+class NeighborTable(object):
+    """List of neighbor ID numbers per virtual helix ID number.
+
+    Neighbors are kept in the order they were set in and
+    :meth:`link` inserts in sorted order, as did the string based
+    bookkeeping this replaces.
+    """
+
+    def __init__(self):
+        self.adjacency: Dict[int, List[int]] = {}
+        self.dirty: Set[int] = set()
+    # end def
+
+    def __len__(self) -> int:
+        return len(self.adjacency)
+
+    def __contains__(self, id_num: int) -> bool:
+        return id_num in self.adjacency
+
+    def copy(self) -> 'NeighborTable':
+        new_table = NeighborTable()
+        new_table.adjacency = {k: list(v) for k, v in self.adjacency.items()}
+        new_table.dirty = set(self.dirty)
+        return new_table
+    # end def
+
+    def get(self, id_num: int) -> List[int]:
+        """
+        Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            the neighbor list of ``id_num``, do not modify it
+        """
+        return self.adjacency.get(id_num, [])
+    # end def
+
+    def set(self, id_num: int, neighbors: List[int], is_dirty: bool = True):
+        """
+        Args:
+            id_num: virtual helix ID number
+            neighbors: ID numbers of the neighbors
+            is_dirty: whether the serialized property needs to be updated
+        """
+        self.adjacency[id_num] = list(neighbors)
+        if is_dirty:
+            self.dirty.add(id_num)
+        else:
+            self.dirty.discard(id_num)
+    # end def
+
+    def link(self, id_num: int, neighbor_id: int):
+        """Insert a neighbor into the list of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            neighbor_id: ID number to add
+        """
+        bisect.insort_left(self.adjacency.setdefault(id_num, []), neighbor_id)
+        self.dirty.add(id_num)
+    # end def
+
+    def unlink(self, id_num: int, neighbor_id: int):
+        """Remove a neighbor from the list of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            neighbor_id: ID number to remove
+
+        Raises:
+            ValueError: ``neighbor_id`` is not a neighbor of ``id_num``
+        """
+        self.adjacency.get(id_num, []).remove(neighbor_id)
+        self.dirty.add(id_num)
+    # end def
+
+    def remove(self, id_num: int):
+        """Drop the list of a virtual helix
+        """
+        self.adjacency.pop(id_num, None)
+        self.dirty.discard(id_num)
+    # end def
+
+    def popDirty(self) -> Dict[int, str]:
+        """Serialized ``'neighbors'`` properties in need of an update
+
+        Returns:
+            dictionary of the serialized property keyed by ID number
+        """
+        adjacency = self.adjacency
+        out = {id_num: formatNeighbors(adjacency[id_num])
+               for id_num in self.dirty if id_num in adjacency}
+        self.dirty.clear()
+        return out
+    # end def
+# end class
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
+import io
 import math
-from ast import literal_eval
 from bisect import bisect_left
 from collections import (
     defaultdict,
@@ -11,7 +11,10 @@ from heapq import (
     heappush,
     nsmallest
 )
-from itertools import count as icount
+from itertools import (
+    chain,
+    count as icount
+)
 from typing import (
     Iterable,
     Tuple,
@@ -22,7 +25,6 @@ from typing import (
 )
 
 import numpy as np
-import pandas as pd
 
 from cadnano import util
 from cadnano.oligo import RemoveOligoCommand
@@ -37,11 +39,39 @@ from cadnano.proxies.cnproxy import ProxySignal
 from cadnano.part.part import Part
 from cadnano.removeinstancecmd import RemoveInstanceCommand
 from cadnano.setpropertycmd import SetVHPropertyCommand
-from cadnano.strandset import SplitCommand, StrandSet
-from .createvhelixcmd import CreateVirtualHelixCommand
+from cadnano.strandset import IntervalStrandSet, SplitCommand, StrandSet
+from cadnano.strandset.createstrandcmd import CreateStrandsCommand
+from cadnano.strandset.splitcmd import SplitStrandsCommand
+from .coordinatearena import CoordinateArena
+from .createvhelixcmd import (
+    CreateVirtualHelixCommand,
+    CreateVirtualHelicesCommand
+)
+from .crossovertable import (
+    CrossoverTable,
+    XOVER_TABLE_PROPERTY_KEYS,
+    windowHits
+)
+from .insertionindex import InsertionIndices
+from .neighbortable import (
+    NeighborTable,
+    parseNeighbors
+)
 from .removevhelixcmd import RemoveVirtualHelixCommand
 from .resizevirtualhelixcmd import ResizeVirtualHelixCommand
+from .spatialindex import (
+    BasePointGrid,
+    OriginGrid
+)
+from .stapleengine import (
+    MAX_LENGTH,
+    MIN_LENGTH,
+    MIN_XOVER_DISTANCE,
+    StapleEngine,
+    TARGET_LENGTH
+)
 from .translatevhelixcmd import TranslateVirtualHelicesCommand
+from .vhproperties import VirtualHelixPropertyStore
 from .virtualhelix import VirtualHelix
 from .xovercmds import (
     CreateXoverCommand,
@@ -75,6 +105,9 @@ equivalent to np.sum(a*a, axis=1) but faster
 from numpy.core.umath_tests import inner1d
 
 DEFAULT_CACHE_SIZE = 20
+CROSSOVER_BLOCK_SIZE = 2**18
+"""Maximum number of point pairs compared at once by the crossover engine
+"""
 
 def _defaultProperties(id_num):
     props = [('name', "vh%d" % (id_num)),
@@ -97,20 +130,18 @@ def _defaultProperties(id_num):
 
 
 VH_PROPERTY_KEYS = set([x for x in _defaultProperties(0)[0]])
-Z_PROP_INDEX = -1  # index for Dataframe.iloc calls
 
 
-def _defaultDataFrame(size):
+def _defaultPropertyStore(size):
     dummy_id_num = 999
-    columns, row = _defaultProperties(dummy_id_num)
-    df = pd.DataFrame([row for i in range(size)], columns=columns)
-    return df
+    return VirtualHelixPropertyStore(_defaultProperties(dummy_id_num), size)
 # end def
 
 
 DEFAULT_SIZE = 256
 DEFAULT_FULL_SIZE = DEFAULT_SIZE * 48
 DEFAULT_RADIUS = 1.125  # nm
+DEFAULT_GRID_CELL_SIZE = 2*DEFAULT_RADIUS  # nm, spatial index cell edge length
 HONEYCOMB_SUB_STEP_SIZE = 7
 SQUARE_SUB_STEP_SIZE = 8
 
@@ -175,7 +206,7 @@ class NucleicAcidPart(Part):
             return
 
         self._radius = DEFAULT_RADIUS     # probably a property???
-        self._insertions = defaultdict(dict)  # dict of insertions per virtualhelix
+        self._insertions = InsertionIndices(self._insertionChanged)  # dict of insertions per virtualhelix
         self._mods: Dict[str, dict] = {
             'int_instances': {},
             'ext_instances': {}
@@ -222,14 +253,8 @@ class NucleicAcidPart(Part):
         # Begin low level attributes
         ############################
 
-        # 1. per virtual base pair allocations
-        self.total_points: int = 0
-        self.axis_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        # self.axis_pts[:, 2] = 0.0
-        self.fwd_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        self.rev_pts = np.full((DEFAULT_FULL_SIZE, 3), np.inf, dtype=float)
-        self.id_nums = np.full((DEFAULT_FULL_SIZE,), -1, dtype=int)
-        self.indices = np.zeros((DEFAULT_FULL_SIZE,), dtype=int)
+        # 1. per virtual base pair allocations, see the properties below
+        self._arena = CoordinateArena(DEFAULT_FULL_SIZE)
 
         # 2. per virtual helix allocations
         self.total_id_nums: int = 0  # should be equal to len(self.reserved_ids)
@@ -243,15 +268,13 @@ class NucleicAcidPart(Part):
 
         self.directions = np.zeros((DEFAULT_SIZE, 3), dtype=float)
 
-        self._offset_and_size: List[Union[None, Tuple[int, int]]] = [None] * DEFAULT_SIZE
-        """Bookkeeping for fast lookup of indices for insertions and deletions
-        and coordinate points. The length of this is the max id_num used.
-        """
         self._virtual_helices_dict: Dict[int, VirtualHelix] = {}
 
         self.reserved_ids: Set[int] = set()
 
-        self.vh_properties = _defaultDataFrame(DEFAULT_SIZE)
+        self.vh_properties = _defaultPropertyStore(DEFAULT_SIZE)
+        # integer version of the 'neighbors' property, see getVirtualHelixNeighbors
+        self.vh_neighbors = NeighborTable()
 
         self.fwd_strandsets = [None] * DEFAULT_SIZE
         self.rev_strandsets = [None] * DEFAULT_SIZE
@@ -265,6 +288,16 @@ class NucleicAcidPart(Part):
         self._origin_cache_keys = None
         self._resetOriginCache()
 
+        # Spatial indices, see _queryBasePoint and _queryVirtualHelixOrigin
+        self.use_spatial_index: bool = True
+        self._point_grid = BasePointGrid(DEFAULT_GRID_CELL_SIZE)
+        self._origin_grid = OriginGrid(DEFAULT_GRID_CELL_SIZE)
+
+        # Potential crossovers, see potentialCrossoverMap
+        self._xover_table = CrossoverTable()
+        # virtual helices moved by translation previews, see _translateVirtualHelices
+        self._translated_id_nums: Set[int] = set()
+
         # scratch allocations for vector calculations
         self.m3_scratch0 = np.zeros((3, 3), dtype=float)
         self.m3_scratch1 = np.zeros((3, 3), dtype=float)
@@ -292,6 +325,9 @@ class NucleicAcidPart(Part):
     partVirtualHelixAddedSignal = ProxySignal(object, int, object, object, name='partVirtualHelixAddedSignal')
     """self, virtual_helix id_num, virtual_helix, neighbor list"""
 
+    partVirtualHelicesAddedSignal = ProxySignal(object, object, name='partVirtualHelicesAddedSignal')
+    """self, list of virtual_helix id_nums, see batchCreateVirtualHelices"""
+
     partVirtualHelixRemovingSignal = ProxySignal(object, int, object, object, name='partVirtualHelixRemovingSignal')
     """self, virtual_helix id_num, virtual_helix, neighbor list"""
 
@@ -334,6 +370,38 @@ class NucleicAcidPart(Part):
         self._point_cache_keys = deque([None] * DEFAULT_CACHE_SIZE)
     # end def
 
+    @property
+    def axis_pts(self) -> np.ndarray:
+        """Axis points of all virtual bases, see :class:`CoordinateArena`"""
+        return self._arena.axis_pts
+
+    @property
+    def fwd_pts(self) -> np.ndarray:
+        return self._arena.fwd_pts
+
+    @property
+    def rev_pts(self) -> np.ndarray:
+        return self._arena.rev_pts
+
+    @property
+    def id_nums(self) -> np.ndarray:
+        return self._arena.id_nums
+
+    @property
+    def indices(self) -> np.ndarray:
+        return self._arena.indices
+
+    @property
+    def total_points(self) -> int:
+        return self._arena.total_points
+
+    @property
+    def _offset_and_size(self) -> List[Union[None, Tuple[int, int]]]:
+        """Bookkeeping for fast lookup of indices for insertions and deletions
+        and coordinate points. The length of this is the max id_num used.
+        """
+        return self._arena.offset_and_size
+
     def copy(self,  document: DocT,
                     new_object: NucleicAcidPartT = None) -> NucleicAcidPartT:
         """Copy all arrays and counters and create new StrandSets
@@ -352,22 +420,26 @@ class NucleicAcidPart(Part):
             new_vhg = constructor(document=document, do_copy=True)
         if not isinstance(new_vhg, NucleicAcidPart):
             raise ValueError("new_vhg {} is not an instance of a NucleicAcidPart".format(new_vhg))
-        new_vhg.total_points = self.total_points
-        new_vhg.axis_pts = self.axis_pts.copy()
-        new_vhg.fwd_pts = self.fwd_pts.copy()
-        new_vhg.rev_pts = self.rev_pts.copy()
-        new_vhg.id_nums = self.id_nums.copy()
-        new_vhg.indices = self.indices.copy()
+        new_vhg._arena = self._arena.copy()
 
         new_vhg.total_id_nums = self.total_id_nums
         new_vhg._origin_pts = self._origin_pts
         new_vhg.origin_limits = self.origin_limits
         new_vhg.directions = self.directions
 
-        new_vhg.offset_and_size = self._offset_and_size.copy()
+        new_vhg.use_spatial_index = self.use_spatial_index
+        new_vhg._point_grid = point_grid = BasePointGrid(DEFAULT_GRID_CELL_SIZE)
+        new_vhg._origin_grid = origin_grid = OriginGrid(DEFAULT_GRID_CELL_SIZE)
+        for id_num in self.reserved_ids:
+            point_grid.invalidate(id_num)
+            origin_grid.insert(id_num, self._origin_pts[id_num])
+        new_vhg._xover_table = CrossoverTable()
+
         new_vhg.reserved_ids = self.reserved_ids.copy()
 
-        new_vhg.vh_properties = _defaultDataFrame(DEFAULT_SIZE)
+        new_vhg.vh_properties = _defaultPropertyStore(DEFAULT_SIZE)
+        new_vhg.vh_neighbors = vh_neighbors = self.vh_neighbors.copy()
+        vh_neighbors.dirty.update(vh_neighbors.adjacency)
 
         new_vhg.fwd_strandsets = [x.simpleCopy(new_vhg) for x in self.fwd_strandsets]
         new_vhg.rev_strandsets = [x.simpleCopy(new_vhg) for x in self.rev_strandsets]
@@ -692,20 +764,83 @@ class NucleicAcidPart(Part):
         return (self.fwd_strandsets[id_num], self.rev_strandsets[id_num])
     # end def
 
-    def refreshSegments(self, id_num: int):
+    def refreshSegments(self, id_num: int, idx_low: int = None, idx_high: int = None):
         """Partition strandsets into overlapping segments
 
+        Segments only change around the ends of strands, so when the strands
+        added, removed or resized since the last refresh all lie within
+        ``idx_low`` to ``idx_high`` only the strands overlapping that range,
+        widened by one base, are partitioned again.  Entries of
+        :attr:`segment_dict` for segments that no longer exist are dropped
+        and all others keep their abstract segment id.
+
+        Args:
+            id_num: virtual helix ID number
+            idx_low (optional): low index of the edited range.  Default
+                ``None`` partitions the whole virtual helix
+            idx_high (optional): high index of the edited range
+
         Returns:
-            tuple: of segments for the forward and reverse strand of form::
+            tuple: of segments for the forward and reverse strands
+                partitioned, of form::
 
                 ( [ [(start, end),...], ...], [ [(start, end),...], ...])
         """
-        _, _ = self.getOffsetAndSize(id_num)
+        _, size = self.getOffsetAndSize(id_num)
         fwd_ss = self.fwd_strandsets[id_num]
         rev_ss = self.rev_strandsets[id_num]
 
-        self.segment_dict[id_num] = {}
-        return self._refreshSegments(fwd_ss, rev_ss)
+        if idx_low is None:
+            idx_low, idx_high = 0, size - 1
+            fwd_segments, rev_segments = self._refreshSegments(fwd_ss, rev_ss)
+        else:
+            idx_low, idx_high = max(idx_low - 1, 0), min(idx_high + 1, size - 1)
+            fwd_segments, rev_segments = self._refreshSegmentsInRange(fwd_ss, rev_ss,
+                                                                      idx_low, idx_high)
+
+        segment_dict = self.segment_dict.get(id_num)
+        if segment_dict:
+            # a live segment overlapping the range belongs to a strand just partitioned
+            live_segments = set(chain.from_iterable(fwd_segments))
+            live_segments.update(chain.from_iterable(rev_segments))
+            for segment in [x for x in segment_dict
+                            if x[0] <= idx_high and x[1] >= idx_low and x not in live_segments]:
+                del segment_dict[segment]
+        else:
+            self.segment_dict[id_num] = {}
+        return fwd_segments, rev_segments
+    # end def
+
+    def _refreshSegmentsInRange(self, fwd_ss, rev_ss, idx_low: int, idx_high: int):
+        """Partition only the strands overlapping ``idx_low`` to ``idx_high``.
+        The ends of a strand are only partitioned by the strands overlapping
+        it or starting right after it.
+
+        Returns:
+            tuple: of segments of the strands partitioned, see
+            :meth:`_refreshSegments`
+        """
+        out = []
+        for ss in (fwd_ss, rev_ss):
+            ss_segments = []
+            for strand in ss.getOverlappingStrands(idx_low, idx_high):
+                start, idx_hi = strand.idxs()
+                hi_endpoints = {idx_hi}
+                for other in chain(fwd_ss.getOverlappingStrands(start, idx_hi + 1),
+                                   rev_ss.getOverlappingStrands(start, idx_hi + 1)):
+                    other_lo, other_hi = other.idxs()
+                    if start < other_lo <= idx_hi:
+                        hi_endpoints.add(other_lo - 1)
+                    if other_hi < idx_hi:
+                        hi_endpoints.add(other_hi)
+                segments = []
+                for end in sorted(hi_endpoints):
+                    segments.append((start, end))
+                    start = end + 1
+                strand.segments = segments
+                ss_segments.append(segments)
+            out.append(ss_segments)
+        return out[0], out[1]
     # end def
 
     def _refreshSegments(self, fwd_ss, rev_ss):
@@ -832,7 +967,8 @@ class NucleicAcidPart(Part):
 
     def _translateCoordinates(self, id_nums, delta):
         """delta is a :obj:`array-like` of floats of length 3
-        for now support XY translation
+        for now support XY translation.  All virtual helices are shifted in
+        one fancy indexed operation per buffer.
 
         Args:
             id_nums (array-like): of :obj:`int` virtual helix ID numbers
@@ -840,19 +976,18 @@ class NucleicAcidPart(Part):
         """
         self._resetOriginCache()
         self._resetPointCache()
+        id_list = list(id_nums)
+        if not id_list:
+            return
+        ids = np.array(id_list, dtype=int)
+        self._arena.translateMany(id_list, delta)
         origin_pts = self._origin_pts
-        delta_origin = delta #delta[:2]  # x, y only
-        for id_num in id_nums:
-            coord_pts, fwd_pts, rev_pts = self.getCoordinates(id_num)
-            coord_pts += delta  # use += to modify the view
-            fwd_pts += delta  # use += to modify the view
-            rev_pts += delta  # use += to modify the view
-            origin_pts[id_num, :] += delta_origin
-        try:
-            self.vh_properties.iloc[list(id_nums), Z_PROP_INDEX] += delta[2]
-        except Exception:
-            print(list(id_nums), Z_PROP_INDEX)
-            raise
+        origin_pts[ids] += delta
+        self._origin_grid.moveMany(id_list, origin_pts[ids])
+        point_grid = self._point_grid
+        for id_num in id_list:
+            point_grid.invalidate(id_num)
+        self.vh_properties.column('z')[ids] += delta[2]
         self._setVirtualHelixOriginLimits()
     # end def
 
@@ -920,6 +1055,9 @@ class NucleicAcidPart(Part):
         not internally.  NO GAPS!
         handles reindex the points in self.indices
 
+        Only the rows of ``id_num`` are touched unless it outgrows its block
+        in the :class:`CoordinateArena`
+
         Args:
             id_num: virtual helix ID number
             points: n x 3 shaped numpy ndarray of floats or
@@ -927,80 +1065,14 @@ class NucleicAcidPart(Part):
             is_right: whether we are extending in the positive index
                 direction or prepending
         """
-        offset_and_size_tuple = self.getOffsetAndSize(id_num)
-
-        # 1. Find insert indices
-        offset_and_size = self._offset_and_size
-        len_axis_pts = len(self.axis_pts)
-
-        new_axis_pts, new_fwd_pts, new_rev_pts = points
-        num_points = len(new_axis_pts)  # number of points being added
+        _, _ = self.getOffsetAndSize(id_num)
 
         self._resetPointCache()
+        # prepending shifts the base indices so always rebin
+        self._point_grid.invalidate(id_num)
+        self._invalidateCrossoverTable(id_num)
 
-        # 1. existing id_num
-        offset, size = offset_and_size_tuple
-        lo_idx_limit, hi_idx_limit = offset, offset + size
-        if is_right:
-            insert_idx = hi_idx_limit
-        else:  # prepend
-            insert_idx = offset
-
-        # new_lims = (hi_idx_limit, hi_idx_limit + num_points)
-        # print("{} settting offset {} and size {}".format(id_num, offset, size + num_points))
-        # print("length before {}".format(len_axis_pts))
-        offset_and_size[id_num] = (offset, size + num_points)
-        # increment the offset for every higher index
-        for i, o_and_s in enumerate(offset_and_size[id_num + 1:], start=id_num + 1):
-            if o_and_s is not None:
-                offset_and_size[i] = (o_and_s[0] + num_points, o_and_s[1])
-
-        # 2. Did exceed allocation???
-        total_points = self.total_points
-        if total_points + num_points > len_axis_pts:
-            diff = self.total_points + num_points - len_axis_pts
-            number_of_new_elements = math.ceil(diff / DEFAULT_FULL_SIZE) * DEFAULT_FULL_SIZE
-            total_rows = len_axis_pts + number_of_new_elements
-            # resize per virtual base allocations
-            self.axis_pts.resize((total_rows, 3))
-            self.axis_pts[len_axis_pts:] = [np.inf, np.inf, np.inf]
-
-            self.fwd_pts.resize((total_rows, 3))
-            self.fwd_pts[len_axis_pts:] = np.inf
-
-            self.rev_pts.resize((total_rows, 3))
-            self.rev_pts[len_axis_pts:] = np.inf
-
-            self.id_nums.resize((total_rows,))
-            self.id_nums[len_axis_pts:] = -1
-
-            self.indices.resize((total_rows,))
-            self.indices[len_axis_pts:] = 0
-        # end if exceeded allocation
-        axis_pts = self.axis_pts
-        fwd_pts = self.fwd_pts
-        rev_pts = self.rev_pts
-        id_nums = self.id_nums
-        indices = self.indices
-
-        # 3. Move Existing data
-        move_idx_start = insert_idx + num_points
-        move_idx_end = total_points + num_points
-
-        axis_pts[move_idx_start:move_idx_end] = axis_pts[insert_idx:total_points]
-        axis_pts[insert_idx:move_idx_start] = new_axis_pts
-        fwd_pts[move_idx_start:move_idx_end] = fwd_pts[insert_idx:total_points]
-        fwd_pts[insert_idx:move_idx_start] = new_fwd_pts
-        rev_pts[move_idx_start:move_idx_end] = rev_pts[insert_idx:total_points]
-        rev_pts[insert_idx:move_idx_start] = new_rev_pts
-
-        # just overwrite everything for indices and id_nums no need to move
-        id_nums[move_idx_start:move_idx_end] = id_nums[insert_idx:total_points]
-        id_nums[insert_idx:move_idx_start] = id_num
-        indices[move_idx_start:move_idx_end] = indices[insert_idx:total_points]
-        indices[lo_idx_limit:lo_idx_limit + num_points + size] = list(range(num_points + size))
-
-        self.total_points += num_points
+        self._arena.insert(id_num, points, is_right)
     # end def
 
     def getDirections(self, id_nums) -> np.ndarray:
@@ -1076,7 +1148,8 @@ class NucleicAcidPart(Part):
         Returns:
             ndarray of shape (3, 3)
         """
-        if np.all(v1 == v2):
+        # compare as arrays, a tuple never equals a list
+        if np.array_equal(v1, v2):
             return self.eye3_scratch.copy()
 
         v1 = self.normalize(v1)
@@ -1134,27 +1207,15 @@ class NucleicAcidPart(Part):
 
         self._reserveIdNum(id_num)
 
-        offset_and_size = self._offset_and_size
-
-        # 1. New id_num / virtual helix insert after all other points
-        # expand offset and size as required
+        # 1. New id_num / virtual helix gets an empty block in the arena
+        # expand the strandset lists as required
         self._resetOriginCache()
 
-        len_offset_and_size = len(offset_and_size)
-        number_of_new_elements = id_num - len_offset_and_size + 1
+        number_of_new_elements = id_num - len(self.fwd_strandsets) + 1
         if number_of_new_elements > 0:
-            offset_and_size += [None]*number_of_new_elements
             self.fwd_strandsets += [None]*number_of_new_elements
             self.rev_strandsets += [None]*number_of_new_elements
-        # find the next highest insertion offset
-        next_o = self.total_points
-        for next_o_and_s in offset_and_size[id_num + 1:]:
-            if next_o_and_s:
-                next_o, next_s = next_o_and_s
-                break
-        # this_offset = num_points
-        offset_and_size[id_num] = (next_o, 0)
-        # the other offsets will be adjusted later
+        self._arena.addHelix(id_num)
 
         # 2. Assign origin on creation, resizing as needed
         len_origin_pts = len(self._origin_pts)
@@ -1169,10 +1230,10 @@ class NucleicAcidPart(Part):
             self.directions.resize((total_rows, 3))
             self.directions[len_origin_pts:] = 0  # unnecessary as resize fills with zeros
 
-            self.vh_properties = self.vh_properties.append(_defaultDataFrame(number_of_new_elements),
-                                                           ignore_index=True)
+            self.vh_properties.resize(total_rows)
 
         self._origin_pts[id_num] = origin #origin[:2]
+        self._origin_grid.insert(id_num, origin)
         new_x, new_y = origin[:2]
         xLL, yLL, xUR, yUR = self.origin_limits
         if new_x < xLL:
@@ -1185,11 +1246,13 @@ class NucleicAcidPart(Part):
             yUR = new_y
         self.origin_limits = (xLL, yLL, xUR, yUR)
         self.directions[id_num] = direction
-        self.vh_properties.loc[id_num, ['name', 'color', 'length']] = "vh%d" % (id_num), color, num_points
+        self.vh_properties.setValues(id_num, ('name', 'color', 'length'),
+                                     ("vh%d" % (id_num), color, num_points))
+        self.vh_neighbors.set(id_num, [])
 
         if self.fwd_strandsets[id_num] is None:
-            self.fwd_strandsets[id_num] = StrandSet(True, id_num, self, num_points)
-            self.rev_strandsets[id_num] = StrandSet(False, id_num, self, num_points)
+            self.fwd_strandsets[id_num] = IntervalStrandSet(True, id_num, self, num_points)
+            self.rev_strandsets[id_num] = IntervalStrandSet(False, id_num, self, num_points)
         else:
             self.fwd_strandsets[id_num]._reset(num_points)
             self.rev_strandsets[id_num]._reset(num_points)
@@ -1204,6 +1267,170 @@ class NucleicAcidPart(Part):
         return vh
     # end def
 
+    def _createHelices(self,    id_nums: List[int],
+                                origins: np.ndarray,
+                                directions: np.ndarray,
+                                lengths: List[int],
+                                color: str,
+                                properties_list: List[Tuple] = None,
+                                points: PointsT = None) -> List[VirtualHelix]:
+        """Bulk version of :meth:`_createHelix`.  Arrays are resized once,
+        coordinate rows are reserved at once and the points of virtual helices
+        sharing a geometry are computed once and offset by origin.
+
+        Unlike :meth:`_createHelix` properties are set before the points are
+        computed so no :meth:`resetCoordinates` is needed
+
+        Args:
+            id_nums: virtual helix ID numbers
+            origins: n x 3 origins, referenced from an index of 0
+            directions: n x 3 direction vectors of the virtual helices
+            lengths: number of bases of each virtual helix
+            color: hexadecimal color code in the form: ``#RRGGBB``
+            properties_list: optional, a (keys, values) tuple or ``None`` per
+                virtual helix
+            points: optional, the axis, forward and reverse points of the
+                virtual helices one after the other, used instead of computing
+                them
+
+        Returns:
+            list of the Virtual Helix objects
+
+        Raises:
+            ValueError: ``points`` do not match ``lengths``
+        """
+        origins = np.asarray(origins, dtype=float).reshape((-1, 3))
+        directions = np.asarray(directions, dtype=float).reshape((-1, 3))
+        lengths = [int(x) for x in lengths]
+        offset_and_size = self._offset_and_size
+        len_offset_and_size = len(offset_and_size)
+        for id_num in id_nums:
+            if id_num < len_offset_and_size and offset_and_size[id_num] is not None:
+                raise IndexError('id_num %s already exists' % id_num)
+            self._reserveIdNum(id_num)
+        self._resetOriginCache()
+        self._resetPointCache()
+
+        # 1. expand per virtual helix allocations once
+        max_id_num = max(id_nums)
+        number_of_new_elements = max_id_num - len(self.fwd_strandsets) + 1
+        if number_of_new_elements > 0:
+            self.fwd_strandsets += [None]*number_of_new_elements
+            self.rev_strandsets += [None]*number_of_new_elements
+        len_origin_pts = len(self._origin_pts)
+        if max_id_num >= len_origin_pts:
+            diff = max_id_num - len_origin_pts + 1
+            number_of_new_elements = math.ceil(diff / DEFAULT_SIZE)*DEFAULT_SIZE
+            total_rows = len_origin_pts + number_of_new_elements
+            self._origin_pts.resize((total_rows, 3))
+            self._origin_pts[len_origin_pts:] = np.inf
+            self.directions.resize((total_rows, 3))
+            self.directions[len_origin_pts:] = 0
+            self.vh_properties.resize(total_rows)
+
+        # 2. origins, directions and properties
+        self._origin_pts[id_nums] = origins
+        self.directions[id_nums] = directions
+        origin_grid = self._origin_grid
+        for id_num, origin in zip(id_nums, origins):
+            origin_grid.insert(id_num, origin)
+        xLL, yLL, xUR, yUR = self.origin_limits
+        self.origin_limits = (min(xLL, origins[:, 0].min()), min(yLL, origins[:, 1].min()),
+                              max(xUR, origins[:, 0].max()), max(yUR, origins[:, 1].max()))
+        vh_properties = self.vh_properties
+        vh_neighbors = self.vh_neighbors
+        for i, id_num in enumerate(id_nums):
+            vh_properties.setValues(id_num, ('name', 'color', 'length'),
+                                    ("vh%d" % (id_num), color, lengths[i]))
+            vh_neighbors.set(id_num, [])
+            properties = properties_list[i] if properties_list is not None else None
+            if properties is not None:
+                keys, values = properties
+                self._setVirtualHelixProperties(id_num, list(keys), list(values),
+                                                emit_signals=False)
+
+        # 3. Create points, once per distinct geometry, unless given
+        key_prop_list = ['helical_pitch', 'bases_per_repeat', 'turns_per_repeat',
+                         'eulerZ', 'minor_groove_angle']
+        templates = {}
+        if points is not None:
+            if any(len(pts) != sum(lengths) for pts in points):
+                raise ValueError("%d points given for %d bases" % (len(points[0]), sum(lengths)))
+            point_start = 0
+        arena = self._arena
+        arena.reserve(lengths)
+        point_grid = self._point_grid
+        virtual_helices_dict = self._virtual_helices_dict
+        vh_order = self._group_properties['virtual_helix_order']
+        vh_list = []
+        for id_num, origin, direction, num_points in zip(id_nums, origins, directions, lengths):
+            if points is not None:
+                point_end = point_start + num_points
+                helix_points = tuple(pts[point_start:point_end] for pts in points)
+                point_start = point_end
+            else:
+                key = (tuple(vh_properties.getValues(id_num, key_prop_list)),
+                       tuple(direction), num_points)
+                template = templates.get(key)
+                if template is None:
+                    templates[key] = template = self._pointsFromDirection(
+                        id_num, (0., 0., 0.), direction, num_points, 0)
+                helix_points = tuple(pts + origin for pts in template)
+            if self.fwd_strandsets[id_num] is None:
+                self.fwd_strandsets[id_num] = IntervalStrandSet(True, id_num, self, num_points)
+                self.rev_strandsets[id_num] = IntervalStrandSet(False, id_num, self, num_points)
+            else:
+                self.fwd_strandsets[id_num]._reset(num_points)
+                self.rev_strandsets[id_num]._reset(num_points)
+            arena.addHelix(id_num)
+            arena.insert(id_num, helix_points, is_right=False)
+            point_grid.invalidate(id_num)
+            self._invalidateCrossoverTable(id_num)
+            vh_order.append(id_num)
+            virtual_helices_dict[id_num] = vh = VirtualHelix(id_num, self)
+            vh_list.append(vh)
+        self.total_id_nums += len(id_nums)
+        return vh_list
+    # end def
+
+    def _batchOriginNeighbors(self, id_nums: List[int], radius: float) -> Dict[int, List[int]]:
+        """Neighbors of many virtual helices in one pass, like
+        :meth:`_getVirtualHelixOriginNeighbors` but all candidate pairs from
+        the origin grid are tested at once
+
+        Args:
+            id_nums: virtual helix ID numbers
+            radius: radial distance within which a neighbors origin exists
+
+        Returns:
+            dictionary of sorted lists of neighbor ID numbers keyed by ID number
+        """
+        origin_pts = self._origin_pts
+        origin_grid = self._origin_grid
+        pairs_a = []
+        pairs_b = []
+        for id_num in id_nums:
+            candidates = None
+            if self.use_spatial_index:
+                candidates = origin_grid.candidatesInRadius(radius, origin_pts[id_num])
+            if candidates is None:
+                candidates = self._getVirtualHelixOriginNeighbors(id_num, radius)
+            pairs_a += [id_num]*len(candidates)
+            pairs_b += candidates
+        out = {id_num: [] for id_num in id_nums}
+        if pairs_a:
+            a = np.array(pairs_a, dtype=int)
+            b = np.array(pairs_b, dtype=int)
+            difference = origin_pts[a] - origin_pts[b]
+            delta = inner1d(difference, difference)
+            is_neighbor = (delta <= radius*radius) & (a != b)
+            for id_num, neighbor_id in zip(a[is_neighbor].tolist(), b[is_neighbor].tolist()):
+                out[id_num].append(neighbor_id)
+        for neighbors in out.values():
+            neighbors.sort()
+        return out
+    # end def
+
     def _pointsFromDirection(self,
                     id_num: int,
                     origin: Vec3T,
@@ -1229,12 +1456,12 @@ class NucleicAcidPart(Part):
         """
         rad = self._radius
         BW = self._BASE_WIDTH
-        hp, bpr, tpr, eulerZ, mgroove = self.vh_properties.loc[id_num,
-                                                               ['helical_pitch',
-                                                                'bases_per_repeat',
-                                                                'turns_per_repeat',
-                                                                'eulerZ',
-                                                                'minor_groove_angle']]
+        hp, bpr, tpr, eulerZ, mgroove = self.vh_properties.getValues(id_num,
+                                                                     ['helical_pitch',
+                                                                      'bases_per_repeat',
+                                                                      'turns_per_repeat',
+                                                                      'eulerZ',
+                                                                      'minor_groove_angle'])
         twist_per_base = tpr*360./bpr
         """
         + angle is CCW
@@ -1279,7 +1506,7 @@ class NucleicAcidPart(Part):
         np.add(np.dot(m, coord_pts.T, out=scratch).T, origin, out=coord_pts)
 
         if index < 0:
-            self.vh_properties.loc[id_num, 'eulerZ'] = math.degrees(eulerZ_new)
+            self.vh_properties.set(id_num, 'eulerZ', math.degrees(eulerZ_new))
 
         return (coord_pts, fwd_pts, rev_pts)
     # end def
@@ -1299,14 +1526,52 @@ class NucleicAcidPart(Part):
         """
         if safe:
             _, _ = self.getOffsetAndSize(id_num)
-        # 1. Find insert indices
-        props = self.vh_properties.loc[id_num, keys]
-        if isinstance(props, pd.Series):
-            return [v.item() if isinstance(v, (np.float64, np.int64, np.bool_)) else v for v in props]
-        else:
-            return props.item() if isinstance(props, (np.float64, np.int64, np.bool_)) else props
+        if self.vh_neighbors.dirty:
+            self._syncNeighborProperties()
+        return self.vh_properties.getValues(id_num, keys)
     # end
 
+    def getVirtualHelixNeighbors(self, id_num: int) -> List[int]:
+        """Integer version of the ``'neighbors'`` property
+
+        Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            list of the ID numbers of the neighbors of a virtual helix
+        """
+        return list(self.vh_neighbors.get(id_num))
+    # end def
+
+    def _setVirtualHelixNeighbors(self, id_num: int,
+                                        neighbors: List[int],
+                                        emit_signals: bool = True):
+        """Replace the neighbors of a virtual helix
+
+        emits ``partVirtualHelixPropertyChangedSignal``
+
+        Args:
+            id_num: virtual helix ID number
+            neighbors: ID numbers of the neighbors
+            emit_signals: optionally echew signaling
+        """
+        self.vh_neighbors.set(id_num, neighbors)
+        if emit_signals:
+            self._syncNeighborProperties()
+            self.partVirtualHelixPropertyChangedSignal.emit(
+                self, id_num, self.getVirtualHelix(id_num),
+                ['neighbors'], [self.vh_properties.get(id_num, 'neighbors')])
+    # end def
+
+    def _syncNeighborProperties(self):
+        """Write the ``'neighbors'`` property of all virtual helices whose
+        neighbors changed since the last sync
+        """
+        vh_properties = self.vh_properties
+        for id_num, value in self.vh_neighbors.popDirty().items():
+            vh_properties.set(id_num, 'neighbors', value)
+    # end def
+
     def helixProperties(self,
                 id_num_list: List[int] = None) -> Tuple[dict, np.ndarray, np.ndarray]:
         """
@@ -1323,18 +1588,18 @@ class NucleicAcidPart(Part):
         Raises:
             ValueError:
         """
+        if self.vh_neighbors.dirty:
+            self._syncNeighborProperties()
         if id_num_list is None:
             lim = max(self._highest_even_id_num_used + 1,
                       self._highest_odd_id_num_used + 1)
-            props = self.vh_properties.iloc[:lim]
-            props = props.to_dict(orient='list')
+            props = self.vh_properties.toDict(slice(0, lim))
             origins = self._origin_pts[:lim]
             directions = self.directions[:lim]
             return props, origins, directions
         elif isinstance(id_num_list, list):
             # select by list of indices
-            props = self.vh_properties.iloc[id_num_list].reset_index(drop=True)
-            props = props.to_dict(orient='list')
+            props = self.vh_properties.toDict(id_num_list)
             origins = self._origin_pts[id_num_list]
             directions = self.getDirections(id_num_list)
             return props, origins, directions
@@ -1363,12 +1628,10 @@ class NucleicAcidPart(Part):
         """
         if safe:
             _, _ = self.getOffsetAndSize(id_num)
-        # 1. Find insert indices
-        series = self.vh_properties.loc[id_num]
-        # to_dict doesn't promote to python native types needed by QVariant
-        # leaves as numpy integers and floats
-        out = dict((k, v.item()) if isinstance(v, (np.float64, np.int64, np.bool_))
-                   else (k, v) for k, v in zip(series.index, series.tolist()))
+        if self.vh_neighbors.dirty:
+            self._syncNeighborProperties()
+        # values are python native types as needed by QVariant
+        out = self.vh_properties.row(id_num)
         if inject_extras:
             bpr = float(out['bases_per_repeat'])
             tpr = float(out['turns_per_repeat'])
@@ -1440,10 +1703,15 @@ class NucleicAcidPart(Part):
 
         for index, key in enumerate(keys_list):
             try:
-                self.vh_properties.loc[id_num, (key)] = values_list[index]
+                self.vh_properties.set(id_num, key, values_list[index])
             except KeyError:
                 print("Key not in VH properties {}: {}, {}".format(key, id_num, values))
                 raise
+        if 'neighbors' in keys_list:
+            neighbors = values_list[keys_list.index('neighbors')]
+            self.vh_neighbors.set(id_num, parseNeighbors(neighbors), is_dirty=False)
+        if not XOVER_TABLE_PROPERTY_KEYS.isdisjoint(keys_list):
+            self._invalidateCrossoverTable(id_num)
 
         if emit_signals:
             self.partVirtualHelixPropertyChangedSignal.emit(
@@ -1521,25 +1789,21 @@ class NucleicAcidPart(Part):
         else:  # delta == 0
             return
         _, final_size = self.getOffsetAndSize(id_num)
-        self.vh_properties.loc[id_num, 'length'] = final_size
-        self._group_properties['max_vhelix_length'] = self.vh_properties['length'].max()
-        # return 0, self.vh_properties['length'].idxmax()
+        self.vh_properties.set(id_num, 'length', final_size)
+        self._group_properties['max_vhelix_length'] = self._arena.maxSize()
         return self.zBoundsIds()
     # end def
 
     def zBoundsIds(self) -> Tuple[int, int]:
         """Get the ID numbers of the Z bounds accounting for infinity for
-        unitialized virtual helices
+        unitialized virtual helices.  Ties go to the lowest ID number.  The
+        Z extent of every virtual helix is kept by the
+        :class:`CoordinateArena`, so this does not scan the coordinates.
 
         Returns:
             tuple: of :obj:`int`, of form (ID_z_min, ID_z_max)
         """
-        test = self.axis_pts[:, 2]
-        id_z_min = self.id_nums[np.argmin(test)]
-        # use numpy masked arrays to mask out infinites
-        id_z_max = self.id_nums[np.argmax(np.ma.array(test,
-                                                      mask=np.isinf(test)))]
-        return id_z_min, id_z_max
+        return self._arena.zBounds()
     # end def
 
     def _removeHelix(self, id_num: int):
@@ -1556,6 +1820,7 @@ class NucleicAcidPart(Part):
         did_remove = self._removeCoordinates(id_num, size, is_right=False)
         self._recycleIdNum(id_num)
         assert did_remove
+        self.vh_neighbors.remove(id_num)
         # TODO if making 'virtual_helix_order' an instance property,
         # this needs to be changed
         self._group_properties['virtual_helix_order'].remove(id_num)
@@ -1601,12 +1866,9 @@ class NucleicAcidPart(Part):
                    "start index {} given existing size {}")
             raise IndexError(err.format(len(points), idx_start, size))
 
-        new_axis_pts, new_fwd_pts, new_rev_pts = points
-        lo = offset + idx_start
-        hi = lo + len(new_axis_pts)
-        self.axis_pts[lo:hi] = new_axis_pts
-        self.fwd_pts[lo:hi] = new_fwd_pts
-        self.rev_pts[lo:hi] = new_rev_pts
+        self._arena.setPoints(id_num, points, idx_start)
+        self._point_grid.invalidate(id_num)
+        self._invalidateCrossoverTable(id_num)
     # end def
 
     def _removeCoordinates(self, id_num: int, length: int, is_right: bool) -> bool:
@@ -1625,78 +1887,19 @@ class NucleicAcidPart(Part):
             KeyError:
             IndexError:
         """
-        offset, size = self.getOffsetAndSize(id_num)
-        if length > size:
-            raise IndexError("length longer {} than indices existing".format(length))
-        lo, hi = offset, offset + size
-        if is_right:
-            idx_start, idx_stop = hi - length, hi
-        else:
-            idx_start, idx_stop = lo, lo + length
-
+        _, _ = self.getOffsetAndSize(id_num)
         self._resetPointCache()
-        offset_and_size = self._offset_and_size
-        current_offset_and_size_length = len(offset_and_size)
-
-        # 1. Move the good data
-        total_points = self.total_points
-        relocate_idx_end = total_points - length
-
-        axis_pts = self.axis_pts
-        try:
-            axis_pts[idx_start:relocate_idx_end] = axis_pts[idx_stop:total_points]
-        except Exception:
-            err = "idx_start {}, relocate_idx_end {}, idx_stop {}, total_points {}, length {}"
-            print(err.format(idx_start, relocate_idx_end, idx_stop, total_points, length))
-            raise
-        axis_pts[relocate_idx_end:total_points] = np.inf
+        self._invalidateCrossoverTable(id_num)
 
-        fwd_pts = self.fwd_pts
-        fwd_pts[idx_start:relocate_idx_end] = fwd_pts[idx_stop:total_points]
-        fwd_pts[relocate_idx_end:total_points] = np.inf
-
-        rev_pts = self.rev_pts
-        rev_pts[idx_start:relocate_idx_end] = rev_pts[idx_stop:total_points]
-        rev_pts[relocate_idx_end:total_points] = np.inf
-
-        id_nums = self.id_nums
-        id_nums[idx_start:relocate_idx_end] = id_nums[idx_stop:total_points]
-        id_nums[relocate_idx_end:total_points] = -1
-
-        indices = self.indices
-        indices[idx_start:relocate_idx_end] = indices[idx_stop:total_points]
-        indices[relocate_idx_end:total_points] = 0
-        if not is_right:
-            # We need to adjust the base index
-            # lo offset index should not change for a given id_num
-            indices[lo:lo + length] -= length
-
-        # 2. Adjust the offsets of id_nums greater than id_num
-        for i, item in enumerate(offset_and_size[id_num + 1:], start=1):
-            if item is not None:
-                offset_other, size_other = item
-                offset_and_size[i + id_num] = (offset_other - length, size_other)
-
-        # 3. Check if we need to remove Virtual Helix
-        if size == length:
+        did_remove = self._arena.trim(id_num, length, is_right)
+        if did_remove:
             self.total_id_nums -= 1
             self._resetOriginCache()
-            offset_and_size[id_num] = None
             self._origin_pts[id_num, :] = (np.inf, np.inf, np.inf)  # set off to infinity
-            # trim the unused id_nums at the end
-            remove_count = 0
-            for i in range(current_offset_and_size_length - 1, id_num - 1, -1):
-                if offset_and_size[i] is None:
-                    remove_count += 1
-                else:
-                    break
-            self._offset_and_size = offset_and_size[:current_offset_and_size_length - remove_count]
-            did_remove = True
+            self._point_grid.remove(id_num)
+            self._origin_grid.remove(id_num)
         else:
-            # print("Did remove", size, length)
-            offset_and_size[id_num] = (offset, size - length)
-            did_remove = False
-        self.total_points -= length
+            self._point_grid.invalidate(id_num)
         return did_remove
     # end def
 
@@ -1730,7 +1933,9 @@ class NucleicAcidPart(Part):
     def _queryBasePoint(self,
                         radius: float,
                         point: Vec3T) -> Tuple[np.ndarray, np.ndarray]:
-        """return the indices of all virtual helices closer than radius
+        """return the indices of all virtual helices closer than radius.
+        Uses the spatial index when enabled, falling back to
+        :meth:`_queryBasePointBruteForce` for queries the index can't narrow
 
         Args:
             radius: distance to consider
@@ -1739,7 +1944,66 @@ class NucleicAcidPart(Part):
         Returns:
             tuple of :obj:`ndarray`
         """
-        difference = self.axis_pts - point
+        if self.use_spatial_index:
+            res = self._queryBasePointIndexed(radius, point)
+            if res is not None:
+                return res
+        return self._queryBasePointBruteForce(radius, point)
+    # end def
+
+    def _queryBasePointIndexed(self,
+                        radius: float,
+                        point: Vec3T) -> Tuple[np.ndarray, np.ndarray]:
+        """Spatial index version of :meth:`_queryBasePoint`.  Results are
+        ordered by ID number then index like the brute force version
+
+        Args:
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+
+        Returns:
+            tuple of :obj:`ndarray` or ``None`` if the index can't handle the
+            query
+        """
+        point_grid = self._point_grid
+        if point_grid.dirty:
+            for id_num in point_grid.dirty.copy():
+                point_grid.rebin(id_num, self.getCoordinates(id_num)[0])
+            point_grid.dirty.clear()
+        candidates = point_grid.candidates(radius, point)
+        if candidates is None:
+            return None
+        offset_and_size = self._offset_and_size
+        rows_list = []
+        for id_num in sorted(candidates):
+            idx_list = candidates[id_num]
+            idxs = idx_list[0] if len(idx_list) == 1 else np.sort(np.concatenate(idx_list))
+            rows_list.append(idxs + offset_and_size[id_num][0])
+        if not rows_list:
+            empty = np.empty((0,), dtype=int)
+            return empty, empty
+        rows = np.concatenate(rows_list)
+        difference = self.axis_pts[rows] - point
+        delta = inner1d(difference, difference)
+        close_points = rows[delta < radius*radius]
+        return (np.take(self.id_nums, close_points),
+                np.take(self.indices, close_points))
+    # end def
+
+    def _queryBasePointBruteForce(self,
+                        radius: float,
+                        point: Vec3T) -> Tuple[np.ndarray, np.ndarray]:
+        """Brute force version of :meth:`_queryBasePoint` checking every point
+
+        Args:
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+
+        Returns:
+            tuple of :obj:`ndarray`
+        """
+        axis_pts, _, _, id_nums, indices = self._arena.flatView()
+        difference = axis_pts - point
         ldiff = len(difference)
         delta = self.delta3D_scratch
         if ldiff != len(delta):
@@ -1748,10 +2012,10 @@ class NucleicAcidPart(Part):
         # compute square of distance to point
         delta = inner1d(difference, difference, out=delta)
         close_points, = np.where(delta < radius*radius)
-        # return list(zip(    np.take(self.id_nums, close_points),
-        #                     np.take(self.indices, close_points) ))
-        return (np.take(self.id_nums, close_points),
-                np.take(self.indices, close_points))
+        # return list(zip(    np.take(id_nums, close_points),
+        #                     np.take(indices, close_points) ))
+        return (np.take(id_nums, close_points),
+                np.take(indices, close_points))
     # end def
 
     def queryVirtualHelixOrigin(self,
@@ -1795,6 +2059,31 @@ class NucleicAcidPart(Part):
         """Return the indices of all id_nums closer
         than radius, sorted by distance
 
+        Args:
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+
+        Returns:
+            ``ndarray`` close origin points to ``point``
+        """
+        if self.use_spatial_index:
+            candidates = self._origin_grid.candidatesInRadius(radius, point)
+            if candidates is not None:
+                candidates = np.array(sorted(candidates), dtype=int)
+                difference = self._origin_pts[candidates] - point
+                delta = inner1d(difference, difference)
+                close_points, = np.where(delta <= radius*radius)
+                sorted_idxs = np.argsort(np.take(delta, close_points))
+                return candidates[close_points[sorted_idxs]]
+        return self._queryVirtualHelixOriginBruteForce(radius, point)
+    # end def
+
+    def _queryVirtualHelixOriginBruteForce(self,
+                                            radius: float,
+                                            point: Vec3T) -> np.ndarray:
+        """Brute force version of :meth:`_queryVirtualHelixOrigin` checking
+        every origin
+
         Args:
             radius: distance to consider
             point: of :obj:`float` of length 3
@@ -1828,6 +2117,30 @@ class NucleicAcidPart(Part):
                 definining the lower left and upper right corner of the
                 rectangle respetively
 
+        Returns:
+            ndarray: list of ID numbers satisfying the query
+        """
+        if self.use_spatial_index:
+            candidates = self._origin_grid.candidatesInRect(rect)
+            if candidates is not None:
+                x1, y1, x2, y2 = rect
+                candidates = np.array(sorted(candidates), dtype=int)
+                xs = self._origin_pts[candidates, 0]
+                ys = self._origin_pts[candidates, 1]
+                mask = (xs > x1) & (xs < x2) & (ys > y1) & (ys < y2)
+                return candidates[mask]
+        return self._queryVirtualHelixOriginRectBruteForce(rect)
+    # end def
+
+    def _queryVirtualHelixOriginRectBruteForce(self, rect: RectT) -> np.ndarray:
+        """Brute force version of :meth:`_queryVirtualHelixOriginRect` checking
+        every origin
+
+        Args:
+            rect: of :obj:`float` rectangle defined by::
+
+                    (x1, y1, x2, y2)
+
         Returns:
             ndarray: list of ID numbers satisfying the query
         """
@@ -1929,7 +2242,7 @@ class NucleicAcidPart(Part):
                 (start index, bases per repeat)
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr = self.vh_properties.loc[id_num, 'bases_per_repeat']
+        bpr = self.vh_properties.get(id_num, 'bases_per_repeat')
         half_period = bpr // 2
         if size - index < bpr:
             start = size - bpr
@@ -1964,8 +2277,8 @@ class NucleicAcidPart(Part):
 
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr, tpr = self.vh_properties.loc[id_num,
-                                          ['bases_per_repeat', 'turns_per_repeat']]
+        bpr, tpr = self.vh_properties.getValues(id_num,
+                                                ['bases_per_repeat', 'turns_per_repeat'])
         bases_per_turn = bpr / tpr
         if index is None:
             start, length = 0, size
@@ -2000,7 +2313,7 @@ class NucleicAcidPart(Part):
         key_prop_list = ['eulerZ', 'bases_per_repeat',
                          'turns_per_repeat', 'minor_groove_angle']
         for neighbor_id in neighbors:
-            eulerZ, bpr, tpr, mgroove = self.vh_properties.loc[neighbor_id, key_prop_list]
+            eulerZ, bpr, tpr, mgroove = self.vh_properties.getValues(neighbor_id, key_prop_list)
             twist_per_base = tpr*360./bpr
             half_period = math.floor(bpr / 2)
             tpb = math.radians(twist_per_base)
@@ -2105,6 +2418,11 @@ class NucleicAcidPart(Part):
         """Get indices of all virtual helices phosphates within a bond
         length of each phosphate for the id_num Virtual Helix.
 
+        All phosphates of the (windowed) virtual helix are compared with the
+        phosphates of each neighbor at once, see
+        :meth:`_pairwiseCrossoverHits`.  Results are identical to
+        :meth:`_queryIdNumNeighborPerBase`
+
         Args:
             id_num: virtual helix ID number
             neighbors: neighbors of id_num
@@ -2123,8 +2441,224 @@ class NucleicAcidPart(Part):
             ValueError:
         """
         offset, size = self.getOffsetAndSize(id_num)
-        bpr, tpr = self.vh_properties.loc[id_num,
-                                          ['bases_per_repeat', 'turns_per_repeat']]
+        bpr, tpr = self.vh_properties.getValues(id_num,
+                                                ['bases_per_repeat', 'turns_per_repeat'])
+        bases_per_turn = bpr / tpr
+        start, length = self._crossoverWindow(id_num, index)
+        RADIUS = self._radius
+        BW = self._BASE_WIDTH
+
+        # same ideal crossover distances as _queryIdNumNeighborPerBase
+        half_twist_per_base = math.pi/bases_per_turn
+        ma_f = 2.55
+        r2_radial = (RADIUS*((1. - math.cos(half_twist_per_base)) +
+                             (1. - math.cos(ma_f*half_twist_per_base))))**2
+        r2_tangent = (RADIUS*(math.sin(half_twist_per_base) +
+                              math.sin(ma_f*half_twist_per_base)))**2
+        r2_axial = BW*BW
+        rsquared_ap = r2_tangent + r2_radial
+        ap_limits = (0, rsquared_ap, None, 0.3*r2_axial)
+        p_limits = (r2_axial, rsquared_ap + r2_axial + 0.25*r2_axial,
+                    0.3*r2_axial, 1.1*r2_axial)
+
+        axis_pts = self.axis_pts
+        fwd_pts = self.fwd_pts
+        rev_pts = self.rev_pts
+        lo, hi = offset + start, offset + start + length
+        this_fwd_pts = fwd_pts[lo:hi]
+        this_rev_pts = rev_pts[lo:hi]
+
+        pairwiseHits = self._pairwiseCrossoverHits
+        per_neighbor_hits = {}
+        for neighbor_id in neighbors:
+            offset, size = self.getOffsetAndSize(neighbor_id)
+            nfwd_pts = fwd_pts[offset:offset + size]
+            nrev_pts = rev_pts[offset:offset + size]
+
+            fwd_axis_hits = _mergeCrossoverHits(start,
+                                                pairwiseHits(this_fwd_pts, nfwd_pts, p_limits),
+                                                pairwiseHits(this_fwd_pts, nrev_pts, ap_limits))
+            rev_axis_hits = _mergeCrossoverHits(start,
+                                                pairwiseHits(this_rev_pts, nfwd_pts, ap_limits),
+                                                pairwiseHits(this_rev_pts, nrev_pts, p_limits))
+            per_neighbor_hits[neighbor_id] = (fwd_axis_hits, rev_axis_hits)
+        # end for
+        return per_neighbor_hits, self._crossoverPairs(id_num, per_neighbor_hits)
+    # end def
+
+    def _crossoverWindow(self, id_num: int, index: int = None) -> Tuple[int, int]:
+        """Range of a virtual helix searched for potential crossovers
+
+        Args:
+            id_num: virtual helix ID number
+            index: optional, index to center a ``bases_per_repeat`` long window
+                on. default is the whole virtual helix
+
+        Returns:
+            tuple of form::
+
+                (start index, length)
+        """
+        offset, size = self.getOffsetAndSize(id_num)
+        if index is None:
+            return 0, size
+        bpr = self.vh_properties.get(id_num, 'bases_per_repeat')
+        half_period = bpr // 2
+        if size - index < bpr:
+            return int(size - bpr), int(bpr)
+        else:
+            return int(max(index - half_period, 0)), int(bpr)
+    # end def
+
+    def _crossoverPairs(self,
+                        id_num: int,
+                        per_neighbor_hits: Dict[int, Tuple[HitListT, HitListT]]
+                        ) -> Tuple[dict, dict]:
+        """Scan potential crossover hits for the bases pairing up in
+        crossovers
+
+        Args:
+            id_num: virtual helix ID number
+            per_neighbor_hits: hits as returned by :meth:`queryIdNumNeighbor`
+
+        Returns:
+            tuple of :obj:`dict` of form (fwd_axis_pairs, rev_axis_pairs)
+            mapping an index to a tuple of form (is_5p, neighbor_id_num)
+        """
+        axis_pts = self.axis_pts
+        offset, size = self.getOffsetAndSize(id_num)
+        this_z = axis_pts[offset:offset + size, 2].tolist()
+        fwd_axis_pairs = {}
+        rev_axis_pairs = {}
+        for neighbor_id, (fwd_axis_hits, rev_axis_hits) in per_neighbor_hits.items():
+            offset, size = self.getOffsetAndSize(neighbor_id)
+            neighbor_z = axis_pts[offset:offset + size, 2].tolist()
+
+            # Scan for pairs of bases in AP xovers
+            # NOTE: as in the per base version only the pairs of the last
+            # neighbor are kept for the forward strand
+            idx_last = -2
+            fwd_axis_pairs = {}
+            for i, f_idxs, r_idxs in fwd_axis_hits:
+                if r_idxs:
+                    if idx_last + 1 == i:
+                        fwd_axis_pairs[idx_last] = (True, neighbor_id)  # 5 prime  most strand
+                        fwd_axis_pairs[i] = (False, neighbor_id)        # 3 prime most strand
+                    idx_last = i
+                if f_idxs:
+                    # the last neighbor index wins
+                    is_5p = not this_z[i] > neighbor_z[f_idxs[-1]]
+                    fwd_axis_pairs[i] = (is_5p, neighbor_id)
+
+            idx_last = -2
+            for i, f_idxs, r_idxs in rev_axis_hits:
+                if f_idxs:
+                    if idx_last + 1 == i:
+                        rev_axis_pairs[idx_last] = (False, neighbor_id)    # 3 prime  most strand
+                        rev_axis_pairs[i] = (True, neighbor_id)            # 5 prime most strand
+                    idx_last = i
+                if r_idxs:
+                    is_5p = this_z[i] > neighbor_z[r_idxs[-1]]
+                    rev_axis_pairs[i] = (is_5p, neighbor_id)
+        # end for
+        return fwd_axis_pairs, rev_axis_pairs
+    # end def
+
+    @staticmethod
+    def _pairwiseCrossoverHits(pts: np.ndarray,
+                                other_pts: np.ndarray,
+                                limits: Tuple[float, float, float, float]
+                                ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find all pairs of points in ``pts`` and ``other_pts`` within
+        ``limits``.  Every limit requires a small axial (Z) delta, so
+        ``other_pts`` is sorted by Z and only pairs in the axial window are
+        tested, in blocks of at most ``CROSSOVER_BLOCK_SIZE`` pairs.
+
+        Args:
+            pts: M x 3 array of phosphate points
+            other_pts: N x 3 array of phosphate points
+            limits: exclusive bounds of the form::
+
+                (r2_min, r2_max, zdelta2_min, zdelta2_max)
+
+                where ``zdelta2_min`` may be ``None``
+
+        Returns:
+            tuple of :obj:`ndarray` of form (rows, columns) of the pairs within
+            the limits, ordered by row then column
+        """
+        r2_min, r2_max, z2_min, z2_max = limits
+        empty = np.empty((0,), dtype=int)
+        if len(other_pts) == 0 or len(pts) == 0:
+            return empty, empty
+        # pad the window, the exact test is done on the candidates below
+        z_window = math.sqrt(z2_max)*(1. + 1e-6)
+        order = np.argsort(other_pts[:, 2], kind='stable')
+        sorted_z = other_pts[order, 2]
+        z = pts[:, 2]
+        lo_idxs = np.searchsorted(sorted_z, z - z_window, side='left')
+        counts = np.searchsorted(sorted_z, z + z_window, side='right') - lo_idxs
+        cum_counts = np.cumsum(counts)
+
+        rows_list, cols_list = [], []
+        num_pts = len(pts)
+        row_lo = 0
+        while row_lo < num_pts:
+            done = cum_counts[row_lo - 1] if row_lo > 0 else 0
+            row_hi = int(np.searchsorted(cum_counts, done + CROSSOVER_BLOCK_SIZE, side='right'))
+            row_hi = max(row_hi, row_lo + 1)
+            block_counts = counts[row_lo:row_hi]
+            total = int(block_counts.sum())
+            if total > 0:
+                rows = np.repeat(np.arange(row_lo, row_hi), block_counts)
+                # position of each candidate within its row's window
+                starts = np.repeat(cum_counts[row_lo:row_hi] - block_counts - done, block_counts)
+                cols = order[np.repeat(lo_idxs[row_lo:row_hi], block_counts) +
+                             np.arange(total) - starts]
+                difference = other_pts[cols] - pts[rows]
+                delta = inner1d(difference, difference)
+                zdelta = np.square(difference[:, 2])
+                mask = (delta > r2_min) & (delta < r2_max) & (zdelta < z2_max)
+                if z2_min is not None:
+                    mask &= zdelta > z2_min
+                rows_list.append(rows[mask])
+                cols_list.append(cols[mask])
+            row_lo = row_hi
+        if not rows_list:
+            return empty, empty
+        rows = np.concatenate(rows_list)
+        cols = np.concatenate(cols_list)
+        sort_idxs = np.lexsort((cols, rows))
+        return rows[sort_idxs], cols[sort_idxs]
+    # end def
+
+    def _queryIdNumNeighborPerBase(self,
+                id_num: int,
+                neighbors: List[int],
+                index: int = None) -> Dict[int, Tuple[HitListT, HitListT]]:
+        """Per base reference implementation of :meth:`queryIdNumNeighbor`.
+        Kept to verify and benchmark the vectorized version against.
+
+        Args:
+            id_num: virtual helix ID number
+            neighbors: neighbors of id_num
+            index:  optional, of :obj:`int` start_index into a virtual helix
+
+        Returns:
+            ``dict`` of :obj:`tuple` of form::
+
+                neighbor_id_num: (fwd_hit_list, rev_hit_list)
+
+            where each list has the form:
+
+                [(id_num_index, forward_neighbor_idxs, reverse_neighbor_idxs), ...]]
+
+        Raises:
+            ValueError:
+        """
+        offset, size = self.getOffsetAndSize(id_num)
+        bpr, tpr = self.vh_properties.getValues(id_num,
+                                                ['bases_per_repeat', 'turns_per_repeat'])
         bases_per_turn = bpr / tpr
         if index is None:
             start, length = 0, size
@@ -2467,13 +3001,16 @@ class NucleicAcidPart(Part):
     def potentialCrossoverMap(self,
                 id_num: int,
                 idx: int = None) -> Dict[int, Tuple[HitListT, HitListT]]:
-        """
+        """Potential crossovers of a virtual helix, looked up in the crossover
+        table.  Same results as :meth:`queryIdNumNeighbor`
+
         Args:
             id_num: ID Number
             idx: index
 
         Returns:
-            dictionary of tuples:
+            tuple of form (per_neighbor_hits, (fwd_axis_pairs, rev_axis_pairs))
+            where per_neighbor_hits is a dictionary of tuples:
 
                 neighbor_id_num: (fwd_hit_list, rev_hit_list)
 
@@ -2483,17 +3020,66 @@ class NucleicAcidPart(Part):
 
 
         """
-        neighbors = literal_eval(self.vh_properties.loc[id_num, 'neighbors'])
+        neighbors = self.vh_neighbors.get(id_num)
         # alpha = self.getProperty('crossover_span_angle')
 
         # idx = None # FORCE this for now to prevent animation GC crashes
 
         # per_neighbor_hits = self._queryIdNumRangeNeighbor(id_num, neighbors,
         #                                                 alpha, index=idx)
-        per_neighbor_hits = self.queryIdNumNeighbor(id_num, neighbors, index=idx)
+        per_neighbor_hits = self._crossoverTableHits(id_num, neighbors)
+        if idx is not None:
+            start, length = self._crossoverWindow(id_num, idx)
+            per_neighbor_hits = {neighbor_id: (windowHits(fwd_hits, start, length),
+                                               windowHits(rev_hits, start, length))
+                                 for neighbor_id, (fwd_hits, rev_hits) in per_neighbor_hits.items()}
+        else:
+            per_neighbor_hits = dict(per_neighbor_hits)
+        return per_neighbor_hits, self._crossoverPairs(id_num, per_neighbor_hits)
+    # end def
+
+    def _crossoverTableHits(self,
+                            id_num: int,
+                            neighbors: List[int]) -> Dict[int, Tuple[HitListT, HitListT]]:
+        """Full length potential crossover hits of a virtual helix from the
+        crossover table, computing them on a miss
+
+        Args:
+            id_num: ID Number
+            neighbors: current neighbors of ``id_num``
+
+        Returns:
+            dictionary of tuples of form::
+
+                neighbor_id_num: (fwd_hit_list, rev_hit_list)
+        """
+        xover_table = self._xover_table
+        per_neighbor_hits = xover_table.get(id_num, neighbors)
+        if per_neighbor_hits is None:
+            per_neighbor_hits, _ = self.queryIdNumNeighbor(id_num, neighbors)
+            xover_table.set(id_num, neighbors, per_neighbor_hits)
         return per_neighbor_hits
+    # end def
+
+    def buildCrossoverTable(self):
+        """Fill the crossover table for all virtual helices, e.g. after
+        loading a design, so that :meth:`potentialCrossoverMap` is a lookup
+        """
+        vh_neighbors = self.vh_neighbors
+        for id_num in sorted(self.reserved_ids):
+            self._crossoverTableHits(id_num, vh_neighbors.get(id_num))
+    # end def
+
+    def _invalidateCrossoverTable(self, id_num: int):
+        """Drop potential crossovers depending on a virtual helix after its
+        coordinates or crossover related properties change
 
+        Args:
+            id_num: ID Number
+        """
+        self._xover_table.invalidate(id_num)
     # end def
+
     def boundDimensions(self, scale_factor: float = 1.0) -> RectT:
         """Returns a tuple of rectangle defining the XY limits of a part"""
         DMIN = 10  # 30
@@ -2510,16 +3096,17 @@ class NucleicAcidPart(Part):
     # end def
 
     def getSequences(self) -> str:
-        """getSequences"""
-        # s = "Start\tEnd\tColor\tMod5\tSequence\tMod3\tAbstractSequence\n"
-        keys = ['Start', 'End', 'Color', 'Mod5',
-                'Sequence', 'Mod3', 'AbstractSequence']
-        out = {key: [] for key in keys}
-        for oligo in self._oligos:
-            oligo.sequenceExport(out)
-        df = pd.DataFrame(out, columns=keys)
-        s = df.to_csv(index=False)
-        return s
+        """getSequences
+
+        Returns:
+            CSV of the oligo sequences, see
+            :func:`cadnano.fileio.sequenceexport.writeCSV` to write them to a
+            file as they are produced
+        """
+        from cadnano.fileio.sequenceexport import iterPartRows, writeCSV
+        output = io.StringIO()
+        writeCSV(output, iterPartRows(self))
+        return output.getvalue()
 
     def getIdNums(self) -> Set[int]:
         """return the set of all ids used"""
@@ -2667,6 +3254,88 @@ class NucleicAcidPart(Part):
         return -1
     # end def
 
+    def autoStaple(self, min_length: int = MIN_LENGTH,
+                        max_length: int = MAX_LENGTH,
+                        target_length: int = TARGET_LENGTH,
+                        min_xover_distance: int = MIN_XOVER_DISTANCE,
+                        do_break: bool = True,
+                        use_undostack: bool = True) -> List[OligoT]:
+        """Create staples complementary to the scaffold wherever it has no
+        staple, join them with crossovers at every double crossover site of
+        neighboring virtual helices and break them to ``min_length`` to
+        ``max_length`` bases, closest to ``target_length``.  Everything is
+        computed by a :class:`StapleEngine` before the staples are created in
+        one :class:`CreateStrandsCommand`.
+
+        Args:
+            min_length: fewest bases of a staple
+            max_length: most bases of a staple
+            target_length: preferred number of bases of a staple
+            min_xover_distance: fewest bases between a break and a crossover
+            do_break: break the staples, default is ``True``
+            use_undostack: default is ``True``
+
+        Returns:
+            the new staple oligos, of which only those without any possible
+            break may be circular
+        """
+        engine = StapleEngine(self, min_length, max_length, target_length, min_xover_distance)
+        runs, xovers = engine.autoStaple(do_break)
+        strands = []
+        offsets = {}
+        for id_num, (is_fwd, lows, highs) in runs.items():
+            strandset = self.getStrandSets(id_num)[0 if is_fwd else 1]
+            offsets[id_num] = len(strands)
+            strands += [(strandset, low, high) for low, high in zip(lows.tolist(), highs.tolist())]
+        if not strands:
+            return []
+
+        def strandAt(id_num, idx):
+            return offsets[id_num] + int(np.searchsorted(runs[id_num][1], idx, side='right')) - 1
+        xover_idxs = [(strandAt(id_num5p, idx5p), strandAt(id_num3p, idx3p))
+                      for id_num5p, idx5p, id_num3p, idx3p in xovers]
+        c = CreateStrandsCommand(self, strands, xover_idxs)
+        util.doCmd(self, c, use_undostack=use_undostack)
+        return c.oligos()
+    # end def
+
+    def autoBreak(self, oligos: Iterable[OligoT] = None,
+                        min_length: int = MIN_LENGTH,
+                        max_length: int = MAX_LENGTH,
+                        target_length: int = TARGET_LENGTH,
+                        min_xover_distance: int = MIN_XOVER_DISTANCE,
+                        use_undostack: bool = True) -> Tuple[int, List[OligoT]]:
+        """Break staple oligos to ``min_length`` to ``max_length`` bases,
+        closest to ``target_length``, never within ``min_xover_distance``
+        bases of a crossover.  The breaks of all oligos are computed by a
+        :class:`StapleEngine` and made in one :class:`SplitStrandsCommand`.
+        Linear oligos that can't be broken that way are left alone, circular
+        ones are opened by a single break where possible, see
+        :meth:`StapleEngine.breakChains`.
+
+        Args:
+            oligos: default is every staple oligo of the part
+            min_length: fewest bases of a staple
+            max_length: most bases of a staple
+            target_length: preferred number of bases of a staple
+            min_xover_distance: fewest bases between a break and a crossover
+            use_undostack: default is ``True``
+
+        Returns:
+            tuple of form::
+
+                (number of breaks, circular oligos left unbroken)
+        """
+        if oligos is None:
+            oligos = [olg for olg in self._oligos if olg.strand5p().strandSet().isStaple()]
+        engine = StapleEngine(self, min_length, max_length, target_length, min_xover_distance)
+        splits, whole_loops = engine.oligoBreaks(oligos)
+        if splits:
+            c = SplitStrandsCommand(self, splits)
+            util.doCmd(self, c, use_undostack=use_undostack)
+        return len(splits), whole_loops
+    # end def
+
     def _addOligoToSet(self, oligo: OligoT, emit_signals: bool = False):
         """This is an exceptional private method not part of the API as this
         is to be called only by an Oligo.
@@ -2752,7 +3421,9 @@ class NucleicAcidPart(Part):
                                     properties_list: List[Tuple] = None,
                                     parities: List[int] = None,
                                     safe_list: List[bool] = None,
-                                    use_undo_stack=True) -> List[int]:
+                                    use_undo_stack=True,
+                                    directions: List[Vec3T] = None,
+                                    points: PointsT = None) -> List[int]:
         """Create multiple helices at once.
 
         This method requires that x_list and y_list be specified.  Otherwise,
@@ -2761,11 +3432,11 @@ class NucleicAcidPart(Part):
         lists that have lengths equal to that of x_list and y_list (which must
         also be lists with equal lengths).
 
-        For each element in the specified lists, a CreateVirtualHelixCommand is
-        created and queued in a list.  execCommandList is then called to batch
-        the creation of virtual helices in an undo stack macro.  This results in
-        one undo/redo operation for all the virtual helices created in this
-        batch
+        A single CreateVirtualHelicesCommand creates all the virtual helices
+        in one pass:  the part's arrays grow once, neighbors are found
+        together and the views get one ``partVirtualHelicesAddedSignal``
+        instead of a signal per virtual helix.  This results in one undo/redo
+        operation for all the virtual helices created in this batch
 
         Args:
             x_list:  A list of length N corresponding to the x
@@ -2786,6 +3457,11 @@ class NucleicAcidPart(Part):
                 neighbors should be updated
             use_undo_stack (bool):  whether or not the undo stack should be used
                 for this operation
+            directions:  a list of length N corresponding to the direction of
+                each of the N Virtual Helices to be made, default is (0, 0, 1)
+            points: optional, the axis, forward and reverse points of the N
+                Virtual Helices one after the other, e.g. as saved in a file,
+                used instead of computing them
 
         Returns:
             a list of id_numbers that were created during this batch operation
@@ -2806,34 +3482,37 @@ class NucleicAcidPart(Part):
         assert isinstance(use_undo_stack, bool)
         assert parities is None or isinstance(parities, (list, tuple))
         assert parities is None or len(parities) == len(x_list)
+        assert directions is None or isinstance(directions, (list, tuple))
+        assert directions is None or len(directions) == len(x_list)
 
-        commands = []
+        if len(x_list) == 0:
+            return []
         id_numbers = []
+        origins = []
+        lengths = []
 
         for i, x in enumerate(x_list):
             y = y_list[i]
             z = z_list[i] if z_list else 0.0
             _length = length[i] if length else self._STEP_SIZE*2
             _id_num = id_nums[i] if id_nums is not None else None
-            _properties = properties_list[i] if properties_list is not None else None
-            _safe = safe_list[i] if safe_list is not None else True
             _parity = parities[i] if parities is not None else None
 
             # Reserve the _id_num to prevent id_number collisions between VHs created in this loop
             if _id_num is None:
                 _id_num = self._getNewIdNum(parity=_parity)
-                self._reserveIdNum(requested_id_num=_id_num)
-
-            command = CreateVirtualHelixCommand(self, x=x, y=y, z=z,
-                                                length=_length,
-                                                id_num=_id_num,
-                                                properties=_properties,
-                                                safe=_safe,
-                                                parity=_parity)
-            commands.append(command)
+            self._reserveIdNum(requested_id_num=_id_num)
             id_numbers.append(_id_num)
-
-        util.execCommandList(self, commands=commands, desc='SPA', use_undostack=use_undo_stack)
+            origins.append((x, y, z))
+            lengths.append(_length)
+
+        if directions is None:
+            directions = [(0, 0, 1.)]*len(x_list)
+        command = CreateVirtualHelicesCommand(self, id_numbers, origins, directions, lengths,
+                                              properties_list=properties_list,
+                                              safe_list=safe_list,
+                                              points=points)
+        util.execCommandList(self, commands=[command], desc='SPA', use_undostack=use_undo_stack)
         return id_numbers
     # end def
 
@@ -3121,7 +3800,7 @@ class NucleicAcidPart(Part):
                                 new_size: int,
                                 use_undostack: bool = True,
                                 zoom_to_fit: bool = False):
-        old_size = self.vh_properties.loc[id_num, 'length']
+        old_size = self.vh_properties.get(id_num, 'length')
         delta = int(new_size - old_size)
         c = ResizeVirtualHelixCommand(self, id_num, True, delta, zoom_to_fit)
         util.doCmd(self, c, use_undostack=use_undostack)
@@ -3132,7 +3811,23 @@ class NucleicAcidPart(Part):
                                     dy: float,
                                     dz: float,
                                     finalize: bool,
-                                    use_undostack: bool = False):
+                                    use_undostack: bool = False,
+                                    preview: bool = False):
+        """Move virtual helices
+
+        Args:
+            vh_set: virtual helix ID numbers to move
+            dx: X distance
+            dy: Y distance
+            dz: Z distance
+            finalize: push a single command of the total move of a drag,
+                see :func:`util.finalizeCommands`
+            use_undostack (optional): default ``False``
+            preview (optional): without the undostack only, defer updating
+                neighbors and potential crossovers until the next move that
+                is not a preview or :meth:`finalizeTranslation`.  Meant for
+                the intermediate steps of a drag. default ``False``
+        """
         if use_undostack:
             c = TranslateVirtualHelicesCommand(self, vh_set, dx, dy, dz)
             if finalize:
@@ -3141,55 +3836,91 @@ class NucleicAcidPart(Part):
             else:
                 util.doCmd(self, c, use_undostack=True)
         else:
-            self._translateVirtualHelices(vh_set, dx, dy, dz, False)
+            self._translateVirtualHelices(vh_set, dx, dy, dz, False, preview=preview)
+    # end def
+
+    def finalizeTranslation(self):
+        """Update the neighbors and potential crossovers of virtual helices
+        moved by previews of :meth:`translateVirtualHelices`, for when a drag
+        ends without a final move.
+
+        emits ``partVirtualHelicesTranslatedSignal``
+        """
+        if self._translated_id_nums:
+            left_overs = self._updateTranslatedVirtualHelices()
+            self.partVirtualHelicesTranslatedSignal.emit(self, set(), left_overs, False)
     # end def
 
     def _translateVirtualHelices(self, vh_set: Set[int],
                                         dx: float,
                                         dy: float,
                                         dz: float,
-                                        do_deselect: bool):
+                                        do_deselect: bool,
+                                        preview: bool = False):
         """do_deselect tells a view to clear selections that might have
         undesirable Object parenting to make sure the translations are set
         correctly.  set to True when "undo-ing"
 
+        A ``preview`` only moves the coordinates and leaves the neighbors and
+        potential crossovers to the next translation that is not a preview.
+
         emits ``partVirtualHelicesTranslatedSignal``
         """
-        threshold = 2.1*self._radius
-        # 1. get old neighbor list
-        old_neighbors = set()
-        for id_num in vh_set:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            old_neighbors.update(neighbors)
-        # 2. move in the virtual_helix_group
         self._translateCoordinates(vh_set, (dx, dy, dz))
-        # 3. update neighbor calculations
-        new_neighbors = set()
-        for id_num in vh_set:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            try:
-                self.setVirtualHelixProperties( id_num,
-                                                'neighbors',
-                                                str(list(neighbors)),
-                                                use_undostack=False)
-            except Exception:
-                print("neighbors", list(neighbors))
-                raise
-            new_neighbors.update(neighbors)
+        self._translated_id_nums.update(vh_set)
+        if preview:
+            left_overs = set()
+        else:
+            left_overs = self._updateTranslatedVirtualHelices()
+            left_overs.difference_update(vh_set)
+        self.partVirtualHelicesTranslatedSignal.emit(self, vh_set, left_overs, do_deselect)
+    # end def
+
+    def _updateTranslatedVirtualHelices(self) -> Set[int]:
+        """Update the neighbors and potential crossovers of the virtual
+        helices translated since the last update.  Only the neighbors of
+        the moved virtual helices are searched for, the lists of the ones
+        left in place only gain or lose moved virtual helices.  Lists are
+        only written when they change.
 
-        # now update the old and new neighbors that were not in the vh set
-        left_overs = new_neighbors.union(old_neighbors).difference(vh_set)
+        Returns:
+            ID numbers of virtual helices not moved that were or are now
+            neighbors of a moved one
+        """
+        vh_dict = self._virtual_helices_dict
+        moved = {id_num for id_num in self._translated_id_nums if id_num in vh_dict}
+        self._translated_id_nums.clear()
+        if not moved:
+            return set()
+        for id_num in moved:
+            self._invalidateCrossoverTable(id_num)
+
+        vh_neighbors = self.vh_neighbors
+        old_neighbors = {id_num: vh_neighbors.get(id_num) for id_num in moved}
+        new_neighbors = self._batchOriginNeighbors(sorted(moved), 2.1*self._radius)
+        left_overs = set()
+        gained = defaultdict(list)
+        for id_num, neighbors in old_neighbors.items():
+            left_overs.update(neighbors)
+        for id_num, neighbors in new_neighbors.items():
+            left_overs.update(neighbors)
+            for neighbor_id in neighbors:
+                if neighbor_id not in moved:
+                    gained[neighbor_id].append(id_num)
+        left_overs.difference_update(moved)
+
+        changed = {}
+        for id_num, neighbors in new_neighbors.items():
+            if neighbors != sorted(old_neighbors[id_num]):
+                changed[id_num] = neighbors
         for id_num in left_overs:
-            neighbors = self._getVirtualHelixOriginNeighbors(id_num, threshold)
-            try:
-                self.setVirtualHelixProperties( id_num,
-                                                'neighbors',
-                                                str(list(neighbors)),
-                                                use_undostack=False)
-            except Exception:
-                print("neighbors", list(neighbors))
-                raise
-        self.partVirtualHelicesTranslatedSignal.emit(self, vh_set, left_overs, do_deselect)
+            old = vh_neighbors.get(id_num)
+            neighbors = sorted([x for x in old if x not in moved] + gained[id_num])
+            if neighbors != sorted(old):
+                changed[id_num] = neighbors
+        for id_num, neighbors in changed.items():
+            self._setVirtualHelixNeighbors(id_num, neighbors)
+        return left_overs
     # end def
 
     ### PRIVATE SUPPORT METHODS ###
@@ -3297,25 +4028,29 @@ class NucleicAcidPart(Part):
     # end def
 
     def initializeAbstractSegmentId(self):
+        # ids restart at 0 so drop the ids kept by the segments
+        for segment_dict in self.segment_dict.values():
+            segment_dict.clear()
         self._abstract_segment_id = icount(0)
         self._current_base_count = 0
     # end def
 
     def setAbstractSequences(self, emit_signals: bool = False):
-        """Reset, assign, and display abstract sequence numbers."""
-        # reset all sequence numbers
-        print("setting abstract sequence")
-        for oligo in self._oligos:
-            oligo.clearAbstractSequences()
+        """Reset, assign, and display abstract sequence numbers.
 
+        Numbers are assigned and displayed in a single pass over the strands
+        of the oligos, as runs per segment, see
+        :meth:`Strand.applyAbstractSequence`.
+        """
+        print("setting abstract sequence")
         self.initializeAbstractSegmentId()
 
         for oligo in self._oligos:
-            oligo.applyAbstractSequences()
-
-        # display new sequence numbers
-        for oligo in self._oligos:
-            oligo.displayAbstractSequences()
+            strand5p = oligo.strand5p()
+            if strand5p is not None:
+                for strand in strand5p.generator3pStrand():
+                    strand.applyAbstractSequence()
+                    strand.copyAbstractSequenceToSequence()
             if emit_signals:
                 oligo.oligoSequenceAddedSignal.emit(oligo)
     # end def
@@ -3426,10 +4161,29 @@ class NucleicAcidPart(Part):
     # end def
 
     def insertions(self) -> dict:
-        """Return dictionary of insertions."""
+        """Return dictionary of insertions.
+
+        Returns:
+            dictionary of :class:`InsertionIndex` by virtual helix ID number
+        """
         return self._insertions
     # end def
 
+    def _insertionChanged(self, id_num: int, idx: int):
+        """Refresh the total length of the strands over a changed insertion
+
+        Args:
+            id_num: virtual helix ID number
+            idx: base index of the insertion
+        """
+        if id_num >= len(self.fwd_strandsets) or self.fwd_strandsets[id_num] is None:
+            return
+        for strandset in (self.fwd_strandsets[id_num], self.rev_strandsets[id_num]):
+            strand = strandset.getStrand(idx)
+            if strand is not None:
+                strand._refreshTotalLength()
+    # end def
+
     def dumpInsertions(self):
         """ Serialize insertions
 
@@ -3640,6 +4394,36 @@ def distanceToPoint(origin: Vec3T, direction: Vec3T, point: Vec3T) -> float:
 # end def
 
 
+def _mergeCrossoverHits(start: int,
+                        f_hits: Tuple[np.ndarray, np.ndarray],
+                        r_hits: Tuple[np.ndarray, np.ndarray]) -> HitListT:
+    """Combine (rows, columns) hit arrays against the forward and reverse
+    phosphates of a neighbor into a hit list
+
+    Args:
+        start: index of row 0 in the virtual helix
+        f_hits: hits against the neighbor's forward phosphates
+        r_hits: hits against the neighbor's reverse phosphates
+
+    Returns:
+        list of the form::
+
+            [(id_num_index, forward_neighbor_idxs, reverse_neighbor_idxs), ...]]
+    """
+    f_rows, f_cols = f_hits
+    r_rows, r_cols = r_hits
+    hit_rows = np.union1d(f_rows, r_rows)
+    f_bounds = zip(np.searchsorted(f_rows, hit_rows, side='left').tolist(),
+                   np.searchsorted(f_rows, hit_rows, side='right').tolist())
+    r_bounds = zip(np.searchsorted(r_rows, hit_rows, side='left').tolist(),
+                   np.searchsorted(r_rows, hit_rows, side='right').tolist())
+    f_cols = f_cols.tolist()
+    r_cols = r_cols.tolist()
+    return [(start + i, f_cols[f_lo:f_hi], r_cols[r_lo:r_hi])
+            for i, (f_lo, f_hi), (r_lo, r_hi) in zip(hit_rows.tolist(), f_bounds, r_bounds)]
+# end def
+
+
 def remapSlice(start: int, stop: int, length: int) -> Tuple[int, int]:
     """Remap a slice to positive indices for a given
     length
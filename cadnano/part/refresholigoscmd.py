@@ -1,5 +1,4 @@
 from cadnano.proxies.cnproxy import UndoCommand
-from cadnano.strand import Strand
 from cadnano.cntypes import (
     NucleicAcidPartT
 )
@@ -13,7 +12,9 @@ class RefreshOligosCommand(UndoCommand):
     strands.
 
     Hence, we disable oligo assignment during the xover creation step,
-    and then do it all in one pass at the end with this command.
+    and then do it all in one pass at the end with this command.  Each chain
+    of strands gets the oligo of the first strand visited in one step, and
+    every oligo it replaces is removed and signalled once.
 
     This command is meant for non-undoable steps, like file-io.
     """
@@ -33,12 +34,13 @@ class RefreshOligosCommand(UndoCommand):
             for strand in fwd_ss:
                 visited[strand] = False
 
-        fSetOligo = Strand.setOligo
         for strand in list(visited.keys()):
             if visited[strand]:
                 continue
             visited[strand] = True
             start_oligo = strand.oligo()
+            # the replaced oligos in the order found
+            old_oligos = {}
 
             strand5gen = strand.generator5pStrand()
             # this gets the oligo and burns a strand in the generator
@@ -46,8 +48,7 @@ class RefreshOligosCommand(UndoCommand):
             for strand5 in strand5gen:
                 oligo5 = strand5.oligo()
                 if oligo5 != start_oligo:
-                    oligo5.removeFromPart(emit_signals=True)
-                    fSetOligo(strand5, start_oligo, emit_signals=True)  # emits strandHasNewOligoSignal
+                    old_oligos[oligo5] = True
                 visited[strand5] = True
             # end for
             start_oligo.setStrand5p(strand5)
@@ -60,10 +61,14 @@ class RefreshOligosCommand(UndoCommand):
                 for strand3 in strand3gen:
                     oligo3 = strand3.oligo()
                     if oligo3 != start_oligo:
-                        oligo3.removeFromPart(emit_signals=True)
-                        fSetOligo(strand3, start_oligo, emit_signals=True)  # emits strandHasNewOligoSignal
+                        old_oligos[oligo3] = True
                     visited[strand3] = True
                 # end for
+            if old_oligos:
+                strand.setChainOligo(start_oligo)
+                for oligo in old_oligos:
+                    oligo.removeFromPart(emit_signals=True)
+                    oligo.oligoStrandsMovedSignal.emit(oligo)
             start_oligo.refreshLength(emit_signals=True)
         # end for
 
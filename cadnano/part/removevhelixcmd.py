@@ -1,6 +1,3 @@
-from ast import literal_eval
-import bisect
-
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import (
     NucleicAcidPartT,
@@ -19,8 +16,7 @@ class RemoveVirtualHelixCommand(UndoCommand):
         x, y, _ = part.getVirtualHelixOrigin(id_num)
         self.origin_pt = (x, y, 0.)
         self.direction = tuple(part.directions[id_num]) # (0, 0, 1.)
-        neighbors = part.getVirtualHelixProperties(id_num, 'neighbors')
-        self.neighbors = literal_eval(neighbors)
+        self.neighbors = part.getVirtualHelixNeighbors(id_num)
         self.color = part.getVirtualHelixProperties(id_num, 'color')
         self.props = part.getAllVirtualHelixProperties(id_num, inject_extras=False)
         self.old_active_base_info = part.active_base_info
@@ -32,12 +28,9 @@ class RemoveVirtualHelixCommand(UndoCommand):
         id_num = self.id_num
         # clear out part references
         part.clearActiveVirtualHelix()
+        vh_neighbors = part.vh_neighbors
         for neighbor_id in self.neighbors:
-            nneighbors = literal_eval(
-                part.getVirtualHelixProperties(neighbor_id, 'neighbors')
-            )
-            nneighbors.remove(id_num)
-            part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+            vh_neighbors.unlink(neighbor_id, id_num)
         # signaling the view is two parts to clean up signals properly
         # and then allow the views to refresh
         part.partVirtualHelixRemovingSignal.emit(
@@ -49,12 +42,9 @@ class RemoveVirtualHelixCommand(UndoCommand):
     def undo(self):
         part = self.part
         id_num = self.id_num
+        vh_neighbors = part.vh_neighbors
         for neighbor_id in self.neighbors:
-            nneighbors = literal_eval(
-                part.getVirtualHelixProperties(neighbor_id, 'neighbors')
-            )
-            bisect.insort_left(nneighbors, id_num)
-            part.vh_properties.loc[neighbor_id, 'neighbors'] = str(list(nneighbors))
+            vh_neighbors.link(neighbor_id, id_num)
         vh = part._createHelix(id_num, self.origin_pt,
                                         self.direction,
                                         self.length,
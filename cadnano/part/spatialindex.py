@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Uniform grid spatial indices used by :class:`NucleicAcidPart` to answer
+radius and rectangle queries without scanning the whole coordinate buffers.
+
+The indices only narrow the set of candidates.  Exact distance tests are
+still done by the part against its coordinate arrays, so a query can always
+be answered by the brute force path instead.
+"""
+import math
+from collections import defaultdict
+from typing import (
+    Dict,
+    List,
+    Set,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    RectT,
+    Vec3T
+)
+
+CellT = Tuple[int, ...]
+
+MIN_CELL_BUDGET = 125
+"""Queries may always visit this many cells before deferring to brute force
+"""
+
+
+def _cellSpan(lo: float, hi: float, cell_size: float) -> range:
+    """Range of cell coordinates covering the closed interval [lo, hi]
+    """
+    return range(math.floor(lo / cell_size), math.floor(hi / cell_size) + 1)
+# end def
+
+
+class OriginGrid(object):
+    """2D (X, Y) uniform grid of virtual helix origins keyed by ``id_num``
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size: float = cell_size
+        self.cells: Dict[CellT, Set[int]] = defaultdict(set)
+        self.cell_of: Dict[int, CellT] = {}
+    # end def
+
+    def __len__(self) -> int:
+        return len(self.cell_of)
+
+    def clear(self):
+        self.cells.clear()
+        self.cell_of.clear()
+    # end def
+
+    def insert(self, id_num: int, point: Vec3T):
+        """Add or move the origin of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            point: origin, only X and Y are used
+        """
+        self.remove(id_num)
+        cs = self.cell_size
+        cell = (math.floor(point[0] / cs), math.floor(point[1] / cs))
+        self.cells[cell].add(id_num)
+        self.cell_of[id_num] = cell
+    # end def
+
+    def moveMany(self, id_nums: List[int], points: np.ndarray):
+        """Move the origins of several virtual helices, only touching the
+        cells of those leaving their cell
+
+        Args:
+            id_nums: virtual helix ID numbers
+            points: n x 3 origins in the order of ``id_nums``
+        """
+        cell_xy = np.floor(points[:, :2] / self.cell_size).astype(int).tolist()
+        cell_of = self.cell_of
+        for id_num, (i, j) in zip(id_nums, cell_xy):
+            if cell_of.get(id_num) != (i, j):
+                self.remove(id_num)
+                self.cells[(i, j)].add(id_num)
+                cell_of[id_num] = (i, j)
+    # end def
+
+    def remove(self, id_num: int):
+        cell = self.cell_of.pop(id_num, None)
+        if cell is not None:
+            members = self.cells[cell]
+            members.discard(id_num)
+            if not members:
+                del self.cells[cell]
+    # end def
+
+    def candidatesInRect(self, rect: RectT) -> List[int]:
+        """Candidates whose cell overlaps a rectangle
+
+        Args:
+            rect: (x1, y1, x2, y2)
+
+        Returns:
+            list of ID numbers or ``None`` if the rectangle spans more cells
+            than are occupied (and the budget), in which case brute force is
+            the better option
+        """
+        x1, y1, x2, y2 = rect
+        cs = self.cell_size
+        if not all(map(math.isfinite, rect)):
+            return None
+        x_span = _cellSpan(x1, x2, cs)
+        y_span = _cellSpan(y1, y2, cs)
+        if len(x_span)*len(y_span) > max(len(self.cells), MIN_CELL_BUDGET):
+            return None
+        cells = self.cells
+        out = []
+        for i in x_span:
+            for j in y_span:
+                members = cells.get((i, j))
+                if members:
+                    out.extend(members)
+        return out
+    # end def
+
+    def candidatesInRadius(self, radius: float, point: Vec3T) -> List[int]:
+        x, y = point[0], point[1]
+        return self.candidatesInRect((x - radius, y - radius, x + radius, y + radius))
+    # end def
+# end class
+
+
+class BasePointGrid(object):
+    """3D uniform grid of virtual helix axis points.  Entries are stored as
+    base indices per ``id_num`` so that reallocations and offset shifts in the
+    part's coordinate buffers do not invalidate the grid.  A virtual helix is
+    only rebinned lazily after its coordinates change.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size: float = cell_size
+        self.cells: Dict[CellT, Dict[int, np.ndarray]] = defaultdict(dict)
+        self.helix_cells: Dict[int, List[CellT]] = {}
+        self.dirty: Set[int] = set()
+    # end def
+
+    def clear(self):
+        self.cells.clear()
+        self.helix_cells.clear()
+        self.dirty.clear()
+    # end def
+
+    def invalidate(self, id_num: int):
+        """Flag a virtual helix to be rebinned before the next query
+        """
+        self.dirty.add(id_num)
+    # end def
+
+    def remove(self, id_num: int):
+        """Drop all entries of a virtual helix
+        """
+        self.dirty.discard(id_num)
+        cells = self.cells
+        for cell in self.helix_cells.pop(id_num, ()):
+            members = cells[cell]
+            del members[id_num]
+            if not members:
+                del cells[cell]
+    # end def
+
+    def rebin(self, id_num: int, axis_pts: np.ndarray):
+        """Replace the entries of a virtual helix
+
+        Args:
+            id_num: virtual helix ID number
+            axis_pts: n x 3 array of the helix axis points by base index
+        """
+        self.remove(id_num)
+        finite_idxs, = np.where(np.isfinite(axis_pts).all(axis=1))
+        if len(finite_idxs) == 0:
+            self.helix_cells[id_num] = []
+            return
+        keys = np.floor(axis_pts[finite_idxs] / self.cell_size).astype(int)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        splits = np.cumsum(np.bincount(inverse))[:-1]
+        cells = self.cells
+        helix_cells = []
+        for key, idxs in zip(unique_keys.tolist(),
+                             np.split(finite_idxs[order], splits)):
+            cell = tuple(key)
+            cells[cell][id_num] = idxs
+            helix_cells.append(cell)
+        self.helix_cells[id_num] = helix_cells
+    # end def
+
+    def candidates(self, radius: float, point: Vec3T) -> Dict[int, List[np.ndarray]]:
+        """Base indices of all points in cells overlapping the bounding box of
+        a sphere
+
+        Args:
+            radius: distance to consider
+            point: of :obj:`float` of length 3
+
+        Returns:
+            dictionary of lists of index arrays keyed by ID number or ``None``
+            if the query spans more cells than are occupied
+        """
+        cs = self.cell_size
+        if not (math.isfinite(radius) and all(map(math.isfinite, point))):
+            return None
+        spans = [_cellSpan(c - radius, c + radius, cs) for c in point]
+        num_cells = len(spans[0])*len(spans[1])*len(spans[2])
+        if num_cells > max(len(self.cells), MIN_CELL_BUDGET):
+            return None
+        cells = self.cells
+        out = defaultdict(list)
+        for i in spans[0]:
+            for j in spans[1]:
+                for k in spans[2]:
+                    members = cells.get((i, j, k))
+                    if members:
+                        for id_num, idxs in members.items():
+                            out[id_num].append(idxs)
+        return out
+    # end def
+# end class
@@ -0,0 +1,605 @@
+# -*- coding: utf-8 -*-
+"""Staple strands, staple crossovers and staple breaks of a whole
+:class:`NucleicAcidPart` computed in array form, see
+:meth:`NucleicAcidPart.autoStaple` and :meth:`NucleicAcidPart.autoBreak`
+"""
+from bisect import bisect_left
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT,
+    StrandT
+)
+
+MIN_LENGTH = 18
+MAX_LENGTH = 49
+TARGET_LENGTH = 32
+MIN_XOVER_DISTANCE = 3
+MIN_SITE_SPACING = 7
+"""Fewest bases between two staple crossover sites of a virtual helix"""
+MAX_LOOP_STARTS = 8
+"""How many breaks to try as the first break of a circular staple"""
+
+RunsT = Dict[int, Tuple[bool, np.ndarray, np.ndarray]]
+LinkT = Tuple[int, int, int, int]
+
+
+class StapleEngine(object):
+    """Computes staples for a whole part at once.
+
+    Staples are described by per virtual helix arrays of strand indices and
+    crossovers by positions, ``(id_num, idx)`` of the 3' end of the 5'
+    strand and ``(id_num, idx)`` of the 5' end of the 3' strand, so no
+    :class:`Strand` exists until the result is committed.
+
+    Breaking staples is a shortest path over the possible break positions of
+    each staple, with ``(length - target_length)**2`` as the cost of a
+    staple of ``min_length`` to ``max_length`` bases.  The paths of all
+    staples are extended one base at a time together, so the work in Python
+    is proportional to the length of the longest staple, not the number of
+    staples.
+
+    Args:
+        part:
+        min_length: fewest bases of a staple
+        max_length: most bases of a staple
+        target_length: preferred number of bases of a staple
+        min_xover_distance: fewest bases between a break and a crossover
+    """
+
+    def __init__(self, part: NucleicAcidPartT,
+                 min_length: int = MIN_LENGTH,
+                 max_length: int = MAX_LENGTH,
+                 target_length: int = TARGET_LENGTH,
+                 min_xover_distance: int = MIN_XOVER_DISTANCE):
+        if not 2 <= min_length <= target_length <= max_length:
+            err = "StapleEngine: need 2 <= min_length <= target_length <= max_length, got {}, {}, {}"
+            raise ValueError(err.format(min_length, target_length, max_length))
+        self.part = part
+        self.min_length = min_length
+        self.max_length = max_length
+        self.target_length = target_length
+        self.min_xover_distance = min_xover_distance
+    # end def
+
+    ### STAPLE GENERATION ###
+    def stapleRuns(self) -> RunsT:
+        """Runs of bases paired with the scaffold but not with a staple
+
+        Returns:
+            dictionary of tuples of form::
+
+                id_num: (is staple forward, low indices, high indices)
+        """
+        part = self.part
+        runs = {}
+        for id_num in sorted(part.getIdNums()):
+            fwd_ss, rev_ss = part.getStrandSets(id_num)
+            scaffold_ss, staple_ss = (fwd_ss, rev_ss) if fwd_ss.isScaffold() else (rev_ss, fwd_ss)
+            if not scaffold_ss.strand_heap:
+                continue
+            size = staple_ss.length() + 1
+            free = _coverage(scaffold_ss.strand_heap, size)
+            if staple_ss.strand_heap:
+                free &= ~_coverage(staple_ss.strand_heap, size)
+            edges = np.diff(free.astype(np.int8), prepend=0)
+            lows = np.flatnonzero(edges == 1)
+            if len(lows):
+                highs = np.flatnonzero(edges == -1) - 1
+                runs[id_num] = (staple_ss.isForward(), lows, highs)
+        return runs
+    # end def
+
+    def crossoverSites(self, runs: RunsT) -> List[LinkT]:
+        """Double crossover sites between staple runs of neighboring virtual
+        helices, from :meth:`NucleicAcidPart.potentialCrossoverMap`.  A site
+        ``(id_num, idx, neighbor_id, neighbor_idx)`` joins bases ``idx`` and
+        ``idx + 1`` of ``id_num`` with ``neighbor_idx`` and ``neighbor_idx + 1``
+        of ``neighbor_id``.  Sites are kept in order of ID number and index if
+        they are at least ``MIN_SITE_SPACING`` bases from the sites kept
+        before them and don't close a loop shorter than ``min_length`` with
+        the adjacent site.  A site is at least half of ``min_length`` from the
+        ends of the runs, as the staple ends next to it are joined.
+
+        Args:
+            runs: see :meth:`stapleRuns`
+
+        Returns:
+            list of sites
+        """
+        part = self.part
+        end_margin = (self.min_length + 1) // 2
+        candidates = []
+        for id_num, (is_fwd, lows, highs) in runs.items():
+            per_neighbor_hits, _ = part.potentialCrossoverMap(id_num)
+            for neighbor_id, (fwd_hits, rev_hits) in per_neighbor_hits.items():
+                if neighbor_id <= id_num or neighbor_id not in runs:
+                    continue
+                n_is_fwd, n_lows, n_highs = runs[neighbor_id]
+                if n_is_fwd == is_fwd:
+                    continue
+                pairs = set((idx, j) for idx, fwd_idxs, rev_idxs in (fwd_hits if is_fwd else rev_hits)
+                            for j in (fwd_idxs if n_is_fwd else rev_idxs))
+                pairs = sorted(x for x in pairs if (x[0] + 1, x[1] + 1) in pairs)
+                if not pairs:
+                    continue
+                idxs, n_idxs = np.array(pairs).T
+                keep = (_inRuns(idxs, lows, highs, end_margin) &
+                        _inRuns(n_idxs, n_lows, n_highs, end_margin))
+                candidates += [(id_num, int(i), neighbor_id, int(j))
+                               for i, j in zip(idxs[keep], n_idxs[keep])]
+        candidates.sort()
+
+        sites = []
+        cuts: Dict[int, List[int]] = {}
+        site_of: Dict[Tuple[int, int], int] = {}  # the site of each cut
+        for site in candidates:
+            id_num, idx, neighbor_id, neighbor_idx = site
+            adjacent = _adjacentCuts(cuts, id_num, idx)
+            n_adjacent = _adjacentCuts(cuts, neighbor_id, neighbor_idx)
+            if any(cut is not None and abs(cut - x) < MIN_SITE_SPACING
+                   for cuts_x, x in ((adjacent, idx), (n_adjacent, neighbor_idx)) for cut in cuts_x):
+                continue
+            # the staples between two sites of the same virtual helices form
+            # a loop that has to be long enough to be broken
+            if any(cut is not None and n_cut is not None and
+                   site_of[(id_num, cut)] == site_of[(neighbor_id, n_cut)] and
+                   (self._lengthBetweenCuts(id_num, cut, idx) +
+                    self._lengthBetweenCuts(neighbor_id, n_cut, neighbor_idx)) < self.min_length
+                   for cut, n_cut in zip(adjacent, n_adjacent)):
+                continue
+            _addCut(cuts, id_num, idx)
+            _addCut(cuts, neighbor_id, neighbor_idx)
+            site_of[(id_num, idx)] = site_of[(neighbor_id, neighbor_idx)] = len(sites)
+            sites.append(site)
+        return sites
+    # end def
+
+    def autoStaple(self, do_break: bool = True) -> Tuple[RunsT, List[LinkT]]:
+        """Staples for every base paired with the scaffold and not with a
+        staple, joined by crossovers at every site of :meth:`crossoverSites`
+        and optionally broken by :meth:`breakChains`
+
+        Args:
+            do_break: break the staples, default is ``True``
+
+        Returns:
+            tuple of form::
+
+                (strands, xovers)
+
+            where ``strands`` is a dictionary of tuples like :meth:`stapleRuns`
+            and ``xovers`` a list of ``(id_num5p, idx5p, id_num3p, idx3p)``
+        """
+        runs = self.stapleRuns()
+        sites = self.crossoverSites(runs)
+
+        # 1. cut the runs at the sites.  The low halves of a site are joined
+        # from forward to reverse strand, the high halves from reverse to forward
+        site_cuts: Dict[int, List[int]] = {}
+        xovers = []
+        for id_num, idx, neighbor_id, neighbor_idx in sites:
+            site_cuts.setdefault(id_num, []).append(idx)
+            site_cuts.setdefault(neighbor_id, []).append(neighbor_idx)
+            if runs[id_num][0]:
+                fwd_id, fwd_idx, rev_id, rev_idx = id_num, idx, neighbor_id, neighbor_idx
+            else:
+                fwd_id, fwd_idx, rev_id, rev_idx = neighbor_id, neighbor_idx, id_num, idx
+            xovers.append((fwd_id, fwd_idx, rev_id, rev_idx))
+            xovers.append((rev_id, rev_idx + 1, fwd_id, fwd_idx + 1))
+        strands = _cutRuns(runs, site_cuts)
+        if not do_break or not strands:
+            return strands, xovers
+
+        # 2. the chains of strands, in arrays
+        id_nums = np.array([id_num for id_num, (_, lows, _) in strands.items() for _ in lows], dtype=int)
+        is_fwds = np.concatenate([np.full(len(lows), is_fwd, dtype=bool)
+                                  for is_fwd, lows, _ in strands.values()])
+        lows = np.concatenate([x[1] for x in strands.values()])
+        highs = np.concatenate([x[2] for x in strands.values()])
+        offsets = {}
+        offset = 0
+        for id_num, (_, helix_lows, _) in strands.items():
+            offsets[id_num] = offset
+            offset += len(helix_lows)
+
+        def strandAt(id_num, idx):
+            return offsets[id_num] + int(np.searchsorted(strands[id_num][1], idx, side='right')) - 1
+
+        next3p = np.full(len(lows), -1, dtype=int)
+        for id_num5p, idx5p, id_num3p, idx3p in xovers:
+            next3p[strandAt(id_num5p, idx5p)] = strandAt(id_num3p, idx3p)
+        chains, is_circulars = _chains(next3p)
+
+        # 3. break the chains and cut the strands at the breaks
+        order = np.concatenate(chains) if chains else np.zeros(0, dtype=int)
+        has_prev = np.zeros(len(lows), dtype=bool)
+        has_prev[next3p[next3p >= 0]] = True
+        has_next = next3p >= 0
+        # staples left circular show in the oligos made from the result
+        breaks, _ = self.breakChains(id_nums[order], is_fwds[order], lows[order], highs[order],
+                                     has_prev[order], has_next[order],
+                                     [len(chain) for chain in chains], is_circulars)
+        break_cuts: Dict[int, List[int]] = {}
+        for i, idx3p in breaks:
+            strand = order[i]
+            cut = idx3p if is_fwds[strand] else idx3p - 1
+            break_cuts.setdefault(int(id_nums[strand]), []).append(cut)
+        return _cutRuns(strands, break_cuts), xovers
+    # end def
+
+    ### BREAKING ###
+    def oligoBreaks(self, oligos: Iterable[OligoT]) -> Tuple[List[Tuple[StrandT, int]], List[OligoT]]:
+        """Breaks of existing oligos, see :meth:`breakChains`
+
+        Args:
+            oligos:
+
+        Returns:
+            tuple of form::
+
+                (splits, whole_loops)
+
+            where ``splits`` is a list of ``(strand, idx)``, the strand to
+            split and the new 3' end of its 5' part, see
+            :class:`SplitStrandsCommand`, and ``whole_loops`` lists the
+            circular oligos left unbroken
+        """
+        oligos = list(oligos)
+        strands = []
+        chain_lengths = []
+        is_circulars = []
+        for oligo in oligos:
+            chain = list(oligo.strand5p().generator3pStrand())
+            strands += chain
+            chain_lengths.append(len(chain))
+            is_circulars.append(oligo.isCircular())
+        if not strands:
+            return [], []
+        breaks, whole_loops = self.breakChains(
+            np.array([x.idNum() for x in strands], dtype=int),
+            np.array([x.isForward() for x in strands], dtype=bool),
+            np.array([x.lowIdx() for x in strands], dtype=int),
+            np.array([x.highIdx() for x in strands], dtype=int),
+            np.array([x.connection5p() is not None for x in strands], dtype=bool),
+            np.array([x.connection3p() is not None for x in strands], dtype=bool),
+            chain_lengths, is_circulars)
+        return [(strands[i], idx3p) for i, idx3p in breaks], [oligos[i] for i in whole_loops]
+    # end def
+
+    def breakChains(self, id_nums: np.ndarray, is_fwds: np.ndarray,
+                    lows: np.ndarray, highs: np.ndarray,
+                    has_prevs: np.ndarray, has_nexts: np.ndarray,
+                    chain_lengths: List[int],
+                    is_circulars: List[bool]
+                    ) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """Break positions of chains of strands such that every part is
+        ``min_length`` to ``max_length`` long, closest to ``target_length``.
+
+        A break is never within ``min_xover_distance`` bases of a crossover,
+        nor next to an insertion or skip.  A linear chain that can't be
+        broken that way is left whole.  A circular chain that can't is
+        opened by a single break at its first possible break, tried in order
+        of ID number and index, so only a circular chain without any possible
+        break stays circular.  These are returned, as a staple export rejects
+        circular oligos.
+
+        The strand arrays list the strands of all chains, each chain from its
+        5' strand, with ``has_prevs`` and ``has_nexts`` telling if a strand
+        has a 5' or 3' connection.
+
+        Args:
+            id_nums:
+            is_fwds:
+            lows:
+            highs:
+            has_prevs:
+            has_nexts:
+            chain_lengths: number of strands of each chain
+            is_circulars: whether each chain is circular
+
+        Returns:
+            tuple of form::
+
+                (breaks, whole_loops)
+
+            where ``breaks`` is a list of ``(i, idx)``, the strand ``i`` of the
+            arrays to break and the base index of the new 3' end, and
+            ``whole_loops`` lists the circular chains left unbroken by index
+        """
+        if not len(lows):
+            return [], []
+        # 1. the bases of every chain 5' to 3'
+        sizes = highs - lows + 1
+        strand_of = np.repeat(np.arange(len(lows)), sizes)
+        first_base = np.cumsum(sizes) - sizes
+        offset = np.arange(len(strand_of)) - first_base[strand_of]
+        base_idxs = np.where(is_fwds[strand_of], lows[strand_of] + offset, highs[strand_of] - offset)
+        weights = 1 + self._insertionLengths(id_nums[strand_of], base_idxs)
+
+        # 2. the bases each break may go before
+        dist = self.min_xover_distance
+        ok = np.zeros(len(strand_of), dtype=bool)
+        ok[1:] = strand_of[1:] == strand_of[:-1]
+        ok &= ~has_prevs[strand_of] | (offset >= dist)
+        ok &= ~has_nexts[strand_of] | (sizes[strand_of] - offset >= dist)
+        ok &= weights == 1
+        ok[1:] &= weights[:-1] == 1
+
+        chain_first = np.cumsum(chain_lengths) - chain_lengths
+        chain_base_starts = first_base[chain_first]
+        position = np.cumsum(weights) - weights    # length before each base
+        chain_of = np.repeat(np.arange(len(chain_lengths)), np.add.reduceat(sizes, chain_first))
+        position -= position[chain_base_starts][chain_of]
+        chain_totals = np.add.reduceat(weights, chain_base_starts)
+        gaps = np.flatnonzero(ok)
+
+        # 3. linear chains break anywhere, circular chains are rotated to
+        # start at one of their possible breaks, tried in order of ID number
+        # and index so the result doesn't depend on the 5' strand of a loop
+        breaks = []
+        is_circulars = np.asarray(is_circulars, dtype=bool)
+        lines = [(chain, 0) for chain in np.flatnonzero(~is_circulars)]
+        by_chain = gaps[np.lexsort((base_idxs[gaps], id_nums[strand_of[gaps]], chain_of[gaps]))]
+        loop_chains = np.flatnonzero(is_circulars)
+        firsts = np.searchsorted(chain_of[by_chain], loop_chains)
+        lasts = np.searchsorted(chain_of[by_chain], loop_chains, side='right')
+        # the loops not broken yet
+        loops = {chain: by_chain[first:last] for chain, first, last in
+                 zip(loop_chains, firsts, lasts) if last > first}
+        whole_loops = [int(chain) for chain, first, last in
+                       zip(loop_chains, firsts, lasts) if last == first]
+        for attempt in range(MAX_LOOP_STARTS + 1):
+            if attempt > 0:
+                lines = [(chain, chain_gaps[attempt - 1]) for chain, chain_gaps in loops.items()
+                         if attempt - 1 < len(chain_gaps)]
+            if not lines:
+                if attempt > 0:
+                    break
+                continue
+            results = self._breakLines(lines, gaps, chain_of, position, chain_totals)
+            for (chain, start_gap), line_gaps in zip(lines, results):
+                if line_gaps is None:
+                    continue
+                if attempt > 0:
+                    line_gaps.append(start_gap)
+                    del loops[chain]
+                breaks += [(int(strand_of[k]), int(base_idxs[k - 1])) for k in line_gaps]
+
+        # 4. open the remaining loops at their first possible break
+        for chain_gaps in loops.values():
+            k = chain_gaps[0]
+            breaks.append((int(strand_of[k]), int(base_idxs[k - 1])))
+        return breaks, whole_loops
+    # end def
+
+    def _breakLines(self, lines: List[Tuple[int, int]],
+                    gaps: np.ndarray, chain_of: np.ndarray,
+                    position: np.ndarray,
+                    chain_totals: np.ndarray) -> List[List[int]]:
+        """Shortest paths from the start to the end of each line.  A line is
+        a chain, started after the base ``start_gap`` precedes if that is not
+        0, i.e. rotated for a circular chain.  Position ``p`` of a line is
+        the length of the line before it.
+
+        Args:
+            lines: ``(chain, start_gap)`` tuples
+            gaps: bases a break may go before
+            chain_of: chain of every base
+            position: length of its chain before every base
+            chain_totals: length of every chain
+
+        Returns:
+            the bases to break before for each line, or ``None`` if the line
+            can't be broken
+        """
+        min_length, max_length = self.min_length, self.max_length
+        chains = np.array([chain for chain, _ in lines], dtype=int)
+        shifts = np.array([position[start] if start else 0 for _, start in lines], dtype=int)
+        lengths = chain_totals[chains]
+        starts = np.cumsum(lengths + 1) - (lengths + 1)
+        total = int(starts[-1] + lengths[-1] + 1)
+
+        # the gap at every breakable position of every line
+        line_of_chain = np.full(len(chain_totals), -1, dtype=int)
+        line_of_chain[chains] = np.arange(len(chains))
+        gap_lines = line_of_chain[chain_of[gaps]]
+        gap_lines_ok = gap_lines >= 0
+        line_gaps, gap_lines = gaps[gap_lines_ok], gap_lines[gap_lines_ok]
+        gap_pos = (position[line_gaps] - shifts[gap_lines]) % np.maximum(lengths[gap_lines], 1)
+        gap_at = np.full(total, -1, dtype=int)
+        gap_at[starts[gap_lines] + gap_pos] = line_gaps
+        gap_at[starts] = -1
+        breakable = gap_at >= 0
+
+        cost = np.full(total, np.inf)
+        cost[starts] = 0.
+        back = np.full(total, -1, dtype=int)
+        steps = np.arange(min_length, max_length + 1)
+        penalties = ((steps - self.target_length)**2).astype(float)
+        order = np.argsort(-lengths, kind='stable')
+        sorted_lengths = lengths[order]
+        sorted_starts = starts[order]
+        for p in range(min_length, int(lengths.max()) + 1):
+            # lines at least p long, the first ones by length
+            n = np.searchsorted(-sorted_lengths, -p, side='right')
+            pos = sorted_starts[:n] + p
+            is_end = sorted_lengths[:n] == p
+            active = breakable[pos] | is_end
+            pos = pos[active]
+            if not len(pos):
+                continue
+            k = min(max_length, p) - min_length + 1
+            prev = pos[:, None] - steps[None, :k]
+            candidates = cost[prev] + penalties[None, :k]
+            best = np.argmin(candidates, axis=1)
+            rows = np.arange(len(pos))
+            cost[pos] = candidates[rows, best]
+            back[pos] = prev[rows, best]
+
+        results = []
+        for start, length in zip(starts, lengths):
+            pos = start + length
+            if not np.isfinite(cost[pos]):
+                results.append(None)
+                continue
+            line_gaps = []
+            pos = back[pos]
+            while pos != start:
+                line_gaps.append(int(gap_at[pos]))
+                pos = back[pos]
+            results.append(line_gaps)
+        return results
+    # end def
+
+    def _lengthBetweenCuts(self, id_num: int, cut_a: int, cut_b: int) -> int:
+        """
+        Returns:
+            length of the bases between two cuts of a virtual helix,
+            including insertions
+        """
+        idx_low, idx_high = min(cut_a, cut_b) + 1, max(cut_a, cut_b)
+        length = idx_high - idx_low + 1
+        insertions = self.part.insertions().get(id_num)
+        if insertions:
+            length += insertions.lengthBetween(idx_low, idx_high)
+        return length
+    # end def
+
+    def _insertionLengths(self, id_nums: np.ndarray, idxs: np.ndarray) -> np.ndarray:
+        """
+        Returns:
+            length of the insertion at each base, -1 for a skip, else 0
+        """
+        lengths = np.zeros(len(idxs), dtype=int)
+        keys = []
+        values = []
+        stride = int(idxs.max()) + 1
+        for id_num, insertions in self.part.insertions().items():
+            for idx, insertion in insertions.items():
+                if idx < stride:
+                    keys.append(id_num*stride + idx)
+                    values.append(insertion.length())
+        if not keys:
+            return lengths
+        order = np.argsort(keys)
+        keys = np.array(keys, dtype=int)[order]
+        values = np.array(values, dtype=int)[order]
+        base_keys = id_nums*stride + idxs
+        at = np.minimum(np.searchsorted(keys, base_keys), len(keys) - 1)
+        hit = keys[at] == base_keys
+        lengths[hit] = values[at[hit]]
+        return lengths
+    # end def
+# end class
+
+
+def _coverage(strands: List[StrandT], size: int) -> np.ndarray:
+    """
+    Returns:
+        which of ``size`` bases the strands cover
+    """
+    counts = np.zeros(size + 1, dtype=int)
+    np.add.at(counts, [x._base_idx_low for x in strands], 1)
+    np.add.at(counts, [x._base_idx_high + 1 for x in strands], -1)
+    return np.cumsum(counts[:size]) > 0
+# end def
+
+
+def _inRuns(idxs: np.ndarray, lows: np.ndarray, highs: np.ndarray,
+            margin: int) -> np.ndarray:
+    """
+    Returns:
+        which sites at ``idxs`` and ``idxs + 1`` lie in a run at least
+        ``margin`` bases from its ends
+    """
+    k = np.searchsorted(lows, idxs, side='right') - 1
+    found = k >= 0
+    k = np.maximum(k, 0)
+    return found & (idxs - lows[k] + 1 >= margin) & (highs[k] - idxs >= margin)
+# end def
+
+
+def _adjacentCuts(cuts: Dict[int, List[int]], id_num: int, idx: int) -> Tuple[int, int]:
+    """
+    Returns:
+        the nearest cuts of a virtual helix below and above ``idx``, ``None``
+        where there is none
+    """
+    helix_cuts = cuts.get(id_num, ())
+    i = bisect_left(helix_cuts, idx)
+    below = helix_cuts[i - 1] if i > 0 else None
+    above = helix_cuts[i] if i < len(helix_cuts) else None
+    return below, above
+# end def
+
+
+def _addCut(cuts: Dict[int, List[int]], id_num: int, idx: int):
+    helix_cuts = cuts.setdefault(id_num, [])
+    helix_cuts.insert(bisect_left(helix_cuts, idx), idx)
+# end def
+
+
+def _cutRuns(runs: RunsT, cuts: Dict[int, List[int]]) -> RunsT:
+    """Split runs between every cut index and the next base
+
+    Args:
+        runs: see :meth:`StapleEngine.stapleRuns`
+        cuts: cut indices inside the runs by ID number
+
+    Returns:
+        the runs after cutting
+    """
+    result = {}
+    for id_num, (is_fwd, lows, highs) in runs.items():
+        helix_cuts = cuts.get(id_num)
+        if helix_cuts:
+            helix_cuts = np.array(helix_cuts, dtype=int)
+            lows = np.sort(np.concatenate((lows, helix_cuts + 1)))
+            highs = np.sort(np.concatenate((highs, helix_cuts)))
+        result[id_num] = (is_fwd, lows, highs)
+    return result
+# end def
+
+
+def _chains(next3p: np.ndarray) -> Tuple[List[np.ndarray], List[bool]]:
+    """Chains of a graph of 3' connections
+
+    Args:
+        next3p: the 3' connection of each strand or -1
+
+    Returns:
+        tuple of form::
+
+            (chains, is_circulars)
+
+        where each chain lists its strands 5' to 3'
+    """
+    has_prev = np.zeros(len(next3p), dtype=bool)
+    has_prev[next3p[next3p >= 0]] = True
+    visited = np.zeros(len(next3p), dtype=bool)
+    chains = []
+    is_circulars = []
+    next3p = next3p.tolist()
+    for heads, is_circular in ((np.flatnonzero(~has_prev), False), (range(len(next3p)), True)):
+        for head in heads:
+            if visited[head]:
+                continue
+            chain = [head]
+            i = next3p[head]
+            while i >= 0 and i != head:
+                chain.append(i)
+                i = next3p[i]
+            visited[chain] = True
+            chains.append(np.array(chain, dtype=int))
+            is_circulars.append(is_circular)
+    return chains, is_circulars
+# end def
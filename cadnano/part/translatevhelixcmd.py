@@ -4,9 +4,6 @@ from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import (
     NucleicAcidPartT
 )
-# prevent circular imports
-# from cadnano.part.nucleicacidpart import Z_PROP_INDEX
-Z_PROP_INDEX = -1  # index for Dataframe.iloc calls
 
 
 class TranslateVirtualHelicesCommand(UndoCommand):
@@ -39,10 +36,8 @@ class TranslateVirtualHelicesCommand(UndoCommand):
 
     def doSignals(self, part, vh_set):
         vh_list = list(vh_set)
-        z_vals = part.vh_properties.iloc[vh_list, Z_PROP_INDEX]
+        z_vals = part.vh_properties.column('z')[vh_list].tolist()
         if self.delta[2] > 0:
-            if isinstance(z_vals, float):
-                z_vals = (z_vals, )
             for id_num, z_val in zip(vh_list, z_vals):
                 part.partVirtualHelixPropertyChangedSignal.emit(
                     part, id_num, part.getVirtualHelix(id_num), ('z',), (z_val,))
@@ -50,11 +45,12 @@ class TranslateVirtualHelicesCommand(UndoCommand):
     # end def
 
     def specialUndo(self):
-        """ does not deselect
+        """ does not deselect.  Only a preview, as the command is redone
+        right after by :func:`util.finalizeCommands`
         """
         dx, dy, dz = self.delta
         part = self._part
         vh_set = self._vhelix_set
-        part._translateVirtualHelices(vh_set, -dx, -dy, -dz, False)
+        part._translateVirtualHelices(vh_set, -dx, -dy, -dz, False, preview=True)
     # end def
 # end class
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""Columnar storage of the per virtual helix properties of a
+:class:`NucleicAcidPart`
+"""
+import sys
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Union
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    KeyT,
+    ValueT
+)
+
+RowsT = Union[slice, List[int]]
+
+
+def _dtypeFor(value: Any) -> np.dtype:
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype(bool)
+    elif isinstance(value, (int, np.integer)):
+        return np.dtype(np.int64)
+    elif isinstance(value, (float, np.floating)):
+        return np.dtype(np.float64)
+    else:
+        return np.dtype(object)
+# end def
+
+
+def _fitsColumn(dtype: np.dtype, value: Any) -> bool:
+    """Whether ``value`` can be stored in a column of type ``dtype``
+    without loss
+    """
+    kind = dtype.kind
+    if kind == 'O':
+        return True
+    elif kind == 'b':
+        return isinstance(value, (bool, np.bool_))
+    elif kind == 'i':
+        if isinstance(value, (bool, np.bool_)):
+            return False
+        if isinstance(value, (int, np.integer)):
+            return True
+        return isinstance(value, (float, np.floating)) and float(value).is_integer()
+    else:   # 'f'
+        return isinstance(value, (int, float, np.integer, np.floating, np.bool_))
+# end def
+
+
+def _native(value: Any) -> Any:
+    """numpy scalars to python types as needed by QVariant and json"""
+    return value.item() if isinstance(value, np.generic) else value
+# end def
+
+
+class VirtualHelixPropertyStore(object):
+    """Table of virtual helix properties with one NumPy array per property
+    (column) indexed by virtual helix ID number (row).
+
+    Numeric and boolean properties are stored in typed arrays.  As with a
+    pandas ``DataFrame`` a column is promoted to ``float64`` or ``object``
+    when a value is set that does not fit its type, and setting an unknown
+    key adds a column filled with ``NaN``.  String values are
+    interned since names and colors repeat a lot.  Capacity grows
+    geometrically so adding rows is amortized O(1).
+
+    Args:
+        defaults: tuple of form (keys, default values) determining the
+            columns, their order and their types
+        size: initial number of rows
+    """
+
+    def __init__(self, defaults: Tuple[Tuple[str, ...], Tuple], size: int = 0):
+        keys, values = defaults
+        self.keys: List[str] = list(keys)
+        self.defaults: Dict[str, Any] = dict(zip(keys, values))
+        self.columns: Dict[str, np.ndarray] = {key: np.empty((0,), dtype=_dtypeFor(value))
+                                               for key, value in zip(keys, values)}
+        self._size: int = 0
+        self._capacity: int = 0
+        self.resize(size)
+    # end def
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def copy(self) -> 'VirtualHelixPropertyStore':
+        new_store = VirtualHelixPropertyStore((tuple(self.keys),
+                                               tuple(self.defaults[k] for k in self.keys)))
+        new_store.columns = {k: v.copy() for k, v in self.columns.items()}
+        new_store._size = self._size
+        new_store._capacity = self._capacity
+        return new_store
+    # end def
+
+    def resize(self, size: int):
+        """Set the number of rows, new rows are filled with default values
+
+        Args:
+            size: new number of rows
+        """
+        if size > self._capacity:
+            capacity = max(size, 2*self._capacity)
+            defaults = self.defaults
+            columns = self.columns
+            for key, column in columns.items():
+                new_column = np.empty((capacity,), dtype=column.dtype)
+                new_column[:self._capacity] = column
+                new_column[self._capacity:] = defaults[key]
+                columns[key] = new_column
+            self._capacity = capacity
+        self._size = size
+    # end def
+
+    def addColumn(self, key: str, default: Any = np.nan):
+        """Append a column filled with a default value
+
+        Args:
+            key: property key
+            default: value of the existing and new rows
+        """
+        if key in self.columns:
+            raise KeyError("column {} already exists".format(key))
+        self.keys.append(key)
+        self.defaults[key] = default
+        self.columns[key] = np.full((self._capacity,), default, dtype=_dtypeFor(default))
+    # end def
+
+    def column(self, key: str) -> np.ndarray:
+        """View of a column, modifications are stored
+
+        Args:
+            key: property key
+
+        Returns:
+            array of length ``len(self)``
+        """
+        return self.columns[key][:self._size]
+    # end def
+
+    def get(self, id_num: int, key: str) -> ValueT:
+        """
+        Args:
+            id_num: virtual helix ID number
+            key: property key
+
+        Returns:
+            the value as a python type
+
+        Raises:
+            KeyError: unknown key
+            IndexError: id_num out of range
+        """
+        if id_num >= self._size:
+            raise IndexError("id_num {} out of range".format(id_num))
+        return _native(self.columns[key][id_num])
+    # end def
+
+    def getValues(self, id_num: int, keys: KeyT) -> ValueT:
+        """Values for a single key or a list of keys
+
+        Args:
+            id_num: virtual helix ID number
+            keys: :obj:`str` or :obj:`list`/:obj:`tuple`
+
+        Returns:
+            ``object`` or list depending on type of arg ``keys``
+        """
+        if isinstance(keys, str):
+            return self.get(id_num, keys)
+        return [self.get(id_num, key) for key in keys]
+    # end def
+
+    def set(self, id_num: int, key: str, value: ValueT):
+        """
+        Args:
+            id_num: virtual helix ID number
+            key: property key
+            value: new value
+
+        Raises:
+            IndexError: id_num out of range
+        """
+        if id_num >= self._size:
+            raise IndexError("id_num {} out of range".format(id_num))
+        if key not in self.columns:
+            self.addColumn(key)
+        column = self.columns[key]
+        if not _fitsColumn(column.dtype, value):
+            if column.dtype.kind in 'if' and isinstance(value, (float, np.floating)):
+                column = column.astype(np.float64)
+            else:
+                column = column.astype(object)
+            self.columns[key] = column
+        if isinstance(value, str):
+            value = sys.intern(value)
+        column[id_num] = value
+    # end def
+
+    def setValues(self, id_num: int, keys: Iterable[str], values: Iterable[ValueT]):
+        for key, value in zip(keys, values):
+            self.set(id_num, key, value)
+    # end def
+
+    def row(self, id_num: int) -> Dict[str, ValueT]:
+        """
+        Args:
+            id_num: virtual helix ID number
+
+        Returns:
+            ordered dictionary of all properties of a virtual helix
+        """
+        if id_num >= self._size:
+            raise IndexError("id_num {} out of range".format(id_num))
+        columns = self.columns
+        return {key: _native(columns[key][id_num]) for key in self.keys}
+    # end def
+
+    def toDict(self, rows: RowsT) -> Dict[str, list]:
+        """
+        Args:
+            rows: slice or list of virtual helix ID numbers
+
+        Returns:
+            dictionary of lists of python values per key, ordered as ``rows``
+        """
+        size = self._size
+        columns = self.columns
+        if isinstance(rows, slice):
+            return {key: columns[key][:size][rows].tolist() for key in self.keys}
+        rows = np.asarray(rows, dtype=int)
+        if len(rows) and rows.max() >= size:
+            raise IndexError("id_num {} out of range".format(rows.max()))
+        return {key: columns[key][rows].tolist() for key in self.keys}
+    # end def
+# end class
@@ -45,7 +45,6 @@ class CreateXoverCommand(UndoCommand):
         doc.removeStrandFromSelection(strand5p)
         doc.removeStrandFromSelection(strand3p)
 
-        fSetOligo = Strand.setOligo
         if self._update_oligo:
             # Test for Loopiness
             if olg5p == strand3p.oligo():
@@ -55,9 +54,8 @@ class CreateXoverCommand(UndoCommand):
                 olg5p._incrementLength(old_olg3p.length(), emit_signals=True)
                 # 2. Remove the old oligo and apply the 5' oligo to the 3' strand
                 old_olg3p.removeFromPart(emit_signals=True)
-                for strand in strand3p.generator3pStrand():
-                    # emits strandHasNewOligoSignal
-                    fSetOligo(strand, olg5p, emit_signals=True)
+                strand3p.setOligo3p(olg5p)
+                old_olg3p.oligoStrandsMovedSignal.emit(old_olg3p)
 
         # 3. install the Xover
         strand5p.setConnection3p(strand3p)
@@ -94,19 +92,18 @@ class CreateXoverCommand(UndoCommand):
         strand5p.setConnection3p(None)
         strand3p.setConnection5p(None)
 
-        fSetOligo = Strand.setOligo
         if self._update_oligo:
             # Test Loopiness
             if old_olg3p.isCircular():
                 old_olg3p._setLoop(False)
+                old_olg3p.setStrand5p(strand3p)
             else:
                 # 2. restore the modified oligo length
                 olg5p._decrementLength(old_olg3p.length(), emit_signals=True)
                 # 3. apply the old oligo to strand3p
                 old_olg3p.addToPart(part, emit_signals=True)
-                for strand in strand3p.generator3pStrand():
-                    # emits strandHasNewOligoSignal
-                    fSetOligo(strand, old_olg3p, emit_signals=True)
+                strand3p.setOligo3p(old_olg3p)
+                olg5p.oligoStrandsMovedSignal.emit(olg5p)
 
         if self._update_oligo:
             strand5p.strandConnectionChangedSignal.emit(strand5p)
@@ -137,10 +134,7 @@ class RemoveXoverCommand(UndoCommand):
 
         color_list = pathstyles.STAP_COLORS
         n_o3p._setColor(random.choice(color_list))
-        n_o3p._setLength(0, emit_signals=True)
-        for strand in strand3p.generator3pStrand():
-            n_o3p._incrementLength(strand.totalLength(), emit_signals=True)
-        # end def
+        n_o3p._setLength(strand3p.totalLength3p(), emit_signals=True)
         n_o3p.setStrand5p(strand3p)
 
         self._isCircular = strand3p.oligo().isCircular()
@@ -155,8 +149,6 @@ class RemoveXoverCommand(UndoCommand):
         new_olg3p = self._new_oligo3p
         olg5p = self._strand5p.oligo()
 
-        fSetOligo = Strand.setOligo
-
         # 0. Deselect the involved strands
         doc = strand5p.document()
         doc.removeStrandFromSelection(strand5p)
@@ -174,9 +166,8 @@ class RemoveXoverCommand(UndoCommand):
             olg5p._decrementLength(new_olg3p.length(), emit_signals=True)
             # 3. apply the old oligo to strand3p
             new_olg3p.addToPart(part, emit_signals=True)
-            for strand in strand3p.generator3pStrand():
-                # emits strandHasNewOligoSignal
-                fSetOligo(strand, new_olg3p, emit_signals=True)
+            strand3p.setOligo3p(new_olg3p)
+            olg5p.oligoStrandsMovedSignal.emit(olg5p)
 
         strand5p.strandConnectionChangedSignal.emit(strand5p)
         strand3p.strandConnectionChangedSignal.emit(strand3p)
@@ -191,8 +182,6 @@ class RemoveXoverCommand(UndoCommand):
         olg5p = strand5p.oligo()
         new_olg3p = self._new_oligo3p
 
-        fSetOligo = Strand.setOligo
-
         # 0. Deselect the involved strands
         doc = strand5p.document()
         doc.removeStrandFromSelection(strand5p)
@@ -206,9 +195,8 @@ class RemoveXoverCommand(UndoCommand):
             olg5p._incrementLength(new_olg3p.length(), emit_signals=True)
             # 2. Remove the old oligo and apply the 5' oligo to the 3' strand
             new_olg3p.removeFromPart(emit_signals=True)
-            for strand in strand3p.generator3pStrand():
-                # emits strandHasNewOligoSignal
-                fSetOligo(strand, olg5p, emit_signals=True)
+            strand3p.setOligo3p(olg5p)
+            new_olg3p.oligoStrandsMovedSignal.emit(new_olg3p)
         # end else
 
         # 3. install the Xover
@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+import inspect
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 
 from cadnano import undocommand, undostack
 
@@ -40,26 +44,130 @@ class ProxyObject(object):
 
 
 class DummySignal(object):
+    """Signal for running without Qt, declared as a class attribute like
+    ``pyqtSignal``.  Accessed on an instance it returns a
+    :class:`BoundDummySignal` of that instance, so an ``emit`` only calls the
+    slots connected to the emitting object.
+
+    Args:
+        *args: argument types, unused
+        name (str): name of the signal
+    """
+
     def __init__(self, *args, **kwargs):
         name = kwargs.get('name')
         if name is None:
             raise ValueError("missing name")
-        self.targets = set()
         self.argtypes = args
         self.name = name
+        self.attr_name = name
+
+    def __set_name__(self, owner, attr_name):
+        self.attr_name = attr_name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        # cache in the instance dictionary, which takes precedence over this
+        # non data descriptor on the next access
+        bsignal = BoundDummySignal(self.name)
+        obj.__dict__[self.attr_name] = bsignal
+        return bsignal
+# end class
+
+
+class BoundDummySignal(object):
+    """The :class:`DummySignal` of one sender.  Bound method slots are held
+    by weak reference and dropped when their object is deleted, like Qt
+    disconnects the slots of deleted ``QObject`` s.  Other callables are held
+    strongly.
+
+    Args:
+        name: name of the signal
+    """
+    __slots__ = 'name', 'targets', '__weakref__'
+
+    def __init__(self, name: str):
+        self.name = name
+        self.targets = {}
+
+    @staticmethod
+    def _key(target):
+        if inspect.ismethod(target):
+            return (id(target.__self__), target.__func__)
+        return target
 
     def connect(self, target):
-        self.targets.add(target)
+        key = self._key(target)
+        if inspect.ismethod(target):
+            targets = self.targets
+
+            def prune(ref, key=key):
+                if targets.get(key) is ref:
+                    del targets[key]
+            self.targets[key] = weakref.WeakMethod(target, prune)
+        else:
+            self.targets[key] = lambda: target
 
     def disconnect(self, target):
-        self.targets.remove(target)
+        del self.targets[self._key(target)]
 
     def emit(self, *args):
-        for t in self.targets:
-            t(*args)
+        if _batch_depth:
+            try:
+                key = (self, args)
+                _pending[key] = args
+                # a repeat is sent at the position of its last emission
+                _pending.move_to_end(key)
+            except TypeError:   # unhashable arguments are not coalesced
+                _pending[(self, object())] = args
+            return
+        self._send(args)
+
+    def _send(self, args):
+        for ref in list(self.targets.values()):
+            t = ref()
+            if t is not None:
+                t(*args)
 # end class
 
 
+_batch_depth = 0
+_pending = OrderedDict()
+
+
+@contextmanager
+def signalBatch():
+    """Context to hold back the emissions of every :class:`BoundDummySignal`
+    until the outermost batch exits.  Repeated emissions of a signal of the
+    same sender with equal arguments are sent once, in the order of their
+    last emission, so listeners end up in the state of the final one.  Without effect on Qt or blinker signals.
+
+    Example::
+
+        with signalBatch():
+            for strand in strands:
+                strand.strandSet().removeStrand(strand)
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            _flushSignals()
+# end def
+
+
+def _flushSignals():
+    """Send the emissions held back by :func:`signalBatch`"""
+    while _pending:
+        (bsignal, _), args = _pending.popitem(last=False)
+        bsignal._send(args)
+# end def
+
+
 ProxySignal = DummySignal
 BaseObject = ProxyObject
 UndoCommand = undocommand.UndoCommand
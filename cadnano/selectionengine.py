@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Bounds and new indices for moving the selected strand ends of a
+:class:`Document`
+"""
+from bisect import bisect_left
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy as np
+
+from cadnano.cntypes import (
+    Int2T,
+    SegmentT,
+    StrandSetT,
+    StrandT
+)
+
+
+class SelectionEngine(object):
+    """Arrays describing a strand selection, built once per selection in one
+    pass over each strandset with selected strands, instead of looking up
+    the neighbors of every selected strand on every query.
+
+    Row ``i`` of the arrays describes ``strands[i]``:
+
+    * ``idx_lows``, ``idx_highs``: its indices
+    * ``sel_lows``, ``sel_highs``: whether its low or high end is selected
+    * ``low_gaps``: how far its low end may move down, the empty bases down
+      to its low neighbor, or to index 0.  Unconstrained when the low
+      neighbor moves along, i.e. has its high end selected
+    * ``high_gaps``: the same for its high end moving up
+    * ``max_idxs``: the highest index of its strandset, the most any end
+      may move
+
+    Args:
+        selection_dict: selected strands of a document of form::
+
+            {strandset: {strand: (is low end selected, is high end selected)}}
+    """
+
+    def __init__(self, selection_dict: Dict[StrandSetT, Dict[StrandT, Tuple[bool, bool]]]):
+        self.versions = []
+        strands = []
+        sel_values = []
+        positions = []
+        # the strands of all strandsets in one list, each strandset padded by
+        # a strand ending at -1 and one starting past its end so the neighbor
+        # lookups need no bounds check
+        lows = []
+        highs = []
+        max_idxs = []
+        for strandset, ss_dict in selection_dict.items():
+            self.versions.append((strandset, strandset.version))
+            heap = strandset.strand_heap
+            max_idx = strandset.length() - 1
+            offset = len(lows) + 1
+            lows.append(0)
+            highs.append(-1)
+            lows += [x._base_idx_low for x in heap]
+            highs += [x._base_idx_high for x in heap]
+            lows.append(max_idx + 1)
+            highs.append(max_idx + 1)
+            for strand, value in ss_dict.items():
+                strands.append(strand)
+                sel_values.append(value)
+                positions.append(bisect_left(lows, strand._base_idx_low,
+                                             offset, offset + len(heap)))
+            max_idxs += [max_idx]*len(ss_dict)
+        # end for
+        self.strands: List[StrandT] = strands
+        n = len(lows)
+        lows = np.array(lows, dtype=int)
+        highs = np.array(highs, dtype=int)
+        pos = np.array(positions, dtype=int)
+        sel = np.array(sel_values, dtype=bool).reshape(-1, 2)
+        self.sel_lows = sel_lows = sel[:, 0]
+        self.sel_highs = sel_highs = sel[:, 1]
+        self.max_idxs = max_idxs = np.array(max_idxs, dtype=int)
+        heap_sel_lows = np.zeros(n, dtype=bool)
+        heap_sel_highs = np.zeros(n, dtype=bool)
+        heap_sel_lows[pos] = sel_lows
+        heap_sel_highs[pos] = sel_highs
+
+        self.idx_lows = lows[pos]
+        self.idx_highs = highs[pos]
+        self.low_gaps = np.where(heap_sel_highs[pos - 1], max_idxs,
+                                 self.idx_lows - highs[pos - 1] - 1)
+        self.high_gaps = np.where(heap_sel_lows[pos + 1], max_idxs,
+                                  lows[pos + 1] - self.idx_highs - 1)
+        self._bounds = None
+    # end def
+
+    def isValid(self) -> bool:
+        """
+        Returns:
+            ``True`` if no strand was added, removed or moved in the
+            strandsets of the selection since this was built
+        """
+        return all(strandset.version == version for strandset, version in self.versions)
+    # end def
+
+    def bounds(self) -> Int2T:
+        """How far the selection may move down and up, see
+        :meth:`Document.getSelectionBounds`
+
+        Returns:
+            tuple: ``(low bound, high bound)``, ``(-1, -1)`` if nothing is
+            selected
+        """
+        if self._bounds is not None:
+            return self._bounds
+        if not self.strands:
+            self._bounds = (-1, -1)
+            return self._bounds
+        sel_lows, sel_highs = self.sel_lows, self.sel_highs
+        # a strand with only one end selected may shrink to 2 bases
+        spans = self.idx_highs - self.idx_lows - 1
+        low_bound = min(self.max_idxs.min(),
+                        self.low_gaps[sel_lows].min(initial=self.max_idxs[0]),
+                        spans[sel_highs & ~sel_lows].min(initial=self.max_idxs[0]))
+        high_bound = min(self.max_idxs.min(),
+                         self.high_gaps[sel_highs].min(initial=self.max_idxs[0]),
+                         spans[sel_lows & ~sel_highs].min(initial=self.max_idxs[0]))
+        self._bounds = (int(low_bound), int(high_bound))
+        return self._bounds
+    # end def
+
+    def clampDelta(self, delta: int) -> int:
+        """
+        Args:
+            delta: number of bases to move the selected ends by
+
+        Returns:
+            ``delta`` limited to :meth:`bounds`
+        """
+        low_bound, high_bound = self.bounds()
+        if delta > 0:
+            return min(delta, high_bound)
+        if delta < 0:
+            return -min(-delta, low_bound)
+        return delta
+    # end def
+
+    def newIdxs(self, delta: int) -> Optional[List[Tuple[StrandT, SegmentT]]]:
+        """New indices of the strands whose ends move when the selected ends
+        move by ``delta``.  Selected ends with a crossover may snap, see
+        :meth:`NucleicAcidPart.xoverSnapTo`, and then drag the other selected
+        end of their strand along.
+
+        Args:
+            delta: number of bases to move the selected ends by
+
+        Returns:
+            ``(strand, new_idxs)`` items of the strands that change, or
+            ``None`` if the move is illegal
+        """
+        strands = self.strands
+        new_lows = self.idx_lows + delta*self.sel_lows
+        new_highs = self.idx_highs + delta*self.sel_highs
+
+        for i, strand in enumerate(strands):
+            xover_low = self.sel_lows[i] and strand.connectionLow() is not None
+            xover_high = self.sel_highs[i] and strand.connectionHigh() is not None
+            if not (xover_low or xover_high):
+                continue
+            part = strand.part()
+            idx_low, idx_high = int(self.idx_lows[i]), int(self.idx_highs[i])
+            delta_low = delta_high = delta
+            if xover_low:
+                new_low = part.xoverSnapTo(strand, idx_low, delta)
+                if new_low is None:
+                    return None
+                delta_high = new_low - idx_low
+                new_lows[i] = new_low
+            if xover_high:
+                new_high = part.xoverSnapTo(strand, idx_high, delta)
+                if new_high is None:
+                    return None
+                delta_low = new_high - idx_high
+                new_highs[i] = new_high
+            if self.sel_lows[i] and not xover_low:
+                new_lows[i] = idx_low + delta_low
+            if self.sel_highs[i] and not xover_high:
+                new_highs[i] = idx_high + delta_high
+        # end for
+
+        if np.any(new_lows > new_highs):  # check for illegal state
+            return None
+        changed = np.flatnonzero((new_lows != self.idx_lows) | (new_highs != self.idx_highs))
+        return [(strands[i], (int(new_lows[i]), int(new_highs[i]))) for i in changed]
+    # end def
+# end class
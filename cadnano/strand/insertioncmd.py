@@ -109,7 +109,7 @@ class ChangeInsertionCommand(UndoCommand):
         strand = self._strand
         c_strand = self._comp_strand
         inst = self._insertions[self._idx]
-        inst.setLength(self._new_length, emit_signals=True)
+        self._insertions.setLength(self._idx, self._new_length)
         strand.oligo()._incrementLength(self._new_length - self._old_length,
                                         emit_signals=True)
         strand.strandInsertionChangedSignal.emit(strand, inst)
@@ -124,7 +124,7 @@ class ChangeInsertionCommand(UndoCommand):
         strand = self._strand
         c_strand = self._comp_strand
         inst = self._insertions[self._idx]
-        inst.setLength(self._old_length)
+        self._insertions.setLength(self._idx, self._old_length)
         strand.oligo()._decrementLength(self._new_length - self._old_length,
                                         emit_signals=True)
         strand.strandInsertionChangedSignal.emit(strand, inst)
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""Oligo membership of strands
+
+The strands connected 5' to 3' form a chain, and all strands of a chain
+normally belong to one :class:`Oligo`.  Each chain is kept as a treap with
+implicit keys, i.e. a randomized balanced tree whose in order traversal is
+the 5' to 3' order of the strands.  A circular chain is stored as the
+sequence from any of its strands plus the connection closing the loop.
+
+Joining and splitting chains, finding the ends of a chain, applying an oligo
+to a whole chain or to the 3' part of it and summing the total lengths of the
+strands 3' of a strand are ``O(log n)`` in the number of strands of the
+chain.  Oligos applied to a range are stored as a lazy
+``tag`` on the root of a subtree and only pushed down to the nodes when the
+tree is restructured, so the oligo of a strand is the tag closest to the
+root on the path to it, otherwise its own ``oligo``.
+
+The trees follow the connections of the strands: a connection counts once
+both strands point at each other, see :meth:`Strand.setConnection3p`.
+"""
+import random
+from typing import (
+    Iterator,
+    Optional,
+    Tuple
+)
+
+from cadnano.cntypes import (
+    OligoT,
+    StrandT
+)
+
+NO_TAG = object()
+"""Marker of a node without a pending oligo for its subtree"""
+
+_random = random.Random()
+
+
+class OligoIndexNode(object):
+    """Node of the tree of a chain of strands
+
+    Args:
+        strand: the strand of this node
+        oligo: the oligo of the strand
+        length: the total length of the strand
+    """
+    __slots__ = ('strand', 'oligo', 'tag', 'priority',
+                 'parent', 'left', 'right', 'size', 'length', 'total')
+
+    def __init__(self, strand: StrandT, oligo: OligoT = None, length: int = 0):
+        self.strand = strand
+        self.oligo = oligo
+        self.tag = NO_TAG
+        self.priority = _random.random()
+        self.parent: Optional[OligoIndexNode] = None
+        self.left: Optional[OligoIndexNode] = None
+        self.right: Optional[OligoIndexNode] = None
+        self.size: int = 1
+        self.length: int = length
+        self.total: int = length  # sum of the lengths of the subtree
+    # end def
+# end class
+
+
+NodeT = Optional[OligoIndexNode]
+
+
+def _push(node: OligoIndexNode):
+    """Pass the pending oligo of ``node`` on to its children"""
+    tag = node.tag
+    if tag is not NO_TAG:
+        node.oligo = tag
+        if node.left is not None:
+            node.left.tag = tag
+        if node.right is not None:
+            node.right.tag = tag
+        node.tag = NO_TAG
+# end def
+
+
+def _update(node: OligoIndexNode):
+    size = 1
+    total = node.length
+    left = node.left
+    if left is not None:
+        size += left.size
+        total += left.total
+    right = node.right
+    if right is not None:
+        size += right.size
+        total += right.total
+    node.size = size
+    node.total = total
+# end def
+
+
+def _merge(a: NodeT, b: NodeT) -> NodeT:
+    """Concatenate the trees ``a`` and ``b``
+
+    Returns:
+        the root of the merged tree
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        _push(a)
+        right = a.right = _merge(a.right, b)
+        right.parent = a
+        _update(a)
+        return a
+    else:
+        _push(b)
+        left = b.left = _merge(a, b.left)
+        left.parent = b
+        _update(b)
+        return b
+# end def
+
+
+def _split(node: NodeT, k: int) -> Tuple[NodeT, NodeT]:
+    """Split the tree ``node`` into its first ``k`` nodes and the rest
+
+    Returns:
+        the roots of both trees, whose parents are left to the caller
+    """
+    if node is None:
+        return None, None
+    _push(node)
+    left = node.left
+    left_size = 0 if left is None else left.size
+    if k <= left_size:
+        low, high = _split(left, k)
+        node.left = high
+        if high is not None:
+            high.parent = node
+        _update(node)
+        return low, node
+    else:
+        low, high = _split(node.right, k - left_size - 1)
+        node.right = low
+        if low is not None:
+            low.parent = node
+        _update(node)
+        return node, high
+# end def
+
+
+def _splitRoot(root: OligoIndexNode, k: int) -> Tuple[NodeT, NodeT]:
+    low, high = _split(root, k)
+    if low is not None:
+        low.parent = None
+    if high is not None:
+        high.parent = None
+    return low, high
+# end def
+
+
+def root(node: OligoIndexNode) -> OligoIndexNode:
+    while node.parent is not None:
+        node = node.parent
+    return node
+# end def
+
+
+def rank(node: OligoIndexNode) -> int:
+    """
+    Returns:
+        the position of ``node`` in its chain
+    """
+    i = 0 if node.left is None else node.left.size
+    while node.parent is not None:
+        parent = node.parent
+        if node is parent.right:
+            i += 1 if parent.left is None else parent.left.size + 1
+        node = parent
+    return i
+# end def
+
+
+def first(node: OligoIndexNode) -> OligoIndexNode:
+    """
+    Returns:
+        the first node of the tree rooted at ``node``
+    """
+    while node.left is not None:
+        node = node.left
+    return node
+# end def
+
+
+def last(node: OligoIndexNode) -> OligoIndexNode:
+    """
+    Returns:
+        the last node of the tree rooted at ``node``
+    """
+    while node.right is not None:
+        node = node.right
+    return node
+# end def
+
+
+def iterNodes(node: NodeT) -> Iterator[OligoIndexNode]:
+    """Iterate in order over the tree rooted at ``node``"""
+    stack = []
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+        else:
+            node = stack.pop()
+            yield node
+            node = node.right
+# end def
+
+
+def isCircular(root_node: OligoIndexNode) -> bool:
+    """
+    Returns:
+        whether the chain of the tree rooted at ``root_node`` is closed by a
+        connection from its last to its first strand
+    """
+    strand5p = first(root_node).strand
+    strand3p = last(root_node).strand
+    return strand3p._strand3p is strand5p and strand5p._strand5p is strand3p
+# end def
+
+
+def oligoOf(node: OligoIndexNode) -> OligoT:
+    """
+    Returns:
+        the oligo of the strand of ``node``
+    """
+    tag = node.tag
+    parent = node.parent
+    while parent is not None:
+        if parent.tag is not NO_TAG:
+            tag = parent.tag
+        parent = parent.parent
+    return node.oligo if tag is NO_TAG else tag
+# end def
+
+
+def setOligo(node: OligoIndexNode, oligo: OligoT):
+    """Set the oligo of the strand of ``node`` only"""
+    path = []
+    parent = node
+    while parent is not None:
+        path.append(parent)
+        parent = parent.parent
+    for path_node in reversed(path):
+        _push(path_node)
+    node.oligo = oligo
+# end def
+
+
+def setChainOligo(node: OligoIndexNode, oligo: OligoT):
+    """Set the oligo of every strand in the chain of ``node``"""
+    root(node).tag = oligo
+# end def
+
+
+def setOligo3p(node: OligoIndexNode, oligo: OligoT):
+    """Set the oligo of the strand of ``node`` and every strand 3' of it,
+    i.e. of the strands :meth:`Strand.generator3pStrand` visits
+    """
+    root_node = root(node)
+    if isCircular(root_node):
+        root_node.tag = oligo
+        return
+    low, high = _splitRoot(root_node, rank(node))
+    high.tag = oligo
+    _merge(low, high).parent = None
+# end def
+
+
+def setLength(node: OligoIndexNode, length: int):
+    """Set the total length of the strand of ``node``"""
+    node.length = length
+    while node is not None:
+        _update(node)
+        node = node.parent
+# end def
+
+
+def length3p(node: OligoIndexNode) -> int:
+    """
+    Returns:
+        the sum of the total lengths of the strand of ``node`` and every
+        strand 3' of it, i.e. of the strands :meth:`Strand.generator3pStrand`
+        visits
+    """
+    root_node = root(node)
+    if isCircular(root_node):
+        return root_node.total
+    total = node.length
+    if node.right is not None:
+        total += node.right.total
+    while node.parent is not None:
+        parent = node.parent
+        if node is parent.left:
+            total += parent.length
+            if parent.right is not None:
+                total += parent.right.total
+        node = parent
+    return total
+# end def
+
+
+def link(node5p: OligoIndexNode, node3p: OligoIndexNode):
+    """Record the connection of the 3' end of the strand of ``node5p`` to
+    the 5' end of the strand of ``node3p``.  ``node5p`` must be the last
+    node of its chain and ``node3p`` the first node of its chain.
+    """
+    root5p = root(node5p)
+    root3p = root(node3p)
+    if root5p is root3p:
+        # closes a loop
+        return
+    _merge(root5p, root3p).parent = None
+# end def
+
+
+def cut(node5p: OligoIndexNode, node3p: OligoIndexNode):
+    """Record the removal of the connection of the 3' end of the strand of
+    ``node5p`` to the 5' end of the strand of ``node3p``.  Call before
+    either connection of the strands changes.
+    """
+    root_node = root(node5p)
+    if last(root_node) is node5p and first(root_node) is node3p:
+        # opens a loop
+        return
+    is_circular = isCircular(root_node)
+    low, high = _splitRoot(root_node, rank(node3p))
+    if is_circular:
+        # the loop now starts at node3p
+        _merge(high, low).parent = None
+# end def
@@ -1,4 +1,11 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
+from typing import (
+    Iterable,
+    List,
+    Tuple
+)
+
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.cntypes import (
     StrandT,
@@ -14,17 +21,8 @@ class ResizeCommand(UndoCommand):
         self.old_indices = o_i = strand.idxs()
         self.new_idxs = new_idxs
         # an increase in length leads to positive delta
-        self.delta = (new_idxs[1] - new_idxs[0]) - (o_i[1] - o_i[0])
-        # now handle insertion deltas
-        oldInsertions = strand.insertionsOnStrand(*o_i)
-        newInsertions = strand.insertionsOnStrand(*new_idxs)
-        o_l = 0
-        for i in oldInsertions:
-            o_l += i.length()
-        n_l = 0
-        for i in newInsertions:
-            n_l += i.length()
-        self.delta += (n_l - o_l)
+        self.idx_delta = (new_idxs[1] - new_idxs[0]) - (o_i[1] - o_i[0])
+        self.delta = self.idx_delta
 
         self.update_segments = update_segments
         # the strand sequence will need to be regenerated from scratch
@@ -39,11 +37,16 @@ class ResizeCommand(UndoCommand):
         strandset = self.strand.strandSet()
         part = strandset.part()
 
+        # now handle insertion deltas, measured once the insertions removed
+        # by the commands preceding this one are gone
+        o_l = std.insertionLengthBetweenIdxs(*o_i)
+        n_l = std.insertionLengthBetweenIdxs(*n_i)
+        self.delta = self.idx_delta + (n_l - o_l)
         std.oligo()._incrementLength(self.delta, emit_signals=True)
         std.setIdxs(n_i)
         strandset._updateStrandIdxs(std, o_i, n_i)
         if self.update_segments:
-            part.refreshSegments(strandset.idNum())
+            part.refreshSegments(strandset.idNum(), min(o_i[0], n_i[0]), max(o_i[1], n_i[1]))
 
         std.strandResizedSignal.emit(std, n_i)
         # for updating the Slice View displayed helices
@@ -64,7 +67,7 @@ class ResizeCommand(UndoCommand):
         std.setIdxs(o_i)
         strandset._updateStrandIdxs(std, n_i, o_i)
         if self.update_segments:
-            part.refreshSegments(strandset.idNum())
+            part.refreshSegments(strandset.idNum(), min(o_i[0], n_i[0]), max(o_i[1], n_i[1]))
 
         std.strandResizedSignal.emit(std, o_i)
         # for updating the Slice View displayed helices
@@ -74,3 +77,80 @@ class ResizeCommand(UndoCommand):
             std5p.strandResizedSignal.emit(std5p, std5p.idxs())
     # end def
 # end class
+
+
+class ResizeStrandsCommand(UndoCommand):
+    """Resizes many strands in one step.  Each strandset is updated once
+    with :meth:`StrandSet._updateStrandsIdxs`, the segments of each virtual
+    helix are refreshed once over the range the strands cover, and each
+    oligo, strand and virtual helix emits its signal once.
+
+    Args:
+        resizes: ``(strand, new_idxs)`` items
+    """
+    def __init__(self, resizes: Iterable[Tuple[StrandT, SegmentT]]):
+        super(ResizeStrandsCommand, self).__init__("resize strands")
+        self.resizes = [(strand, strand.idxs(), new_idxs) for strand, new_idxs in resizes]
+        self.oligo_deltas = []
+    # end def
+
+    def redo(self):
+        # now handle insertion deltas, measured once the insertions removed
+        # by the commands preceding this one are gone
+        oligo_deltas = defaultdict(int)
+        for strand, o_i, n_i in self.resizes:
+            o_l = strand.insertionLengthBetweenIdxs(*o_i)
+            n_l = strand.insertionLengthBetweenIdxs(*n_i)
+            oligo_deltas[strand.oligo()] += (n_i[1] - n_i[0]) - (o_i[1] - o_i[0]) + n_l - o_l
+        self.oligo_deltas = list(oligo_deltas.items())
+        for oligo, delta in self.oligo_deltas:
+            oligo._incrementLength(delta, emit_signals=True)
+        self._setIdxs([(strand, o_i, n_i) for strand, o_i, n_i in self.resizes])
+    # end def
+
+    def undo(self):
+        for oligo, delta in self.oligo_deltas:
+            oligo._decrementLength(delta, emit_signals=True)
+        self._setIdxs([(strand, n_i, o_i) for strand, o_i, n_i in self.resizes])
+    # end def
+
+    def _setIdxs(self, resizes: List[Tuple[StrandT, SegmentT, SegmentT]]):
+        """
+        Args:
+            resizes: ``(strand, from_idxs, to_idxs)`` items
+        """
+        strandset_resizes = defaultdict(list)
+        for item in resizes:
+            strand = item[0]
+            strand.setIdxs(item[2])
+            strandset_resizes[strand.strandSet()].append(item)
+
+        # (part, ID number) of each virtual helix, a selection can span parts
+        helix_ranges = {}
+        for strandset, ss_resizes in strandset_resizes.items():
+            strandset._updateStrandsIdxs(ss_resizes)
+            key = (strandset.part(), strandset.idNum())
+            idx_low = min(min(f_i[0], t_i[0]) for _, f_i, t_i in ss_resizes)
+            idx_high = max(max(f_i[1], t_i[1]) for _, f_i, t_i in ss_resizes)
+            if key in helix_ranges:
+                low, high = helix_ranges[key]
+                idx_low, idx_high = min(low, idx_low), max(high, idx_high)
+            helix_ranges[key] = (idx_low, idx_high)
+
+        for (part, id_num), (idx_low, idx_high) in helix_ranges.items():
+            part.refreshSegments(id_num, idx_low, idx_high)
+
+        resized = set()
+        for strand, _, t_i in resizes:
+            strand.strandResizedSignal.emit(strand, t_i)
+            resized.add(strand)
+        for strand, _, _ in resizes:
+            std5p = strand.connection5p()
+            if std5p and std5p not in resized:
+                resized.add(std5p)
+                std5p.strandResizedSignal.emit(std5p, std5p.idxs())
+        # for updating the Slice View displayed helices
+        for part, id_num in helix_ranges:
+            part.partStrandChangedSignal.emit(part, id_num)
+    # end def
+# end class
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Sequence application on byte buffers
+
+A strand stores its sequence as a string from 5' to 3', one character per
+base plus the bases of its insertions, less one per skip.  Complementary
+strands of a virtual helix share the insertions of the helix, so the bases
+of an overlap line up once both sequences are read from low to high index.
+The functions here work on those low to high byte buffers: the sequence of
+an oligo is split, complemented and reversed in whole slices, each
+complementary strand is patched in one ``bytearray`` however many strands
+overlap it, and strings are only built once per strand at the end.
+Characters outside ASCII are stored as ``?``.
+"""
+from collections import OrderedDict
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from cadnano import util
+from cadnano.cntypes import (
+    OligoT,
+    StrandT
+)
+
+COMPLEMENT = bytes.maketrans(b'ACGTacgt', b'TGCATGCA')
+"""Translation table of the complement of a sequence in bytes"""
+
+SequenceMapT = Dict[StrandT, Optional[str]]
+
+
+def lowToHigh(strand: StrandT, sequence: Optional[str]) -> bytearray:
+    """
+    Args:
+        strand:
+        sequence: of ``strand`` from 5' to 3', blank if ``None``
+
+    Returns:
+        ``sequence`` from the low to the high index of ``strand``
+    """
+    if sequence is None:
+        return bytearray(b' '*strand.totalLength())
+    buf = bytearray(sequence.encode('ascii', 'replace'))
+    if not strand.isForward():
+        buf.reverse()
+    return buf
+# end def
+
+
+def fromLowToHigh(strand: StrandT, buf: bytearray) -> Optional[str]:
+    """Inverse of :func:`lowToHigh`
+
+    Returns:
+        the sequence of ``strand`` from 5' to 3', ``None`` if empty
+    """
+    if not strand.isForward():
+        buf = buf[::-1]
+    return buf.decode('ascii') or None
+# end def
+
+
+def copyComplement(buf: bytearray, strand: StrandT,
+                   comp_buf: Optional[bytes], comp_strand: StrandT):
+    """Write the complement of the overlap of ``comp_strand`` into ``buf``
+
+    Args:
+        buf: low to high sequence of ``strand``, modified in place
+        strand:
+        comp_buf: low to high complemented sequence of ``comp_strand``, or
+            ``None`` to blank the overlap
+        comp_strand: strand of the complementary strandset
+    """
+    low_idx, high_idx = strand.idxs()
+    c_low_idx, c_high_idx = comp_strand.idxs()
+    o_low_idx, o_high_idx = util.overlap(low_idx, high_idx, c_low_idx, c_high_idx)
+    length = o_high_idx - o_low_idx + 1
+    start = o_low_idx - low_idx
+    c_start = o_low_idx - c_low_idx
+    # both strands are on the same virtual helix
+    insertions = strand.part().insertions()[strand.idNum()]
+    if insertions:
+        length += insertions.lengthBetween(o_low_idx, o_high_idx)
+        start += insertions.lengthBetween(low_idx, o_low_idx - 1)
+        c_start += insertions.lengthBetween(c_low_idx, o_low_idx - 1)
+    if comp_buf is None:
+        buf[start:start + length] = b' '*length
+    else:
+        buf[start:start + length] = comp_buf[c_start:c_start + length]
+# end def
+
+
+def applySequence(oligo: OligoT, sequence: Optional[str]) -> Tuple[SequenceMapT, List[OligoT]]:
+    """Compute the sequences of the strands of ``oligo`` and of the strands
+    complementary to them once ``sequence`` is applied to ``oligo``.  Strands
+    are visited from 5' to 3' and each overwrites its complementary strands
+    in turn, as :meth:`Strand.setSequence` followed by
+    :meth:`Strand.setComplementSequence` would.
+
+    Args:
+        oligo:
+        sequence: from 5' to 3', padded with blanks if shorter than the
+            oligo, or ``None`` to clear the sequence of ``oligo``
+
+    Returns:
+        tuple of the new 5' to 3' sequence by strand, for every strand
+        touched, and the oligos whose sequence changed
+    """
+    strands = list(oligo.strand5p().generator3pStrand())
+    lengths = [strand.totalLength() for strand in strands]
+    if sequence is None:
+        comp_seq = None
+    else:
+        total_length = sum(lengths)
+        sequence = sequence[:total_length].ljust(total_length)
+        comp_seq = sequence.encode('ascii', 'replace').translate(COMPLEMENT)
+
+    new_sequences: SequenceMapT = OrderedDict()
+    buffers: Dict[StrandT, bytearray] = {}
+    oligos = OrderedDict([(oligo, None)])
+    offset = 0
+    for strand, length in zip(strands, lengths):
+        buffers.pop(strand, None)
+        if sequence is None:
+            new_sequences[strand] = comp_buf = None
+        else:
+            new_sequences[strand] = sequence[offset:offset + length]
+            comp_buf = comp_seq[offset:offset + length]
+            if not strand.isForward():
+                comp_buf = comp_buf[::-1]
+            offset += length
+        for comp_strand in strand.getComplementStrands():
+            buf = buffers.get(comp_strand)
+            if buf is None:
+                current = new_sequences[comp_strand] if comp_strand in new_sequences \
+                    else comp_strand._sequence
+                buf = buffers[comp_strand] = lowToHigh(comp_strand, current)
+            copyComplement(buf, comp_strand, comp_buf, strand)
+            oligos[comp_strand.oligo()] = None
+        # end for
+    # end for
+    for strand, buf in buffers.items():
+        new_sequences[strand] = fromLowToHigh(strand, buf)
+    return new_sequences, list(oligos)
+# end def
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from array import array
 from operator import attrgetter
 from typing import (
     Tuple,
@@ -22,6 +21,7 @@ from .modscmd import (
     RemoveModsCommand
 )
 from .resizecmd import ResizeCommand
+from . import oligoindex, sequenceengine
 from cadnano.cntypes import (
     NucleicAcidPartT,
     OligoT,
@@ -32,14 +32,6 @@ from cadnano.cntypes import (
     SegmentT
 )
 
-def sixb(x: str) -> bytes: return x.encode('utf-8')
-
-
-ARRAY_TYPE = 'B'
-
-
-def tostring(x: array) -> str: return x.tobytes().decode('utf-8')
-
 
 class Strand(CNObject):
     """A Strand is a continuous stretch of bases that are all in the same
@@ -59,6 +51,10 @@ class Strand(CNObject):
     or high-to-low directions, connection accessor methods (connectionLow and
     connectionHigh) are bound during the init for convenience.
 
+    The oligo of a Strand is looked up in a tree shared by the chain of
+    connected strands (see :mod:`cadnano.strand.oligoindex`), so it can be
+    changed for a whole chain at once.
+
     Args:
         strandset (StrandSet):
         base_idx_low (int): low index
@@ -80,13 +76,14 @@ class Strand(CNObject):
 
         self._base_idx_low = base_idx_low  # base index of the strand's left bound
         self._base_idx_high = base_idx_high  # base index of the right bound
-        self._oligo = oligo
+        self._total_length = (None, 0)  # (insertions version, totalLength)
+        self._oligo_node = oligoindex.OligoIndexNode(self, oligo, self.totalLength())
         self._strand5p = None  # 5' connection to another strand
         self._strand3p = None  # 3' connection to another strand
         self._sequence = None
 
         self.segments = []
-        self.abstract_sequence = []
+        self.abstract_sequence = []  # (seg_id, offset, length, direction) runs
 
         # dynamic methods for mapping high/low connection /indices
         # to corresponding 3Prime 5Prime
@@ -210,11 +207,11 @@ class Strand(CNObject):
     # end def
 
     def oligo(self) -> OligoT:
-        return self._oligo
+        return oligoindex.oligoOf(self._oligo_node)
     # end def
 
     def getColor(self) -> str:
-        return self._oligo.getColor()
+        return self.oligo().getColor()
     # end def
 
     def sequence(self, for_export: bool = False) -> str:
@@ -227,7 +224,22 @@ class Strand(CNObject):
     # end def
 
     def abstractSeq(self) -> str:
-        return ','.join([str(i) for i in self.abstract_sequence])
+        """
+        Returns:
+            comma separated abstract base numbers from 5' to 3', expanded
+            from the runs of :attr:`abstract_sequence`
+        """
+        return ','.join(','.join(map(str, abstractRange(*run)))
+                        for run in self.abstract_sequence)
+    # end def
+
+    def abstractSequenceLength(self) -> int:
+        """
+        Returns:
+            number of abstract base numbers of this strand
+        """
+        return sum(run[2] for run in self.abstract_sequence)
+    # end def
 
     def strandSet(self) -> StrandSetT:
         return self._strandset
@@ -314,51 +326,16 @@ class Strand(CNObject):
         Returns:
             str: the used portion of the sequence
         """
-        s_low_idx, s_high_idx = self._base_idx_low, self._base_idx_high
-        c_low_idx, c_high_idx = strand.idxs()
-        is_forward = self._is_forward
-        self_seq = self._sequence
-        # get the ovelap
-        low_idx, high_idx = util.overlap(s_low_idx, s_high_idx, c_low_idx, c_high_idx)
-
-        # only get the characters we're using, while we're at it, make it the
-        # reverse compliment
-
-        total_length = self.totalLength()
-
-        # see if we are applying
         if sequence is None:
-            # clear out string for in case of not total overlap
-            use_seq = ''.join([' ' for x in range(total_length)])
-        else:  # use the string as is
-            use_seq = sequence[::-1] if is_forward else sequence
-
-        temp = array(ARRAY_TYPE, sixb(use_seq))
-        if self_seq is None:
-            temp_self = array(ARRAY_TYPE, sixb(''.join([' ' for x in range(total_length)])))
+            comp_buf = None
         else:
-            temp_self = array(ARRAY_TYPE, sixb(self_seq) if is_forward else sixb(self_seq[::-1]))
-
-        # generate the index into the compliment string
-        a = self.insertionLengthBetweenIdxs(s_low_idx, low_idx - 1)
-        b = self.insertionLengthBetweenIdxs(low_idx, high_idx)
-        c = strand.insertionLengthBetweenIdxs(c_low_idx, low_idx - 1)
-        start = low_idx - c_low_idx + c
-        end = start + b + high_idx - low_idx + 1
-        temp_self[low_idx - s_low_idx + a:high_idx - s_low_idx + 1 + a + b] = temp[start:end]
-        # print("old sequence", self_seq)
-        self._sequence = tostring(temp_self)
-
-        # if we need to reverse it do it now
-        if not is_forward:
-            self._sequence = self._sequence[::-1]
-
-        # test to see if the string is empty(), annoyingly expensive
-        # if len(self._sequence.strip()) == 0:
-        if not self._sequence:
-            self._sequence = None
-
-        # print("new sequence", self._sequence)
+            # sequence is in the 5' to 3' order of strand
+            comp_buf = sequence.encode('ascii', 'replace')
+            if self._is_forward:
+                comp_buf = comp_buf[::-1]
+        buf = sequenceengine.lowToHigh(self, self._sequence)
+        sequenceengine.copyComplement(buf, self, comp_buf, strand)
+        self._sequence = sequenceengine.fromLowToHigh(self, buf)
         return self._sequence
     # end def
 
@@ -368,31 +345,30 @@ class Strand(CNObject):
 
     def applyAbstractSequence(self):
         """Assigns virtual index from 5' to 3' on strand and its complement
-        location.
+        location.  The indices are stored as one
+        ``(seg_id, offset, length, direction)`` run per segment, where the
+        run of a forward strand counts up from ``offset`` and that of a
+        reverse strand counts down to it, see :func:`abstractRange`.
         """
-        abstract_seq = []
         part = self.part()
         segment_dict = part.segment_dict[self._id_num]
 
         # make sure we apply numbers from 5' to 3'
         strand_order = 1 if self._is_forward else -1
 
+        abstract_seq = []
         for segment in self.segments[::strand_order]:
-            if segment in segment_dict:
-                seg_id, offset, length = segment_dict[segment]
-            else:
-                seg_id, offset, length = part.getNewAbstractSegmentId(segment)
-                segment_dict[segment] = (seg_id, offset, length)
-
-            for i in range(length)[::strand_order]:
-                abstract_seq.append(offset + i)
+            seg_record = segment_dict.get(segment)
+            if seg_record is None:
+                seg_record = part.getNewAbstractSegmentId(segment)
+                segment_dict[segment] = seg_record
+            abstract_seq.append(seg_record + (strand_order,))
         self.abstract_sequence = abstract_seq
     # end def
 
     def copyAbstractSequenceToSequence(self):
-        abstract_seq = self.abstract_sequence
         # self._sequence = ''.join([ascii_letters[i % 52] for i in abstract_seq])
-        self._sequence = ''.join(['|' for i in abstract_seq])
+        self._sequence = '|'*self.abstractSequenceLength()
     # end def
 
     ### PUBLIC METHODS FOR QUERYING THE MODEL ###
@@ -404,6 +380,29 @@ class Strand(CNObject):
         return self._strand5p
     # end def
 
+    def chainEnds(self) -> Tuple[StrandT, StrandT]:
+        """The ends of the chain of strands connected to this one, which
+        for a loop start at an arbitrary strand of it.
+
+        Returns:
+            tuple of form::
+
+                (<5' end strand>, <3' end strand>)
+        """
+        root = oligoindex.root(self._oligo_node)
+        return oligoindex.first(root).strand, oligoindex.last(root).strand
+    # end def
+
+    def totalLength3p(self) -> int:
+        """The total length of this strand and every strand 3' of it, i.e.
+        of the strands :meth:`generator3pStrand` visits.
+
+        Returns:
+            the sum of the :meth:`totalLength` of the strands
+        """
+        return oligoindex.length3p(self._oligo_node)
+    # end def
+
     def idxs(self) -> SegmentT:
         return (self._base_idx_low, self._base_idx_high)
     # end def
@@ -617,11 +616,7 @@ class Strand(CNObject):
         Returns:
             total length
         """
-        tL = 0
-        insertions = self.insertionsOnStrand(idx_low, idx_high)
-        for insertion in insertions:
-            tL += insertion.length()
-        return tL
+        return self.part().insertions()[self._id_num].lengthBetween(idx_low, idx_high)
     # end def
 
     def insertionsOnStrand(self, idx_low: int = None,
@@ -635,18 +630,9 @@ class Strand(CNObject):
         Returns:
             list of :class:`Insertion`
         """
-        insertions = []
-        insertionsDict = self.part().insertions()[self._id_num]
-        sortedIndices = sorted(insertionsDict.keys())
         if idx_low is None:
             idx_low, idx_high = self.idxs()
-        for index in sortedIndices:
-            insertion = insertionsDict[index]
-            if idx_low <= insertion.idx() <= idx_high:
-                insertions.append(insertion)
-            # end if
-        # end for
-        return insertions
+        return self.part().insertions()[self._id_num].insertionsBetween(idx_low, idx_high)
     # end def
 
     def modifersOnStrand(self) -> List[dict]:
@@ -671,14 +657,16 @@ class Strand(CNObject):
     # end def
 
     def totalLength(self) -> int:
-        """includes the length of insertions in addition to the bases
+        """includes the length of insertions in addition to the bases.
+        Cached until the strand is resized or the insertions of its virtual
+        helix change.
         """
-        tL = 0
-        insertions = self.insertionsOnStrand()
-
-        for insertion in insertions:
-            tL += insertion.length()
-        return tL + self.length()
+        insertions = self.part().insertions()[self._id_num]
+        version, total_length = self._total_length
+        if version != insertions.version:
+            total_length = self.length() + insertions.lengthBetween(*self.idxs())
+            self._total_length = (insertions.version, total_length)
+        return total_length
     # end def
 
     ### PUBLIC METHODS FOR EDITING THE MODEL ###
@@ -835,24 +823,65 @@ class Strand(CNObject):
     # end def
 
     def setConnection3p(self, strand: StrandT):
+        old_strand = self._strand3p
+        if old_strand is not None and old_strand._strand5p is self:
+            oligoindex.cut(self._oligo_node, old_strand._oligo_node)
         self._strand3p = strand
+        if strand is not None and strand._strand5p is self:
+            oligoindex.link(self._oligo_node, strand._oligo_node)
     # end def
 
     def setConnection5p(self, strand: StrandT):
+        old_strand = self._strand5p
+        if old_strand is not None and old_strand._strand3p is self:
+            oligoindex.cut(old_strand._oligo_node, self._oligo_node)
         self._strand5p = strand
+        if strand is not None and strand._strand3p is self:
+            oligoindex.link(strand._oligo_node, self._oligo_node)
     # end def
 
     def setIdxs(self, idxs: SegmentT):
         self._base_idx_low = idxs[0]
         self._base_idx_high = idxs[1]
+        self._refreshTotalLength()
+    # end def
+
+    def _refreshTotalLength(self):
+        """Recompute :meth:`totalLength` after the strand is resized or the
+        insertions in its range change
+        """
+        self._total_length = (None, 0)
+        oligoindex.setLength(self._oligo_node, self.totalLength())
     # end def
 
     def setOligo(self, new_oligo: OligoT, emit_signals: bool = False):
-        self._oligo = new_oligo
+        oligoindex.setOligo(self._oligo_node, new_oligo)
         if emit_signals:
             self.strandHasNewOligoSignal.emit(self)
     # end def
 
+    def setOligo3p(self, new_oligo: OligoT):
+        """Set the oligo of this strand and every strand 3' of it, which is
+        the whole chain for a loop.  Does not emit ``strandHasNewOligoSignal``,
+        callers signal the change once per oligo with
+        ``Oligo.oligoStrandsMovedSignal``.
+
+        Args:
+            new_oligo:
+        """
+        oligoindex.setOligo3p(self._oligo_node, new_oligo)
+    # end def
+
+    def setChainOligo(self, new_oligo: OligoT):
+        """Set the oligo of every strand connected to this one.  See
+        :meth:`setOligo3p`.
+
+        Args:
+            new_oligo:
+        """
+        oligoindex.setChainOligo(self._oligo_node, new_oligo)
+    # end def
+
     def split(self, idx: int, update_sequence: bool = True):
         """Called by view items to split this strand at idx."""
         self._strandset.splitStrand(self, idx, update_sequence)
@@ -933,8 +962,7 @@ class Strand(CNObject):
     def shallowCopy(self):
         """
         """
-        new_s = Strand(self._strandset, *self.idxs())
-        new_s._oligo = self._oligo
+        new_s = Strand(self._strandset, *self.idxs(), oligo=self.oligo())
         new_s._strand5p = self._strand5p
         new_s._strand3p = self._strand3p
         # required to shallow copy the dictionary
@@ -945,9 +973,26 @@ class Strand(CNObject):
     def _deepCopy(self, strandset: StrandSetT, oligo: OligoT):
         """
         """
-        new_s = Strand(strandset, *self.idxs())
-        new_s._oligo = oligo
+        new_s = Strand(strandset, *self.idxs(), oligo=oligo)
         new_s._sequence = self._sequence
         return new_s
     # end def
 # end class
+
+
+def abstractRange(seg_id: int, offset: int, length: int, direction: int) -> range:
+    """
+    Args:
+        seg_id: abstract segment id
+        offset: lowest abstract base number of the segment
+        length: number of bases of the segment
+        direction: ``1`` to count up from ``offset``, ``-1`` to count down
+            to it
+
+    Returns:
+        the abstract base numbers of a run of :attr:`Strand.abstract_sequence`
+    """
+    if direction > 0:
+        return range(offset, offset + length)
+    return range(offset + length - 1, offset - 1, -1)
+# end def
@@ -1 +1,2 @@
 from .strandset import *
+from .intervalstrandset import IntervalStrandSet
@@ -1,8 +1,19 @@
 # -*- coding: utf-8 -*-
+import random
+from typing import (
+    List,
+    Sequence,
+    Tuple
+)
+
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.oligo import Oligo
 from cadnano.strand import Strand
+from cadnano.views.pathview import pathstyles
+from .strandscmd import StrandsCommand
 from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT,
     StrandSetT
 )
 
@@ -74,3 +85,91 @@ class CreateStrandCommand(UndoCommand):
                                                       strandset.idNum())
     # end def
 # end class
+
+
+class CreateStrandsCommand(StrandsCommand):
+    """Creates many strands of a part and the crossovers between them in one
+    step.  Every chain of the new strands gets a new oligo, segments are
+    refreshed once per virtual helix and every strand, oligo and virtual
+    helix signals once.
+
+    Args:
+        part:
+        strands: ``(strandset, base_idx_low, base_idx_high)`` of each strand
+        xovers: ``(i5p, i3p)`` crossovers from the 3' end of ``strands[i5p]``
+            to the 5' end of ``strands[i3p]``
+    """
+
+    def __init__(self, part: NucleicAcidPartT,
+                 strands: Sequence[Tuple[StrandSetT, int, int]],
+                 xovers: Sequence[Tuple[int, int]] = ()):
+        super(CreateStrandsCommand, self).__init__(part, "create strands")
+        self._strands = new_strands = [Strand(strandset, idx_low, idx_high)
+                                       for strandset, idx_low, idx_high in strands]
+        for i5p, i3p in xovers:
+            strand5p, strand3p = new_strands[i5p], new_strands[i3p]
+            strand5p.setConnection3p(strand3p)
+            strand3p.setConnection5p(strand5p)
+
+        self._oligos = []
+        visited = set()
+        color_list = pathstyles.STAP_COLORS
+        for strand in new_strands:
+            if strand in visited:
+                continue
+            oligo = Oligo(None, random.choice(color_list))
+            chain = list(strand.generator5pStrand())
+            strand5p = chain[-1]
+            is_circular = strand.connection3p() is strand5p
+            if not is_circular:
+                chain += list(strand.generator3pStrand())[1:]
+            strand.setChainOligo(oligo)
+            visited.update(chain)
+            oligo.setStrand5p(strand5p)
+            oligo._setLoop(is_circular)
+            self._oligos.append(oligo)
+    # end def
+
+    def strands(self) -> List[Strand]:
+        return self._strands
+    # end def
+
+    def oligos(self) -> List[OligoT]:
+        return self._oligos
+    # end def
+
+    def redo(self):
+        part = self._part
+        for strand in self._strands:
+            strand.strandSet()._addToStrandList(strand, update_segments=False)
+        helix_ranges = self._refreshSegments(self._strands)
+        for oligo in self._oligos:
+            oligo.refreshLength()
+            oligo.addToPart(part, emit_signals=True)
+
+        for strand in self._strands:
+            strandset = strand.strandSet()
+            strandset.strandsetStrandAddedSignal.emit(strandset, strand)
+        # for updating the Slice View displayed helices
+        for id_num in helix_ranges:
+            part.partStrandChangedSignal.emit(part, id_num)
+        for strand in self._strands:
+            if strand.connection5p() is not None or strand.connection3p() is not None:
+                strand.strandConnectionChangedSignal.emit(strand)
+    # end def
+
+    def undo(self):
+        part = self._part
+        for strand in self._strands:
+            strand.strandSet()._removeFromStrandList(strand, update_segments=False)
+        helix_ranges = self._refreshSegments(self._strands)
+        for oligo in self._oligos:
+            oligo.removeFromPart(emit_signals=True)
+
+        for strand in self._strands:
+            strand.strandRemovedSignal.emit(strand)
+        # for updating the Slice View displayed helices
+        for id_num in helix_ranges:
+            part.partStrandChangedSignal.emit(part, id_num)
+    # end def
+# end class
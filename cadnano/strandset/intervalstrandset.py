@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+from bisect import (
+    bisect_left,
+    bisect_right
+)
+from typing import (
+    Iterable,
+    List,
+    Tuple
+)
+
+from .strandset import StrandSet
+from cadnano.cntypes import (
+    Int2T,
+    StrandT
+)
+
+
+class IntervalStrandSet(StrandSet):
+    """:class:`StrandSet` without the per base ``strand_array``.
+
+    The strands of a set never overlap, so sorted by low index they are also
+    sorted by high index, and the only other structure kept is the sorted
+    list of their low indices::
+
+        strand_heap = [strandA, strandB, strandC, ...]
+        low_idxs = [strandA.lowIdx(), strandB.lowIdx(), strandC.lowIdx(), ...]
+
+    The strand at a base index, or the strands overlapping a range, are found
+    by bisecting ``low_idxs``, and adding, resizing or removing a strand is a
+    bisection and a list insertion or deletion instead of a loop over every
+    base it covers.  Both lists are plain lists, so the insertion or deletion
+    is O(n) in the number of strands of the set, which is small next to the
+    number of bases, and only the lookups are logarithmic.
+
+    Args:
+        is_fwd (bool):  is this a forward or reverse StrandSet?
+        id_num (int):   ID number of the virtual helix this is on
+        part (Part):  Part object this is a child of
+        initial_size (int): initial_size to allocate
+    """
+
+    def _reset(self, initial_size: int):
+        """Reset this object clearing out references to all :class:`Strand`
+        objects.  Exceptional private method to be only used by Parts
+
+        Args:
+            initial_size: size to revert to
+        """
+        self._length = initial_size
+        self.strand_heap = []
+        self.low_idxs = []
+        self.version += 1
+    # end def
+
+    def resize(self, delta_low: int, delta_high: int):
+        """Resize this StrandSet.
+
+        Args:
+            delta_low:  amount to resize the low index end
+            delta_high:  amount to resize the high index end
+        """
+        self._length += delta_low + delta_high
+        self.version += 1
+    # end def
+
+    def length(self) -> int:
+        """length of the :class:`StrandSet` and therefore also the associated
+        virtual helix in bases
+
+        Returns:
+            length of the set
+        """
+        return self._length
+    # end def
+
+    def _heapIndex(self, strand: StrandT) -> int:
+        """
+        Returns:
+            position of ``strand`` in ``strand_heap`` or -1 if it is not in
+            the set at its current indices
+        """
+        i = bisect_left(self.low_idxs, strand.lowIdx())
+        if i < len(self.strand_heap) and self.strand_heap[i] is strand:
+            return i
+        return -1
+    # end def
+
+    ### PUBLIC METHODS FOR QUERYING THE MODEL ###
+    def getNeighbors(self, strand: StrandT) -> Tuple[StrandT, StrandT]:
+        """Given a :class:`Strand` in this :class:`StrandSet` find its internal
+        neighbors
+
+        Args:
+            strand:
+
+        Returns:
+            of form::
+
+                (low neighbor, high neighbor)
+
+            of types :class:`Strand` or :obj:`None`
+        """
+        sh = self.strand_heap
+        i = self._heapIndex(strand)
+        if i < 0:
+            raise ValueError("getNeighbors: strand not in set")
+        low_strand = sh[i - 1] if i > 0 else None
+        high_strand = sh[i + 1] if i < len(sh) - 1 else None
+        return low_strand, high_strand
+    # end def
+
+    def getBoundsOfEmptyRegionContaining(self, base_idx: int) -> Int2T:
+        """Return the bounds of the empty region containing base index <base_idx>.
+
+        Args:
+            base_idx: the index of interest
+
+        Returns:
+            tuple of :obj:`int` of form::
+
+                (low_idx, high_idx)
+        """
+        sh = self.strand_heap
+        # the i-th strand is on the high side, the i-1 strand on the low side
+        i = bisect_left(self.low_idxs, base_idx)
+        low_idx = sh[i - 1].highIdx() + 1 if i > 0 else 0
+        high_idx = sh[i].lowIdx() - 1 if i < len(sh) else self._length - 1
+        return (low_idx, high_idx)
+    # end def
+
+    def isStrandInSet(self, strand: StrandT) -> bool:
+        return self._heapIndex(strand) >= 0
+    # end def
+
+    def hasStrandAt(self, idx_low: int, idx_high: int) -> bool:
+        """Check if set has a strand on the interval given
+
+        Args:
+            idx_low: low index
+            idx_high: high index
+
+        Returns:
+            ``True`` if strandset has a strand in the region between ``idx_low``
+            and ``idx_high`` (both included). ``False`` otherwise
+        """
+        # the last strand starting at or below idx_high reaches the highest
+        i = bisect_right(self.low_idxs, idx_high) - 1
+        return i >= 0 and self.strand_heap[i].highIdx() >= idx_low
+    # end def
+
+    def getOverlappingStrands(self, idx_low: int, idx_high: int) -> List[StrandT]:
+        """Gets :class:`Strand` list that overlap the given range.
+
+        Args:
+            idx_low: low index of overlap region
+            idx_high: high index of overlap region
+
+        Returns:
+            all :class:`Strand` objects in range
+        """
+        low_idxs = self.low_idxs
+        sh = self.strand_heap
+        start = bisect_right(low_idxs, idx_low) - 1
+        if start < 0 or sh[start].highIdx() < idx_low:
+            start += 1
+        return sh[start:bisect_right(low_idxs, idx_high)]
+    # end def
+
+    def getStrand(self, base_idx: int) -> StrandT:
+        """Returns the :class:`Strand` that overlaps with `base_idx`
+
+        Args:
+            base_idx:
+
+        Returns:
+            Strand: :class:`Strand` at `base_idx` if it exists, else ``None``,
+            also for a `base_idx` outside of the set, where
+            :meth:`StrandSet.getStrand` raises an :class:`IndexError`
+        """
+        i = bisect_right(self.low_idxs, base_idx) - 1
+        if i >= 0:
+            strand = self.strand_heap[i]
+            if strand._base_idx_high >= base_idx:
+                return strand
+        return None
+    # end def
+
+    ### PRIVATE SUPPORT METHODS ###
+    def _setStrands(self, strands: Iterable[StrandT]):
+        """Replace all strands at once, without signals or segment refresh.
+        Used by bulk decoding.
+
+        Args:
+            strands: non overlapping strands of this set
+        """
+        strands = sorted(strands, key=lambda x: x.lowIdx())
+        self.strand_heap = strands
+        self.low_idxs = [strand.lowIdx() for strand in strands]
+        self.version += 1
+    # end def
+
+    def _addToStrandList(self, strand: StrandT, update_segments: bool = True):
+        """Inserts strand into the strand_heap
+
+        Args:
+            strand: the strand to add
+            update_segments (optional): whether to signal default=``True``
+        """
+        idx_low = strand.lowIdx()
+        i = bisect_left(self.low_idxs, idx_low)
+        self.strand_heap.insert(i, strand)
+        self.low_idxs.insert(i, idx_low)
+        self.version += 1
+        if update_segments:
+            self._part.refreshSegments(self._id_num, *strand.idxs())
+    # end def
+
+    def _updateStrandIdxs(self, strand: StrandT, old_idxs: Int2T, new_idxs: Int2T):
+        """update the indices of an existing strand
+
+        Args:
+            strand: the strand
+            old_idxs: range (:obj:`int`) the strand was stored at
+            new_idxs: range (:obj:`int`) the strand now covers
+        """
+        low_idxs = self.low_idxs
+        i = bisect_left(low_idxs, old_idxs[0])
+        del low_idxs[i]
+        self.strand_heap.pop(i)
+        i = bisect_left(low_idxs, new_idxs[0])
+        low_idxs.insert(i, new_idxs[0])
+        self.strand_heap.insert(i, strand)
+        self.version += 1
+
+    def _updateStrandsIdxs(self, resizes: Iterable[Tuple[StrandT, Int2T, Int2T]]):
+        """update the indices of several existing strands at once, which
+        already have their new indices
+
+        Args:
+            resizes: ``(strand, old_idxs, new_idxs)`` items
+        """
+        sh = self.strand_heap
+        sh.sort(key=lambda x: x._base_idx_low)
+        self.low_idxs = [strand._base_idx_low for strand in sh]
+        self.version += 1
+    # end def
+
+    def _removeFromStrandList(self, strand: StrandT, update_segments: bool = True):
+        """Remove strand from strand_heap.
+
+        Args:
+            strand: the strand
+            update_segments (optional): whether to signal default=``True``
+        """
+        self._document.removeStrandFromSelection(strand)  # make sure the strand is no longer selected
+        i = bisect_left(self.low_idxs, strand.lowIdx())
+        del self.low_idxs[i]
+        self.strand_heap.pop(i)
+        self.version += 1
+        if update_segments:
+            self._part.refreshSegments(self._id_num, *strand.idxs())
+    # end def
+
+    def getStrandIndex(self, strand: StrandT) -> Tuple[bool, int]:
+        """Get the low index of strand if it exists
+
+        Returns:
+            tuple of form::
+
+                (is_existing, index)
+        """
+        if self._heapIndex(strand) >= 0:
+            return (True, strand.lowIdx())
+        return (False, 0)
+    # end def
+# end class
@@ -74,8 +74,6 @@ class MergeCommand(UndoCommand):
         l_olg = s_low.oligo()
         h_olg = s_high.oligo()
 
-        fSetOligo = Strand.setOligo
-
         # Remove old strands from the s_set (reusing idx, so order matters)
         ss._removeFromStrandList(s_low, update_segments=False)
         ss._removeFromStrandList(s_high, update_segments=False)
@@ -98,9 +96,11 @@ class MergeCommand(UndoCommand):
             else:
                 nScH.setConnectionHigh(new_strand)
 
-        # Traverse the strands via 3'conns to assign the new oligo
-        for strand in olg.strand5p().generator3pStrand():
-            fSetOligo(strand, olg, emit_signals=True)  # emits strandHasNewOligoSignal
+        # Assign the new oligo to the strands 3' of its 5' end
+        olg.strand5p().setOligo3p(olg)
+        l_olg.oligoStrandsMovedSignal.emit(l_olg)
+        if h_olg != l_olg:
+            h_olg.oligoStrandsMovedSignal.emit(h_olg)
 
         # Add new oligo and remove old oligos
         olg.addToPart(ss.part(), emit_signals=True)
@@ -121,8 +121,6 @@ class MergeCommand(UndoCommand):
         s_high = self._strand_high
         new_strand = self._new_strand
 
-        fSetOligo = Strand.setOligo
-
         olg = self._new_oligo
         l_olg = self._s_low_oligo
         h_olg = self._s_high_oligo
@@ -148,11 +146,10 @@ class MergeCommand(UndoCommand):
             else:
                 sHcH.setConnectionHigh(s_high)
 
-        # Traverse the strands via 3'conns to assign the old oligo
-        for strand in l_olg.strand5p().generator3pStrand():
-            fSetOligo(strand, l_olg, emit_signals=True)  # emits strandHasNewOligoSignal
-        for strand in h_olg.strand5p().generator3pStrand():
-            fSetOligo(strand, h_olg, emit_signals=True)  # emits strandHasNewOligoSignal
+        # Assign the old oligos to the strands 3' of their 5' ends
+        l_olg.strand5p().setOligo3p(l_olg)
+        h_olg.strand5p().setOligo3p(h_olg)
+        olg.oligoStrandsMovedSignal.emit(olg)
 
         # Remove new oligo and add old oligos
         olg.removeFromPart(emit_signals=True)
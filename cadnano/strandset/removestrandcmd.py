@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
+from typing import (
+    Iterable,
+    List,
+    Tuple
+)
+
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.strand import Strand
 from cadnano.views.pathview import pathstyles
 import random
+from .strandscmd import StrandsCommand
 from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT,
     StrandSetT
 )
 
@@ -38,6 +47,9 @@ class RemoveStrandCommand(UndoCommand):
             self._new_oligo3p = olg3p = None
             if self._new_oligo5p:
                 self._new_oligo5p._setLoop(False)
+                if olg.isCircular():
+                    # the rest of the loop starts 3' of the strand
+                    self._new_oligo5p.setStrand5p(self._old_strand3p)
         else:
             self._new_oligo3p = olg3p = olg.shallowCopy()
             olg3p.setStrand5p(self._old_strand3p)
@@ -56,8 +68,6 @@ class RemoveStrandCommand(UndoCommand):
         doc.removeStrandFromSelection(strand)
         strandset._removeFromStrandList(strand)
 
-        fSetOligo = Strand.setOligo
-
         strand5p = self._old_strand5p
         strand3p = self._old_strand3p
         oligo = self._oligo
@@ -73,8 +83,7 @@ class RemoveStrandCommand(UndoCommand):
 
         # Clear connections and update oligos
         if strand5p is not None:
-            for s5p in oligo.strand5p().generator3pStrand():
-                fSetOligo(s5p, olg5p, emit_signals=True)
+            strand5p.setChainOligo(olg5p)
             olg5p.refreshLength(emit_signals=True)
             olg5p.addToPart(strandset.part(), emit_signals=True)
             if self._solo:
@@ -87,8 +96,7 @@ class RemoveStrandCommand(UndoCommand):
         if strand3p is not None:
             if not oligo.isCircular():
                 # apply 2nd oligo copy to all 3' downstream strands
-                for s3p in strand3p.generator3pStrand():
-                    fSetOligo(s3p, olg3p, emit_signals=True)
+                strand3p.setOligo3p(olg3p)
                 olg3p.addToPart(strandset.part(), emit_signals=True)
             if self._solo:
                 part = strandset.part()
@@ -96,6 +104,8 @@ class RemoveStrandCommand(UndoCommand):
                 part.partActiveVirtualHelixChangedSignal.emit(part, id_num)
             strand3p.strandConnectionChangedSignal.emit(strand3p)
         # end if
+        if strand5p is not None or strand3p is not None:
+            oligo.oligoStrandsMovedSignal.emit(oligo)
         # Emit a signal to notify on completion
         strand.strandRemovedSignal.emit(strand)
 
@@ -121,8 +131,6 @@ class RemoveStrandCommand(UndoCommand):
         olg5p = self._new_oligo5p
         olg3p = self._new_oligo3p
 
-        fSetOligo = Strand.setOligo
-
         # Restore connections to this strand
         if strand5p is not None:
             strand5p.setConnection3p(strand)
@@ -136,9 +144,11 @@ class RemoveStrandCommand(UndoCommand):
             olg5p.removeFromPart(emit_signals=True)
         if olg3p:
             olg3p.removeFromPart(emit_signals=True)
-        for s5p in oligo.strand5p().generator3pStrand():
-            fSetOligo(s5p, oligo, emit_signals=True)
-        # end for
+        oligo.strand5p().setOligo3p(oligo)
+        if olg5p:
+            olg5p.oligoStrandsMovedSignal.emit(olg5p)
+        if olg3p:
+            olg3p.oligoStrandsMovedSignal.emit(olg3p)
 
         # Emit a signal to notify on completion
         strandset.strandsetStrandAddedSignal.emit(strandset, strand)
@@ -171,3 +181,136 @@ class RemoveStrandCommand(UndoCommand):
             strand.strandConnectionChangedSignal.emit(strand)
     # end def
 # end class
+
+
+class RemoveStrandsCommand(StrandsCommand):
+    """Removes many strands and crossovers of a part in one step.
+
+    All crossovers in ``xovers`` and all connections of the strands in
+    ``strands`` are cut, the strands are removed from their strandsets and
+    each resulting chain of strands gets an oligo once: an oligo keeps the
+    chain starting at its 5' strand if that remains, every other chain gets
+    a new oligo.  Segments are refreshed once per virtual helix and every
+    strand, oligo and virtual helix signals once.
+
+    Args:
+        part:
+        strands: strands to remove
+        xovers: ``(strand5p, strand3p)`` crossovers to remove
+    """
+
+    def __init__(self, part: NucleicAcidPartT, strands: Iterable[Strand],
+                 xovers: Iterable[Tuple[Strand, Strand]] = ()):
+        super(RemoveStrandsCommand, self).__init__(part, "remove strands")
+        self._strands = strands = list(dict.fromkeys(strands))
+        removed = set(strands)
+
+        links = dict.fromkeys((s5p, s3p) for s5p, s3p in xovers if s5p.connection3p() is s3p)
+        for strand in strands:
+            strand5p, strand3p = strand.connection5p(), strand.connection3p()
+            if strand5p is not None:
+                links[(strand5p, strand)] = None
+            if strand3p is not None:
+                links[(strand, strand3p)] = None
+        self._links = list(links)
+        # the surviving strands next to a cut, whose chains get new oligos
+        self._cut_strands = list(dict.fromkeys(strand for link in self._links
+                                               for strand in link if strand not in removed))
+
+        self._saveOligos(strand.oligo() for strand in strands + self._cut_strands)
+        self.mids = [(part.getModID(strand, strand.lowIdx()),
+                      part.getModID(strand, strand.highIdx())) for strand in strands]
+    # end def
+
+    def _findChains(self) -> List[Tuple[Strand, OligoT, bool]]:
+        """Oligos for the chains of the strands next to a cut, called once
+        the connections are cut and before any oligo is reassigned.  An
+        oligo keeps its chain if its 5' strand remains.
+        """
+        removed = set(self._strands)
+        kept = {}
+        for olg, strand5p, _, _ in self._old_oligos:
+            if strand5p not in removed:
+                kept.setdefault(strand5p.chainEnds()[0], olg)
+        return self._chainOligos(((strand.chainEnds()[0], strand.oligo())
+                                  for strand in self._cut_strands), kept)
+    # end def
+
+    def redo(self):
+        part = self._part
+        doc = part.document()
+        for strand in self._cut_strands:
+            doc.removeStrandFromSelection(strand)
+
+        # 1. cut the connections
+        for strand5p, strand3p in self._links:
+            strand5p.setConnection3p(None)
+            strand3p.setConnection5p(None)
+
+        # 2. remove the strands
+        for strand in self._strands:
+            strand.strandSet()._removeFromStrandList(strand, update_segments=False)
+        helix_ranges = self._refreshSegments(self._strands)
+
+        # 3. give each chain its oligo
+        if self._chains is None:
+            self._chains = self._findChains()
+        kept = self._applyChains()
+        for olg, _, _, _ in self._old_oligos:
+            if olg not in kept:
+                olg.removeFromPart(emit_signals=True)
+
+        # 4. signal
+        for olg, _, _, _ in self._old_oligos:
+            olg.oligoStrandsMovedSignal.emit(olg)
+        for strand in self._cut_strands:
+            strand.strandConnectionChangedSignal.emit(strand)
+        for strand, mids in zip(self._strands, self.mids):
+            strand.strandRemovedSignal.emit(strand)
+            if mids[0] is not None:
+                part.removeModStrandInstance(strand, strand.lowIdx(), mids[0])
+            if mids[1] is not None:
+                part.removeModStrandInstance(strand, strand.highIdx(), mids[1])
+        # for updating the Slice View displayed helices
+        for id_num in helix_ranges:
+            part.partStrandChangedSignal.emit(part, id_num)
+    # end def
+
+    def undo(self):
+        part = self._part
+
+        # 1. restore the strands
+        for _, olg, is_new in self._chains:
+            if is_new:
+                olg.removeFromPart(emit_signals=True)
+        for strand in self._strands:
+            strand.strandSet()._addToStrandList(strand, update_segments=False)
+        helix_ranges = self._refreshSegments(self._strands)
+
+        # 2. restore the connections
+        for strand5p, strand3p in self._links:
+            strand5p.setConnection3p(strand3p)
+            strand3p.setConnection5p(strand5p)
+
+        # 3. restore the oligos
+        self._restoreOligos(add_to_part=True)
+
+        # 4. signal
+        for _, olg, is_new in self._chains:
+            if is_new:
+                olg.oligoStrandsMovedSignal.emit(olg)
+        for strand, mids in zip(self._strands, self.mids):
+            strand.strandSet().strandsetStrandAddedSignal.emit(strand.strandSet(), strand)
+            if mids[0] is not None:
+                part.addModStrandInstance(strand, strand.lowIdx(), mids[0])
+                strand.strandModsAddedSignal.emit(strand, mids[0], strand.lowIdx())
+            if mids[1] is not None:
+                part.addModStrandInstance(strand, strand.highIdx(), mids[1])
+                strand.strandModsAddedSignal.emit(strand, mids[1], strand.highIdx())
+        for strand in dict.fromkeys(strand for link in self._links for strand in link):
+            strand.strandConnectionChangedSignal.emit(strand)
+        # for updating the Slice View displayed helices
+        for id_num in helix_ranges:
+            part.partStrandChangedSignal.emit(part, id_num)
+    # end def
+# end class
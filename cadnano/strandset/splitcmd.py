@@ -1,9 +1,20 @@
 # -*- coding: utf-8 -*-
 import random
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple
+)
 
 from cadnano.views.pathview import pathstyles
 from cadnano.proxies.cnproxy import UndoCommand
 from cadnano.strand import Strand
+from .strandscmd import StrandsCommand
+from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT
+)
 
 
 class SplitCommand(UndoCommand):
@@ -80,11 +91,11 @@ class SplitCommand(UndoCommand):
             # Update the oligo color if necessary
             l_oligo._setColor(color_low)
             h_oligo._setColor(color_high)
-            # settle the oligo length
-            length = 0
-            for strand in std3p.generator3pStrand():
-                length += strand.totalLength()
-            # end for
+            # settle the oligo length, std3p is a copy not yet in the chain
+            # of its 3' connection
+            length = std3p.totalLength()
+            if std3p.connection3p() is not None:
+                length += std3p.connection3p().totalLength3p()
             olg5p._setLength(olg5p.length() - length, emit_signals=True)
             olg3p._setLength(length, emit_signals=True)
         # end if
@@ -134,14 +145,11 @@ class SplitCommand(UndoCommand):
             else:
                 sHcH.setConnectionHigh(s_high)
 
-        # Traverse the strands via 3'conns to assign the new oligos
-        fSetOligo = Strand.setOligo
-        for strand in l_olg.strand5p().generator3pStrand():
-            fSetOligo(strand, l_olg, emit_signals=True)  # emits strandHasNewOligoSignal
+        # Assign the new oligos to the strands 3' of their 5' ends
+        l_olg.strand5p().setOligo3p(l_olg)
         if was_not_loop:  # do the second oligo which is different
-            for i, strand in enumerate(h_olg.strand5p().generator3pStrand()):
-                # emits strandHasNewOligoSignal
-                fSetOligo(strand, h_olg, emit_signals=True)
+            h_olg.strand5p().setOligo3p(h_olg)
+        olg.oligoStrandsMovedSignal.emit(olg)
 
         # Add new oligo and remove old oligos from the part
         olg.removeFromPart(emit_signals=True)
@@ -194,10 +202,11 @@ class SplitCommand(UndoCommand):
             else:
                 oScH.setConnectionHigh(o_strand)
 
-        # Traverse the strands via 3'conns to assign the old oligo
-        fSetOligo = Strand.setOligo
-        for strand in olg.strand5p().generator3pStrand():
-            fSetOligo(strand, olg, emit_signals=True)
+        # Assign the old oligo to the strands 3' of its 5' end
+        olg.strand5p().setOligo3p(olg)
+        l_olg.oligoStrandsMovedSignal.emit(l_olg)
+        if was_not_loop:
+            h_olg.oligoStrandsMovedSignal.emit(h_olg)
         # Add old oligo and remove new oligos from the part
         olg.addToPart(ss.part(), emit_signals=True)
         l_olg.removeFromPart(emit_signals=True)
@@ -215,3 +224,165 @@ class SplitCommand(UndoCommand):
         #     doc.updateStrandSelection()
     # end def
 # end class
+
+
+class SplitStrandsCommand(StrandsCommand):
+    """Splits many strands of a part in one step, each at one or more base
+    indices.  As for :class:`SplitCommand` a split at ``base_idx`` leaves a
+    new 3' end at ``base_idx``.
+
+    Each split strand is replaced by copies covering its parts, which take
+    over its connections.  An oligo keeps the chain starting at its 5'
+    strand, or at the 5' part of it, every other chain gets a new oligo.
+    Segments are refreshed once per virtual helix and every strand, oligo
+    and virtual helix signals once.
+
+    Args:
+        part:
+        splits: ``(strand, base_idx)`` of each split
+        update_sequence: split the sequences of the strands too, default is
+            ``True``
+    """
+
+    def __init__(self, part: NucleicAcidPartT,
+                 splits: Iterable[Tuple[Strand, int]],
+                 update_sequence: bool = True):
+        super(SplitStrandsCommand, self).__init__(part, "split strands")
+        split_idxs: Dict[Strand, List[int]] = {}
+        for strand, base_idx in splits:
+            split_idxs.setdefault(strand, []).append(base_idx)
+        self._old_strands = list(split_idxs)
+
+        # the parts of each strand 5' to 3'
+        self._pieces: Dict[Strand, List[Strand]] = {}
+        for strand, idxs in split_idxs.items():
+            idx_low, idx_high = strand.idxs()
+            idxs = sorted(set(idxs))
+            if strand.isForward():
+                if idxs[0] < idx_low or idxs[-1] >= idx_high:
+                    raise ValueError("SplitStrandsCommand: can't split %s at %s" % (strand, idxs))
+                bounds = zip([idx_low] + [x + 1 for x in idxs], idxs + [idx_high])
+            else:
+                if idxs[0] <= idx_low or idxs[-1] > idx_high:
+                    raise ValueError("SplitStrandsCommand: can't split %s at %s" % (strand, idxs))
+                bounds = reversed(list(zip([idx_low] + idxs, [x - 1 for x in idxs] + [idx_high])))
+            strandset = strand.strandSet()
+            pieces = self._pieces[strand] = [Strand(strandset, low, high) for low, high in bounds]
+            sequence = strand._sequence
+            if update_sequence and sequence:
+                i = 0
+                for piece in pieces:
+                    length = piece.totalLength()
+                    piece._sequence = sequence[i:i + length]
+                    i += length
+
+        def head(strand):
+            pieces = self._pieces.get(strand)
+            return strand if pieces is None else pieces[0]
+
+        def tail(strand):
+            pieces = self._pieces.get(strand)
+            return strand if pieces is None else pieces[-1]
+
+        links = {}
+        for strand in self._old_strands:
+            strand5p, strand3p = strand.connection5p(), strand.connection3p()
+            if strand5p is not None:
+                links[(strand5p, strand)] = None
+            if strand3p is not None:
+                links[(strand, strand3p)] = None
+        self._old_links = list(links)
+        self._new_links = [(tail(strand5p), head(strand3p)) for strand5p, strand3p in links]
+
+        self._saveOligos(strand.oligo() for strand in self._old_strands)
+        self._head = head
+    # end def
+
+    def _findChains(self) -> List[Tuple[Strand, OligoT, bool]]:
+        """Oligos for the chains of the new strands, called once they are
+        connected and before any oligo is reassigned.  An oligo keeps the
+        chain starting at its 5' strand, or at the 5' part of it.
+        """
+        kept = {self._head(strand5p).chainEnds()[0]: olg
+                for olg, strand5p, _, _ in self._old_oligos}
+        return self._chainOligos(((piece.chainEnds()[0], strand.oligo())
+                                  for strand in self._old_strands
+                                  for piece in self._pieces[strand]), kept)
+    # end def
+
+    def redo(self):
+        part = self._part
+
+        # 1. replace the strands by their parts
+        for strand5p, strand3p in self._old_links:
+            strand5p.setConnection3p(None)
+            strand3p.setConnection5p(None)
+        for strand in self._old_strands:
+            strandset = strand.strandSet()
+            strandset._removeFromStrandList(strand, update_segments=False)
+            for piece in self._pieces[strand]:
+                strandset._addToStrandList(piece, update_segments=False)
+        for strand5p, strand3p in self._new_links:
+            strand5p.setConnection3p(strand3p)
+            strand3p.setConnection5p(strand5p)
+        helix_ranges = self._refreshSegments(self._old_strands)
+
+        # 2. give each chain its oligo
+        if self._chains is None:
+            self._chains = self._findChains()
+        self._applyChains()
+
+        # 3. signal
+        for olg, _, _, _ in self._old_oligos:
+            olg.oligoStrandsMovedSignal.emit(olg)
+        for strand in self._old_strands:
+            strand.strandRemovedSignal.emit(strand)
+            strandset = strand.strandSet()
+            for piece in self._pieces[strand]:
+                strandset.strandsetStrandAddedSignal.emit(strandset, piece)
+        for strand in dict.fromkeys(strand for link in self._new_links for strand in link):
+            strand.strandConnectionChangedSignal.emit(strand)
+        # for updating the Slice View displayed helices
+        for id_num in helix_ranges:
+            part.partStrandChangedSignal.emit(part, id_num)
+    # end def
+
+    def undo(self):
+        part = self._part
+
+        # 1. restore the strands
+        for _, olg, is_new in self._chains:
+            if is_new:
+                olg.removeFromPart(emit_signals=True)
+        for strand5p, strand3p in self._new_links:
+            strand5p.setConnection3p(None)
+            strand3p.setConnection5p(None)
+        for strand in self._old_strands:
+            strandset = strand.strandSet()
+            for piece in self._pieces[strand]:
+                strandset._removeFromStrandList(piece, update_segments=False)
+            strandset._addToStrandList(strand, update_segments=False)
+        for strand5p, strand3p in self._old_links:
+            strand5p.setConnection3p(strand3p)
+            strand3p.setConnection5p(strand5p)
+        helix_ranges = self._refreshSegments(self._old_strands)
+
+        # 2. restore the oligos
+        self._restoreOligos()
+
+        # 3. signal
+        for _, olg, is_new in self._chains:
+            if is_new:
+                olg.oligoStrandsMovedSignal.emit(olg)
+        for strand in self._old_strands:
+            for piece in self._pieces[strand]:
+                piece.strandRemovedSignal.emit(piece)
+            strandset = strand.strandSet()
+            strandset.strandsetStrandAddedSignal.emit(strandset, strand)
+        for strand in dict.fromkeys(strand for link in self._old_links for strand in link):
+            strand.strandConnectionChangedSignal.emit(strand)
+        # for updating the Slice View displayed helices
+        for id_num in helix_ranges:
+            part.partStrandChangedSignal.emit(part, id_num)
+    # end def
+# end class
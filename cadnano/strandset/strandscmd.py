@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import random
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Set,
+    Tuple
+)
+
+from cadnano.proxies.cnproxy import UndoCommand
+from cadnano.strand import Strand
+from cadnano.views.pathview import pathstyles
+from cadnano.cntypes import (
+    NucleicAcidPartT,
+    OligoT
+)
+
+
+class StrandsCommand(UndoCommand):
+    """Base of the commands that change many strands of a part in one step,
+    :class:`CreateStrandsCommand`, :class:`RemoveStrandsCommand` and
+    :class:`SplitStrandsCommand`.
+
+    Subclasses record the oligos they change in ``_old_oligos`` and, on their
+    first redo, the oligo of each resulting chain of strands in ``_chains``.
+
+    Args:
+        part:
+        description: name of the command
+    """
+
+    def __init__(self, part: NucleicAcidPartT, description: str):
+        super(StrandsCommand, self).__init__(description)
+        self._part = part
+        # (oligo, 5' strand, is circular, length) of each changed oligo
+        self._old_oligos: List[Tuple[OligoT, Strand, bool, int]] = []
+        # (chain 5' strand, oligo, is new oligo) on first redo
+        self._chains: List[Tuple[Strand, OligoT, bool]] = None
+    # end def
+
+    def _saveOligos(self, oligos: Iterable[OligoT]):
+        """Record the state of ``oligos`` to restore on undo
+
+        Args:
+            oligos: the oligos the command changes
+        """
+        self._old_oligos = [(olg, olg.strand5p(), olg.isCircular(), olg.length())
+                            for olg in dict.fromkeys(oligos)]
+    # end def
+
+    def _refreshSegments(self, strands: Iterable[Strand]) -> Dict[int, Tuple[int, int]]:
+        """Refresh the segments of each virtual helix once over the range of
+        ``strands`` on it
+
+        Args:
+            strands: the strands added to or removed from the part
+
+        Returns:
+            the refreshed ``(idx_low, idx_high)`` range by ID number
+        """
+        helix_ranges = {}
+        for strand in strands:
+            id_num = strand.idNum()
+            idx_low, idx_high = strand.idxs()
+            if id_num in helix_ranges:
+                low, high = helix_ranges[id_num]
+                idx_low, idx_high = min(low, idx_low), max(high, idx_high)
+            helix_ranges[id_num] = (idx_low, idx_high)
+        for id_num, (idx_low, idx_high) in helix_ranges.items():
+            self._part.refreshSegments(id_num, idx_low, idx_high)
+        return helix_ranges
+    # end def
+
+    @staticmethod
+    def _chainOligos(chain5ps: Iterable[Tuple[Strand, OligoT]],
+                     kept: Dict[Strand, OligoT]) -> List[Tuple[Strand, OligoT, bool]]:
+        """Oligos for chains of strands, called once the connections are
+        changed and before any oligo is reassigned
+
+        Args:
+            chain5ps: ``(chain 5' strand, oligo to copy for a new oligo)`` of
+                each chain, the first item of a chain counts
+            kept: oligos that keep the chain starting at their key
+
+        Returns:
+            ``(chain 5' strand, oligo, is new oligo)`` of each chain
+        """
+        chains = []
+        done = set()
+        for chain5p, template in chain5ps:
+            if chain5p in done:
+                continue
+            done.add(chain5p)
+            olg = kept.get(chain5p)
+            if olg is not None:
+                chains.append((chain5p, olg, False))
+            else:
+                new_olg = template.shallowCopy()
+                new_olg._setColor(random.choice(pathstyles.STAP_COLORS))
+                chains.append((chain5p, new_olg, True))
+        return chains
+    # end def
+
+    def _applyChains(self) -> Set[OligoT]:
+        """Give each chain of ``_chains`` its oligo and add the new oligos to
+        the part
+
+        Returns:
+            the kept oligos
+        """
+        part = self._part
+        kept = set()
+        for chain5p, olg, is_new in self._chains:
+            chain5p.setChainOligo(olg)
+            olg.setStrand5p(chain5p)
+            olg._setLoop(False)
+            olg.refreshLength(emit_signals=True)
+            if is_new:
+                olg.addToPart(part, emit_signals=True)
+            else:
+                kept.add(olg)
+        return kept
+    # end def
+
+    def _restoreOligos(self, add_to_part: bool = False):
+        """Restore the oligos of ``_old_oligos`` over their strands, undoing
+        :meth:`_applyChains`.  The new oligos of ``_chains`` must have been
+        removed from the part.
+
+        Args:
+            add_to_part (optional): add the oligos that were not kept back to
+                the part, default is ``False``
+        """
+        part = self._part
+        kept = set(olg for _, olg, is_new in self._chains if not is_new)
+        for olg, strand5p, is_circular, length in self._old_oligos:
+            olg._setLoop(is_circular)
+            olg.setStrand5p(strand5p)
+            strand5p.setOligo3p(olg)
+            olg._setLength(length, emit_signals=True)
+            if add_to_part and olg not in kept:
+                olg.addToPart(part, emit_signals=True)
+    # end def
+# end class
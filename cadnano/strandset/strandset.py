@@ -4,6 +4,7 @@ from bisect import (
     insort_left
 )
 from typing import (
+    Iterable,
     Tuple,
     List
 )
@@ -73,6 +74,7 @@ class StrandSet(CNObject):
         self._id_num = id_num
         self._part = part
 
+        self.version = 0    # bumped whenever strands are added, removed or moved
         self._reset(int(initial_size))
 
         self._undo_stack = None
@@ -87,8 +89,8 @@ class StrandSet(CNObject):
         Args:
             part (Part): part to copy this into
         """
-        return StrandSet(self._is_fwd, self._id_num,
-                         part, len(self.strand_array))
+        return type(self)(self._is_fwd, self._id_num,
+                          part, self.length())
     # end def
 
     def __iter__(self) -> StrandT:
@@ -151,6 +153,7 @@ class StrandSet(CNObject):
         """
         self.strand_array = [None]*(initial_size)
         self.strand_heap = []
+        self.version += 1
     # end def
 
     def resize(self, delta_low: int, delta_high: int):
@@ -166,6 +169,7 @@ class StrandSet(CNObject):
         if delta_high < 0:
             self.strand_array = self.strand_array[:delta_high]
         self.strand_array = [None]*delta_low + self.strand_array + [None]*delta_high
+        self.version += 1
     # end def
 
     ### PUBLIC METHODS FOR QUERYING THE MODEL ###
@@ -728,6 +732,21 @@ class StrandSet(CNObject):
     # end def
 
     ### PRIVATE SUPPORT METHODS ###
+    def _setStrands(self, strands: Iterable[StrandT]):
+        """Replace all strands at once, without signals or segment refresh.
+        Used by bulk decoding.
+
+        Args:
+            strands: non overlapping strands of this set
+        """
+        self.strand_array = [None]*len(self.strand_array)
+        for strand in strands:
+            low_idx, high_idx = strand.idxs()
+            self.strand_array[low_idx:high_idx + 1] = [strand]*(high_idx - low_idx + 1)
+        self.strand_heap = sorted(strands, key=lambda x: x.lowIdx())
+        self.version += 1
+    # end def
+
     def _addToStrandList(self, strand: StrandT, update_segments: bool = True):
         """Inserts strand into the strand_array at idx
 
@@ -739,8 +758,9 @@ class StrandSet(CNObject):
         for i in range(idx_low, idx_high+1):
             self.strand_array[i] = strand
         insort_left(self.strand_heap, strand)
+        self.version += 1
         if update_segments:
-            self._part.refreshSegments(self._id_num)
+            self._part.refreshSegments(self._id_num, *strand.idxs())
 
     def _updateStrandIdxs(self, strand: StrandT, old_idxs: Int2T, new_idxs: Int2T):
         """update indices in the strand array/list of an existing strand
@@ -754,6 +774,24 @@ class StrandSet(CNObject):
             self.strand_array[i] = None
         for i in range(new_idxs[0], new_idxs[1] + 1):
             self.strand_array[i] = strand
+        self.version += 1
+
+    def _updateStrandsIdxs(self, resizes: Iterable[Tuple[StrandT, Int2T, Int2T]]):
+        """update the indices of several existing strands at once, which
+        already have their new indices.  All old ranges are cleared before
+        any new range is set, so strands may move into bases another strand
+        of ``resizes`` leaves.
+
+        Args:
+            resizes: ``(strand, old_idxs, new_idxs)`` items
+        """
+        sa = self.strand_array
+        for strand, old_idxs, new_idxs in resizes:
+            sa[old_idxs[0]:old_idxs[1] + 1] = [None]*(old_idxs[1] - old_idxs[0] + 1)
+        for strand, old_idxs, new_idxs in resizes:
+            sa[new_idxs[0]:new_idxs[1] + 1] = [strand]*(new_idxs[1] - new_idxs[0] + 1)
+        self.strand_heap.sort(key=lambda x: x.lowIdx())
+        self.version += 1
 
     def _removeFromStrandList(self, strand: StrandT, update_segments: bool = True):
         """Remove strand from strand_array.
@@ -768,8 +806,9 @@ class StrandSet(CNObject):
             self.strand_array[i] = None
         i = bisect_left(self.strand_heap, strand)
         self.strand_heap.pop(i)
+        self.version += 1
         if update_segments:
-            self._part.refreshSegments(self._id_num)
+            self._part.refreshSegments(self._id_num, *strand.idxs())
 
     def getStrandIndex(self, strand: StrandT) -> Tuple[bool, int]:
         """Get the 5' end index of strand if it exists for forward strands
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+import copy
+import json
+import os
+
+import numpy as np
+import pytest
+
+from cntestcase import cnapp
+from pathsetup import TEST_PATH
+
+from cadnano.document import Document
+from cadnano.fileio import cnbencode, v3decode
+from cadnano.fileio.cnbdecode import CNBFile
+from cadnano.fileio.decode import decodeFile
+from cadnano.fileio.encode import encode
+from cadnano.fileio.jsonstream import JSONStreamReader
+
+DESIGN_FILES = sorted(f for f in os.listdir(os.path.join(TEST_PATH, 'data'))
+                      if f.endswith('.json'))
+
+
+def _snapshot(document):
+    """Everything about the decoded model that should not depend on how it
+    was decoded, i.e. all but part and oligo names and uuids
+    """
+    obj = json.loads(encode(document))
+    obj.pop('date')
+    snapshot = {'encoded': obj, 'parts': []}
+    for part_dict, part in zip(obj['parts'], document.getParts()):
+        part_dict.pop('uuid')
+        part_dict.pop('name')
+        for oligo in part_dict['oligos']:
+            oligo.pop('name')
+        part_dict['oligos'].sort(key=lambda x: (x['id_num'], x['idx5p'], x['is_5p_fwd']))
+        # insertions are serialized in the order their helices were first looked up
+        part_dict['insertions'].sort()
+        strands = []
+        for id_num in part.getidNums():
+            for strandset in part.getStrandSets(id_num):
+                assert all(strandset.getStrand(i) is strand
+                           for strand in strandset for i in range(strand.lowIdx(), strand.highIdx() + 1))
+                for strand in strandset:
+                    oligo = strand.oligo()
+                    strands.append((id_num, strandset.isForward(), strand.idxs(), strand.segments,
+                                    strand.sequence(), oligo.strand5p().dump5p(), oligo.getColor(),
+                                    oligo.length(), oligo.isCircular()))
+        assert len(part.oligos()) == len(part_dict['oligos'])
+        coordinates = {id_num: [pts.tolist() for pts in part.getCoordinates(id_num)]
+                       for id_num in part.getidNums()}
+        snapshot['parts'].append((strands, coordinates,
+                                  {id_num: part.getVirtualHelixNeighbors(id_num)
+                                   for id_num in part.getidNums()}))
+    return snapshot
+
+
+@pytest.mark.parametrize('designname', DESIGN_FILES)
+def testFastDecode(cnapp, designname):
+    """The bulk v3 decoder builds the same model as the command based one"""
+    doc = cnapp.document
+    doc.readFile(os.path.join(TEST_PATH, 'data', designname))
+    obj = json.loads(encode(doc))
+
+    snapshots = []
+    for fast in (False, True):
+        document = Document()
+        v3decode.decode(document, copy.deepcopy(obj), fast=fast)
+        snapshots.append(_snapshot(document))
+    legacy, fast = snapshots
+    assert legacy == fast
+    for strands, coordinates, _ in fast['parts']:
+        assert all(np.isfinite(pts).all() for pts_list in coordinates.values() for pts in pts_list)
+
+
+def _readStream(reader):
+    """Rebuild a value with the container iterators of ``reader``"""
+    c = reader._peek()
+    if c == '{':
+        return {key: _readStream(reader) for key in reader.iterObject()}
+    elif c == '[':
+        return [_readStream(reader) for _ in reader.iterArray()]
+    return reader.readValue()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def testJSONStreamReader(chunk_size):
+    small_files = [f for f in DESIGN_FILES
+                   if os.path.getsize(os.path.join(TEST_PATH, 'data', f)) < 100000]
+    for designname in small_files:
+        path = os.path.join(TEST_PATH, 'data', designname)
+        with open(path) as fd:
+            expected = json.load(fd)
+        with open(path) as fd:
+            reader = JSONStreamReader(fd, chunk_size=chunk_size)
+            assert _readStream(reader) == expected
+            assert reader._peek() == ''
+        with open(path) as fd:
+            # skipped members are parsed and dropped
+            reader = JSONStreamReader(fd, chunk_size=chunk_size)
+            assert list(reader.iterObject()) == list(expected.keys())
+
+
+@pytest.mark.parametrize('designname', DESIGN_FILES)
+def testStreamDecode(cnapp, designname, tmpdir):
+    """Streaming decode builds the same model as decoding the parsed file, for
+    cadnano 2 files and their cadnano 3 re-encoding
+    """
+    path = os.path.join(TEST_PATH, 'data', designname)
+    doc = decodeFile(path)
+    v3_path = str(tmpdir.join('v3.json'))
+    with open(v3_path, 'w') as fd:
+        fd.write(encode(doc))
+    for filename in (path, v3_path):
+        fractions = []
+        stream_doc = decodeFile(filename, stream=True, progress=fractions.append)
+        assert _snapshot(stream_doc) == _snapshot(decodeFile(filename))
+        assert fractions == sorted(fractions) and fractions[-1] == 1.
+
+
+@pytest.mark.parametrize('designname', DESIGN_FILES)
+def testCNBRoundTrip(cnapp, designname, tmpdir):
+    """A .cnb file holds the same document as the v3 json encoding and decodes
+    to the same model
+    """
+    doc = decodeFile(os.path.join(TEST_PATH, 'data', designname))
+    json_path = str(tmpdir.join('design.json'))
+    cnb_path = str(tmpdir.join('design.cnb'))
+    doc.writeToFile(json_path)
+    # a document whose points a decode of its json computes alike
+    doc = decodeFile(json_path)
+    doc.writeToFile(json_path)
+    cnbencode.encodeToFile(cnb_path, doc, with_points=True)
+
+    cnb_file = CNBFile(cnb_path)
+    with open(json_path) as fd:
+        expected = json.load(fd)
+    obj = cnb_file.toDict()
+    obj.pop('date')
+    expected.pop('date')
+    assert obj == expected
+    part = doc.activePart()
+    axis_pts = cnb_file.array(0, 'axis_pts')
+    assert not axis_pts.flags.writeable
+    assert np.array_equal(axis_pts, np.concatenate([part.getCoordinates(id_num)[0]
+                                                    for id_num in part.getidNums()]))
+    del axis_pts
+    cnb_file.close()
+
+    cnb_doc = decodeFile(cnb_path)
+    assert _snapshot(cnb_doc) == _snapshot(decodeFile(json_path))
+    # the stored crossover table is the one the part would build
+    xover_table = cnb_doc.activePart()._xover_table
+    stored = dict(xover_table.entries)
+    assert len(stored) == len(part.getidNums())
+    xover_table.clear()
+    cnb_doc.activePart().buildCrossoverTable()
+    assert stored == xover_table.entries
+    # saving a document leaves out the points
+    doc.writeToFile(cnb_path)
+    cnb_file = CNBFile(cnb_path, use_mmap=False)
+    assert 'axis_pts' not in cnb_file.arrayNames(0)
+    assert cnb_file.toDict()['parts'] == expected['parts']
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-from cntestcase import CNTestApp
+from cntestcase import CNTestApp, pjoin
+from pathsetup import TEST_PATH
 
 
 @pytest.fixture()
@@ -109,3 +110,181 @@ def testStapleOutput_Nature09_monolith_legacy(cnapp):
 #     # cnapp.writeRefSequences("gap_vs_skip.csv_2.csv", test_set)
 #     ref_set = cnapp.getRefSequences(refname)
 #     assert test_set == ref_set
+
+
+def testSequenceExportFormats(cnapp, tmpdir):
+    """Streamed CSV matches getSequences, and the parts of a document export
+    the same in worker processes
+    """
+    from cadnano.fileio.sequenceexport import exportSequences
+    test_set = cnapp.getTestSequences("skip.json", [("M13mp18", 0, 14)])
+    doc = cnapp.document
+    part = doc.activePart()
+    csv_path = str(tmpdir.join('staples.csv'))
+    exportSequences(csv_path, doc, active_part_only=True)
+    with open(csv_path) as fd:
+        assert fd.read() == part.getSequences()
+    assert test_set == cnapp.getRefSequences("skip.csv")
+
+    num_oligos = len(part.oligos())
+    fasta_path = str(tmpdir.join('staples.fasta'))
+    exportSequences(fasta_path, doc, fmt='fasta')
+    with open(fasta_path) as fd:
+        lines = fd.read().splitlines()
+    assert len(lines) == 2*num_oligos and all(x.startswith('>') for x in lines[::2])
+
+    doc.readFile(pjoin(TEST_PATH, "data", "simple42legacy.json"))
+    assert len(list(doc.getParts())) == 2
+    outputs = []
+    for processes in (None, 2):
+        plate_path = str(tmpdir.join('plate%s.csv' % (processes)))
+        exportSequences(plate_path, doc, fmt='plate', processes=processes)
+        with open(plate_path) as fd:
+            outputs.append(fd.read())
+    assert outputs[0] == outputs[1]
+    rows = outputs[0].splitlines()
+    assert rows[0] == 'Plate,Well,Name,Sequence'
+    assert len(rows) == 1 + sum(len(p.oligos()) for p in doc.getParts())
+    assert [row.split(',')[1] for row in rows[1:4]] == ['A1', 'A2', 'A3']
+
+
+def _strandKey(strand):
+    return None if strand is None else (strand.idNum(), strand.isForward(), strand.idxs())
+
+
+def _designState(part):
+    """Strands, connections, segments and oligos of a part, keyed by the
+    positions of the strands
+    """
+    strands = {}
+    for id_num in part.getIdNums():
+        for strandset in part.getStrandSets(id_num):
+            for strand in strandset:
+                assert strand.oligo() in part.oligos()
+                strands[_strandKey(strand)] = (_strandKey(strand.connection3p()),
+                                               tuple(strand.segments))
+    oligos = set()
+    for oligo in part.oligos():
+        chain = tuple(_strandKey(x) for x in oligo.strand5p().generator3pStrand())
+        assert all(strands[x] for x in chain)
+        oligos.add((chain, oligo.length(), oligo.isCircular()))
+    return strands, oligos
+
+
+def testDeleteStrandSelection(cnapp):
+    """Deleting a selection in one batched step leaves the design as removing
+    its crossovers and strands one at a time, and undoes in one step
+    """
+    import random
+    from cadnano.document import Document
+    from cadnano.part.nucleicacidpart import NucleicAcidPart
+    designname = pjoin(TEST_PATH, "data", "Nature09_squarenut.json")
+    doc = cnapp.document
+    doc.undoStack().setUndoLimit(1000)
+    doc.readFile(designname)
+    part = doc.activePart()
+    ref_doc = Document()
+    ref_doc.readFile(designname)
+    ref_part = ref_doc.activePart()
+    original_state = _designState(part)
+    assert _designState(ref_part) == original_state
+
+    rng = random.Random(3)
+    selection = []
+    for id_num in part.getIdNums():
+        for strandset in part.getStrandSets(id_num):
+            for strand in strandset:
+                if rng.random() < 0.3:
+                    selection.append((_strandKey(strand),
+                                      rng.choice([(True, False), (False, True), (True, True)])))
+
+    def getStrand(part, key):
+        id_num, is_fwd, idxs = key
+        return part.getStrandSets(id_num)[0 if is_fwd else 1].getStrand(idxs[0])
+
+    for key, value in selection:
+        doc.addStrandToSelection(getStrand(part, key), value)
+    doc.deleteStrandSelection()
+    state = _designState(part)
+
+    # the same removals one by one
+    xovers = []
+    removed = []
+    for key, value in selection:
+        strand = getStrand(ref_part, key)
+        delete = value[0] and value[1]
+        sel3p = value[0] if strand.lowIdx() == strand.idx3Prime() else value[1]
+        if sel3p:
+            if strand.connection3p():
+                xovers.append((strand, strand.connection3p()))
+            else:
+                delete = True
+        elif not strand.connection5p():
+            delete = True
+        if delete:
+            removed.append(strand)
+    for strand5p, strand3p in xovers:
+        NucleicAcidPart.removeXover(ref_part, strand5p, strand3p, False)
+    for strand in removed:
+        strand.strandSet().removeStrand(strand, use_undostack=False)
+    assert state == _designState(ref_part)
+    assert len(state[0]) < len(original_state[0])
+
+    doc.undoStack().undo()
+    assert _designState(part) == original_state
+    doc.undoStack().redo()
+    assert _designState(part) == state
+
+
+def testAutoStaple(cnapp):
+    """Staples made by autoStaple pair with every scaffold base and are in the
+    length range, autoBreak of the unbroken staples breaks them the same way,
+    and both undo in one step
+    """
+    from cadnano.strandset.removestrandcmd import RemoveStrandsCommand
+    designname = pjoin(TEST_PATH, "data", "Nature09_squarenut.json")
+    doc = cnapp.document
+    doc.undoStack().setUndoLimit(1000)
+    doc.readFile(designname)
+    part = doc.activePart()
+    staples = [strand for id_num in part.getIdNums()
+               for strandset in part.getStrandSets(id_num) if strandset.isStaple()
+               for strand in strandset]
+    part.undoStack().push(RemoveStrandsCommand(part, staples))
+    empty_state = _designState(part)
+
+    oligos = part.autoStaple(min_length=18, max_length=49, target_length=32)
+    state = _designState(part)
+    assert len(oligos) == len(part.oligos()) - 1
+    for oligo in oligos:
+        assert 18 <= oligo.length() <= 49
+        assert not oligo.isCircular()
+    for id_num in part.getIdNums():
+        fwd_ss, rev_ss = part.getStrandSets(id_num)
+        scaffold_ss, staple_ss = (fwd_ss, rev_ss) if fwd_ss.isScaffold() else (rev_ss, fwd_ss)
+        for strand in scaffold_ss:
+            for idx in range(strand.lowIdx(), strand.highIdx() + 1):
+                assert staple_ss.getStrand(idx) is not None
+
+    part.undoStack().undo()
+    assert _designState(part) == empty_state
+    part.undoStack().redo()
+    assert _designState(part) == state
+    part.undoStack().undo()
+
+    part.autoStaple(do_break=False)
+    unbroken_state = _designState(part)
+    num_breaks, whole_loops = part.autoBreak(min_length=18, max_length=49, target_length=32)
+    assert num_breaks > 0 and whole_loops == []
+    assert _designState(part) == state
+    part.undoStack().undo()
+    assert _designState(part) == unbroken_state
+
+    # circular staples that can't be broken in range are opened once
+    loops = [olg for olg in part.oligos()
+             if olg.isCircular() and olg.strand5p().strandSet().isStaple()]
+    assert loops
+    num_breaks, whole_loops = part.autoBreak(loops, min_length=5000, max_length=5000,
+                                             target_length=5000)
+    assert num_breaks == len(loops) and whole_loops == []
+    assert not any(olg.isCircular() for olg in loops)
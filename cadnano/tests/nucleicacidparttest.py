@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+import os
 import pytest
 import math
+from ast import literal_eval
 
 from cntestcase import cnapp
+from pathsetup import TEST_PATH
 
 from cadnano.part.nucleicacidpart import NucleicAcidPart
 
@@ -51,3 +54,243 @@ def testRemove(cnapp):
     assert len(doc.children()) == 0
     us.undo()
     assert len(doc.children()) == 1
+
+
+def _assertSpatialIndexMatches(part, points, radius):
+    for point in points:
+        idx_res = part._queryBasePointIndexed(radius, point)
+        bf_res = part._queryBasePointBruteForce(radius, point)
+        assert idx_res is not None
+        assert idx_res[0].tolist() == bf_res[0].tolist()
+        assert idx_res[1].tolist() == bf_res[1].tolist()
+        origin_res = part._queryVirtualHelixOrigin(radius, point)
+        bf_origin_res = part._queryVirtualHelixOriginBruteForce(radius, point)
+        assert set(origin_res.tolist()) == set(bf_origin_res.tolist())
+        x, y = point[0], point[1]
+        rect = (x - radius, y - radius, x + radius, y + radius)
+        assert (part._queryVirtualHelixOriginRect(rect).tolist() ==
+                part._queryVirtualHelixOriginRectBruteForce(rect).tolist())
+
+
+def testSpatialIndex(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    radius = 2.1*part.radius()
+    points = [tuple(part.getCoordinate(id_num, idx))
+              for id_num in part.getidNums() for idx in (0, 10, 41)]
+    _assertSpatialIndexMatches(part, points, radius)
+
+    # index must follow resizes, translations and removals
+    part.setVirtualHelixSize(1, 84)
+    part.translateVirtualHelices([2], 1.5, -0.5, 0.0, False)
+    points += [tuple(part.getCoordinate(1, 80)), tuple(part.getCoordinate(2, 5))]
+    _assertSpatialIndexMatches(part, points, radius)
+    part.removeVirtualHelix(0)
+    _assertSpatialIndexMatches(part, points, radius)
+    part.undoStack().undo()
+    _assertSpatialIndexMatches(part, points, radius)
+
+
+@pytest.mark.parametrize('designname', ['Nature09_squarenut.json', 'Science09_prot120_98_v3.json'])
+def testQueryIdNumNeighbor(cnapp, designname):
+    doc = cnapp.document
+    doc.readFile(os.path.join(TEST_PATH, 'data', designname))
+    part = doc.activePart()
+    for id_num in sorted(part.getidNums())[:12]:
+        neighbors = literal_eval(part.getVirtualHelixProperties(id_num, 'neighbors'))
+        for index in (None, 0, 40):
+            assert (part.queryIdNumNeighbor(id_num, neighbors, index) ==
+                    part._queryIdNumNeighborPerBase(id_num, neighbors, index))
+
+
+def testCrossoverTable(cnapp):
+    doc = cnapp.document
+    doc.readFile(os.path.join(TEST_PATH, 'data', 'Nature09_squarenut.json'))
+    part = doc.activePart()
+    id_nums = sorted(part.getidNums())
+    assert len(part._xover_table) == len(id_nums)
+
+    def checkCrossoverMap(id_num):
+        neighbors = literal_eval(part.getVirtualHelixProperties(id_num, 'neighbors'))
+        for idx in (None, 0, 40):
+            assert (part.potentialCrossoverMap(id_num, idx) ==
+                    part.queryIdNumNeighbor(id_num, neighbors, idx))
+
+    # resizing a virtual helix invalidates it and its neighbors only
+    id_num = id_nums[0]
+    neighbors = literal_eval(part.getVirtualHelixProperties(id_num, 'neighbors'))
+    part.setVirtualHelixSize(id_num, part.getVirtualHelixProperties(id_num, 'length') + 32)
+    assert id_num not in part._xover_table
+    assert all(x not in part._xover_table for x in neighbors)
+    assert len(part._xover_table) == len(id_nums) - len(neighbors) - 1
+    checkCrossoverMap(id_num)
+    for neighbor_id in neighbors:
+        checkCrossoverMap(neighbor_id)
+
+    part.translateVirtualHelices([id_nums[1]], 0.5, 0.5, 0.0, False)
+    assert id_nums[1] not in part._xover_table
+    checkCrossoverMap(id_nums[1])
+
+    part.setVirtualHelixProperties(id_nums[2], 'eulerZ', 10.0)
+    assert id_nums[2] not in part._xover_table
+
+
+def testVirtualHelixProperties(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    assert part.getVirtualHelixProperties(1, 'name') == 'vh1'
+    props = part.getAllVirtualHelixProperties(1)
+    assert type(props['bases_per_repeat']) is int
+    assert type(props['is_visible']) is bool
+    assert props['bases_per_turn'] == 10.5
+
+    part.setVirtualHelixProperties(1, ['eulerZ', 'color'], [12.5, '#ff0000'], use_undostack=False)
+    assert part.getVirtualHelixProperties(1, ['eulerZ', 'color']) == [12.5, '#ff0000']
+    # integer valued columns are promoted like a pandas DataFrame
+    part.vh_properties.set(2, 'repeat_hint', 2.5)
+    assert part.getVirtualHelixProperties(2, 'repeat_hint') == 2.5
+    assert part.getVirtualHelixProperties(0, 'repeat_hint') == 2.0
+
+    vh_props, origins, directions = part.helixProperties([2, 0])
+    assert vh_props['name'] == ['vh2', 'vh0']
+    assert len(origins) == len(directions) == 2
+
+    # growing past the initial allocation keeps existing rows
+    part.createVirtualHelix(100., 100., id_num=300, length=42)
+    assert part.getVirtualHelixProperties(300, 'name') == 'vh300'
+    assert part.getVirtualHelixProperties(1, 'eulerZ') == 12.5
+
+
+def testVirtualHelixNeighbors(cnapp):
+    doc = cnapp.document
+    part = create3Helix(doc, (0, 0, 1), 42)
+    radius = part.radius()
+
+    def checkNeighbors(expected):
+        for id_num, neighbors in expected.items():
+            assert sorted(part.getVirtualHelixNeighbors(id_num)) == neighbors
+            assert part.getVirtualHelixNeighbors(id_num) == \
+                literal_eval(part.getVirtualHelixProperties(id_num, 'neighbors'))
+
+    checkNeighbors({0: [1, 2], 1: [0], 2: [0]})
+    part.createVirtualHelix(-2*radius, 0, 0, id_num=3, length=42)
+    checkNeighbors({0: [1, 2, 3], 1: [0], 2: [0], 3: [0]})
+    part.removeVirtualHelix(0)
+    checkNeighbors({1: [], 2: [], 3: []})
+    part.undoStack().undo()
+    checkNeighbors({0: [1, 2, 3], 1: [0], 2: [0], 3: [0]})
+    part.translateVirtualHelices([2], 10., 0., 0., False)
+    checkNeighbors({0: [1, 3], 1: [0], 2: [], 3: [0]})
+
+    # previews leave the neighbors until the move is finalized
+    part.translateVirtualHelices([2, 3], -5., 0., 0., False, preview=True)
+    part.translateVirtualHelices([2, 3], -5., 0., 1., False, preview=True)
+    checkNeighbors({0: [1, 3], 1: [0], 2: [], 3: [0]})
+    part.translateVirtualHelices([2, 3], 0., 0., -1., False)
+    checkNeighbors({0: [1, 2], 1: [0], 2: [0], 3: []})
+    part.translateVirtualHelices([0, 1, 2, 3], 0., 0., 5., False, use_undostack=True)
+    # a drag previews its steps and then pushes the total move
+    part.translateVirtualHelices([0, 1], radius, 0., 0., False, preview=True)
+    part.translateVirtualHelices([0, 1], radius, 0., 0., False, preview=True)
+    part.translateVirtualHelices([0, 1], 2*radius, 0., 0., True, use_undostack=True)
+    checkNeighbors({0: [1], 1: [0], 2: [], 3: []})
+    part.undoStack().undo()
+    part.undoStack().undo()
+    checkNeighbors({0: [1, 2], 1: [0], 2: [0], 3: []})
+    for id_num in range(4):
+        assert part.getVirtualHelixNeighbors(id_num) == \
+            sorted(part._getVirtualHelixOriginNeighbors(id_num, 2.1*radius))
+
+
+def testCoordinateArena(cnapp):
+    """Random edits of a small arena, forcing relocations, compaction and
+    growth, must keep every virtual helix's rows intact
+    """
+    import random
+    import numpy as np
+    from cadnano.part.coordinatearena import CoordinateArena
+
+    rng = random.Random(7)
+    arena = CoordinateArena(16)
+    expected = {}
+
+    def makePoints(n):
+        # multiples of 1/1024 so translated points stay exact
+        pts = np.array([[rng.randrange(1024) / 1024 for _ in range(3)] for _ in range(n)])
+        return pts, pts + 1., pts + 2.
+
+    for _ in range(400):
+        op = rng.random()
+        id_num = rng.randrange(12)
+        if id_num not in expected:
+            arena.addHelix(id_num)
+            points = makePoints(rng.randrange(1, 40))
+            arena.insert(id_num, points, is_right=False)
+            expected[id_num] = points[0]
+        elif op < 0.5:
+            is_right = op < 0.25
+            points = makePoints(rng.randrange(1, 90))
+            arena.insert(id_num, points, is_right)
+            old = expected[id_num]
+            expected[id_num] = np.concatenate((old, points[0]) if is_right else (points[0], old))
+        else:
+            length = rng.randrange(1, len(expected[id_num]) + 1)
+            is_right = op < 0.75
+            if arena.trim(id_num, length, is_right):
+                del expected[id_num]
+            else:
+                old = expected[id_num]
+                expected[id_num] = old[:-length] if is_right else old[length:]
+        if id_num in expected and rng.random() < 0.3:
+            delta = (0., 0., rng.choice([-1., -0.5, 0.25, 1.5]))
+            arena.translateMany([id_num], delta)
+            expected[id_num] = expected[id_num] + delta
+        for id_num, pts in expected.items():
+            offset, size = arena.offset_and_size[id_num]
+            assert size == len(pts)
+            assert np.array_equal(arena.axis_pts[offset:offset + size], pts)
+            assert np.array_equal(arena.rev_pts[offset:offset + size], pts + 2.)
+            assert (arena.id_nums[offset:offset + size] == id_num).all()
+            assert arena.indices[offset:offset + size].tolist() == list(range(size))
+        assert arena.total_points == sum(len(x) for x in expected.values())
+        assert (arena.id_nums >= 0).sum() == arena.total_points
+        z_mins = {id_num: pts[:, 2].min() for id_num, pts in expected.items()}
+        z_maxs = {id_num: pts[:, 2].max() for id_num, pts in expected.items()}
+        assert arena.zBounds() == (min(z_mins, key=lambda x: (z_mins[x], x)),
+                                   min(z_maxs, key=lambda x: (-z_maxs[x], x)))
+        assert arena.maxSize() == max(len(x) for x in expected.values())
+    axis_pts, _, _, id_nums, indices = arena.flatView()
+    assert id_nums.tolist() == [i for i in sorted(expected) for _ in expected[i]]
+    assert np.array_equal(axis_pts, np.concatenate([expected[i] for i in sorted(expected)]))
+
+
+def testBatchCreateVirtualHelices(cnapp):
+    doc = cnapp.document
+    seq_part = create3Helix(doc, (0, 0, 1), 42)
+    radius = seq_part.radius()
+    x_list, y_list = [], []
+    for id_num in (0, 1, 2):
+        x, y, _ = seq_part.getVirtualHelixOrigin(id_num)
+        x_list.append(x)
+        y_list.append(y)
+    seq_part.createVirtualHelix(-2*radius, 0, 0, id_num=3, length=42)
+    part = doc.createNucleicAcidPart(is_lattice=True)
+    part.createVirtualHelix(-2*radius, 0, 0, id_num=3, length=42)
+
+    id_nums = part.batchCreateVirtualHelices(x_list, y_list, length=[42]*3, id_nums=[0, 1, 2])
+    assert id_nums == [0, 1, 2]
+    for id_num in (0, 1, 2, 3):
+        assert (sorted(part.getVirtualHelixNeighbors(id_num)) ==
+                sorted(seq_part.getVirtualHelixNeighbors(id_num)))
+        assert part.getVirtualHelixNeighbors(id_num) == \
+            literal_eval(part.getVirtualHelixProperties(id_num, 'neighbors'))
+        assert part.getCoordinates(id_num)[0].tolist() == \
+            seq_part.getCoordinates(id_num)[0].tolist()
+
+    # a batch is a single undo step
+    part.undoStack().undo()
+    assert list(part.getidNums()) == [3]
+    assert part.getVirtualHelixNeighbors(3) == []
+    part.undoStack().redo()
+    assert sorted(part.getidNums()) == [0, 1, 2, 3]
+    assert part.getVirtualHelixNeighbors(3) == [0]
@@ -1,9 +1,17 @@
+import gc
+import random
+
 import pytest
 
 from cntestcase import cnapp
 
 from nucleicacidparttest import create3Helix
 
+from cadnano.part.xovercmds import CreateXoverCommand, RemoveXoverCommand
+from cadnano.proxies.cnproxy import signalBatch
+from cadnano.strand import oligoindex
+from cadnano.strandset import IntervalStrandSet, StrandSet
+
 
 def testStrandset(cnapp):
     doc = cnapp.document
@@ -93,3 +101,469 @@ def testStrandset(cnapp):
 
     # resize --> resize Part???
 # end def
+
+
+def _checkOligos(part):
+    """The oligo index agrees with walking the strand connections"""
+    num_strands = 0
+    for oligo in part.oligos():
+        chain = list(oligo.strand5p().generator3pStrand())
+        num_strands += len(chain)
+        assert all(strand.oligo() is oligo for strand in chain)
+        root = oligoindex.root(chain[0]._oligo_node)
+        assert root.size == len(chain)
+        indexed = [node.strand for node in oligoindex.iterNodes(root)]
+        if oligo.isCircular():
+            i = indexed.index(chain[0])
+            indexed = indexed[i:] + indexed[:i]
+        else:
+            assert chain[0].connection5p() is None and chain[-1].connection3p() is None
+            assert oligo.strand3p() is chain[-1]
+        assert indexed == chain
+        lengths = [strand.totalLength() for strand in chain]
+        assert oligo.length() == sum(lengths)
+        for i, strand in enumerate(chain):
+            assert strand.totalLength3p() == (sum(lengths) if oligo.isCircular() else sum(lengths[i:]))
+    assert num_strands == sum(ss.strandCount() for id_num in part.getidNums()
+                              for ss in part.getStrandSets(id_num))
+
+
+def _allStrands(part):
+    return [strand for id_num in part.getidNums()
+            for ss in part.getStrandSets(id_num) for strand in ss]
+
+
+def testOligoIndex(cnapp):
+    """Random crossover, split, merge, strand removal and insertion edits and
+    their undo keep the oligo and lengths of every strand in line with its
+    connections.  Loops are
+    covered by testOligoIndexLoop.
+    """
+    rng = random.Random(11)
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 84)
+    undo_stack = part.undoStack()
+    undo_stack.setUndoLimit(1000)
+    for id_num in part.getidNums():
+        for ss in part.getStrandSets(id_num):
+            for low_idx in range(0, 84, 12):
+                ss.createStrand(low_idx, low_idx + 9)
+    initial = {strand: strand.oligo() for strand in _allStrands(part)}
+    _checkOligos(part)
+    num_created = len(undo_stack.undostack)
+
+    num_redo = 0
+    for _ in range(600):
+        num_undo = len(undo_stack.undostack)
+        strands = [x for x in _allStrands(part) if not x.oligo().isCircular()]
+        op = rng.random() if strands else 0.9
+        if op < 0.35:
+            strand5p = rng.choice([x for x in strands if x.connection3p() is None])
+            strand3p = rng.choice([x for x in strands if x.connection5p() is None])
+            if strand5p.oligo() is not strand3p.oligo():
+                undo_stack.push(CreateXoverCommand(part, strand5p, strand5p.idx3Prime(),
+                                                   strand3p, strand3p.idx5Prime()))
+        elif op < 0.5:
+            connected = [x for x in strands if x.connection3p() is not None]
+            if connected:
+                strand5p = rng.choice(connected)
+                undo_stack.push(RemoveXoverCommand(part, strand5p, strand5p.connection3p()))
+        elif op < 0.65:
+            strand = rng.choice(strands)
+            strand.strandSet().splitStrand(strand, rng.randint(strand.lowIdx(), strand.highIdx()))
+        elif op < 0.75:
+            strand = rng.choice(strands)
+            ss = strand.strandSet()
+            for neighbor in ss.getNeighbors(strand):
+                if (neighbor is not None and neighbor.oligo() is not strand.oligo() and
+                        ss.strandsCanBeMerged(strand, neighbor)):
+                    ss.mergeStrands(strand, neighbor)
+                    break
+        elif op < 0.8:
+            strand = rng.choice(strands)
+            strand.strandSet().removeStrand(strand)
+        elif op < 0.85:
+            strand = rng.choice(strands)
+            idx = rng.randint(strand.lowIdx(), strand.highIdx())
+            if idx in part.insertions()[strand.idNum()]:
+                strand.removeInsertion(idx)
+            else:
+                strand.addInsertion(idx, rng.choice([-1, 2]))
+        elif op < 0.95:
+            if num_undo > num_created:
+                undo_stack.undo()
+                num_redo += 1
+        elif num_redo:
+            undo_stack.redo()
+            num_redo -= 1
+        if len(undo_stack.undostack) > num_undo:
+            # pushing a command drops what could be redone
+            num_redo = 0
+        _checkOligos(part)
+
+    while len(undo_stack.undostack) > num_created:
+        undo_stack.undo()
+    assert set(_allStrands(part)) == set(initial)
+    assert all(strand.oligo() is oligo for strand, oligo in initial.items())
+    _checkOligos(part)
+
+
+def testOligoIndexLoop(cnapp):
+    """Closing, opening and cutting a loop of strands"""
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    undo_stack = part.undoStack()
+    strands = [part.getStrandSets(id_num)[0].createStrand(0, 9) for id_num in range(3)]
+    oligos = [strand.oligo() for strand in strands]
+    for i in range(3):
+        strand5p, strand3p = strands[i], strands[(i + 1) % 3]
+        undo_stack.push(CreateXoverCommand(part, strand5p, strand5p.idx3Prime(),
+                                           strand3p, strand3p.idx5Prime()))
+        _checkOligos(part)
+    oligo = strands[0].oligo()
+    assert oligo.isCircular() and all(strand.oligo() is oligo for strand in strands)
+    for i in (1, 2, 0):
+        # cutting the loop anywhere leaves one chain starting 3' of the cut
+        undo_stack.push(RemoveXoverCommand(part, strands[i], strands[(i + 1) % 3]))
+        _checkOligos(part)
+        assert not oligo.isCircular()
+        assert strands[i].chainEnds() == (strands[(i + 1) % 3], strands[i])
+        undo_stack.undo()
+        _checkOligos(part)
+        assert oligo.isCircular()
+    for _ in range(3):
+        undo_stack.undo()
+        _checkOligos(part)
+    assert [strand.oligo() for strand in strands] == oligos
+
+
+def testInsertionIndex(cnapp):
+    """Insertion queries and cached strand lengths follow insertion edits,
+    resizing and undo
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    undo_stack = part.undoStack()
+    undo_stack.setUndoLimit(1000)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    fwd_strand = fwd_ss.createStrand(0, 40)
+    rev_strand = rev_ss.createStrand(10, 30)
+    insertions = part.insertions()[0]
+
+    def check():
+        for strand in (fwd_strand, rev_strand):
+            low_idx, high_idx = strand.idxs()
+            on_strand = [insertions[idx] for idx in sorted(insertions) if low_idx <= idx <= high_idx]
+            assert strand.insertionsOnStrand() == on_strand
+            assert strand.totalLength() == strand.length() + sum(x.length() for x in on_strand)
+            assert strand.oligo().length() == strand.totalLength()
+            assert strand.totalLength3p() == strand.totalLength()
+            for idx_low, idx_high in ((low_idx, high_idx - 3), (low_idx + 5, low_idx + 4), (12, 20)):
+                assert strand.insertionLengthBetweenIdxs(idx_low, idx_high) == \
+                    sum(insertions[idx].length() for idx in insertions if idx_low <= idx <= idx_high)
+
+    rng = random.Random(5)
+    for _ in range(60):
+        idx = rng.randint(0, 40)
+        if idx in insertions:
+            if rng.random() < 0.5:
+                fwd_strand.removeInsertion(idx)
+            else:
+                fwd_strand.changeInsertion(idx, rng.choice([-1, 1, 2, 5]))
+        else:
+            fwd_strand.addInsertion(idx, rng.choice([-1, 1, 3]))
+        check()
+    fwd_strand.resize((5, 35))
+    check()
+    for _ in range(20):
+        undo_stack.undo()
+        check()
+
+
+def testApplySequence(cnapp):
+    """Sequences reach the complementary strands across insertions and skips
+    and undo restores every strand touched
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    undo_stack = part.undoStack()
+    undo_stack.setUndoLimit(1000)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    fwd_strand = fwd_ss.createStrand(0, 20)
+    rev_strands = [rev_ss.createStrand(0, 7), rev_ss.createStrand(12, 30)]
+    fwd_strand.addInsertion(3, 2)
+    fwd_strand.addInsertion(14, -1)
+
+    def sequences():
+        return [strand._sequence for strand in [fwd_strand] + rev_strands]
+
+    assert fwd_strand.totalLength() == 22
+    initial = sequences()
+    fwd_strand.oligo().applySequence('AACCGGTTAACCGGTTAACCGG')
+    assert fwd_strand.sequence() == 'AACCGGTTAACCGGTTAACCGG'
+    # bases 0-7 and the insertion at 3 of the forward strand, read 5' to 3'
+    assert rev_strands[0].sequence() == 'TTAACCGGTT'
+    # bases 12-20 less the skip at 14, then unpaired bases 21-30
+    assert rev_strands[1].sequence() == ' '*10 + 'CCGGTTAA'
+    applied = sequences()
+
+    rev_strands[1].oligo().applySequence('TTTTTTTTTTGGGGGGCC')
+    assert fwd_strand.sequence() == 'AACCGGTTAACCGGGGCCCCCC'
+    assert rev_strands[0].sequence() == 'TTAACCGGTT'
+    undo_stack.undo()
+    assert sequences() == applied
+    undo_stack.undo()
+    assert sequences() == initial
+    undo_stack.redo()
+    assert sequences() == applied
+
+
+def testIntervalStrandSet(cnapp):
+    """The interval strand sets of a part answer queries like the per base
+    array of StrandSet after random edits
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 84)
+    fwd_ss = part.getStrandSets(0)[0]
+    assert isinstance(fwd_ss, IntervalStrandSet)
+    size = fwd_ss.length()
+    rng = random.Random(7)
+    for step in range(300):
+        strands = list(fwd_ss)
+        op = rng.random()
+        if op < 0.4 or not strands:
+            idx = rng.randrange(size)
+            if fwd_ss.getStrand(idx) is None:
+                low_idx, high_idx = fwd_ss.getBoundsOfEmptyRegionContaining(idx)
+                fwd_ss.createStrand(rng.randint(low_idx, idx), rng.randint(idx, high_idx))
+        elif op < 0.55:
+            fwd_ss.removeStrand(rng.choice(strands))
+        elif op < 0.7:
+            strand = rng.choice(strands)
+            fwd_ss.splitStrand(strand, rng.randint(*strand.idxs()))
+        elif op < 0.85:
+            strand = rng.choice(strands)
+            low_strand, high_strand = fwd_ss.getNeighbors(strand)
+            low_idx = 0 if low_strand is None else low_strand.highIdx() + 1
+            high_idx = size - 1 if high_strand is None else high_strand.lowIdx() - 1
+            new_low = rng.randint(low_idx, strand.highIdx())
+            strand.resize((new_low, rng.randint(new_low, high_idx)))
+        else:
+            strand = rng.choice(strands)
+            low_strand, high_strand = fwd_ss.getNeighbors(strand)
+            if high_strand is not None:
+                fwd_ss.mergeStrands(strand, high_strand)
+
+        dense_ss = StrandSet(True, 0, part, size)
+        dense_ss._setStrands(list(fwd_ss))
+        for idx in range(size):
+            assert fwd_ss.getStrand(idx) is dense_ss.getStrand(idx)
+            assert fwd_ss.getBoundsOfEmptyRegionContaining(idx) == \
+                dense_ss.getBoundsOfEmptyRegionContaining(idx)
+        for _ in range(20):
+            idx_low = rng.randrange(size)
+            idx_high = rng.randrange(idx_low, size)
+            assert fwd_ss.hasStrandAt(idx_low, idx_high) == dense_ss.hasStrandAt(idx_low, idx_high)
+            assert fwd_ss.getOverlappingStrands(idx_low, idx_high) == \
+                dense_ss.getOverlappingStrands(idx_low, idx_high)
+        for strand in fwd_ss:
+            assert fwd_ss.isStrandInSet(strand) and dense_ss.isStrandInSet(strand)
+            assert fwd_ss.getNeighbors(strand) == dense_ss.getNeighbors(strand)
+            assert fwd_ss.getStrandIndex(strand) == dense_ss.getStrandIndex(strand)
+
+
+def testRefreshSegments(cnapp):
+    """Segments kept up to date by the edits of the strands of a virtual
+    helix match a full partition of the virtual helix, and the abstract
+    segment ids of the segments an edit leaves alone are kept
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 84)
+    undo_stack = part.undoStack()
+    undo_stack.setUndoLimit(1000)
+    strandsets = part.getStrandSets(0)
+    size = strandsets[0].length()
+    part.initializeAbstractSegmentId()
+    rng = random.Random(11)
+    for step in range(300):
+        old_ids = dict(part.segment_dict.get(0, {}))
+        ss = rng.choice(strandsets)
+        strands = list(ss)
+        op = rng.random()
+        if op < 0.4 or not strands:
+            idx = rng.randrange(size)
+            if ss.getStrand(idx) is None:
+                low_idx, high_idx = ss.getBoundsOfEmptyRegionContaining(idx)
+                ss.createStrand(rng.randint(low_idx, idx), rng.randint(idx, high_idx))
+        elif op < 0.55:
+            ss.removeStrand(rng.choice(strands))
+        elif op < 0.7:
+            strand = rng.choice(strands)
+            ss.splitStrand(strand, rng.randint(*strand.idxs()))
+        elif op < 0.85:
+            strand = rng.choice(strands)
+            low_strand, high_strand = ss.getNeighbors(strand)
+            low_idx = 0 if low_strand is None else low_strand.highIdx() + 1
+            high_idx = size - 1 if high_strand is None else high_strand.lowIdx() - 1
+            new_low = rng.randint(low_idx, strand.highIdx())
+            strand.resize((new_low, rng.randint(new_low, high_idx)))
+        elif op < 0.95:
+            strand = rng.choice(strands)
+            low_strand, high_strand = ss.getNeighbors(strand)
+            if high_strand is not None:
+                ss.mergeStrands(strand, high_strand)
+        else:
+            undo_stack.undo()
+
+        segment_dict = part.segment_dict[0]
+        all_strands = list(strandsets[0]) + list(strandsets[1])
+        segments = [strand.segments for strand in all_strands]
+        expected = part._refreshSegments(*strandsets)
+        assert segments == expected[0] + expected[1]
+        live_segments = set(segment for x in segments for segment in x)
+        assert set(segment_dict) <= live_segments
+        assert all(old_ids[segment] == segment_dict[segment] for segment in segment_dict)
+        for strand in all_strands:
+            strand.applyAbstractSequence()
+        assert set(segment_dict) == live_segments
+
+
+def testAbstractSequences(cnapp):
+    """Abstract sequences are kept as runs per segment and the bases paired
+    across the helix share their abstract numbers
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss, rev_ss = part.getStrandSets(0)
+    fwd_strand = fwd_ss.createStrand(0, 20)
+    rev_strand = rev_ss.createStrand(5, 10)
+    part.setAbstractSequences()
+
+    assert [run[2:] for run in fwd_strand.abstract_sequence] == [(5, 1), (6, 1), (10, 1)]
+    assert [run[2:] for run in rev_strand.abstract_sequence] == [(6, -1)]
+    fwd_seq = [int(x) for x in fwd_strand.abstractSeq().split(',')]
+    rev_seq = [int(x) for x in rev_strand.abstractSeq().split(',')]
+    assert len(set(fwd_seq)) == 21
+    assert rev_seq == fwd_seq[5:11][::-1]
+    assert fwd_strand.sequence() == '|'*21
+    assert rev_strand.sequence() == '|'*6
+
+
+def testResizeSelection(cnapp):
+    """Selection bounds match the per strandset bounds and moving the
+    selection resizes all selected ends in one undoable step
+    """
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 84)
+    undo_stack = part.undoStack()
+    undo_stack.setUndoLimit(1000)
+    strandsets = part.getStrandSets(0) + part.getStrandSets(1)
+    size = strandsets[0].length()
+    rng = random.Random(5)
+    for ss in strandsets:
+        idx = rng.randrange(4)
+        while idx < size - 4:
+            high_idx = min(idx + rng.randrange(2, 12), size - 1)
+            ss.createStrand(idx, high_idx)
+            idx = high_idx + 1 + rng.randrange(10)
+    for step in range(40):
+        doc.clearAllSelected()
+        for ss in strandsets:
+            for strand in ss:
+                if rng.random() < 0.2:
+                    doc.addStrandToSelection(strand, rng.choice([(True, False),
+                                                                 (False, True),
+                                                                 (True, True)]))
+        expected = (-1, -1)
+        for ss in doc._selection_dict:
+            bounds = doc.determineStrandSetBounds(doc.sortedSelectedStrands(ss), ss)
+            expected = tuple(x if y < 0 else min(x, y) for x, y in zip(bounds, expected))
+        low_bound, high_bound = doc.getSelectionBounds()
+        assert (low_bound, high_bound) == expected
+        engine = doc.selectionEngine()
+        assert engine.clampDelta(size) == high_bound
+        assert engine.clampDelta(-size) == -low_bound
+
+        delta = rng.choice([-low_bound, high_bound, rng.randint(-low_bound, high_bound)])
+        old_idxs = [[strand.idxs() for strand in ss] for ss in strandsets]
+        new_idxs = dict(engine.newIdxs(delta) or [])
+        doc.resizeSelection(delta)
+        assert (doc.selectionEngine() is engine) == (not new_idxs)
+        for ss, ss_old_idxs in zip(strandsets, old_idxs):
+            strands = list(ss)
+            assert [strand.idxs() for strand in strands] == \
+                [new_idxs.get(strand, idxs) for strand, idxs in zip(strands, ss_old_idxs)]
+            dense_ss = StrandSet(ss.isForward(), ss.idNum(), part, size)
+            dense_ss._setStrands(strands)
+            for idx in range(size):
+                assert ss.getStrand(idx) is dense_ss.getStrand(idx)
+        for id_num in (0, 1):
+            segments = [strand.segments for ss in part.getStrandSets(id_num) for strand in ss]
+            expected_segments = part._refreshSegments(*part.getStrandSets(id_num))
+            assert segments == expected_segments[0] + expected_segments[1]
+        if new_idxs and rng.random() < 0.5:
+            undo_stack.undo()
+            assert [[strand.idxs() for strand in ss] for ss in strandsets] == old_idxs
+
+
+def testStrandSignals(cnapp):
+    """Headless signals only reach the slots of their sender, drop the slots
+    of deleted objects and coalesce repeated emissions in a batch"""
+    doc = cnapp.document
+    part = create3Helix(doc, [0, 0, 1], 42)
+    fwd_ss = part.getStrandSets(0)[0]
+    strand1 = fwd_ss.createStrand(0, 10)
+    strand2 = fwd_ss.createStrand(20, 30)
+
+    class Listener(object):
+        def __init__(self):
+            self.calls = []
+
+        def resizedSlot(self, strand, idxs):
+            self.calls.append((strand, idxs))
+
+    listener = Listener()
+    strand1.strandResizedSignal.connect(listener.resizedSlot)
+    strand2.resize((20, 32), use_undostack=False)
+    assert listener.calls == []
+    strand1.resize((0, 12), use_undostack=False)
+    assert listener.calls == [(strand1, (0, 12))]
+
+    del listener.calls[:]
+    with signalBatch():
+        strand1.strandResizedSignal.emit(strand1, (0, 12))
+        strand1.strandResizedSignal.emit(strand1, (0, 12))
+        strand1.strandResizedSignal.emit(strand1, (0, 11))
+        assert listener.calls == []
+    assert listener.calls == [(strand1, (0, 12)), (strand1, (0, 11))]
+
+    # a repeat after a different emission is sent last
+    del listener.calls[:]
+    with signalBatch():
+        strand1.strandResizedSignal.emit(strand1, (0, 12))
+        strand1.strandResizedSignal.emit(strand1, (0, 11))
+        strand1.strandResizedSignal.emit(strand1, (0, 12))
+    assert listener.calls == [(strand1, (0, 11)), (strand1, (0, 12))]
+
+    strand1.strandResizedSignal.disconnect(listener.resizedSlot)
+    strand1.strandResizedSignal.connect(listener.resizedSlot)
+    del listener
+    gc.collect()
+    assert not strand1.strandResizedSignal.targets
+    strand1.strandResizedSignal.emit(strand1, (0, 12))
+
+
+def testResizeSelectionParts(cnapp):
+    """A selection spanning parts refreshes the segments of each part"""
+    doc = cnapp.document
+    strands = []
+    for _ in range(2):
+        part = create3Helix(doc, [0, 0, 1], 42)
+        strands.append(part.getStrandSets(0)[0].createStrand(10, 20))
+    doc.clearAllSelected()
+    for strand in strands:
+        doc.addStrandToSelection(strand, (False, True))
+    doc.resizeSelection(2)
+    for strand in strands:
+        assert strand.idxs() == (10, 22)
+        assert strand.segments == [(10, 22)]
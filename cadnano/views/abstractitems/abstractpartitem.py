@@ -125,6 +125,16 @@ class AbstractPartItem(object):
                                         neighbors: List[int]):
         pass
 
+    def partVirtualHelicesAddedSlot(self, part: PartT, id_nums: List[int]):
+        """Default handling of a batch of new virtual helices, one
+        :meth:`partVirtualHelixAddedSlot` call per virtual helix
+        """
+        for id_num in id_nums:
+            self.partVirtualHelixAddedSlot(part, id_num,
+                                           part.getVirtualHelix(id_num),
+                                           part.getVirtualHelixNeighbors(id_num))
+    # end def
+
     def partVirtualHelixRemovingSlot(self,  part: PartT,
                                             id_num: int,
                                             virtual_helix: VirtualHelixT,
@@ -318,6 +328,16 @@ class QAbstractPartItem(QGraphicsRectItem):
                                         neighbors: List[int]):
         pass
 
+    def partVirtualHelicesAddedSlot(self, part: PartT, id_nums: List[int]):
+        """Default handling of a batch of new virtual helices, one
+        :meth:`partVirtualHelixAddedSlot` call per virtual helix
+        """
+        for id_num in id_nums:
+            self.partVirtualHelixAddedSlot(part, id_num,
+                                           part.getVirtualHelix(id_num),
+                                           part.getVirtualHelixNeighbors(id_num))
+    # end def
+
     def partVirtualHelixRemovingSlot(self,  part: PartT,
                                             id_num: int,
                                             virtual_helix: VirtualHelixT,
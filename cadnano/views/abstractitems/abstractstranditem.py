@@ -93,3 +93,7 @@ class AbstractStrandItem(object):
     def oligoSelectedChangedSlot(self, oligo: OligoT, new_value: ValueT):
         pass
     # end def
+
+    def oligoStrandsMovedSlot(self, oligo: OligoT):
+        pass
+    # end def
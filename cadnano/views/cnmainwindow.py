@@ -52,6 +52,7 @@ from cadnano import (
     util
 )
 from cadnano.views import styles
+from cadnano.fileio.sequenceexport import exportSequences
 from cadnano.fileio.v3encode import reEmitPart
 from cadnano.proxies.cnproxy import UndoStack
 from cadnano.gui.mainwindow import ui_mainwindow
@@ -1146,7 +1147,7 @@ class CNMainWindow(QMainWindow, ui_mainwindow.Ui_MainWindow):
             fname = QFileDialog.getSaveFileName(self,
                                                 "%s - Save As" % QApplication.applicationName(),
                                                 directory,
-                                                "%s (*.json)" % QApplication.applicationName())
+                                                "{0} (*.json);;{0} binary (*.cnb)".format(QApplication.applicationName()))
             if isinstance(fname, (list, tuple)):
                 fname = fname[0]
             self.writeDocumentToFile(fname)
@@ -1154,7 +1155,7 @@ class CNMainWindow(QMainWindow, ui_mainwindow.Ui_MainWindow):
             fdialog = QFileDialog(self,
                                   "%s - Save As" % QApplication.applicationName(),
                                   directory,
-                                  "%s (*.json)" % QApplication.applicationName())
+                                  "{0} (*.json);;{0} binary (*.cnb)".format(QApplication.applicationName()))
             fdialog.setAcceptMode(QFileDialog.AcceptSave)
             fdialog.setWindowFlags(Qt.Sheet)
             fdialog.setWindowModality(Qt.WindowModal)
@@ -1209,11 +1210,8 @@ class CNMainWindow(QMainWindow, ui_mainwindow.Ui_MainWindow):
             del self.saveStaplesDialog
             self.saveStaplesDialog = None
         # write the file
-        ap = self._document.activePart()
-        if ap is not None:
-            output = ap.getSequences()
-            with open(fname, 'w') as f:
-                f.write(output)
+        if self._document.activePart() is not None:
+            exportSequences(fname, self._document, active_part_only=True)
     # end def
 
     def newClickedCallback(self):
@@ -1279,7 +1277,7 @@ class CNMainWindow(QMainWindow, ui_mainwindow.Ui_MainWindow):
             fname = selected
         if fname is None or os.path.isdir(fname):
             return False
-        if not fname.lower().endswith(".json"):
+        if not fname.lower().endswith((".json", ".cnb")):
             fname += ".json"
         if self.filesavedialog is not None:
             self.filesavedialog.filesSelected.disconnect(self.saveFileDialogCallback)
@@ -1338,14 +1336,14 @@ class CNMainWindow(QMainWindow, ui_mainwindow.Ui_MainWindow):
         if util.isWindows():  # required for native looking file window#"/",
             fname = QFileDialog.getOpenFileName(None,
                                                 "Open Document", path,
-                                                "cadnano1 / cadnano2 Files (*.nno *.json *.c25)")
+                                                "cadnano1 / cadnano2 Files (*.nno *.json *.c25 *.cnb)")
             self.filesavedialog = None
             self.openAfterMaybeSaveCallback(fname)
         else:  # access through non-blocking callback
             fdialog = QFileDialog(self,
                                   "Open Document",
                                   path,
-                                  "cadnano1 / cadnano2 Files (*.nno *.json *.c25)")
+                                  "cadnano1 / cadnano2 Files (*.nno *.json *.c25 *.cnb)")
             fdialog.setAcceptMode(QFileDialog.AcceptOpen)
             fdialog.setWindowFlags(Qt.Sheet)
             fdialog.setWindowModality(Qt.WindowModal)
@@ -422,7 +422,8 @@ class SelectGridTool(AbstractGridTool):
 
     def moveSelection(self, dx: float, dy: float,
                         finalize: bool,
-                        use_undostack: bool =True):
+                        use_undostack: bool =True,
+                        preview: bool = False):
         """Y-axis is inverted in Qt +y === DOWN
 
         Args:
@@ -430,6 +431,8 @@ class SelectGridTool(AbstractGridTool):
             dy (TYPE): Description
             finalize (TYPE): Description
             use_undostack (bool, optional): Description
+            preview (bool, optional): defer neighbor and crossover updates,
+                see :meth:`NucleicAcidPart.translateVirtualHelices`
         """
         # print("moveSelection: {}, {}".format(dx, dy))
         part_item = self.part_item
@@ -438,7 +441,8 @@ class SelectGridTool(AbstractGridTool):
         part.translateVirtualHelices(self.selection_set,
                                      dx / sf, -dy / sf, 0,
                                      finalize,
-                                     use_undostack=use_undostack)
+                                     use_undostack=use_undostack,
+                                     preview=preview)
     # end def
 
     def deactivate(self):
@@ -639,7 +643,7 @@ class GridSelectionGroup(QGraphicsItemGroup):
             delta = new_pos - self.drag_last_position
             self.drag_last_position = new_pos
             dx, dy = delta.x(), delta.y()
-            self.tool.moveSelection(dx, dy, False, use_undostack=False)
+            self.tool.moveSelection(dx, dy, False, use_undostack=False, preview=True)
         return res
     # end def
 
@@ -660,6 +664,8 @@ class GridSelectionGroup(QGraphicsItemGroup):
             if abs(dx) > MOVE_THRESHOLD or abs(dy) > MOVE_THRESHOLD:
                 # print("finalizling", dx, dy)
                 self.tool.moveSelection(dx, dy, True)
+            else:
+                self.tool.part_item.part().finalizeTranslation()
         self.tool.individual_pick = False
         return QGraphicsItemGroup.mouseReleaseEvent(self, event)
     # end def
@@ -449,6 +449,35 @@ class PreXoverItem(QGraphicsRectItem):
                                         styles.PREXOVER_STROKE_WIDTH,
                                         penstyle=Qt.DotLine))
             bonditem.hide()
+        else:
+            self.hide()
+    # end def
+
+    def isCurrent(self, from_virtual_helix_item: PathVirtualHelixItemT,
+                        nearby_idxs: List[int],
+                        to_vh_id_num: int) -> bool:
+        """Whether :meth:`resetItem` with these arguments, and the same
+        ``is_fwd`` and ``from_index``, would leave this item as it is, i.e.
+        it is shown for them and the strand at its base has not changed color
+        or gained a crossover.
+
+        Args:
+            from_virtual_helix_item: the associated vh_item
+            nearby_idxs:
+            to_vh_id_num: id_num of the other vh
+
+        Returns:
+            ``True`` if the item is up to date, ``False`` otherwise
+        """
+        if (not self.isVisible() or
+                self.parentItem() is not from_virtual_helix_item or
+                self.to_vh_id_num != to_vh_id_num or
+                self.nearby_idxs != nearby_idxs):
+            return False
+        strand = self._model_part.getStrand(self.is_fwd, self._id_num, self.idx)
+        if strand is None:
+            return self.color == EMPTY_COL
+        return not strand.hasXoverAt(self.idx) and self.color == strand.getColor()
     # end def
 
     def setPathAppearance(self, from_virtual_helix_item: PathVirtualHelixItemT) -> bool:
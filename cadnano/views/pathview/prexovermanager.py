@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 from collections import deque
+from typing import (
+    List,
+    Set,
+    Tuple
+)
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
@@ -251,6 +256,10 @@ class PreXoverManager(QGraphicsRectItem):
         of (id_num, is_fwd, idx) to a given PreXoverItem and a List of neighbor PreXoverItems
         This also deactivates any previusly active VirtualHelix
 
+        PreXoverItems are diffed against the ones shown by the previous call
+        for the same VirtualHelix by their (id_num, is_fwd, idx) key, so that
+        only the ones that appear, disappear or change are reset.
+
         Args:
             virtual_helix_item (cadnano.guil.views.pathview.virtualhelixitem.VirtualHelixItem)
             this_idx (int): the base index within the virtual helix
@@ -258,13 +267,19 @@ class PreXoverManager(QGraphicsRectItem):
         """
         # print("ACTIVATING VH", virtual_helix_item.idNum())
 
-        # 1. Clear all PreXoverItems
-        self.clearPreXoverItems()
-        pxis = self.prexover_item_map
-        neighbor_pxis_dict = self.neighbor_prexover_items  # for avoiding duplicates
+        # 1. Clear all PreXoverItems of a previously active VirtualHelix
+        if virtual_helix_item is not self.virtual_helix_item:
+            self.clearPreXoverItems()
+        else:
+            self.deactivateNeighbors()
+        old_active_pxis = self.active_pxis
+        old_neighbor_pxis = self.neighbor_prexover_items
+        self.prexover_item_map = pxis = {}
+        self.active_pxis = active_pxis = {}
+        self.neighbor_prexover_items = neighbor_pxis_dict = {}  # for avoiding duplicates
         part_item = self.part_item
-        pxi_pool = self.pxi_pool
-        getPoolItem = self.getPoolItem
+        updateItem = self._updateItem
+        nearbyIdxs = self._nearbyIdxs
 
         bpr = virtual_helix_item.getProperty('bases_per_repeat')
 
@@ -275,126 +290,109 @@ class PreXoverManager(QGraphicsRectItem):
         id_num = virtual_helix_item.idNum()
         fwd_st_type, rev_st_type = True, False  # for clarity in the call to constructors
 
-        # start, length = part_item.part().normalizedRange(id_num, this_idx)
-        active_pxis = self.active_pxis
-
-        # 1. Construct PXIs for the active virtual_helix_item
+        # 2. Construct or update PXIs for the active virtual_helix_item
         for neighbor_id, hits in per_neighbor_hits.items():
             fwd_axis_hits, rev_axis_hits = hits
 
-            # Track active and neighbor idxs in flat list
+            # Track active and neighbor idxs in sets
             # so we can look for idx pairs
-            fwd_active_idxs = [i[0] for i in fwd_axis_hits]
-            rev_active_idxs = [i[0] for i in rev_axis_hits]
-            fwd_neighbor_idxs = [j for k in [i[2] for i in fwd_axis_hits] for j in k]
-            rev_neighbor_idxs = [j for k in [i[1] for i in rev_axis_hits] for j in k]
+            fwd_active_idxs = {i[0] for i in fwd_axis_hits}
+            rev_active_idxs = {i[0] for i in rev_axis_hits}
+            fwd_neighbor_idxs = {j for i in fwd_axis_hits for j in i[2]}
+            rev_neighbor_idxs = {j for i in rev_axis_hits for j in i[1]}
 
             nvhi = part_item.idToVirtualHelixItem(neighbor_id)
-            # n_step_size = nvhi.getProperty('bases_per_repeat')
-            for idx, fwd_idxs, rev_idxs in fwd_axis_hits:
-                # print("f fwd_active_idxs", fwd_active_idxs)
-                nearby_idxs = []
-                if idx-1 in fwd_active_idxs:
-                    nearby_idxs.append(idx-1)
-                if idx+1 in fwd_active_idxs:
-                    nearby_idxs.append(idx+1)
-                apxi = getPoolItem(pxi_pool,
-                                   PreXoverItem,
-                                   virtual_helix_item, fwd_st_type, idx,
-                                   nearby_idxs, neighbor_id, self
-                                   )
-                # apxi = active_pxis[(fwd_st_type, idx)]
-                apxi.enableActive(True, to_vh_id_num=neighbor_id)
-                active_pxis[(fwd_st_type, idx)] = apxi
-                neighbor_pxis = []
-                pxis[(id_num, fwd_st_type, idx)] = (apxi, neighbor_pxis)
-                # print("f fwd_neighbor_idxs", fwd_neighbor_idxs)
-                for j in fwd_idxs:
-                    nkey = (neighbor_id, fwd_st_type, j)
-                    npxi = neighbor_pxis_dict.get(nkey)
-                    if npxi is None:
-                        nearby_idxs = []
-                        if j-1 in rev_neighbor_idxs:
-                            nearby_idxs.append(j-1)
-                        if j+1 in rev_neighbor_idxs:
-                            nearby_idxs.append(j+1)
-                        npxi = getPoolItem(pxi_pool,
-                                           PreXoverItem,
-                                           nvhi, fwd_st_type, j,
-                                           nearby_idxs, id_num, self
-                                           )
-                        neighbor_pxis_dict[nkey] = npxi
-                    neighbor_pxis.append(npxi)
-                # print("f rev_neighbor_idxs", rev_neighbor_idxs)
-                for j in rev_idxs:
-                    nkey = (neighbor_id, rev_st_type, j)
-                    npxi = neighbor_pxis_dict.get(nkey)
-                    if npxi is None:
-                        nearby_idxs = []
-                        if j-1 in fwd_neighbor_idxs:
-                            nearby_idxs.append(j-1)
-                        if j+1 in fwd_neighbor_idxs:
-                            nearby_idxs.append(j+1)
-                        npxi = getPoolItem(pxi_pool,
-                                           PreXoverItem,
-                                           nvhi, rev_st_type, j,
-                                           nearby_idxs, id_num, self
-                                           )
-                        neighbor_pxis_dict[nkey] = npxi
-                    neighbor_pxis.append(npxi)
-
-            for idx, fwd_idxs, rev_idxs in rev_axis_hits:
-                # print("r rev_active_idxs", rev_active_idxs)
-                nearby_idxs = []
-                if idx-1 in rev_active_idxs:
-                    nearby_idxs.append(idx-1)
-                if idx+1 in rev_active_idxs:
-                    nearby_idxs.append(idx+1)
-                apxi = getPoolItem(pxi_pool,
-                                   PreXoverItem,
-                                   virtual_helix_item, rev_st_type, idx,
-                                   nearby_idxs, neighbor_id, self
-                                   )
-                # apxi = active_pxis[(rev_st_type, idx)]
-                apxi.enableActive(True, to_vh_id_num=neighbor_id)
-                active_pxis[(rev_st_type, idx)] = apxi
-                neighbor_pxis = []
-                pxis[(id_num, rev_st_type, idx)] = (apxi, neighbor_pxis)
-                # print("r fwd_neighbor_idxs", fwd_neighbor_idxs)
-                for j in fwd_idxs:
-                    nkey = (neighbor_id, fwd_st_type, j)
-                    npxi = neighbor_pxis_dict.get(nkey)
-                    if npxi is None:
-                        nearby_idxs = []
-                        if j-1 in rev_neighbor_idxs:
-                            nearby_idxs.append(j-1)
-                        if j+1 in rev_neighbor_idxs:
-                            nearby_idxs.append(j+1)
-                        npxi = getPoolItem(pxi_pool,
-                                           PreXoverItem,
-                                           nvhi, fwd_st_type, j,
-                                           nearby_idxs, id_num, self
-                                           )
-                        neighbor_pxis_dict[nkey] = npxi
-                    neighbor_pxis.append(npxi)
-                # print("r rev_neighbor_idxs", rev_neighbor_idxs)
-                for j in rev_idxs:
-                    nkey = (neighbor_id, rev_st_type, j)
-                    npxi = neighbor_pxis_dict.get(nkey)
-                    if npxi is None:
-                        nearby_idxs = []
-                        if j-1 in fwd_neighbor_idxs:
-                            nearby_idxs.append(j-1)
-                        if j+1 in fwd_neighbor_idxs:
-                            nearby_idxs.append(j+1)
-                        npxi = getPoolItem(pxi_pool,
-                                           PreXoverItem,
-                                           nvhi, rev_st_type, j,
-                                           nearby_idxs, id_num, self
-                                           )
-                        neighbor_pxis_dict[nkey] = npxi
-                    neighbor_pxis.append(npxi)
+            for is_fwd, axis_hits, active_idxs in ((fwd_st_type, fwd_axis_hits, fwd_active_idxs),
+                                                   (rev_st_type, rev_axis_hits, rev_active_idxs)):
+                for idx, fwd_idxs, rev_idxs in axis_hits:
+                    apxi, is_reset = updateItem(old_active_pxis, active_pxis, (is_fwd, idx),
+                                                virtual_helix_item, is_fwd, idx,
+                                                nearbyIdxs(idx, active_idxs), neighbor_id)
+                    if is_reset:
+                        apxi.enableActive(True, to_vh_id_num=neighbor_id)
+                    neighbor_pxis = []
+                    pxis[(id_num, is_fwd, idx)] = (apxi, neighbor_pxis)
+                    for j in fwd_idxs:
+                        nkey = (neighbor_id, fwd_st_type, j)
+                        npxi = neighbor_pxis_dict.get(nkey)
+                        if npxi is None:
+                            npxi, _ = updateItem(old_neighbor_pxis, neighbor_pxis_dict, nkey,
+                                                 nvhi, fwd_st_type, j,
+                                                 nearbyIdxs(j, rev_neighbor_idxs), id_num)
+                        neighbor_pxis.append(npxi)
+                    for j in rev_idxs:
+                        nkey = (neighbor_id, rev_st_type, j)
+                        npxi = neighbor_pxis_dict.get(nkey)
+                        if npxi is None:
+                            npxi, _ = updateItem(old_neighbor_pxis, neighbor_pxis_dict, nkey,
+                                                 nvhi, rev_st_type, j,
+                                                 nearbyIdxs(j, fwd_neighbor_idxs), id_num)
+                        neighbor_pxis.append(npxi)
         # end for per_neighbor_hits
+
+        # 3. Release the PXIs that are no longer hit
+        pxi_pool = self.pxi_pool
+        for x in old_active_pxis.values():
+            x.shutdown()
+            pxi_pool.append(x)
+        for x in old_neighbor_pxis.values():
+            x.shutdown()
+            pxi_pool.append(x)
+    # end def
+
+    @staticmethod
+    def _nearbyIdxs(idx: int, idxs: Set[int]) -> List[int]:
+        """
+        Args:
+            idx: the base index within the virtual helix
+            idxs: indices of the PreXoverItems a PreXoverItem at ``idx`` can
+                pair with
+
+        Returns:
+            the members of ``idxs`` adjacent to ``idx``, low first
+        """
+        return [i for i in (idx - 1, idx + 1) if i in idxs]
+    # end def
+
+    def _updateItem(self, old_items: dict, items: dict, key: tuple,
+                    from_virtual_helix_item: PathVirtualHelixItemT,
+                    is_fwd: bool, idx: int,
+                    nearby_idxs: List[int],
+                    to_vh_id_num: int) -> Tuple[PreXoverItem, bool]:
+        """Get the PreXoverItem for ``key`` in ``items``, reusing the item
+        already there or in ``old_items`` and only resetting it when it
+        changes, or else a pooled or new one.
+
+        Args:
+            old_items: items shown by the previous activation, the reused
+                item is removed
+            items: items of this activation, the item is added
+            key: key of the item in ``old_items`` and ``items``
+            from_virtual_helix_item: see :class:`PreXoverItem`
+            is_fwd: see :class:`PreXoverItem`
+            idx: see :class:`PreXoverItem`
+            nearby_idxs: see :class:`PreXoverItem`
+            to_vh_id_num: see :class:`PreXoverItem`
+
+        Returns:
+            tuple of the item and whether it was reset
+        """
+        item = items.get(key)
+        if item is None:
+            item = old_items.pop(key, None)
+        if item is None:
+            item = self.getPoolItem(self.pxi_pool, PreXoverItem,
+                                    from_virtual_helix_item, is_fwd, idx,
+                                    nearby_idxs, to_vh_id_num, self)
+            is_reset = True
+        elif item.isCurrent(from_virtual_helix_item, nearby_idxs, to_vh_id_num):
+            is_reset = False
+        else:
+            item.resetItem(from_virtual_helix_item, is_fwd, idx,
+                           nearby_idxs, to_vh_id_num, self)
+            is_reset = True
+        items[key] = item
+        return item, is_reset
     # end def
 
     def activateNeighbors(self, id_num: int, is_fwd: bool, idx: int):
@@ -245,6 +245,17 @@ class StrandItem(QGraphicsLineItem):
         pass
     # end def
 
+    def oligoStrandsMovedSlot(self, oligo: OligoT):
+        """Slot for strands of the `Oligo` moving to other oligos, which
+        may include the model `Strand`
+
+        Args:
+            oligo:
+        """
+        if self._model_strand.oligo() is not oligo:
+            self.strandHasNewOligoSlot(self._model_strand)
+    # end def
+
     def strandHasNewOligoSlot(self, strand: StrandT):
         """Slot for changing the `Oligo` of the model `Strand`
 
@@ -4,7 +4,10 @@ from typing import (
     Optional
 )
 
-from PyQt5.QtCore import QPointF
+from PyQt5.QtCore import (
+    QPointF,
+    QRectF
+)
 from PyQt5.QtGui import (
     QFont,
     QPainterPath
@@ -51,6 +54,14 @@ DELTA = (HIGHLIGHT_WIDTH - styles.SLICE_HELIX_STROKE_WIDTH)/2.
 
 
 class GridItem(QGraphicsRectItem):
+    """The lattice of a part in the slice view.
+
+    The lattice dots are painted by this item for the exposed area only.
+    :class:`GridPoint` items, which take the mouse events and show the create
+    hints, only exist for the few lattice coordinates under the cursor or
+    with a hint or highlight, see :meth:`pointAt`.  Painting and rebuilding
+    therefore cost in proportion to the viewport, not to the part bounds.
+    """
     def __init__(self,  part_item: SliceNucleicAcidPartItemT,
                         grid_type: EnumType):
         """previous_grid_bounds (tuple):  a tuple corresponding to the bounds of
@@ -62,6 +73,7 @@ class GridItem(QGraphicsRectItem):
         """
         super(GridItem, self).__init__(parent=part_item)
         self.setFlag(QGraphicsItem.ItemClipsChildrenToShape)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
 
         self._path = None
         self.part_item = part_item
@@ -71,13 +83,15 @@ class GridItem(QGraphicsRectItem):
         # self.allow_snap = part_item.window().action_vhelix_snap.isChecked()
         self._draw_gridpoint_coordinates = False
         self.draw_lines = False
-        self.points = []
         self.points_dict = dict()
+        self._stale_points = set()
+        self._pressed_point = None
         self.previous_grid_bounds = None
         self.bounds = None
         self.grid_type = None
 
         self.setPen(getPenObj(styles.GRAY_STROKE, styles.EMPTY_HELIX_STROKE_WIDTH))
+        self._dot_pen = getPenObj(styles.GRAY_STROKE, styles.EMPTY_HELIX_STROKE_WIDTH)
 
         self.setGridType(grid_type)
         self.previous_grid_type = grid_type
@@ -86,9 +100,9 @@ class GridItem(QGraphicsRectItem):
     def destroyItem(self):
         print("destroying sliceView GridItem")
         scene = self.scene()
-        for point in self.points:
+        for point in self.points_dict.values():
             point.destroyItem()
-        self.points = None
+        self.points_dict = None
         scene.removeItem(self)
     # end def
 
@@ -99,7 +113,6 @@ class GridItem(QGraphicsRectItem):
         part = part_item.part()
         radius = part.radius()
         self.bounds = part_item.bounds()
-        self.removePoints()
 
         self.setRect(self.part_item.outline.rect())
         if self.grid_type == GridEnum.HONEYCOMB:
@@ -107,7 +120,10 @@ class GridItem(QGraphicsRectItem):
         elif self.grid_type == GridEnum.SQUARE:
             self.createSquareGrid(part_item, radius, self.bounds)
         else:
+            self.previous_grid_bounds = None
             self._path.setPath(QPainterPath())
+        self.removePoints()
+        self.update()
     # end def
 
     def setGridType(self, grid_type: EnumType):
@@ -123,7 +139,9 @@ class GridItem(QGraphicsRectItem):
     def createHoneycombGrid(self, part_item: SliceNucleicAcidPartItemT,
                                 radius: float,
                                 bounds: RectT):
-        """Instantiate an area of griditems arranged on a honeycomb lattice.
+        """Set the range of a honeycomb lattice covering ``bounds``.  Only the
+        lines and coordinate labels are drawn here, as a path, the dots are
+        painted by :meth:`paint`.
 
         Args:
             part_item: Description
@@ -138,22 +156,19 @@ class GridItem(QGraphicsRectItem):
         x_h = x_h + HoneycombDnaPart.PAD_GRID_XH
         y_h = y_h + HoneycombDnaPart.PAD_GRID_YL
         y_l = y_l + HoneycombDnaPart.PAD_GRID_YH
-        dot_size, half_dot_size = self.dots
         sf = part_item.scale_factor
-        points = self.points
         row_l, col_l = doPosition(radius, x_l, -y_l, scale_factor=sf)
         row_h, col_h = doPosition(radius, x_h, -y_h, scale_factor=sf)
-
-        redo_neighbors = (row_l, col_l, row_h, col_h) != self.previous_grid_bounds or\
-            self.previous_grid_type != self.grid_type
         self.previous_grid_type = self.grid_type
+        # rows and columns are inclusive
+        self.previous_grid_bounds = (row_l, col_l, row_h - 1, col_h)
 
         path = QPainterPath()
         is_pen_down = False
         draw_lines = self.draw_lines
-
-        if redo_neighbors:
-            self.points_dict = dict()
+        if not (draw_lines or self._draw_gridpoint_coordinates):
+            self._path.setPath(path)
+            return
 
         for row in range(row_l, row_h):
             for column in range(col_l, col_h+1):
@@ -164,31 +179,10 @@ class GridItem(QGraphicsRectItem):
                     else:
                         is_pen_down = True
                         path.moveTo(x, -y)
-                """
-                +x is Left and +y is down
-                origin of ellipse is Top Left corner so we subtract half in X and subtract in y
-                """
-                pt = GridPoint(x - half_dot_size,
-                               -y - half_dot_size,
-                               dot_size,
-                               self,
-                               coord=(row, column))
 
                 if self._draw_gridpoint_coordinates:
                     font = QFont(styles.THE_FONT, 6)
                     path.addText(x - 5, -y + 4, font, "%s,%s" % (-row, column))
-
-                pt.setPen(getPenObj(styles.GRAY_STROKE, styles.EMPTY_HELIX_STROKE_WIDTH))
-
-                # if x == 0 and y == 0:
-                #     pt.setBrush(getBrushObj(Qt.gray))
-
-                points.append(pt)
-                self.points_dict[(-row, column)] = pt
-
-                if redo_neighbors:
-                    self.previous_grid_bounds = (row_l, col_l, row_h, col_h)
-
             is_pen_down = False
 
         if draw_lines:
@@ -209,7 +203,9 @@ class GridItem(QGraphicsRectItem):
     def createSquareGrid(self, part_item: SliceNucleicAcidPartItemT,
                             radius: float,
                             bounds: RectT):
-        """Instantiate an area of griditems arranged on a square lattice.
+        """Set the range of a square lattice covering ``bounds``.  Only the
+        lines and coordinate labels are drawn here, as a path, the dots are
+        painted by :meth:`paint`.
 
         Args:
             part_item: Description
@@ -224,22 +220,18 @@ class GridItem(QGraphicsRectItem):
         y_h = y_h + SquareDnaPart.PAD_GRID_YL
         y_l = y_l + SquareDnaPart.PAD_GRID_YH
 
-        dot_size, half_dot_size = self.dots
         sf = part_item.scale_factor
-        points = self.points
         row_l, col_l = doPosition(radius, x_l, -y_l, scale_factor=sf)
         row_h, col_h = doPosition(radius, x_h, -y_h, scale_factor=sf)
-
-        redo_neighbors = (row_l, col_l, row_h, col_h) != \
-            self.previous_grid_bounds or self.previous_grid_type != self.grid_type
         self.previous_grid_type = self.grid_type
-
-        if redo_neighbors:
-            neighbor_map = dict()
+        self.previous_grid_bounds = (row_l, col_l, row_h, col_h)
 
         path = QPainterPath()
         is_pen_down = False
         draw_lines = self.draw_lines
+        if not (draw_lines or self._draw_gridpoint_coordinates):
+            self._path.setPath(path)
+            return
 
         for row in range(row_l, row_h + 1):
             for column in range(col_l, col_h + 1):
@@ -250,31 +242,10 @@ class GridItem(QGraphicsRectItem):
                     else:
                         is_pen_down = True
                         path.moveTo(x, -y)
-                """ +x is Left and +y is down
-                origin of ellipse is Top Left corner so we subtract half in X
-                and subtract in y
-                """
-                pt = GridPoint(x - half_dot_size,
-                               -y - half_dot_size,
-                               dot_size,
-                               self,
-                               coord=(row, column))
 
                 if self._draw_gridpoint_coordinates:
                     font = QFont(styles.THE_FONT)
                     path.addText(x - 10, -y + 5, font, "%s,%s" % (-row, column))
-
-                pt.setPen(getPenObj(styles.GRAY_STROKE, styles.EMPTY_HELIX_STROKE_WIDTH))
-
-                # if x == 0 and y == 0:
-                #     pt.setBrush(getBrushObj(Qt.gray))
-
-                points.append(pt)
-                self.points_dict[(-row, column)] = pt
-
-                if redo_neighbors:
-                    self.previous_grid_bounds = (row_l, col_l, row_h, col_h)
-
             is_pen_down = False  # pen up
 
         # DO VERTICAL LINES
@@ -291,26 +262,187 @@ class GridItem(QGraphicsRectItem):
         self._path.setPath(path)
     # end def
 
+    def _latticeFunctions(self):
+        """
+        Returns:
+            tuple of the ``latticeCoordToModelXY`` and
+            ``positionModelToLatticeCoord`` of the grid type
+        """
+        if self.grid_type == GridEnum.HONEYCOMB:
+            return (HoneycombDnaPart.latticeCoordToModelXY,
+                    HoneycombDnaPart.positionModelToLatticeCoord)
+        return (SquareDnaPart.latticeCoordToModelXY,
+                SquareDnaPart.positionModelToLatticeCoord)
+    # end def
+
+    def _isOnGrid(self, coord: Tuple[int, int]) -> bool:
+        """
+        Args:
+            coord: (-row, column) key of :attr:`points_dict`
+
+        Returns:
+            whether the lattice range of the grid includes ``coord``
+        """
+        if self.previous_grid_bounds is None:
+            return False
+        row_l, col_l, row_h, col_h = self.previous_grid_bounds
+        return row_l <= -coord[0] <= row_h and col_l <= coord[1] <= col_h
+    # end def
+
+    def paint(self, painter, option, widget=None):
+        """Draw the outline and the lattice dots inside the exposed rectangle
+        """
+        QGraphicsRectItem.paint(self, painter, option, widget)
+        if self.previous_grid_bounds is None:
+            return
+        doLattice, doPosition = self._latticeFunctions()
+        radius = self.part_item.part().radius()
+        sf = self.part_item.scale_factor
+        dot_size, half_dot_size = self.dots
+        rect = option.exposedRect.adjusted(-dot_size, -dot_size, dot_size, dot_size)
+        # the exposed rect in (-row, column) keys, as for points_dict
+        corners = [doPosition(radius, float(x), float(y), scale_factor=sf)
+                   for x in (rect.left(), rect.right()) for y in (rect.top(), rect.bottom())]
+        rows = [-row for row, _ in corners]
+        columns = [column for _, column in corners]
+        row_l, col_l, row_h, col_h = self.previous_grid_bounds
+        row_l, row_h = max(row_l, min(rows) - 1), min(row_h, max(rows) + 1)
+        col_l, col_h = max(col_l, min(columns) - 1), min(col_h, max(columns) + 1)
+
+        # as the points were, the dots are clipped to the outline
+        painter.setClipRect(self.rect())
+        painter.setPen(self._dot_pen)
+        painter.setBrush(getNoBrush())
+        for row in range(row_l, row_h + 1):
+            for column in range(col_l, col_h + 1):
+                x, y = doLattice(radius, row, column, scale_factor=sf)
+                painter.drawEllipse(QRectF(x - half_dot_size, -y - half_dot_size,
+                                           dot_size, dot_size))
+    # end def
+
+    def pointAt(self, coord: Tuple[int, int], create: bool = True) -> Optional['GridPoint']:
+        """The :class:`GridPoint` of a lattice coordinate, created on demand
+
+        Args:
+            coord: (-row, column) key of :attr:`points_dict`, as returned by
+                ``positionModelToLatticeCoord`` for a position of this item
+            create (optional): create the point if it does not exist,
+                default ``True``
+
+        Returns:
+            the point or ``None`` if ``coord`` is not on the grid
+        """
+        point = self.points_dict.get(coord)
+        if point is None and create and self._isOnGrid(coord):
+            self._releaseStalePoints()
+            doLattice, _ = self._latticeFunctions()
+            dot_size, half_dot_size = self.dots
+            row, column = -coord[0], coord[1]
+            x, y = doLattice(self.part_item.part().radius(), row, column,
+                             scale_factor=self.part_item.scale_factor)
+            """
+            +x is Left and +y is down
+            origin of ellipse is Top Left corner so we subtract half in X and subtract in y
+            """
+            point = GridPoint(x - half_dot_size,
+                              -y - half_dot_size,
+                              dot_size,
+                              self,
+                              coord=(row, column))
+            point.setPen(getPenObj(styles.GRAY_STROKE, styles.EMPTY_HELIX_STROKE_WIDTH))
+            self.points_dict[coord] = point
+        return point
+    # end def
+
+    def pointUnder(self, pos: QPointF) -> Optional['GridPoint']:
+        """:meth:`pointAt` the lattice coordinate whose dot contains ``pos``
+
+        Args:
+            pos: position in the coordinates of this item
+
+        Returns:
+            the point or ``None`` if ``pos`` is not on a dot of the grid
+        """
+        if self.previous_grid_bounds is None:
+            return None
+        _, doPosition = self._latticeFunctions()
+        coord = doPosition(self.part_item.part().radius(), float(pos.x()), float(pos.y()),
+                           scale_factor=self.part_item.scale_factor, strict=True)
+        return None if coord is None else self.pointAt(coord)
+    # end def
+
+    def releasePoint(self, point: 'GridPoint'):
+        """Mark a point without hint or highlight to be removed once it is no
+        longer under the cursor
+
+        Args:
+            point: the point
+        """
+        self._stale_points.add(point)
+    # end def
+
+    def _releaseStalePoints(self):
+        keep = set()
+        for point in self._stale_points:
+            if point.grid is None:
+                continue
+            if point.is_hinted or point.is_highlighted or point is self._pressed_point or \
+                    point.isUnderMouse():
+                keep.add(point)
+                continue
+            row, column = point.coord()
+            if self.points_dict.get((-row, column)) is point:
+                del self.points_dict[(-row, column)]
+            point.destroyItem()
+        self._stale_points = keep
+    # end def
+
     def removePoints(self):
-        """Remove all points from the grid.
+        """Remove the points that are no longer on the grid.
         """
-        points = self.points
-        scene = self.scene()
-        while points:
-            scene.removeItem(points.pop())
-        self.points_dict = dict()
+        points_dict = self.points_dict
+        for coord in [x for x in points_dict if not self._isOnGrid(x)]:
+            point = points_dict.pop(coord)
+            self._stale_points.discard(point)
+            if point is self._pressed_point:
+                self._pressed_point = None
+            point.destroyItem()
+    # end def
+
+    def mousePressEvent(self, event: QGraphicsSceneMouseEvent):
+        """Hand a press on a lattice dot to its :class:`GridPoint`, the press
+        falls through to the part item elsewhere
+        """
+        point = self.pointUnder(event.pos())
+        if point is None:
+            return QGraphicsRectItem.mousePressEvent(self, event)
+        self._pressed_point = point
+        point.mousePressEvent(event)
+    # end def
+
+    def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent):
+        if self._pressed_point is not None:
+            self._pressed_point.mouseMoveEvent(event)
+    # end def
+
+    def mouseReleaseEvent(self, event: QGraphicsSceneMouseEvent):
+        point, self._pressed_point = self._pressed_point, None
+        if point is not None:
+            point.mouseReleaseEvent(event)
+            self.releasePoint(point)
     # end def
 
     def showCreateHint(self, coord: Tuple[int, int],
                             next_idnums: Tuple[int, int] = (0, 1),
                             show_hint: bool = True,
                             color: str = None) -> Optional[bool]:
-        point_item = self.points_dict.get(coord)
+        point_item = self.pointAt(coord, create=show_hint)
         if point_item is None:
             return
 
         if not show_hint:
             point_item.showCreateHint(show_hint=False)
+            self.releasePoint(point_item)
 
         if point_item:
             row, column = coord
@@ -335,10 +467,12 @@ class GridItem(QGraphicsRectItem):
     # end def
 
     def highlightGridPoint(self, row: int, column: int, on: bool = True):
-        grid_point = self.points_dict.get((row, column))
+        grid_point = self.pointAt((row, column), create=on)
 
         if grid_point:
             grid_point.highlightGridPoint(on)
+            if not on:
+                self.releasePoint(grid_point)
 # end class
 
 
@@ -368,6 +502,8 @@ class GridPoint(QGraphicsEllipseItem):
         label.setPos(_RADIUS-posx, _RADIUS-posy)
 
         self.click_area = ClickArea(diameter, parent=self)
+        self.is_hinted = False
+        self.is_highlighted = False
 
         self.setPos(x, y)
         self.setZValue(_ZVALUE)
@@ -385,6 +521,7 @@ class GridPoint(QGraphicsEllipseItem):
                             show_hint: bool = True,
                             color: str = None):
         label = self._label
+        self.is_hinted = show_hint
         if show_hint:
             label.setText("%d" % id_num)
             b_rect = label.boundingRect()
@@ -480,6 +617,7 @@ class GridPoint(QGraphicsEllipseItem):
         """
         # Turn the outline of the GridItem off
         self.showCreateHint(show_hint=False)
+        self.grid.releasePoint(self)
 
         part_item = self.grid.part_item
         tool = part_item._getActiveTool()
@@ -551,6 +689,7 @@ class GridPoint(QGraphicsEllipseItem):
     # end def
 
     def highlightGridPoint(self, on: bool = True):
+        self.is_highlighted = on
         if on:
             self.setPen(getPenObj(styles.BLUE_STROKE, 2))
         else:
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from ast import literal_eval
 from warnings import warn
 from typing import (
     Tuple,
@@ -327,8 +326,7 @@ class SliceNucleicAcidPartItem(QAbstractPartItem):
             id_num: VirtualHelix ID number. See `NucleicAcidPart` for description and related methods.
             vhi: the item associated with id_num
         """
-        neighbors = vhi.getProperty('neighbors')
-        neighbors = literal_eval(neighbors)
+        neighbors = self._model_part.getVirtualHelixNeighbors(id_num)
         vhi.beginAddWedgeGizmos()
         for nvh in neighbors:
             nvhi = self._virtual_helix_item_hash.get(nvh, False)
@@ -743,6 +741,9 @@ class SliceNucleicAcidPartItem(QAbstractPartItem):
     def hoverMoveEvent(self, event: QGraphicsSceneHoverEvent):
         mapped_position = self.griditem.mapFromScene(event.scenePos())
         self.last_mouse_position = (mapped_position.x(), mapped_position.y())
+        # the grid points only exist where needed, so make the one under the
+        # cursor to take the following hover and mouse events
+        self.griditem.pointUnder(mapped_position)
         tool = self._getActiveTool()
         tool_method_name = tool.methodPrefix() + "HoverMove"
         if hasattr(self, tool_method_name):
@@ -1009,11 +1010,9 @@ class SliceNucleicAcidPartItem(QAbstractPartItem):
         self.last_mouse_position = event_xy
 
         if event_coord:
-            try:
-                grid_point = self.griditem.points_dict[(event_coord)]
+            grid_point = self.griditem.pointAt(event_coord)
+            if grid_point is not None:
                 self.setLastHoveredItem(grid_point)
-            except KeyError:
-                pass
 
         # Un-highlight GridItems if necessary by calling createToolHoverLeave
         if len(self._highlighted_path) > 1 or (self._highlighted_path and self._highlighted_path[0] != event_coord):
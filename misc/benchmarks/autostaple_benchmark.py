@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# autostaple_benchmark.py
+# Times NucleicAcidPart.autoStaple and NucleicAcidPart.autoBreak on every
+# bundled test design with its staples removed, and on a large honeycomb
+# bundle, against making the same staples one command at a time: a
+# createStrand per strand, a createXover per crossover and a
+# RefreshOligosCommand, then a splitStrand per break.
+# Run from terminal: python3 autostaple_benchmark.py [rows] [columns] [length]
+import sys
+import time
+
+from benchutil import (
+    designNames,
+    loadPart,
+    printHeader,
+    printRow
+)
+from cadnano.document import Document
+from cadnano.fileio.lattice import HoneycombDnaPart
+from cadnano.part.refresholigoscmd import RefreshOligosCommand
+from cadnano.part.stapleengine import StapleEngine
+from cadnano.proxies.cnenum import GridEnum
+from cadnano.strandset.removestrandcmd import RemoveStrandsCommand
+
+
+def stripStaples(part):
+    staples = [strand for id_num in part.getIdNums()
+               for strandset in part.getStrandSets(id_num) if strandset.isStaple()
+               for strand in strandset]
+    RemoveStrandsCommand(part, staples).redo()
+    part.buildCrossoverTable()
+    part.undoStack().setUndoLimit(0)
+    return part
+
+
+def bundlePart(rows, columns, length):
+    """Honeycomb bundle with a scaffold strand on every virtual helix"""
+    doc = Document()
+    part = doc.createNucleicAcidPart(use_undostack=False, grid_type=GridEnum.HONEYCOMB)
+    radius = part.radius()
+    x_list, y_list, parities = [], [], []
+    for row in range(rows):
+        for column in range(columns):
+            x, y = HoneycombDnaPart.latticeCoordToModelXY(radius, row, column)
+            x_list.append(x)
+            y_list.append(y)
+            parities.append(0 if HoneycombDnaPart.isEvenParity(row, column) else 1)
+    part.batchCreateVirtualHelices(x_list, y_list, length=[length]*len(x_list),
+                                   parities=parities, use_undo_stack=False)
+    for id_num in part.getIdNums():
+        for strandset in part.getStrandSets(id_num):
+            if strandset.isScaffold():
+                strandset.createStrand(0, length - 1, use_undostack=False)
+    return stripStaples(part)
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    func()
+    return time.perf_counter() - t0
+
+
+def stapleOneByOne(part):
+    runs, xovers = StapleEngine(part).autoStaple(do_break=False)
+    for id_num, (is_fwd, lows, highs) in runs.items():
+        strandset = part.getStrandSets(id_num)[0 if is_fwd else 1]
+        for low, high in zip(lows.tolist(), highs.tolist()):
+            strandset.createStrand(low, high)
+    for id_num5p, idx5p, id_num3p, idx3p in xovers:
+        strand5p = part.getStrand(runs[id_num5p][0], id_num5p, idx5p)
+        strand3p = part.getStrand(runs[id_num3p][0], id_num3p, idx3p)
+        part.createXover(strand5p, idx5p, strand3p, idx3p, update_oligo=False)
+    RefreshOligosCommand(part).redo()
+
+
+def breakOneByOne(part):
+    oligos = [olg for olg in part.oligos() if olg.strand5p().strandSet().isStaple()]
+    splits = [(strand.idNum(), strand.isForward(), idx)
+              for strand, idx in StapleEngine(part).oligoBreaks(oligos)[0]]
+    for id_num, is_fwd, idx in splits:
+        strand = part.getStrand(is_fwd, id_num, idx)
+        strand.strandSet().splitStrand(strand, idx)
+
+
+def run(name, makePart):
+    before_part, after_part = makePart(), makePart()
+    before = timed(lambda: stapleOneByOne(before_part))
+    after = timed(lambda: after_part.autoStaple(do_break=False))
+    printRow(name + ' staple', before, after)
+    before = timed(lambda: breakOneByOne(before_part))
+    after = timed(lambda: after_part.autoBreak())
+    printRow(name + ' break', before, after)
+
+    part = makePart()
+    num_oligos = len(part.oligos())
+    t = timed(lambda: part.autoStaple())
+    print("{:32s} {:10.4f} s for {} staples".format(name + ' autoStaple', t,
+                                                   len(part.oligos()) - num_oligos))
+# end def
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    length = int(sys.argv[3]) if len(sys.argv) > 3 else 1008
+    printHeader('one by one (s)', 'batch (s)')
+    for designname in designNames():
+        part = loadPart(designname)
+        if not any(strandset.isScaffold() and strandset.strand_heap
+                   for id_num in part.getIdNums()
+                   for strandset in part.getStrandSets(id_num)):
+            continue
+        run(designname, lambda: stripStaples(loadPart(designname)))
+    run("bundle {}x{}x{}".format(rows, columns, length),
+        lambda: bundlePart(rows, columns, length))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Shared helpers for the benchmark scripts in this directory.
+Run the scripts from a terminal, e.g. ``python3 crossover_benchmark.py``
+"""
+import glob
+import os
+import sys
+import time
+pjoin, opd = os.path.join, os.path.dirname
+
+BENCH_PATH = os.path.abspath(opd(__file__))
+PROJECT_PATH = opd(opd(BENCH_PATH))
+DATA_PATH = pjoin(PROJECT_PATH, 'cadnano', 'tests', 'data')
+sys.path.insert(0, PROJECT_PATH)
+
+
+def designNames():
+    """Names of the bundled test designs (json only)"""
+    return sorted(os.path.basename(x) for x in glob.glob(pjoin(DATA_PATH, '*.json')))
+
+
+def loadPart(designname):
+    """Read a bundled test design and return its active part"""
+    from cadnano.document import Document
+    doc = Document()
+    doc.readFile(pjoin(DATA_PATH, designname))
+    return doc.activePart()
+
+
+def bestOf(func, repeat=3):
+    """Best wall clock time in seconds of ``repeat`` calls of ``func``"""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def printRow(name, before, after):
+    speedup = before / after if after > 0 else float('inf')
+    print("{:32s} {:10.4f} {:10.4f} {:8.1f}x".format(name, before, after, speedup))
+
+
+def printHeader(before='before (s)', after='after (s)'):
+    print("{:32s} {:>10s} {:>10s} {:>9s}".format('design', before, after, 'speedup'))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# cnb_benchmark.py
+# Compares v3 json and binary .cnb files of every bundled test design: the
+# time to open the design with decodeFile, from a .cnb file as saved and
+# from one that also stores the points, and the file sizes.
+# Run from terminal: python3 cnb_benchmark.py
+import os
+import shutil
+import tempfile
+
+from benchutil import (
+    bestOf,
+    designNames,
+    loadPart,
+    printHeader,
+    printRow
+)
+from cadnano.fileio import cnbencode
+from cadnano.fileio.decode import decodeFile
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp()
+    rows = []
+    try:
+        for designname in designNames():
+            doc = loadPart(designname).document()
+            json_path = os.path.join(tmp_dir, 'design.json')
+            cnb_path = os.path.join(tmp_dir, 'design.cnb')
+            points_path = os.path.join(tmp_dir, 'points.cnb')
+            doc.writeToFile(json_path)
+            doc.writeToFile(cnb_path)
+            cnbencode.encodeToFile(points_path, doc, with_points=True)
+            rows.append((designname, bestOf(lambda: decodeFile(json_path)),
+                         bestOf(lambda: decodeFile(cnb_path)), bestOf(lambda: decodeFile(points_path)),
+                         os.path.getsize(json_path), os.path.getsize(cnb_path),
+                         os.path.getsize(points_path)))
+    finally:
+        shutil.rmtree(tmp_dir)
+    print("open the design")
+    printHeader('json (s)', 'cnb (s)')
+    for row in rows:
+        printRow(row[0], row[1], row[2])
+    print("\nopen the design, points stored")
+    printHeader('json (s)', 'cnb (s)')
+    for row in rows:
+        printRow(row[0], row[1], row[3])
+    print("\n{:32s} {:>10s} {:>10s} {:>12s}".format('design', 'json (kB)', 'cnb (kB)', 'points (kB)'))
+    for row in rows:
+        print("{:32s} {:10.1f} {:10.1f} {:12.1f}".format(row[0], row[4]/1e3, row[5]/1e3, row[6]/1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# crossover_benchmark.py
+# Compares the vectorized NucleicAcidPart.queryIdNumNeighbor with the per base
+# reference implementation on every bundled test design, for full length
+# queries and for the windowed queries done on active base changes.
+# Run from terminal: python3 crossover_benchmark.py
+from ast import literal_eval
+
+from benchutil import (
+    bestOf,
+    designNames,
+    loadPart,
+    printHeader,
+    printRow
+)
+
+
+def main():
+    printHeader('per base (s)', 'vector (s)')
+    for designname in designNames():
+        part = loadPart(designname)
+        queries = []
+        for id_num in sorted(part.getidNums()):
+            neighbors = literal_eval(part.getVirtualHelixProperties(id_num, 'neighbors'))
+            queries.append((id_num, neighbors, None))
+            queries.append((id_num, neighbors, part.stepSize()))
+
+        def runPerBase():
+            for query in queries:
+                part._queryIdNumNeighborPerBase(*query)
+
+        def runVectorized():
+            for query in queries:
+                part.queryIdNumNeighbor(*query)
+
+        for query in queries:
+            assert part.queryIdNumNeighbor(*query) == part._queryIdNumNeighborPerBase(*query)
+        printRow(designname, bestOf(runPerBase, 1), bestOf(runVectorized))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# oligoindex_benchmark.py
+# Builds a long oligo crossover by crossover, always joining a new strand to
+# the 5' end so every crossover moves the whole oligo built so far, once with
+# the oligo index of CreateXoverCommand and once relabeling strand by strand
+# as before.
+# Run from terminal: python3 oligoindex_benchmark.py
+from benchutil import (
+    bestOf,
+    printHeader,
+    printRow
+)
+
+STRANDS_PER_HELIX = 200
+
+
+def createStrands(num_strands):
+    from cadnano.document import Document
+    doc = Document()
+    part = doc.createNucleicAcidPart(use_undostack=False)
+    strands = []
+    num_helices = -(-num_strands // STRANDS_PER_HELIX)
+    for id_num in range(num_helices):
+        part.createVirtualHelix(0, 10.*id_num, 0, 12*STRANDS_PER_HELIX,
+                                id_num=id_num, use_undostack=False)
+        fwd_ss = part.getStrandSets(id_num)[0]
+        for i in range(min(STRANDS_PER_HELIX, num_strands - len(strands))):
+            strands.append(fwd_ss.createStrand(12*i, 12*i + 9, use_undostack=False))
+    return part, strands
+
+
+def joinWithIndex(part, strands):
+    from cadnano.part.xovercmds import CreateXoverCommand
+    head = strands[0]
+    for strand in strands[1:]:
+        CreateXoverCommand(part, strand, strand.idx3Prime(), head, head.idx5Prime()).redo()
+        head = strand
+
+
+def joinPerStrand(part, strands):
+    from cadnano.part.xovercmds import CreateXoverCommand
+    from cadnano.strand import Strand
+    head = strands[0]
+    for strand in strands[1:]:
+        olg5p, old_olg3p = strand.oligo(), head.oligo()
+        olg5p._incrementLength(old_olg3p.length(), emit_signals=True)
+        old_olg3p.removeFromPart(emit_signals=True)
+        for strand3p in head.generator3pStrand():
+            Strand.setOligo(strand3p, olg5p, emit_signals=True)
+        CreateXoverCommand(part, strand, strand.idx3Prime(), head, head.idx5Prime(),
+                           update_oligo=False).redo()
+        head = strand
+
+
+def main():
+    printHeader('per strand (s)', 'index (s)')
+    for num_strands in (250, 500, 1000, 2000):
+        times = []
+        for join in (joinPerStrand, joinWithIndex):
+            setups = [createStrands(num_strands) for _ in range(3)]
+            times.append(bestOf(lambda: join(*setups.pop())))
+        printRow('{} strands'.format(num_strands), *times)
+
+
+if __name__ == '__main__':
+    main()
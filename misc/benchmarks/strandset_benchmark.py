@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# strandset_benchmark.py
+# Compares the per base array StrandSet with IntervalStrandSet on a single
+# 10000 base virtual helix: bulk strand insertion, point and range queries,
+# strand resizing and removal.
+# Run from terminal: python3 strandset_benchmark.py
+import random
+
+from benchutil import (
+    bestOf,
+    printHeader,
+    printRow
+)
+
+HELIX_LENGTH = 10000
+STRAND_LENGTH = 30
+GAP = 2
+
+
+def createPart():
+    from cadnano.document import Document
+    doc = Document()
+    part = doc.createNucleicAcidPart(use_undostack=False)
+    part.createVirtualHelix(0, 0, 0, HELIX_LENGTH, id_num=0, use_undostack=False)
+    return part
+
+
+def main():
+    from cadnano.strand import Strand
+    from cadnano.strandset import IntervalStrandSet, StrandSet
+    part = createPart()
+    rng = random.Random(1)
+    idxs = [(low_idx, low_idx + STRAND_LENGTH - 1)
+            for low_idx in range(0, HELIX_LENGTH - STRAND_LENGTH, STRAND_LENGTH + GAP)]
+    rng.shuffle(idxs)
+    queries = [rng.randrange(HELIX_LENGTH) for _ in range(20000)]
+    ranges = [(idx, min(idx + 60, HELIX_LENGTH - 1)) for idx in queries]
+
+    results = {}
+    for cls in (StrandSet, IntervalStrandSet):
+        timings = results[cls] = {}
+
+        def setup():
+            strandset = cls(True, 0, part, HELIX_LENGTH)
+            return strandset, [Strand(strandset, *x) for x in idxs]
+
+        def add(strandset, strands):
+            for strand in strands:
+                strandset._addToStrandList(strand, update_segments=False)
+
+        def timed(name, func):
+            strandset, strands = setup()
+            add(strandset, strands)
+            timings[name] = bestOf(lambda: func(strandset, strands))
+
+        setups = [setup() for _ in range(3)]
+        timings['add strands'] = bestOf(lambda: add(*setups.pop()))
+        timed('getStrand', lambda ss, _: [ss.getStrand(i) for i in queries])
+        timed('hasStrandAt', lambda ss, _: [ss.hasStrandAt(*x) for x in ranges])
+        timed('getOverlappingStrands', lambda ss, _: [ss.getOverlappingStrands(*x) for x in ranges])
+        timed('getBoundsOfEmpty...', lambda ss, _: [ss.getBoundsOfEmptyRegionContaining(i)
+                                                    for i in queries])
+        timed('getStrandIndex', lambda ss, strands: [ss.getStrandIndex(s) for s in strands])
+
+        def resize(strandset, strands):
+            for strand in strands:
+                old_idxs = strand.idxs()
+                new_idxs = (old_idxs[0] + 1, old_idxs[1] + 1)
+                strand.setIdxs(new_idxs)
+                strandset._updateStrandIdxs(strand, old_idxs, new_idxs)
+                strand.setIdxs(old_idxs)
+                strandset._updateStrandIdxs(strand, new_idxs, old_idxs)
+        timed('resize strands', resize)
+
+        def remove(strandset, strands):
+            for strand in strands:
+                strandset._removeFromStrandList(strand, update_segments=False)
+        setups = [setup() for _ in range(3)]
+        for x in setups:
+            add(*x)
+        timings['remove strands'] = bestOf(lambda: remove(*setups.pop()))
+
+    printHeader('array (s)', 'interval (s)')
+    for name in results[StrandSet]:
+        printRow(name, results[StrandSet][name], results[IntervalStrandSet][name])
+
+
+if __name__ == '__main__':
+    main()
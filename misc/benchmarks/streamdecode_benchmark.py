@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# streamdecode_benchmark.py
+# Compares the peak traced memory and the time of decoding every bundled test
+# design with decodeFile after json.load and with the streaming reader.
+# Run from terminal: python3 streamdecode_benchmark.py
+import time
+import tracemalloc
+
+from benchutil import (
+    DATA_PATH,
+    designNames,
+    pjoin
+)
+from cadnano.fileio.decode import decodeFile
+
+
+def measure(path, stream):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    decodeFile(path, stream=stream)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main():
+    print("{:32s} {:>12s} {:>12s} {:>10s} {:>10s}".format(
+          'design', 'load (MiB)', 'stream (MiB)', 'load (s)', 'stream (s)'))
+    for designname in designNames():
+        path = pjoin(DATA_PATH, designname)
+        load_time, load_peak = measure(path, False)
+        stream_time, stream_peak = measure(path, True)
+        print("{:32s} {:12.1f} {:12.1f} {:10.3f} {:10.3f}".format(
+              designname, load_peak, stream_peak, load_time, stream_time))
+
+
+if __name__ == '__main__':
+    main()
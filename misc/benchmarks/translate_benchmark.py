@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# translate_benchmark.py
+# Times dragging half of the virtual helices of a large honeycomb bundle
+# across the part: updating neighbors and potential crossovers on every
+# mouse move, against previewing the moves and pushing the total move as
+# one command at the end, as the grid view does.
+# Run from terminal: python3 translate_benchmark.py [rows] [columns] [steps]
+import random
+import sys
+
+from benchutil import (
+    bestOf,
+    printHeader,
+    printRow
+)
+from autostaple_benchmark import bundlePart
+
+
+def drag(part, selection, steps, preview):
+    step = 0.25*part.radius()
+    for _ in range(steps):
+        part.translateVirtualHelices(selection, step, step, 0, False, preview=preview)
+    part.translateVirtualHelices(selection, steps*step, steps*step, 0, True,
+                                 use_undostack=True)
+    part.undoStack().undo()
+# end def
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 45
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 45
+    steps = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    part = bundlePart(rows, columns, 42)
+    part.undoStack().setUndoLimit(1)
+    id_nums = part.getIdNums()
+    selection = set(random.Random(0).sample(id_nums, len(id_nums) // 2))
+    printHeader('each move (s)', 'preview (s)')
+    before = bestOf(lambda: drag(part, selection, steps, False))
+    after = bestOf(lambda: drag(part, selection, steps, True))
+    printRow("drag {} of {} x {}".format(len(selection), len(id_nums), steps), before, after)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# v3decode_benchmark.py
+# Compares the bulk v3 decoder with the command based one on every bundled
+# test design.  Each design is read once, encoded to v3 json and then decoded
+# into a fresh Document with either decoder.
+# Run from terminal: python3 v3decode_benchmark.py
+import json
+
+from benchutil import (
+    DATA_PATH,
+    bestOf,
+    designNames,
+    pjoin,
+    printHeader,
+    printRow
+)
+from cadnano.document import Document
+from cadnano.fileio import v3decode
+from cadnano.fileio.encode import encode
+
+
+def main():
+    printHeader('commands (s)', 'bulk (s)')
+    for designname in designNames():
+        doc = Document()
+        doc.readFile(pjoin(DATA_PATH, designname))
+        json_str = encode(doc)
+
+        def decodeCommands():
+            v3decode.decode(Document(), json.loads(json_str), fast=False)
+
+        def decodeBulk():
+            v3decode.decode(Document(), json.loads(json_str), fast=True)
+
+        printRow(designname, bestOf(decodeCommands), bestOf(decodeBulk))
+
+
+if __name__ == '__main__':
+    main()
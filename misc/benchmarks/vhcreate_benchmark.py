@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# vhcreate_benchmark.py
+# Times bulk creation of virtual helices on a honeycomb lattice, one at a time
+# and with batchCreateVirtualHelices, followed by a round of per helix
+# property edits and reads, i.e. the virtual helix property table hot paths.
+# Run from terminal: python3 vhcreate_benchmark.py [rows] [columns]
+# Run it on two revisions to get before / after numbers.
+import sys
+import time
+
+import benchutil  # noqa: F401, sets up sys.path
+from cadnano.document import Document
+from cadnano.fileio.lattice import HoneycombDnaPart
+from cadnano.proxies.cnenum import GridEnum
+
+
+def createHelices(rows, columns, length=84):
+    doc = Document()
+    part = doc.createNucleicAcidPart(use_undostack=False, grid_type=GridEnum.HONEYCOMB)
+    radius = part.radius()
+    for row in range(rows):
+        for column in range(columns):
+            x, y = HoneycombDnaPart.latticeCoordToModelXY(radius, row, column)
+            parity = 0 if HoneycombDnaPart.isEvenParity(row, column) else 1
+            part.createVirtualHelix(x, y, 0., length, parity=parity, use_undostack=False)
+    return part
+
+
+def batchCreateHelices(rows, columns, length=84):
+    doc = Document()
+    part = doc.createNucleicAcidPart(use_undostack=False, grid_type=GridEnum.HONEYCOMB)
+    radius = part.radius()
+    x_list, y_list, parities = [], [], []
+    for row in range(rows):
+        for column in range(columns):
+            x, y = HoneycombDnaPart.latticeCoordToModelXY(radius, row, column)
+            x_list.append(x)
+            y_list.append(y)
+            parities.append(0 if HoneycombDnaPart.isEvenParity(row, column) else 1)
+    part.batchCreateVirtualHelices(x_list, y_list, length=[length]*len(x_list),
+                                   parities=parities, use_undo_stack=False)
+    return part
+
+
+def editHelices(part):
+    for id_num in part.getidNums():
+        part.setVirtualHelixProperties(id_num, ['eulerZ', 'color'], [10.0, '#cc0000'],
+                                       use_undostack=False)
+        part.getVirtualHelixProperties(id_num, ['bases_per_repeat', 'turns_per_repeat'])
+        part.getAllVirtualHelixProperties(id_num)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    t0 = time.perf_counter()
+    part = createHelices(rows, columns)
+    t1 = time.perf_counter()
+    editHelices(part)
+    t2 = time.perf_counter()
+    batchCreateHelices(rows, columns)
+    t3 = time.perf_counter()
+    num_vhs = len(part.getidNums())
+    print("created {} virtual helices in {:.3f} s ({:.1f} us / helix)".format(
+          num_vhs, t1 - t0, 1e6*(t1 - t0)/num_vhs))
+    print("edited {} virtual helices in {:.3f} s ({:.1f} us / helix)".format(
+          num_vhs, t2 - t1, 1e6*(t2 - t1)/num_vhs))
+    print("batch created {} virtual helices in {:.3f} s ({:.1f} us / helix)".format(
+          num_vhs, t3 - t2, 1e6*(t3 - t2)/num_vhs))
+
+
+if __name__ == '__main__':
+    main()
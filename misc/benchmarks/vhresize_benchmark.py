@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# vhresize_benchmark.py
+# Times extending and trimming the coordinates of single virtual helices in a
+# large honeycomb part, i.e. the per virtual base coordinate storage hot paths
+# of NucleicAcidPart._resizeHelix without the strandset and signal overhead.
+# Run from terminal: python3 vhresize_benchmark.py [rows] [columns] [resizes]
+# Run it on two revisions to get before / after numbers.
+import random
+import sys
+import time
+
+import benchutil  # noqa: F401, sets up sys.path
+from cadnano.document import Document
+from cadnano.fileio.lattice import HoneycombDnaPart
+from cadnano.proxies.cnenum import GridEnum
+
+
+def createHelices(rows, columns, length=84):
+    doc = Document()
+    part = doc.createNucleicAcidPart(use_undostack=False, grid_type=GridEnum.HONEYCOMB)
+    radius = part.radius()
+    for row in range(rows):
+        for column in range(columns):
+            x, y = HoneycombDnaPart.latticeCoordToModelXY(radius, row, column)
+            parity = 0 if HoneycombDnaPart.isEvenParity(row, column) else 1
+            part.createVirtualHelix(x, y, 0., length, parity=parity, use_undostack=False)
+    return part
+
+
+def resizeHelices(part, id_nums, is_right, delta):
+    for id_num in id_nums:
+        if delta > 0:
+            _, size = part.getOffsetAndSize(id_num)
+            index = size if is_right else -delta
+            points = part._pointsFromDirection(id_num, part._origin_pts[id_num],
+                                               part.directions[id_num], delta, index)
+            part._addCoordinates(id_num, points, is_right=is_right)
+        else:
+            part._removeCoordinates(id_num, -delta, is_right)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    resizes = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    t0 = time.perf_counter()
+    part = createHelices(rows, columns)
+    t_create = time.perf_counter() - t0
+    num_helices = len(part.getidNums())
+    print("created {} virtual helices in {:.3f} s".format(num_helices, t_create))
+
+    rng = random.Random(0)
+    id_nums = [rng.choice(part.getidNums()) for _ in range(resizes)]
+    for label, is_right, delta in (('append', True, 21), ('prepend', False, 21),
+                                   ('trim right', True, -21), ('trim left', False, -21)):
+        t0 = time.perf_counter()
+        resizeHelices(part, id_nums, is_right, delta)
+        elapsed = time.perf_counter() - t0
+        print("{:10s} {} helices in {:.3f} s ({:.1f} us / resize)".format(
+              label, resizes, elapsed, 1e6*elapsed/resizes))
+# end def
+
+
+if __name__ == '__main__':
+    main()